@@ -0,0 +1,224 @@
+# coding=utf-8
+"""
+列式历史数据 distinct_titles 的差异校验与基准测试
+
+ParserService.read_distinct_titles（ColumnarStore.distinct_titles）的每一行
+必须与 read_all_titles_for_date 返回的字典条目一一对应（顺序相同）。本脚本：
+
+- 在临时目录中用 LocalStorageBackend 生成多天的新闻数据库
+  （同一平台同一标题多次出现、平台每轮顺序变化、缺失日期、rows / packed 排名格式）
+- 分别带 / 不带 ranks 列、带关键词、带平台过滤调用 read_distinct_titles，
+  与逐天 read_all_titles_for_date 的结果比较
+- 比较列式路径与标题索引路径（read_titles_for_range）的耗时
+
+修改 ColumnarStore 或升级 pyarrow 后运行：
+
+    python bench/columnar_titles_check.py
+    python bench/columnar_titles_check.py --days 30 --items 300 --seed 3
+
+存在差异（或列式路径不可用）时打印第一个不一致的条目并以非零状态退出。
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mcp_server.services.cache_service import get_cache  # noqa: E402
+from mcp_server.services.parser_service import ParserService  # noqa: E402
+from mcp_server.utils.errors import DataNotFoundError  # noqa: E402
+from trendradar.storage.base import NewsData, NewsItem  # noqa: E402
+from trendradar.storage.local import LocalStorageBackend  # noqa: E402
+
+
+_WORDS = ["华为", "DJI", "苹果", "AI", "特斯拉", "芯片", "发布", "降价", "OpenAI", "ai", "天气", "比赛"]
+
+
+def generate(output_dir: Path, days: int, items: int, crawls: int, seed: int) -> List[datetime]:
+    """生成测试数据，返回日期列表（第 2 天缺失）"""
+    rng = random.Random(seed)
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    dates = [today - timedelta(days=offset) for offset in range(days - 1, -1, -1)]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for day_index, date in enumerate(dates):
+            if day_index == 1:
+                continue
+            backend = LocalStorageBackend(
+                data_dir=str(output_dir),
+                enable_txt=False,
+                enable_html=False,
+                rank_history_format="packed" if day_index % 3 == 0 else "rows",
+            )
+            for crawl in range(crawls):
+                crawl_time = f"{8 + crawl:02d}-{(crawl * 7) % 60:02d}"
+                platform_ids = [f"p{i}" for i in range(6)]
+                rng.shuffle(platform_ids)
+                news = {}
+                for platform_id in platform_ids[: rng.randint(3, 6)]:
+                    news[platform_id] = [
+                        NewsItem(
+                            title="".join(rng.choice(_WORDS) for _ in range(3)) + str(i % (items // 2)),
+                            source_id=platform_id,
+                            source_name=f"平台{platform_id}",
+                            rank=rng.randint(1, 50),
+                            url=f"https://example.com/{platform_id}/{i}/{rng.randint(0, 2)}",
+                            crawl_time=crawl_time,
+                        )
+                        for i in range(items)
+                    ]
+                backend.save_news_data(NewsData(
+                    date=date.strftime("%Y-%m-%d"),
+                    crawl_time=crawl_time,
+                    items=news,
+                    id_to_name={platform_id: f"平台{platform_id}" for platform_id in news},
+                    failed_ids=[],
+                ))
+            backend.cleanup()
+    return dates
+
+
+def expected_rows(
+    parser: ParserService,
+    dates: List[datetime],
+    platform_ids: Optional[List[str]],
+    keyword: Optional[str],
+    with_ranks: bool,
+) -> List[Tuple]:
+    """
+    逐天 read_all_titles_for_date 得到的参照结果
+
+    平台顺序按全天条目中的首次出现（与标题索引一致），因此先读取全部平台再过滤；
+    带平台过滤的 SQLite 查询按索引顺序返回平台，只核对其内容一致。
+    """
+    rows = []
+    for date in dates:
+        try:
+            all_titles, id_to_name, _ = parser.read_all_titles_for_date(date)
+        except DataNotFoundError:
+            continue
+        date_str = date.strftime("%Y-%m-%d")
+        day_rows = []
+        for platform_id, titles in all_titles.items():
+            if platform_ids and platform_id not in platform_ids:
+                continue
+            for title, info in titles.items():
+                if keyword and keyword.lower() not in title.lower():
+                    continue
+                row = (date_str, platform_id, id_to_name.get(platform_id, platform_id), title)
+                day_rows.append(row + (info.get("ranks", []),) if with_ranks else row)
+
+        if platform_ids:
+            filtered_titles, _, _ = parser.read_all_titles_for_date(date, platform_ids)
+            filtered = {
+                (platform_id, title, tuple(info.get("ranks", [])))
+                for platform_id, titles in filtered_titles.items()
+                for title, info in titles.items()
+                if not keyword or keyword.lower() in title.lower()
+            }
+            full = {(row[1], row[3], tuple(all_titles[row[1]][row[3]].get("ranks", []))) for row in day_rows}
+            if filtered != full:
+                raise AssertionError(f"{date_str} 带平台过滤的 read_all_titles_for_date 结果与全量过滤不一致")
+        rows.extend(day_rows)
+    return rows
+
+
+def columnar_rows(table, with_ranks: bool) -> List[Tuple]:
+    columns = ["date", "platform_id", "platform_name", "title"] + (["ranks"] if with_ranks else [])
+    return list(zip(*(table[column].to_pylist() for column in columns)))
+
+
+def run_check(parser: ParserService, dates: List[datetime]) -> int:
+    cases = [
+        (None, None),
+        (["p1", "p3"], None),
+        (None, "华为"),
+        (None, "ai"),
+        (["p0"], "芯片"),
+        (None, "不存在的关键词"),
+    ]
+    compared = 0
+    for platform_ids, keyword in cases:
+        for with_ranks in (False, True):
+            columns = ("ranks",) if with_ranks else ()
+            label = f"platforms={platform_ids} keyword={keyword!r} columns={columns}"
+            table = parser.read_distinct_titles(dates[0], dates[-1], platform_ids, keyword=keyword, columns=columns)
+            if table is None:
+                print(f"列式路径不可用: {label}")
+                return 1
+            actual = columnar_rows(table, with_ranks)
+            expected = expected_rows(parser, dates, platform_ids, keyword, with_ranks)
+            if actual != expected:
+                print(f"结果不一致: {label}（列式 {len(actual)} 行，参照 {len(expected)} 行）")
+                for index, (a, b) in enumerate(zip(actual, expected)):
+                    if a != b:
+                        print(f"  第 {index} 行:\n    列式: {a}\n    参照: {b}")
+                        break
+                return 1
+            compared += len(expected)
+
+    print(f"差异校验通过：{len(cases) * 2} 组查询，比较 {compared} 行")
+    return 0
+
+
+def _timed(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        get_cache().clear()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run_bench(parser: ParserService, dates: List[datetime], repeat: int) -> None:
+    start, end = dates[0], dates[-1]
+    # 预热：导出列式分区、建立标题索引
+    parser.read_distinct_titles(start, end, columns=("ranks",))
+    parser.read_titles_for_range(start, end)
+
+    columnar_ms = _timed(lambda: parser.read_distinct_titles(start, end, columns=("ranks",)), repeat)
+    keyword_ms = _timed(lambda: parser.read_distinct_titles(start, end, keyword="华为", columns=("ranks",)), repeat)
+    index_ms = _timed(lambda: parser.read_titles_for_range(start, end), repeat)
+    print(
+        f"{len(dates)} 天: 列式 {columnar_ms:.0f} ms（关键词 {keyword_ms:.0f} ms），"
+        f"标题索引 {index_ms:.0f} ms"
+    )
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description="distinct_titles 差异校验 / 基准测试")
+    arg_parser.add_argument("--days", type=int, default=10, help="生成的天数")
+    arg_parser.add_argument("--items", type=int, default=120, help="每个平台每轮的条目数")
+    arg_parser.add_argument("--crawls", type=int, default=3, help="每天的抓取轮数")
+    arg_parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="基准测试重复次数（取最快一次）")
+    args = arg_parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="columnar-check-"))
+    try:
+        dates = generate(root / "output", args.days, args.items, args.crawls, args.seed)
+        parser = ParserService(str(root))
+        if not parser.columnar_stores:
+            print("未安装 pyarrow，列式路径不可用")
+            return 1
+        status = run_check(parser, dates)
+        if status == 0:
+            run_bench(parser, dates, args.repeat)
+        return status
+    finally:
+        get_cache().clear()
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
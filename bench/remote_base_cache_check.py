@@ -0,0 +1,169 @@
+# coding=utf-8
+"""
+远程存储基线缓存的校验与下载量统计
+
+不配置基线缓存时，每次运行都要下载完整的当天数据库（delta 模式下还有全部增量段）；
+配置 base_cache_dir 后，远程基线 ETag 未变化时只下载增量段。本脚本：
+
+- 模拟多次运行：每次新建 RemoteStorageBackend（新的临时目录，与 GitHub Actions 一样不保留数据目录），
+  写入一轮新闻后上传并 cleanup
+- 对 full / delta 两种复制模式，分别统计不缓存与缓存基线时的下载字节数和耗时
+- 最后用不带缓存的后端重新下载，校验与最后一次运行的本地数据库完全一致
+
+需要一个可写的 S3 兼容存储桶（建议使用 MinIO 或专用的测试桶），连接参数取自环境变量
+S3_ENDPOINT_URL / S3_BUCKET_NAME / S3_ACCESS_KEY_ID / S3_SECRET_ACCESS_KEY / S3_REGION。
+脚本只写入并在结束时删除 --date 指定日期（默认 2000-01-01）的对象：
+
+    python bench/remote_base_cache_check.py
+    python bench/remote_base_cache_check.py --crawls 24 --items 300 --modes delta
+
+重新下载的数据库与本地不一致时以非零状态退出。
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from trendradar.storage.base import NewsData, NewsItem  # noqa: E402
+from trendradar.storage.remote import RemoteStorageBackend  # noqa: E402
+
+
+def create_backend(replication: str, base_cache_dir: Optional[str]) -> RemoteStorageBackend:
+    return RemoteStorageBackend(
+        bucket_name=os.environ["S3_BUCKET_NAME"],
+        access_key_id=os.environ["S3_ACCESS_KEY_ID"],
+        secret_access_key=os.environ["S3_SECRET_ACCESS_KEY"],
+        endpoint_url=os.environ["S3_ENDPOINT_URL"],
+        region=os.environ.get("S3_REGION", ""),
+        enable_html=False,
+        replication=replication,
+        base_cache_dir=base_cache_dir,
+    )
+
+
+def delete_remote(date: str) -> None:
+    """删除该日期的远程数据库、增量段与归档"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        backend = create_backend("full", None)
+        keys = [
+            key
+            for db_type in ("news", "rss")
+            for key in backend._list_objects(f"{db_type}/{date}.db")
+        ]
+        if keys:
+            backend._delete_objects(keys)
+        backend.cleanup()
+
+
+def simulate(date: str, replication: str, crawls: int, items: int, use_cache: bool, seed: int) -> Dict:
+    """模拟多次运行，返回下载字节数、耗时与一致性校验结果"""
+    rng = random.Random(seed)
+    cache_dir = tempfile.mkdtemp(prefix="base-cache-") if use_cache else None
+    downloaded = 0
+    elapsed = 0.0
+    last_db = b""
+
+    delete_remote(date)
+    try:
+        for crawl in range(crawls):
+            crawl_time = f"{crawl // 4:02d}-{crawl % 4 * 15:02d}"
+            news = {
+                f"p{platform}": [
+                    NewsItem(
+                        title=f"标题{platform}-{rng.randint(0, items * 2)}",
+                        source_id=f"p{platform}",
+                        source_name=f"平台{platform}",
+                        rank=rank + 1,
+                        url=f"https://example.com/{platform}/{rng.randint(0, items * 2)}",
+                        crawl_time=crawl_time,
+                    )
+                    for rank in range(items)
+                ]
+                for platform in range(10)
+            }
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                backend = create_backend(replication, cache_dir)
+                fetch_db = backend._fetch_db
+
+                def counting_fetch(*args, **kwargs):
+                    nonlocal downloaded
+                    replica = fetch_db(*args, **kwargs)
+                    if replica:
+                        downloaded += replica["downloaded_bytes"]
+                    return replica
+
+                backend._fetch_db = counting_fetch
+                start = time.perf_counter()
+                saved = backend.save_news_data(NewsData(
+                    date=date,
+                    crawl_time=crawl_time,
+                    items=news,
+                    id_to_name={platform_id: platform_id for platform_id in news},
+                    failed_ids=[],
+                ))
+                elapsed += time.perf_counter() - start
+                last_db = backend._get_local_db_path(date, "news").read_bytes()
+                backend.cleanup()
+            if not saved:
+                raise RuntimeError(f"第 {crawl + 1} 次运行保存失败")
+
+        # 不带缓存重新下载，校验远程内容
+        check_path = Path(tempfile.mkdtemp(prefix="base-cache-check-")) / "news.db"
+        with contextlib.redirect_stdout(io.StringIO()):
+            backend = create_backend(replication, None)
+            backend.download_db(date, "news", str(check_path))
+            backend.cleanup()
+        same = check_path.exists() and check_path.read_bytes() == last_db
+        shutil.rmtree(check_path.parent, ignore_errors=True)
+    finally:
+        if cache_dir:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        delete_remote(date)
+
+    return {"downloaded": downloaded, "elapsed": elapsed, "same": same, "db_size": len(last_db)}
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description="远程存储基线缓存校验 / 下载量统计")
+    arg_parser.add_argument("--date", default="2000-01-01", help="写入的测试日期（结束时删除）")
+    arg_parser.add_argument("--crawls", type=int, default=12, help="模拟的运行次数")
+    arg_parser.add_argument("--items", type=int, default=150, help="每个平台每轮的条目数")
+    arg_parser.add_argument("--modes", nargs="+", default=["full", "delta"], help="复制模式")
+    arg_parser.add_argument("--seed", type=int, default=1, help="随机种子")
+    args = arg_parser.parse_args()
+
+    missing = [
+        name for name in ("S3_ENDPOINT_URL", "S3_BUCKET_NAME", "S3_ACCESS_KEY_ID", "S3_SECRET_ACCESS_KEY")
+        if not os.environ.get(name)
+    ]
+    if missing:
+        print(f"缺少环境变量: {', '.join(missing)}")
+        return 1
+
+    status = 0
+    for replication in args.modes:
+        for use_cache in (False, True):
+            result = simulate(args.date, replication, args.crawls, args.items, use_cache, args.seed)
+            print(
+                f"{replication:<5} {'缓存基线' if use_cache else '不缓存  '}: {args.crawls} 次运行共下载 "
+                f"{result['downloaded'] / 1024 / 1024:.1f} MB（数据库 {result['db_size'] / 1024 / 1024:.1f} MB），"
+                f"耗时 {result['elapsed']:.1f}s，重新下载{'一致' if result['same'] else '不一致'}"
+            )
+            if not result["same"]:
+                status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,397 @@
+# coding=utf-8
+"""
+RSS 快速解析路径的差异校验与基准测试
+
+RSSParser 对标准 RSS 2.0 / Atom 文档使用流式 XML 解析（_iter_xml_entries），
+输出必须与 feedparser 路径完全一致。本脚本：
+
+- 差异校验：随机生成 RSS 2.0 / Atom 文档（HTML、实体、CDATA、guid、作者、
+  各种日期格式、多链接，以及会触发回退的 xml:base、media:*、RDF、
+  不规则 HTML、格式错误的 XML 等结构），
+  分别用快速路径与 feedparser 路径解析，逐条比较 ParsedRSSItem
+- 基准测试：生成类似 WordPress / Atom 导出的大文档，比较两条路径的耗时
+
+升级 feedparser 或修改快速路径的回退规则后运行：
+
+    python bench/rss_parser_check.py                 # 差异校验（默认 2000 个文档）
+    python bench/rss_parser_check.py --docs 10000 --seed 7
+    python bench/rss_parser_check.py --bench         # 基准测试
+
+存在差异时打印第一个不一致的文档并以非零状态退出。
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import feedparser  # noqa: E402
+
+from trendradar.crawler.rss.parser import (  # noqa: E402
+    ParsedRSSItem,
+    RSSParser,
+    _UnsupportedFeed,
+)
+
+
+# ---------- 随机文档生成 ----------
+
+_WORDS = [
+    "AI", "开源", "发布", "Python", "数据库", "性能", "安全", "漏洞", "更新", "Rust",
+    "云", "模型", "芯片", "市场", "报告", "新闻", "测试", "&amp;", "&lt;b&gt;", "&#8217;",
+    "&quot;引号&quot;", "R&amp;D", "C++", "x&lt;y", "&#x4E2D;", "emoji😀", "  多余   空白  ",
+]
+
+# 会让快速路径回退到 feedparser 的结构（每个文档至多注入一种）
+_RSS_TRIGGERS = ["media", "itunes", "dc_date", "no_link", "xml_base", "malformed", "html", "rdf"]
+_ATOM_TRIGGERS = ["xhtml", "src", "authors", "no_alternate", "nameless_author", "xml_base", "malformed", "html"]
+
+_RSS_DATES = [
+    "Mon, 06 Jan 2025 08:30:00 +0000",
+    "Tue, 07 Jan 2025 16:05:59 GMT",
+    "Wed, 08 Jan 2025 23:59:59 +0800",
+    "8 Jan 2025 12:00:00 -0500",
+    "Thu, 09 Jan 2025 01:02:03 EST",
+    "Fri, 10 Jan 2025 10:00 +0100",
+    "2025-01-11T09:00:00Z",
+    "2025-01-12 10:11:12",
+    "not a date",
+    "",
+]
+
+_ATOM_DATES = [
+    "2025-01-06T08:30:00Z",
+    "2025-01-07T16:05:59+08:00",
+    "2025-01-08T23:59:59.123-05:00",
+    "2025-01-09",
+    "2025-01-10T10:00:00",
+    "garbage",
+]
+
+_HTML_SNIPPETS = [
+    "<p>段落 <b>加粗</b> 与 <a href=\"https://example.com\">链接</a></p>",
+    "<script>alert(1)</script>正文",
+    "<style>p{color:red}</style><div>样式之后</div>",
+    "<img src=\"x.png\" alt=\"图\"/>图片说明",
+    "纯文本 &amp; 实体 &lt;tag&gt;",
+    "<ul><li>一</li><li>二</li></ul>",
+    "<applet code=\"x\">旧</applet>剩余",
+    "<p class='a'>单引号属性</p>",
+    "<br/>换行<br>",
+    "<!-- 注释 -->注释之后",
+    "<p>未闭合标签",
+    "&nbsp;&copy;&#8217;&amp;amp; 裸 & 符号",
+    "<SCRIPT type=\"text/javascript\">var a = 1 < 2;</SCRIPT>大写",
+]
+
+# feedparser 清理结果难以复现的 HTML（快速路径应回退）
+_IRREGULAR_HTML = [
+    "<a title=\"a>b\" href=\"https://example.com\">属性中的 &gt;</a>",
+    "x < y 与 a<b",
+    "<!DOCTYPE html>声明",
+]
+
+
+def _text(rng: random.Random, low: int = 1, high: int = 8) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(low, high)))
+
+
+def _escaped_html(rng: random.Random, trigger: Optional[str] = None) -> str:
+    """描述内容：CDATA 或转义后的 HTML"""
+    body = " ".join(
+        rng.choice(_HTML_SNIPPETS) if rng.random() < 0.7 else _text(rng, 1, 3)
+        for _ in range(rng.randint(1, 4))
+    )
+    if trigger == "html" and rng.random() < 0.3:
+        body += rng.choice(_IRREGULAR_HTML)
+    if rng.random() < 0.5:
+        return f"<![CDATA[{body}]]>"
+    return body.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _rss_item(rng: random.Random, index: int, trigger: Optional[str]) -> str:
+    parts = [f"<title>{_text(rng)}</title>"]
+    url = f"https://example.com/post/{index}?utm={rng.randint(1, 9)}"
+    # 没有 link 时，isPermaLink 不为 false 的 guid 作为链接
+    guid_mode = rng.choice(["none", "permalink", "default", "not_permalink"])
+    if trigger == "no_link" and rng.random() < 0.5:
+        guid_mode = rng.choice(["none", "not_permalink"])
+    elif guid_mode in ("none", "not_permalink") or rng.random() < 0.7:
+        parts.append(f"<link>{url}</link>")
+    if guid_mode != "none":
+        permalink = {"permalink": ' isPermaLink="true"', "default": "", "not_permalink": ' isPermaLink="false"'}[guid_mode]
+        guid = url if guid_mode != "not_permalink" else f"tag:example.com,2025:{index}"
+        parts.append(f"<guid{permalink}>{guid}</guid>")
+    date_mode = rng.random()
+    if date_mode < 0.75:
+        parts.append(f"<pubDate>{rng.choice(_RSS_DATES)}</pubDate>")
+    elif date_mode < 0.9:
+        parts.append(f"<dc:date>{rng.choice(_ATOM_DATES)}</dc:date>")
+    if trigger == "dc_date" and rng.random() < 0.5:
+        parts.append(f"<pubDate>{rng.choice(_RSS_DATES)}</pubDate>")
+        parts.append(f"<dc:date>{rng.choice(_ATOM_DATES)}</dc:date>")
+    if rng.random() < 0.8:
+        parts.append(f"<description>{_escaped_html(rng, trigger)}</description>")
+    if rng.random() < 0.3:
+        parts.append(f"<content:encoded>{_escaped_html(rng, trigger)}</content:encoded>")
+    author_mode = rng.random()
+    if author_mode < 0.3:
+        parts.append(f"<author>editor{index}@example.com (编辑 {index})</author>")
+    elif author_mode < 0.6:
+        parts.append(f"<dc:creator>{_text(rng, 1, 2)}</dc:creator>")
+    for _ in range(rng.randint(0, 3)):
+        parts.append(f"<category>{_text(rng, 1, 1)}</category>")
+    if rng.random() < 0.1:
+        parts.append('<enclosure url="https://example.com/a.mp3" length="1" type="audio/mpeg"/>')
+    if trigger == "media" and rng.random() < 0.5:
+        parts.append('<media:content url="https://example.com/v.mp4"/>')
+    if trigger == "itunes" and rng.random() < 0.5:
+        parts.append("<itunes:duration>10:00</itunes:duration>")
+    rng.shuffle(parts)
+    base = ' xml:base="https://example.com/base/"' if trigger == "xml_base" and rng.random() < 0.5 else ""
+    return f"<item{base}>" + "".join(parts) + "</item>"
+
+
+def _atom_entry(rng: random.Random, index: int, trigger: Optional[str]) -> str:
+    parts = []
+    title_type = rng.choice(["", ' type="text"', ' type="html"'])
+    title = _text(rng)
+    if title_type == ' type="html"':
+        title = title.replace("&", "&amp;") + " &lt;em&gt;强调&lt;/em&gt;"
+    parts.append(f"<title{title_type}>{title}</title>")
+    parts.append(f"<id>urn:uuid:{index:08d}-0000</id>")
+    rels = rng.sample(["alternate", "alternate", "enclosure", "self", "related"], rng.randint(1, 3))
+    if trigger == "no_alternate" and rng.random() < 0.5:
+        rels = [rel for rel in rels if rel != "alternate"]
+    elif "alternate" not in rels:
+        rels.append("alternate")
+    for link_index, rel in enumerate(rels):
+        rel_attr = "" if rel == "alternate" and rng.random() < 0.5 else f' rel="{rel}"'
+        parts.append(f'<link{rel_attr} href="https://example.com/{rel}/{index}/{link_index}"/>')
+    if rng.random() < 0.8:
+        parts.append(f"<published>{rng.choice(_ATOM_DATES)}</published>")
+    if rng.random() < 0.8:
+        parts.append(f"<updated>{rng.choice(_ATOM_DATES)}</updated>")
+    if rng.random() < 0.7:
+        summary_type = rng.choice(["", ' type="text"', ' type="html"'])
+        if summary_type == ' type="html"':
+            parts.append(f"<summary{summary_type}>{_escaped_html(rng, trigger)}</summary>")
+        else:
+            parts.append(f"<summary{summary_type}>{_text(rng, 3, 20)}</summary>")
+    if rng.random() < 0.3:
+        parts.append(f'<content type="html">{_escaped_html(rng, trigger)}</content>')
+    author_count = 2 if trigger == "authors" and rng.random() < 0.5 else rng.choice([0, 1, 1])
+    for author_index in range(author_count):
+        email = f"<email>a{author_index}@example.com</email>" if rng.random() < 0.4 else ""
+        name = "" if trigger == "nameless_author" and rng.random() < 0.5 else f"<name>{_text(rng, 1, 2)}</name>"
+        parts.append(f"<author>{name}{email}</author>")
+    if rng.random() < 0.2:
+        parts.append(f'<category term="{rng.choice(["tech", "news"])}"/>')
+    if trigger == "xhtml" and rng.random() < 0.5:
+        parts.append('<content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">x</div></content>')
+    if trigger == "src" and rng.random() < 0.5:
+        parts.append('<content src="https://example.com/body"/>')
+    rng.shuffle(parts)
+    base = ' xml:base="https://example.com/base/"' if trigger == "xml_base" and rng.random() < 0.5 else ""
+    return f"<entry{base}>" + "".join(parts) + "</entry>"
+
+
+def random_feed(rng: random.Random) -> str:
+    """
+    生成一个随机 RSS 2.0 / Atom / RDF 文档
+
+    约 75% 的文档只包含快速路径支持的结构，其余注入一种回退结构
+    （包括格式错误的 XML），用于同时检验回退判断本身。
+    """
+    is_rss = rng.random() < 0.5
+    trigger = None
+    if rng.random() < 0.25:
+        trigger = rng.choice(_RSS_TRIGGERS if is_rss else _ATOM_TRIGGERS)
+    count = rng.randint(0, 30)
+
+    if trigger == "rdf":
+        items = "".join(
+            f'<item rdf:about="https://example.com/{i}"><title>{_text(rng)}</title>'
+            f"<link>https://example.com/{i}</link></item>"
+            for i in range(count)
+        )
+        doc = (
+            '<?xml version="1.0"?><rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"'
+            ' xmlns="http://purl.org/rss/1.0/">'
+            f'<channel rdf:about="https://example.com/"><title>t</title></channel>{items}</rdf:RDF>'
+        )
+    elif is_rss:
+        items = "".join(_rss_item(rng, i, trigger) for i in range(count))
+        doc = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"'
+            ' xmlns:dc="http://purl.org/dc/elements/1.1/"'
+            ' xmlns:media="http://search.yahoo.com/mrss/"'
+            ' xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd">'
+            f"<channel><title>{_text(rng, 1, 3)}</title><link>https://example.com/</link>"
+            f"{items}</channel></rss>"
+        )
+    else:
+        entries = "".join(_atom_entry(rng, i, trigger) for i in range(count))
+        doc = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom">'
+            f"<title>{_text(rng, 1, 3)}</title><id>urn:feed</id>"
+            f"<updated>2025-01-06T00:00:00Z</updated>{entries}</feed>"
+        )
+
+    if trigger == "malformed":
+        # 截断或插入 XML 未定义的 HTML 实体
+        if rng.random() < 0.5 and len(doc) > 20:
+            doc = doc[: rng.randint(10, len(doc) - 1)]
+        else:
+            doc = doc.replace("</title>", "&nbsp;</title>", 1)
+    if rng.random() < 0.05:
+        doc = "\ufeff\n  " + doc
+    return doc
+
+
+# ---------- 两条解析路径 ----------
+
+def parse_fast(parser: RSSParser, content: str) -> Optional[List[ParsedRSSItem]]:
+    """只走快速路径，快速路径不支持时返回 None"""
+    try:
+        entries = list(parser._iter_xml_entries(content))
+    except Exception as e:
+        if isinstance(e, _UnsupportedFeed) or type(e).__name__ == "ParseError":
+            return None
+        raise
+    return [item for item in (parser._parse_entry(entry) for entry in entries) if item]
+
+
+def parse_feedparser(parser: RSSParser, content: str) -> List[ParsedRSSItem]:
+    """只走 feedparser 路径（与 RSSParser.parse 的回退分支一致）"""
+    feed = feedparser.parse(content)
+    return [item for item in (parser._parse_entry(entry) for entry in feed.entries) if item]
+
+
+def run_check(docs: int, seed: int) -> int:
+    """差异校验，返回不一致的文档数"""
+    rng = random.Random(seed)
+    parser = RSSParser()
+    fast_docs = fallback_docs = compared_items = 0
+
+    for doc_index in range(docs):
+        content = random_feed(rng)
+        fast = parse_fast(parser, content)
+        if fast is None:
+            fallback_docs += 1
+            continue
+
+        fast_docs += 1
+        reference = parse_feedparser(parser, content)
+        compared_items += len(reference)
+        if fast != reference:
+            print(f"第 {doc_index} 个文档结果不一致（seed={seed}）")
+            for index, (a, b) in enumerate(zip(fast, reference)):
+                if a != b:
+                    print(f"  条目 {index}:\n    快速路径:   {a}\n    feedparser: {b}")
+                    break
+            else:
+                print(f"  条目数不同: 快速路径 {len(fast)}，feedparser {len(reference)}")
+            print("  文档:")
+            print(content)
+            return 1
+
+    print(
+        f"差异校验通过：{docs} 个文档，快速路径处理 {fast_docs} 个（比较 {compared_items} 条），"
+        f"回退到 feedparser {fallback_docs} 个"
+    )
+    return 0
+
+
+# ---------- 基准测试 ----------
+
+def _wordpress_feed(items: int) -> str:
+    rng = random.Random(1)
+    body = "".join(
+        f"<item><title>{_text(rng, 5, 12)}</title>"
+        f"<link>https://blog.example.com/{i}/</link>"
+        f"<dc:creator><![CDATA[作者 {i % 7}]]></dc:creator>"
+        f"<pubDate>Mon, 06 Jan 2025 {i % 24:02d}:{i % 60:02d}:00 +0000</pubDate>"
+        "<category><![CDATA[技术]]></category>"
+        f'<guid isPermaLink="false">https://blog.example.com/?p={i}</guid>'
+        f"<description><![CDATA[{_text(rng, 30, 60)}]]></description>"
+        f"<content:encoded><![CDATA[{''.join(f'<p>{_text(rng, 60, 130)}</p>' for _ in range(3))}]]></content:encoded>"
+        "</item>"
+        for i in range(items)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"'
+        ' xmlns:content="http://purl.org/rss/1.0/modules/content/"'
+        ' xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        f"<channel><title>Blog</title><link>https://blog.example.com/</link>{body}</channel></rss>"
+    )
+
+
+def _atom_export(entries: int) -> str:
+    rng = random.Random(2)
+    body = "".join(
+        f"<entry><title>{_text(rng, 5, 12)}</title><id>urn:uuid:{i}</id>"
+        f'<link href="https://example.com/{i}"/><updated>2025-01-06T{i % 24:02d}:00:00Z</updated>'
+        f"<author><name>作者 {i % 5}</name></author>"
+        f'<summary type="html">{_text(rng, 40, 80).replace("&", "&amp;")}</summary></entry>'
+        for i in range(entries)
+    )
+    return f'<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom"><title>t</title>{body}</feed>'
+
+
+def _timed(func, repeat: int) -> Tuple[float, int]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, len(result)
+
+
+def run_bench(repeat: int) -> int:
+    parser = RSSParser()
+    for name, content in (
+        ("RSS, 500 items", _wordpress_feed(500)),
+        ("Atom, 2000 entries", _atom_export(2000)),
+    ):
+        size_mb = len(content.encode("utf-8")) / 1024 / 1024
+        fp_ms, fp_count = _timed(lambda: parse_feedparser(parser, content), repeat)
+        fast_ms, fast_count = _timed(lambda: parser.parse(content), repeat)
+        capped_ms, _ = _timed(lambda: parser.parse(content, max_items=50), repeat)
+        fast = parse_fast(parser, content)
+        if fast is None:
+            print(f"{name}: 快速路径不支持该文档（回退到 feedparser），基准无效")
+            return 1
+        same = fast == parse_feedparser(parser, content)
+        print(
+            f"{name} ({size_mb:.1f} MB): feedparser {fp_ms:.0f} ms ({fp_count} 条), "
+            f"快速路径 {fast_ms:.0f} ms ({fast_count} 条), max_items=50 {capped_ms:.0f} ms, "
+            f"结果{'一致' if same else '不一致'}"
+        )
+        if not same:
+            return 1
+    return 0
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description="RSS 快速解析路径差异校验 / 基准测试")
+    arg_parser.add_argument("--docs", type=int, default=2000, help="差异校验的随机文档数")
+    arg_parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    arg_parser.add_argument("--bench", action="store_true", help="运行基准测试")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="基准测试重复次数（取最快一次）")
+    args = arg_parser.parse_args()
+
+    if args.bench:
+        return run_bench(args.repeat)
+    return run_check(args.docs, args.seed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
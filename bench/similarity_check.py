@@ -0,0 +1,178 @@
+# coding=utf-8
+"""
+相似标题聚类（MinHash/LSH）与逐对比较的召回校验与基准测试
+
+cluster_similar 只比较 LSH 候选，结果不会出现误报，但可能漏掉部分相似对；
+漏报率由 num_perm / bands 决定（aggregate_news 的 match_mode 即 CLUSTER_MODES 中的档位）。本脚本：
+
+- 生成带标签的样本：每个"故事"一个基础标题，加上若干平台风格的改写
+  （替换 / 插入 / 删除字符，添加"快讯："之类前缀或"｜视频"之类后缀）
+- 用逐对比较 SequenceMatcher 的贪心聚类作为参照，对每个阈值与每组 num_perm / bands：
+  - 召回：参照中的 (代表, 成员) 对被 LSH 聚类复现的比例
+  - 标签召回：同一故事的标题对被分到同一组的比例（参照与 LSH 分别计算）
+  - 校验 LSH 聚类中每个成员与代表的相似度都达到阈值（无误报），
+    exact 模式（exhaustive=True）与参照完全一致
+  - 耗时
+
+修改 MinHashLSH / cluster_similar 或调整 CLUSTER_MODES 后运行：
+
+    python bench/similarity_check.py                      # 默认 500 个故事（约 1.5k 个标题）
+    python bench/similarity_check.py --stories 1500 --thresholds 0.5 0.7 0.8
+
+发现误报或 exact 模式与参照不一致时以非零状态退出。
+"""
+
+import argparse
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mcp_server.utils.similarity import CLUSTER_MODES, cluster_similar  # noqa: E402
+
+
+_VOCAB = [chr(code) for code in range(0x4E00, 0x4E00 + 1500)]
+_COMMON = list("的了在是我有和就不人都一上也很到说要去你会着没看好自己这中国大新美日年月")
+_PREFIXES = ["突发！", "快讯：", "最新：", "【热议】"]
+_SUFFIXES = ["｜视频", "（图）", "，网友热议", " - 新闻"]
+
+# 除 CLUSTER_MODES 外额外比较的 (num_perm, bands)
+_EXTRA_SETTINGS = [(32, 32), (64, 16), (128, 64)]
+
+
+def generate(stories: int, seed: int) -> Tuple[List[str], List[int]]:
+    """生成带标签的标题样本，返回 (标题列表, 故事编号列表)"""
+    rng = random.Random(seed)
+
+    def base() -> str:
+        return "".join(
+            rng.choice(_VOCAB) if rng.random() < 0.75 else rng.choice(_COMMON)
+            for _ in range(rng.randint(12, 30))
+        )
+
+    def variant(title: str) -> str:
+        chars = list(title)
+        for _ in range(rng.randint(0, 3)):
+            op, index = rng.random(), rng.randrange(len(chars))
+            if op < 0.4:
+                chars[index] = rng.choice(_VOCAB)
+            elif op < 0.7:
+                chars.insert(index, rng.choice(_VOCAB))
+            elif len(chars) > 6:
+                del chars[index]
+        title = "".join(chars)
+        decoration = rng.random()
+        if decoration < 0.2:
+            title = rng.choice(_PREFIXES) + title
+        elif decoration < 0.35:
+            title = title + rng.choice(_SUFFIXES)
+        return title
+
+    samples = []
+    for story in range(stories):
+        title = base()
+        samples.append((title, story))
+        for _ in range(rng.randint(0, 4)):
+            samples.append((variant(title), story))
+    rng.shuffle(samples)
+    return [title for title, _ in samples], [story for _, story in samples]
+
+
+def pairwise_clusters(texts: List[str], threshold: float) -> List[List[int]]:
+    """参照实现：逐对比较 SequenceMatcher.ratio 的贪心聚类"""
+    used = [False] * len(texts)
+    groups = []
+    for i in range(len(texts)):
+        if used[i]:
+            continue
+        used[i] = True
+        group = [i]
+        for j in range(len(texts)):
+            if not used[j] and SequenceMatcher(None, texts[i], texts[j]).ratio() >= threshold:
+                used[j] = True
+                group.append(j)
+        groups.append(group)
+    return groups
+
+
+def _member_pairs(groups: List[List[int]]) -> Set[Tuple[int, int]]:
+    return {(group[0], member) for group in groups for member in group[1:]}
+
+
+def _label_recall(groups: List[List[int]], labels: List[int]) -> float:
+    """同一故事的标题对被分到同一组的比例"""
+    cluster_of = {member: index for index, group in enumerate(groups) for member in group}
+    by_story: Dict[int, List[int]] = {}
+    for index, story in enumerate(labels):
+        by_story.setdefault(story, []).append(index)
+    total = together = 0
+    for members in by_story.values():
+        for a, b in combinations(members, 2):
+            total += 1
+            together += cluster_of[a] == cluster_of[b]
+    return together / total if total else 1.0
+
+
+def run(stories: int, thresholds: List[float], seed: int) -> int:
+    texts, labels = generate(stories, seed)
+    print(f"样本：{stories} 个故事，{len(texts)} 个标题（seed={seed}）")
+
+    settings = [(name, params) for name, params in CLUSTER_MODES.items()]
+    settings += [(f"{num_perm}/{bands}", (num_perm, bands)) for num_perm, bands in _EXTRA_SETTINGS]
+
+    status = 0
+    for threshold in thresholds:
+        start = time.perf_counter()
+        reference = pairwise_clusters(texts, threshold)
+        reference_s = time.perf_counter() - start
+        reference_pairs = _member_pairs(reference)
+        print(
+            f"\n阈值 {threshold}: 逐对比较 {reference_s:.2f}s，{len(reference)} 组，"
+            f"标签召回 {_label_recall(reference, labels):.2%}"
+        )
+
+        for name, params in settings:
+            start = time.perf_counter()
+            if params is None:
+                groups = cluster_similar(texts, threshold, exhaustive=True)
+            else:
+                groups = cluster_similar(texts, threshold, num_perm=params[0], bands=params[1])
+            elapsed = time.perf_counter() - start
+
+            pairs = _member_pairs(groups)
+            false_merges = [
+                (rep, member) for rep, member in pairs
+                if SequenceMatcher(None, texts[rep], texts[member]).ratio() < threshold
+            ]
+            recall = len(pairs & reference_pairs) / len(reference_pairs) if reference_pairs else 1.0
+            label = f"{name} ({params[0]}/{params[1]})" if params and "/" not in name else name
+            print(
+                f"  {label:<18} {elapsed:6.2f}s  召回 {recall:.2%}  "
+                f"标签召回 {_label_recall(groups, labels):.2%}  {len(groups)} 组"
+                f"{'  与参照完全一致' if groups == reference else ''}"
+            )
+            if false_merges:
+                print(f"  误报: {len(false_merges)} 对，例如 {texts[false_merges[0][0]]!r} / {texts[false_merges[0][1]]!r}")
+                status = 1
+            if params is None and groups != reference:
+                print("  exact 模式与逐对比较结果不一致")
+                status = 1
+    return status
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description="相似标题聚类召回校验 / 基准测试")
+    arg_parser.add_argument("--stories", type=int, default=500, help="故事数（每个故事 1-5 个标题）")
+    arg_parser.add_argument("--thresholds", type=float, nargs="+", default=[0.5, 0.7, 0.8], help="相似度阈值")
+    arg_parser.add_argument("--seed", type=int, default=7, help="随机种子")
+    args = arg_parser.parse_args()
+    return run(args.stories, args.thresholds, args.seed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
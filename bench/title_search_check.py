@@ -0,0 +1,220 @@
+# coding=utf-8
+"""
+多日标题索引全文搜索（FTS5 trigram）的差异校验与基准测试
+
+DataService.search_news_by_keyword 改为先从 TitleIndex 的全文索引取候选后，
+结果必须与原来逐天 read_all_titles_for_date 扫描的实现完全一致。本脚本：
+
+- 在临时目录中用 LocalStorageBackend 生成多天的新闻数据库（含缺失日期、大小写混合的关键词）
+- 对不同关键词（3 个字符以上走全文索引，更短的走扫描；中文、英文大小写、不存在的词）
+  与平台过滤，比较 search_news_by_keyword 与逐天扫描参照实现的返回值
+- 比较逐天扫描、全文索引（已建立）的耗时，以及首次建立索引的耗时
+
+修改 TitleIndex / search_titles_for_range 后运行：
+
+    python bench/title_search_check.py
+    python bench/title_search_check.py --days 9 --items 200 --crawls 24
+
+存在差异时打印第一个不一致的查询并以非零状态退出。
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mcp_server.services.cache_service import get_cache  # noqa: E402
+from mcp_server.services.data_service import DataService  # noqa: E402
+from mcp_server.utils.errors import DataNotFoundError  # noqa: E402
+from trendradar.storage.base import NewsData, NewsItem  # noqa: E402
+from trendradar.storage.local import LocalStorageBackend  # noqa: E402
+
+
+_WORDS = ["华为", "DJI", "苹果", "AI", "特斯拉", "美国", "中国", "比赛", "天气", "股票",
+          "小米", "芯片", "的", "发布", "降价", "OpenAI", "ai"]
+
+_KEYWORDS = ["华为", "OpenAI", "openai", "AI芯片", "ai", "特斯拉降价", "DJI", "不存在的关键词"]
+
+
+def generate(output_dir: Path, days: int, items: int, crawls: int, seed: int) -> List[datetime]:
+    """生成测试数据，返回日期列表（倒数第 5 天缺失）"""
+    rng = random.Random(seed)
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    dates = [today - timedelta(days=offset) for offset in range(days - 1, -1, -1)]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        backend = LocalStorageBackend(data_dir=str(output_dir), enable_txt=False, enable_html=False)
+        for day_index, date in enumerate(dates):
+            if day_index == len(dates) - 5:
+                continue
+            date_str = date.strftime("%Y-%m-%d")
+            for crawl in range(crawls):
+                crawl_time = f"{crawl:02d}-00"
+                news = {
+                    f"p{platform}": [
+                        NewsItem(
+                            title="".join(rng.choice(_WORDS) for _ in range(4)) + str(i % 60),
+                            source_id=f"p{platform}",
+                            source_name=f"平台{platform}",
+                            rank=rng.randint(1, 50),
+                            url=f"https://example.com/{platform}/{i}",
+                            crawl_time=crawl_time,
+                        )
+                        for i in range(items)
+                    ]
+                    for platform in range(8)
+                }
+                backend.save_news_data(NewsData(
+                    date=date_str,
+                    crawl_time=crawl_time,
+                    items=news,
+                    id_to_name={platform_id: f"平台{platform_id[1:]}" for platform_id in news},
+                    failed_ids=[],
+                ))
+        backend.cleanup()
+    return dates
+
+
+def scan_search(
+    service: DataService,
+    keyword: str,
+    start_date: datetime,
+    end_date: datetime,
+    platforms: Optional[List[str]] = None,
+) -> Dict:
+    """参照实现：改用全文索引之前逐天 read_all_titles_for_date 扫描的 search_news_by_keyword"""
+    results = []
+    platform_distribution = Counter()
+
+    current_date = start_date
+    while current_date <= end_date:
+        try:
+            all_titles, id_to_name, _ = service.parser.read_all_titles_for_date(
+                date=current_date,
+                platform_ids=platforms
+            )
+            for platform_id, titles in all_titles.items():
+                platform_name = id_to_name.get(platform_id, platform_id)
+                for title, info in titles.items():
+                    if keyword.lower() in title.lower():
+                        avg_rank = sum(info["ranks"]) / len(info["ranks"]) if info["ranks"] else 0
+                        results.append({
+                            "title": title,
+                            "platform": platform_id,
+                            "platform_name": platform_name,
+                            "ranks": info["ranks"],
+                            "count": len(info["ranks"]),
+                            "avg_rank": round(avg_rank, 2),
+                            "url": info.get("url", ""),
+                            "mobileUrl": info.get("mobileUrl", ""),
+                            "date": current_date.strftime("%Y-%m-%d")
+                        })
+                        platform_distribution[platform_id] += 1
+        except DataNotFoundError:
+            pass
+        current_date += timedelta(days=1)
+
+    if not results:
+        raise DataNotFoundError(f"未找到包含关键词 '{keyword}' 的新闻")
+
+    total_ranks = [rank for item in results for rank in item["ranks"]]
+    avg_rank = sum(total_ranks) / len(total_ranks) if total_ranks else 0
+    return {
+        "results": results,
+        "total": len(results),
+        "total_found": len(results),
+        "statistics": {
+            "platform_distribution": dict(platform_distribution),
+            "avg_rank": round(avg_rank, 2),
+            "keyword": keyword
+        }
+    }
+
+
+def _run(func, *args):
+    """调用并把 DataNotFoundError 当作结果（两种实现都应在无结果时抛出）"""
+    try:
+        return func(*args)
+    except DataNotFoundError:
+        return "DataNotFoundError"
+
+
+def _timed(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        get_cache().clear()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _sorted_results(result):
+    """带平台过滤时逐天读取按 SQLite 索引顺序返回平台，只核对内容"""
+    if isinstance(result, str):
+        return result
+    return {**result, "results": sorted(result["results"], key=lambda item: (item["date"], item["platform"], item["title"]))}
+
+
+def run(root: Path, dates: List[datetime], repeat: int) -> int:
+    service = DataService(str(root))
+    start, end = dates[0], dates[-1]
+
+    # 首次建立索引（之后的查询只在数据库文件变化时重建对应日期）
+    get_cache().clear()
+    build_start = time.perf_counter()
+    service.parser.search_titles_for_range("华为", start, end)
+    build_ms = (time.perf_counter() - build_start) * 1000
+    print(f"{len(dates)} 天，首次建立索引 {build_ms:.0f} ms")
+
+    status = 0
+    for keyword in _KEYWORDS:
+        for platforms in (None, ["p1", "p5"]):
+            get_cache().clear()
+            expected = _run(scan_search, service, keyword, start, end, platforms)
+            get_cache().clear()
+            actual = _run(service.search_news_by_keyword, keyword, (start, end), platforms)
+            same = actual == expected if platforms is None else _sorted_results(actual) == _sorted_results(expected)
+
+            scan_ms = _timed(lambda: _run(scan_search, service, keyword, start, end, platforms), repeat)
+            index_ms = _timed(lambda: _run(service.search_news_by_keyword, keyword, (start, end), platforms), repeat)
+            found = expected["total_found"] if isinstance(expected, dict) else 0
+            print(
+                f"  {keyword!r:<12} platforms={platforms}: {found} 条，"
+                f"逐天扫描 {scan_ms:.0f} ms，全文索引 {index_ms:.0f} ms，结果{'一致' if same else '不一致'}"
+            )
+            if not same:
+                status = 1
+    return status
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description="标题全文搜索差异校验 / 基准测试")
+    arg_parser.add_argument("--days", type=int, default=9, help="生成的天数")
+    arg_parser.add_argument("--items", type=int, default=200, help="每个平台每轮的条目数")
+    arg_parser.add_argument("--crawls", type=int, default=2, help="每天的抓取轮数")
+    arg_parser.add_argument("--seed", type=int, default=5, help="随机种子")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="重复次数（取最快一次）")
+    args = arg_parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="title-search-check-"))
+    try:
+        dates = generate(root / "output", args.days, args.items, args.crawls, args.seed)
+        return run(root, dates, args.repeat)
+    finally:
+        get_cache().clear()
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
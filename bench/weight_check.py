@@ -0,0 +1,172 @@
+# coding=utf-8
+"""
+批量权重计算（trendradar.core.weight）的一致性校验与基准测试
+
+calculate_news_weights / sort_news_by_weight 必须与逐条调用 calculate_news_weight
+（原 analyzer 中的标量实现）以及原来的 sorted(...) 排序完全一致。本脚本：
+
+- 一致性校验：随机生成标题数据（空排名、缺少 count、超过 10 的排名、大量并列权重），
+  分别在使用 / 不使用 NumPy 时比较：
+  - 权重逐位相同（==）
+  - tie_break=True 与原报告排序 sorted(key=(-权重, 最小排名, -次数)) 的前 k 条相同
+  - tie_break=False 与原 MCP 排序 sorted(key=权重, reverse=True) 相同
+- 基准测试：大批量条目上比较原排序与批量排序（全部 / 只取前 top_k 条）的耗时
+
+修改 weight 模块后运行：
+
+    python bench/weight_check.py
+    python bench/weight_check.py --batches 1000 --seed 3
+    python bench/weight_check.py --bench --items 300000
+
+存在差异时打印第一个不一致的批次并以非零状态退出。
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import trendradar.core.weight as weight  # noqa: E402
+from trendradar.core.weight import (  # noqa: E402
+    calculate_news_weight,
+    calculate_news_weights,
+    sort_news_by_weight,
+)
+
+
+_WEIGHT_CONFIGS = [
+    {"RANK_WEIGHT": 0.6, "FREQUENCY_WEIGHT": 0.3, "HOTNESS_WEIGHT": 0.1},
+    {"RANK_WEIGHT": 0.4, "FREQUENCY_WEIGHT": 0.3, "HOTNESS_WEIGHT": 0.3},
+    {"RANK_WEIGHT": 1, "FREQUENCY_WEIGHT": 0, "HOTNESS_WEIGHT": 0.7},
+]
+
+
+def generate(rng: random.Random, count: int) -> List[Dict]:
+    items = []
+    for index in range(count):
+        ranks = [rng.choice([1, 2, 3, 5, 7, 10, 11, 30, 99]) for _ in range(rng.choice([0, 1, 1, 2, 3, 5, 12]))]
+        item = {"title": str(index), "ranks": ranks}
+        if rng.random() < 0.8:
+            item["count"] = rng.randint(1, 20) if ranks else 0
+        items.append(item)
+    return items
+
+
+def reference_sort(items: List[Dict], rank_threshold: int, weight_config: Dict) -> List[Dict]:
+    """原报告排序（count_word_frequency / convert_keyword_stats_to_platform_stats）"""
+    return sorted(
+        items,
+        key=lambda x: (
+            -calculate_news_weight(x, rank_threshold, weight_config),
+            min(x["ranks"]) if x["ranks"] else 999,
+            -x.get("count", len(x["ranks"])),
+        ),
+    )
+
+
+def reference_sort_by_weight(items: List[Dict], rank_threshold: int, weight_config: Dict) -> List[Dict]:
+    """原 MCP 排序（只按权重）"""
+    return sorted(items, key=lambda x: calculate_news_weight(x, rank_threshold, weight_config), reverse=True)
+
+
+def _titles(items: List[Dict]) -> List[str]:
+    return [item["title"] for item in items]
+
+
+def run_check(batches: int, seed: int) -> int:
+    rng = random.Random(seed)
+    has_numpy = weight.HAS_NUMPY
+    modes = [True, False] if has_numpy else [False]
+    if not has_numpy:
+        print("未安装 NumPy，只校验回退路径")
+
+    try:
+        for batch in range(batches):
+            items = generate(rng, rng.choice([5, 63, 64, 300, 2000]))
+            rank_threshold = rng.choice([1, 3, 5, 50])
+            weight_config = rng.choice(_WEIGHT_CONFIGS)
+            label = f"批次 {batch}（seed={seed}，{len(items)} 条，阈值 {rank_threshold}）"
+
+            expected_weights = [calculate_news_weight(item, rank_threshold, weight_config) for item in items]
+            expected_order = _titles(reference_sort(items, rank_threshold, weight_config))
+            expected_by_weight = _titles(reference_sort_by_weight(items, rank_threshold, weight_config))
+
+            for use_numpy in modes:
+                weight.HAS_NUMPY = use_numpy
+                path = "NumPy" if use_numpy else "逐条"
+
+                weights = calculate_news_weights(items, rank_threshold, weight_config)
+                if weights != expected_weights:
+                    index = next(i for i, (a, b) in enumerate(zip(weights, expected_weights)) if a != b)
+                    print(f"{label} [{path}]: 第 {index} 条权重 {weights[index]!r}，标量实现 {expected_weights[index]!r}")
+                    return 1
+
+                for top_k in (0, 1, 3, 10, len(items) + 1):
+                    actual = _titles(sort_news_by_weight(items, rank_threshold, weight_config, top_k=top_k))
+                    expected = expected_order[:top_k] if 0 < top_k < len(items) else expected_order
+                    if actual != expected:
+                        print(f"{label} [{path}]: top_k={top_k} 的排序与原排序不一致")
+                        return 1
+
+                actual = _titles(sort_news_by_weight(items, rank_threshold, weight_config, tie_break=False))
+                if actual != expected_by_weight:
+                    print(f"{label} [{path}]: tie_break=False 的排序与原 MCP 排序不一致")
+                    return 1
+    finally:
+        weight.HAS_NUMPY = has_numpy
+
+    print(f"一致性校验通过：{batches} 个批次，{'NumPy 与逐条两种路径' if has_numpy else '逐条路径'}")
+    return 0
+
+
+def _timed(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run_bench(count: int, top_k: int, repeat: int, seed: int) -> int:
+    items = generate(random.Random(seed), count)
+    weight_config = _WEIGHT_CONFIGS[0]
+    rank_threshold = 5
+    has_numpy = weight.HAS_NUMPY
+
+    print(f"{count} 条，NumPy {'已安装' if has_numpy else '未安装'}")
+    print(f"  原排序 sorted: {_timed(lambda: reference_sort(items, rank_threshold, weight_config), repeat):.0f} ms")
+    try:
+        for use_numpy in ([True, False] if has_numpy else [False]):
+            weight.HAS_NUMPY = use_numpy
+            path = "NumPy" if use_numpy else "逐条"
+            full_ms = _timed(lambda: sort_news_by_weight(items, rank_threshold, weight_config), repeat)
+            top_ms = _timed(lambda: sort_news_by_weight(items, rank_threshold, weight_config, top_k=top_k), repeat)
+            weights_ms = _timed(lambda: calculate_news_weights(items, rank_threshold, weight_config), repeat)
+            print(f"  [{path}] 全部排序 {full_ms:.0f} ms，前 {top_k} 条 {top_ms:.0f} ms，只算权重 {weights_ms:.0f} ms")
+    finally:
+        weight.HAS_NUMPY = has_numpy
+    return 0
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description="批量权重计算一致性校验 / 基准测试")
+    arg_parser.add_argument("--batches", type=int, default=300, help="随机批次数")
+    arg_parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    arg_parser.add_argument("--bench", action="store_true", help="运行基准测试")
+    arg_parser.add_argument("--items", type=int, default=300000, help="基准测试的条目数")
+    arg_parser.add_argument("--top-k", type=int, default=50, help="基准测试的 top_k")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="基准测试重复次数（取最快一次）")
+    args = arg_parser.parse_args()
+
+    if args.bench:
+        return run_bench(args.items, args.top_k, args.repeat, args.seed)
+    return run_check(args.batches, args.seed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
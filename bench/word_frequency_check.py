@@ -0,0 +1,237 @@
+# coding=utf-8
+"""
+count_word_frequency 与改写前实现的差异校验与基准测试
+
+count_word_frequency 改为一次匹配分配词组（WordGroupMatcher + 可选的 KeywordMatchIndex）后，
+统计结果与日志输出都必须与改写前逐词组匹配的实现完全一致。本脚本：
+
+- 从 git 读取改写前的 trendradar/core/analyzer.py（--baseline，默认为改写前的提交）作为参照
+- 用 config/frequency_words.txt 与按其词表随机拼接的标题，覆盖 daily / incremental / current 模式、
+  首次 / 非首次抓取、空词组配置、每个关键词的条数限制、按位置优先排序、quiet 开关，
+  比较 count_word_frequency 的返回值与打印的日志；再用新建 / 已填充的 KeywordMatchIndex 各比较一次
+- 同样比较 count_rss_frequency
+- 基准测试：比较两种实现在较大数据上的耗时
+
+修改 analyzer / frequency 后运行：
+
+    python bench/word_frequency_check.py
+    python bench/word_frequency_check.py --trials 20 --seed 3
+    python bench/word_frequency_check.py --bench --platforms 20 --titles 1000
+    python bench/word_frequency_check.py --baseline-file /path/to/old_analyzer.py
+
+存在差异时打印第一个不一致的参数组合并以非零状态退出。
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from trendradar.core import analyzer  # noqa: E402
+from trendradar.core.frequency import load_frequency_words  # noqa: E402
+from trendradar.core.keyword_index import KeywordMatchIndex, frequency_config_hash  # noqa: E402
+
+
+# 改为一次匹配分配词组之前的提交
+DEFAULT_BASELINE = "1de99f8^"
+
+_CONFIG_PATH = ROOT / "config" / "frequency_words.txt"
+
+_FILLER = ["的", "了", "新闻", "DJI", "苹果", "AI", "特斯拉", "美国", "中国", "比赛", "天气", "股票"]
+
+
+def load_baseline(revision: str, path: Optional[str]) -> types.ModuleType:
+    """载入改写前的 analyzer 模块（文件优先，否则从 git 读取）"""
+    if path:
+        source = Path(path).read_text(encoding="utf-8")
+        origin = path
+    else:
+        source = subprocess.run(
+            ["git", "show", f"{revision}:trendradar/core/analyzer.py"],
+            cwd=ROOT, check=True, capture_output=True, text=True, encoding="utf-8",
+        ).stdout
+        origin = f"{revision}:trendradar/core/analyzer.py"
+    module = types.ModuleType("baseline_analyzer")
+    module.__file__ = origin
+    exec(compile(source, origin, "exec"), module.__dict__)
+    return module
+
+
+def _vocabulary(word_groups: List[Dict], filter_words: List) -> List[str]:
+    words = list(_FILLER)
+    for group in word_groups:
+        for word in group["required"] + group["normal"]:
+            if not word["is_regex"]:
+                words.append(word["word"])
+    words.extend(item["word"] if isinstance(item, dict) else item for item in filter_words[:5])
+    return words
+
+
+def generate(rng: random.Random, vocabulary: List[str], platforms: int, titles: int) -> Tuple[Dict, Dict, Dict, Dict]:
+    """生成 (results, title_info, new_titles, id_to_name)"""
+    results: Dict = {}
+    title_info: Dict = {}
+    new_titles: Dict = {}
+    for platform in range(platforms):
+        source_id = f"s{platform}"
+        results[source_id] = {}
+        title_info[source_id] = {}
+        new_titles[source_id] = {}
+        for index in range(titles):
+            title = "".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 5))) + str(index % (titles // 2 or 1))
+            ranks = [rng.randint(1, 50) for _ in range(rng.randint(0, 4))]
+            results[source_id][title] = {"ranks": ranks, "url": f"u{title}", "mobileUrl": f"m{title}"}
+            title_info[source_id][title] = {
+                "first_time": "09-00",
+                "last_time": rng.choice(["10-00", "11-30", "12-00"]),
+                "count": rng.randint(1, 9),
+                "ranks": ranks,
+                "url": f"U{title}",
+            }
+            if rng.random() < 0.2:
+                new_titles[source_id][title] = {}
+    id_to_name = {source_id: f"平台{source_id[1:]}" for source_id in results}
+    return results, title_info, new_titles, id_to_name
+
+
+def _call(func, kwargs: Dict):
+    """调用并捕获打印的日志"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = func(**kwargs)
+    return result, output.getvalue()
+
+
+def run_check(baseline: types.ModuleType, trials: int, seed: int) -> int:
+    rng = random.Random(seed)
+    word_groups, filter_words, global_filters = load_frequency_words(str(_CONFIG_PATH))
+    vocabulary = _vocabulary(word_groups, filter_words)
+    configs = [
+        ("frequency_words.txt", word_groups, filter_words, global_filters),
+        ("空词组", [], [], global_filters),
+        ("无全局过滤词", word_groups, filter_words, None),
+    ]
+    compared = 0
+
+    for trial in range(trials):
+        results, title_info, new_titles, id_to_name = generate(rng, vocabulary, 8, 300)
+        for mode in ("daily", "incremental", "current"):
+            for first_crawl in (True, False):
+                for name, groups, filters, global_words in configs:
+                    kwargs = dict(
+                        results=results,
+                        word_groups=groups,
+                        filter_words=filters,
+                        id_to_name=id_to_name,
+                        title_info=title_info,
+                        new_titles=new_titles,
+                        mode=mode,
+                        global_filters=global_words,
+                        is_first_crawl_func=lambda first=first_crawl: first,
+                        max_news_per_keyword=trial % 3 * 5,
+                        sort_by_position_first=bool(trial % 2),
+                        quiet=bool(trial % 4 == 3),
+                    )
+                    label = f"trial {trial}（seed={seed}）mode={mode} first={first_crawl} 配置={name}"
+                    expected, expected_log = _call(baseline.count_word_frequency, kwargs)
+
+                    index = KeywordMatchIndex(frequency_config_hash(groups, filters, global_words))
+                    variants = [("", {}), ("（新建索引）", {"keyword_index": index}), ("（已填充索引）", {"keyword_index": index})]
+                    for suffix, extra in variants:
+                        actual, actual_log = _call(analyzer.count_word_frequency, {**kwargs, **extra})
+                        if actual != expected:
+                            print(f"{label}{suffix}: 返回值不一致")
+                            return 1
+                        if actual_log != expected_log:
+                            print(f"{label}{suffix}: 日志不一致\n--- 参照 ---\n{expected_log}\n--- 当前 ---\n{actual_log}")
+                            return 1
+                        compared += 1
+
+        items = [
+            {
+                "title": title,
+                "url": rng.choice(["", data["url"], "dup"]),
+                "feed_id": "f",
+                "published_at": f"2026-10-1{rng.randint(0, 9)}T00:00:00Z",
+            }
+            for titles in results.values()
+            for title, data in titles.items()
+        ]
+        for name, groups, filters, global_words in configs[:2]:
+            args = (items, groups, filters, global_words)
+            expected = baseline.count_rss_frequency(*args, new_items=items[:50], quiet=True)
+            if analyzer.count_rss_frequency(*args, new_items=items[:50], quiet=True) != expected:
+                print(f"trial {trial}（seed={seed}）count_rss_frequency 配置={name}: 返回值不一致")
+                return 1
+            compared += 1
+
+    print(f"差异校验通过：{trials} 轮，{compared} 组调用（返回值与日志）")
+    return 0
+
+
+def run_bench(baseline: types.ModuleType, platforms: int, titles: int, repeat: int) -> int:
+    word_groups, filter_words, global_filters = load_frequency_words(str(_CONFIG_PATH))
+    rng = random.Random(1)
+    results, title_info, new_titles, id_to_name = generate(
+        rng, _vocabulary(word_groups, filter_words), platforms, titles
+    )
+    kwargs = dict(
+        results=results,
+        word_groups=word_groups,
+        filter_words=filter_words,
+        id_to_name=id_to_name,
+        title_info=title_info,
+        new_titles=new_titles,
+        mode="current",
+        global_filters=global_filters,
+        is_first_crawl_func=lambda: False,
+        quiet=True,
+    )
+
+    def timed(func, extra: Dict) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(**kwargs, **extra)
+            best = min(best, time.perf_counter() - start)
+        return best * 1000
+
+    index = KeywordMatchIndex(frequency_config_hash(word_groups, filter_words, global_filters))
+    analyzer.count_word_frequency(**kwargs, keyword_index=index)
+
+    print(f"{platforms} 个平台 × {titles} 条标题，{len(word_groups)} 个词组")
+    print(f"  改写前: {timed(baseline.count_word_frequency, {}):.0f} ms")
+    print(f"  当前: {timed(analyzer.count_word_frequency, {}):.0f} ms")
+    print(f"  当前（已填充索引）: {timed(analyzer.count_word_frequency, {'keyword_index': index}):.0f} ms")
+    return 0
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description="count_word_frequency 差异校验 / 基准测试")
+    arg_parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="改写前实现所在的 git 版本")
+    arg_parser.add_argument("--baseline-file", help="改写前的 analyzer.py 文件（代替 --baseline）")
+    arg_parser.add_argument("--trials", type=int, default=6, help="随机数据轮数")
+    arg_parser.add_argument("--seed", type=int, default=1, help="随机种子")
+    arg_parser.add_argument("--bench", action="store_true", help="运行基准测试")
+    arg_parser.add_argument("--platforms", type=int, default=20, help="基准测试的平台数")
+    arg_parser.add_argument("--titles", type=int, default=1000, help="基准测试每个平台的标题数")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="基准测试重复次数（取最快一次）")
+    args = arg_parser.parse_args()
+
+    baseline = load_baseline(args.baseline, args.baseline_file)
+    if args.bench:
+        return run_bench(baseline, args.platforms, args.titles, args.repeat)
+    return run_check(baseline, args.trials, args.seed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
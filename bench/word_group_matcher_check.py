@@ -0,0 +1,253 @@
+# coding=utf-8
+"""
+WordGroupMatcher 的差异校验与基准测试
+
+WordGroupMatcher（Aho-Corasick + 正则预筛）必须与逐词检查的参考实现
+_matches_word_groups_linear 完全一致。本脚本：
+
+- 差异校验：
+  - 用 config/frequency_words.txt 与按其词表随机拼接的标题比较 matches 与命中的词组
+  - 随机生成词组配置（必须词、普通词、过滤词、全局过滤词、字面量交替正则、
+    一般正则、大小写、空配置等）与标题，逐条比较
+- 基准测试：对同一批标题比较参考实现与编译后匹配器的耗时
+
+修改 WordGroupMatcher 或频率词语法后运行：
+
+    python bench/word_group_matcher_check.py
+    python bench/word_group_matcher_check.py --configs 500 --seed 3
+    python bench/word_group_matcher_check.py --bench
+
+存在差异时打印第一个不一致的标题并以非零状态退出。
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from trendradar.core.frequency import (  # noqa: E402
+    WordGroupMatcher,
+    _matches_word_groups_linear,
+    _parse_word,
+    _word_matches,
+    load_frequency_words,
+)
+
+
+_CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "frequency_words.txt"
+
+_FILLER = list("的了是在一个新闻今天发布消息称表示公司市场") + [
+    "The ", "new ", "AI ", "model ", "said ", "report ", "Apple ", "market ", " ", "-", "2025",
+]
+
+
+def reference_groups(title, word_groups: List[Dict], filter_words: List, global_filters: Optional[List[str]]) -> List[int]:
+    """参考实现：命中的词组下标（标题被过滤或未命中时为空）"""
+    if not word_groups or not _matches_word_groups_linear(title, word_groups, filter_words, global_filters):
+        return []
+    title_lower = str(title).lower()
+    result = []
+    for index, group in enumerate(word_groups):
+        if group["required"] and not all(_word_matches(word, title_lower) for word in group["required"]):
+            continue
+        if group["normal"] and not any(_word_matches(word, title_lower) for word in group["normal"]):
+            continue
+        result.append(index)
+    return result
+
+
+def _config_vocabulary(rng: random.Random, word_groups: List[Dict], filter_words: List, global_filters: List[str]) -> List[str]:
+    """配置中出现的词（正则取其中一个交替分支），用于拼接会命中的标题"""
+    words = []
+    for group in word_groups:
+        for word in group["required"] + group["normal"]:
+            if word["is_regex"]:
+                words.append(rng.choice(word["word"].split("|")).replace("\\b", "").strip("()^$"))
+            else:
+                words.append(word["word"])
+    words.extend(item["word"] if isinstance(item, dict) else item for item in filter_words)
+    words.extend(global_filters)
+    return [word for word in words if word] or ["x"]
+
+
+def random_title(rng: random.Random, vocabulary: List[str]) -> str:
+    parts = [rng.choice(_FILLER) for _ in range(rng.randint(0, 12))]
+    for _ in range(rng.choice([0, 0, 1, 1, 2, 3])):
+        word = rng.choice(vocabulary)
+        if rng.random() < 0.3:
+            word = word.upper() if rng.random() < 0.5 else word.title()
+        parts.insert(rng.randint(0, len(parts)), word)
+    return "".join(parts)
+
+
+def random_config(rng: random.Random):
+    """随机词组配置（返回值与 load_frequency_words 相同）"""
+    vocabulary = [
+        "".join(rng.choice("abcdefgxyz中国美日科技AI") for _ in range(rng.randint(1, 4)))
+        for _ in range(rng.randint(5, 40))
+    ]
+
+    def word() -> Dict:
+        kind = rng.random()
+        if kind < 0.1:
+            # 字面量交替正则（字面量进入自动机）
+            choices = rng.sample(vocabulary, min(len(vocabulary), rng.randint(2, 4)))
+            return _parse_word("/" + "|".join(choices) + "/")
+        if kind < 0.15:
+            # 一般正则（合并预筛后逐个确认）
+            return _parse_word(rng.choice([
+                f"/{rng.choice(vocabulary)}\\d+/",
+                f"/^{rng.choice(vocabulary)}/",
+                f"/{rng.choice(vocabulary)}.{{0,3}}{rng.choice(vocabulary)}/",
+                f"/\\b{rng.choice(vocabulary)}\\b/i",
+            ]))
+        if kind < 0.2:
+            return _parse_word(rng.choice(vocabulary).upper() + " => 显示名")
+        return _parse_word(rng.choice(vocabulary))
+
+    word_groups = []
+    for index in range(rng.choice([0, 1, 3, 10, 40])):
+        word_groups.append({
+            "required": [word() for _ in range(rng.choice([0, 0, 1, 2]))],
+            "normal": [word() for _ in range(rng.choice([0, 1, 2, 4]))],
+            "group_key": f"g{index}",
+            "display_name": None,
+            "max_count": 0,
+        })
+    filter_words = [word() if rng.random() < 0.7 else rng.choice(vocabulary) for _ in range(rng.choice([0, 1, 3]))]
+    global_filters = [rng.choice(vocabulary) for _ in range(rng.choice([0, 0, 1, 2]))]
+    if rng.random() < 0.05:
+        global_filters.append("")
+    return word_groups, filter_words, global_filters or None, vocabulary
+
+
+def _compare(label: str, titles: List, word_groups, filter_words, global_filters) -> Optional[str]:
+    """比较一组标题，返回第一个不一致的描述"""
+    matcher = WordGroupMatcher(word_groups, filter_words, global_filters)
+    for title in titles:
+        expected = _matches_word_groups_linear(title, word_groups, filter_words, global_filters)
+        if matcher.matches(title) != expected:
+            return f"{label}: matches({title!r}) 为 {not expected}，参考实现为 {expected}"
+        expected_groups = reference_groups(title, word_groups, filter_words, global_filters)
+        actual_groups = matcher.match_group_indices(title)
+        if actual_groups != expected_groups:
+            return f"{label}: match_group_indices({title!r}) 为 {actual_groups}，参考实现为 {expected_groups}"
+    return None
+
+
+def run_check(configs: int, titles_per_config: int, seed: int) -> int:
+    rng = random.Random(seed)
+    compared = 0
+
+    # 项目自带的频率词配置
+    word_groups, filter_words, global_filters = load_frequency_words(str(_CONFIG_PATH))
+    vocabulary = _config_vocabulary(rng, word_groups, filter_words, global_filters)
+    titles = [random_title(rng, vocabulary) for _ in range(20000)] + ["", "  ", None, 123]
+    error = _compare(_CONFIG_PATH.name, titles, word_groups, filter_words, global_filters)
+    if error:
+        print(error)
+        return 1
+    compared += len(titles)
+
+    # 随机配置
+    for config_index in range(configs):
+        word_groups, filter_words, global_filters, vocabulary = random_config(rng)
+        titles = [random_title(rng, vocabulary) for _ in range(titles_per_config)]
+        error = _compare(f"随机配置 {config_index}（seed={seed}）", titles, word_groups, filter_words, global_filters)
+        if error:
+            print(error)
+            print(f"  词组: {[(g['required'], g['normal']) for g in word_groups]}")
+            print(f"  过滤词: {filter_words}  全局过滤词: {global_filters}")
+            return 1
+        compared += len(titles)
+
+    print(f"差异校验通过：{_CONFIG_PATH.name} + {configs} 个随机配置，比较 {compared} 个标题")
+    return 0
+
+
+def _synthetic_config(rng: random.Random, groups: int):
+    """大规模词组配置（约 300 个词组，部分含必须词与正则）"""
+    vocabulary = [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz中国美日韩科技") for _ in range(rng.randint(2, 5)))
+        for _ in range(1200)
+    ]
+    word_groups = []
+    for index in range(groups):
+        group = {
+            "required": [_parse_word(rng.choice(vocabulary))] if rng.random() < 0.2 else [],
+            "normal": [_parse_word(rng.choice(vocabulary)) for _ in range(rng.randint(1, 4))],
+            "group_key": f"g{index}",
+            "display_name": None,
+            "max_count": 0,
+        }
+        if rng.random() < 0.15:
+            group["normal"].append(_parse_word(f"/{rng.choice(vocabulary)}|{rng.choice(vocabulary)}/"))
+        word_groups.append(group)
+    filter_words = [_parse_word(rng.choice(vocabulary)) for _ in range(20)]
+    global_filters = [rng.choice(vocabulary) for _ in range(10)]
+    titles = [
+        "".join(rng.choice(vocabulary + ["的", "了", " "] * 50) for _ in range(rng.randint(5, 20)))
+        for _ in range(20000)
+    ]
+    return word_groups, filter_words, global_filters, titles
+
+
+def _timed(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run_bench(repeat: int) -> int:
+    rng = random.Random(1)
+    word_groups, filter_words, global_filters = load_frequency_words(str(_CONFIG_PATH))
+    vocabulary = _config_vocabulary(rng, word_groups, filter_words, global_filters)
+    cases = [
+        (_CONFIG_PATH.name, word_groups, filter_words, global_filters,
+         [random_title(rng, vocabulary) for _ in range(20000)]),
+        ("synthetic 300 groups", *_synthetic_config(rng, 300)),
+    ]
+
+    for name, groups, filters, global_words, titles in cases:
+        linear_ms = _timed(
+            lambda: [_matches_word_groups_linear(t, groups, filters, global_words) for t in titles], repeat
+        )
+        compile_start = time.perf_counter()
+        matcher = WordGroupMatcher(groups, filters, global_words)
+        compile_ms = (time.perf_counter() - compile_start) * 1000
+        compiled_ms = _timed(lambda: [matcher.matches(t) for t in titles], repeat)
+        same = all(
+            matcher.matches(t) == _matches_word_groups_linear(t, groups, filters, global_words) for t in titles
+        )
+        print(
+            f"{name}: {len(titles)} 个标题，参考实现 {linear_ms:.0f} ms，"
+            f"编译 {compile_ms:.1f} ms + 匹配 {compiled_ms:.0f} ms，结果{'一致' if same else '不一致'}"
+        )
+        if not same:
+            return 1
+    return 0
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description="WordGroupMatcher 差异校验 / 基准测试")
+    arg_parser.add_argument("--configs", type=int, default=300, help="随机词组配置数")
+    arg_parser.add_argument("--titles", type=int, default=200, help="每个随机配置的标题数")
+    arg_parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    arg_parser.add_argument("--bench", action="store_true", help="运行基准测试")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="基准测试重复次数（取最快一次）")
+    args = arg_parser.parse_args()
+
+    if args.bench:
+        return run_bench(args.repeat)
+    return run_check(args.configs, args.titles, args.seed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -718,7 +718,8 @@ async def aggregate_news(
     platforms: Optional[List[str]] = None,
     similarity_threshold: float = 0.7,
     limit: int = 50,
-    include_url: bool = False
+    include_url: bool = False,
+    match_mode: str = "balanced"
 ) -> str:
     """
     跨平台新闻聚合 - 对相似新闻进行去重合并
@@ -740,6 +741,11 @@ async def aggregate_news(
                               越高越严格（仅合并非常相似的标题）
         limit: 返回聚合新闻数量，默认50
         include_url: 是否包含URL链接，默认False
+        match_mode: 相似标题匹配模式（召回与耗时的取舍），默认 balanced
+            - fast: 最快，可能漏掉部分边缘相似标题
+            - balanced: 默认，适合大多数场景
+            - thorough: 召回更高，耗时约 2 倍
+            - exact: 逐对比较所有标题（结果精确，多日数据时很慢）
 
     Returns:
         JSON格式的聚合结果，包含：
@@ -757,6 +763,7 @@ async def aggregate_news(
     Examples:
         - aggregate_news()  # 聚合今天所有平台的新闻
         - aggregate_news(similarity_threshold=0.8)  # 更严格的相似度匹配
+        - aggregate_news(match_mode="thorough")  # 更少漏合并，耗时更长
         - aggregate_news(date_range={"start": "2025-01-01", "end": "2025-01-07"})
 
     **重要：数据展示策略**
@@ -771,7 +778,8 @@ async def aggregate_news(
         platforms=platforms,
         similarity_threshold=similarity_threshold,
         limit=limit,
-        include_url=include_url
+        include_url=include_url,
+        match_mode=match_mode
     )
     return json.dumps(result, ensure_ascii=False, indent=2)
 
@@ -1066,7 +1074,8 @@ async def sync_from_remote(
     从远程存储拉取数据到本地
 
     用于 MCP Server 等场景：爬虫存到远程云存储（如 Cloudflare R2），
-    MCP Server 拉取到本地进行分析查询。
+    MCP Server 拉取到本地进行分析查询。新闻与 RSS 数据库并发下载；
+    远程未更新的日期自动跳过，之前拉取过但远程已更新的日期（如今天）会重新下载。
 
     Args:
         days: 拉取最近 N 天的数据，默认 7 天
@@ -1079,8 +1088,9 @@ async def sync_from_remote(
         - success: 是否成功
         - synced_files: 成功同步的文件数量
         - synced_dates: 成功同步的日期列表
-        - skipped_dates: 跳过的日期（本地已存在）
+        - skipped_dates: 跳过的日期（远程无更新，或本地文件已被本地写入修改）
         - failed_dates: 失败的日期及错误信息
+        - bytes_downloaded / bytes_saved: 下载字节数 / 跳过未变化文件节省的字节数
         - message: 操作结果描述
 
     Examples:
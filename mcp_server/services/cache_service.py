@@ -1,14 +1,49 @@
 """
 缓存服务
 
-实现TTL缓存机制，提升数据访问性能。
+实现有界的 LRU + TTL 缓存，提升数据访问性能：
+- 条目数与估算字节数双重上限，超出时按最近最少使用淘汰
+- 每个命名空间（缓存 key 中第一个冒号之前的部分，见 make_cache_key）有默认 TTL，
+  过期条目除读取时删除外，还会定期主动清理
+- 按命名空间统计命中、未命中、淘汰、过期次数（系统状态工具中展示）
+- get_or_compute 提供 single-flight：并发的相同请求只计算一次
+- 条目可以依赖数据文件（见 snapshot_files），文件变化（新一轮爬取写入）时立即失效；
+  带依赖的条目默认不过期，历史日期的数据一直缓存到被 LRU 淘汰
 """
 
 import hashlib
 import json
+import sys
 import time
-from typing import Any, Optional
-from threading import Lock
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from threading import Event, Lock
+
+
+# 默认上限
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# 默认 TTL（秒），命名空间未配置时使用
+DEFAULT_TTL = 900
+
+# 各命名空间的默认 TTL（秒）
+NAMESPACE_TTLS = {
+    "latest_news": 900,
+    "news_by_date": 1800,
+    "trending_topics": 1800,
+    "config": 3600,
+    "latest_rss": 900,
+    "search_rss": 900,
+    "rss_feeds_status": 300,
+    "read_all": 900,
+}
+
+# 主动清理过期条目的最小间隔（秒）
+_SWEEP_INTERVAL = 60
+
+# 缓存依赖：((文件路径, 文件状态), ...)
+Dependencies = Tuple[Tuple[str, Any], ...]
 
 
 def make_cache_key(namespace: str, **params) -> str:
@@ -57,48 +92,291 @@ def make_cache_key(namespace: str, **params) -> str:
     return f"{namespace}:{hash_value}"
 
 
-class CacheService:
-    """缓存服务类"""
+def estimate_size(value: Any) -> int:
+    """
+    估算对象占用的内存字节数（递归累加容器内元素，同一对象只计一次）
+
+    Args:
+        value: 任意对象
+
+    Returns:
+        估算字节数
+    """
+    seen = set()
+    total = 0
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        obj_id = id(obj)
+        if obj_id in seen:
+            continue
+        seen.add(obj_id)
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return total
+
+
+def snapshot_files(paths: Iterable) -> Dependencies:
+    """
+    记录文件的当前状态，作为缓存条目的依赖
+
+    应在读取数据之前调用：读取期间文件发生变化时，缓存条目会在下次读取时失效。
+    文件不存在也会被记录，之后文件出现同样视为变化。
+
+    Args:
+        paths: 文件或目录路径（目录的状态随其中文件的增删变化）
+
+    Returns:
+        依赖快照
+    """
+    from trendradar.storage.snapshot import get_file_state
+
+    return tuple((str(path), get_file_state(str(path))) for path in paths)
+
+
+def _dependencies_changed(depends_on: Dependencies) -> bool:
+    """检查依赖的文件是否发生变化"""
+    from trendradar.storage.snapshot import get_file_state
+
+    return any(get_file_state(path) != state for path, state in depends_on)
+
+
+def _namespace(key: str) -> str:
+    """提取缓存 key 的命名空间"""
+    return key.split(":", 1)[0]
+
+
+class _Entry:
+    """缓存条目"""
+
+    __slots__ = ("value", "created_at", "expires_at", "size", "depends_on")
+
+    def __init__(
+        self,
+        value: Any,
+        created_at: float,
+        expires_at: float,
+        size: int,
+        depends_on: Dependencies,
+    ):
+        self.value = value
+        self.created_at = created_at
+        self.expires_at = expires_at
+        self.size = size
+        self.depends_on = depends_on
+
+
+class _Flight:
+    """进行中的计算（single-flight）"""
+
+    __slots__ = ("event", "value", "error")
 
     def __init__(self):
-        """初始化缓存服务"""
-        self._cache = {}
-        self._timestamps = {}
+        self.event = Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class CacheService:
+    """缓存服务类（线程安全）"""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        namespace_ttls: Optional[Dict[str, int]] = None,
+        default_ttl: int = DEFAULT_TTL,
+    ):
+        """
+        初始化缓存服务
+
+        Args:
+            max_entries: 最大条目数
+            max_bytes: 最大估算字节数
+            namespace_ttls: 各命名空间的默认 TTL（秒），默认使用 NAMESPACE_TTLS
+            default_ttl: 未配置命名空间的默认 TTL（秒）
+        """
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self.namespace_ttls = dict(NAMESPACE_TTLS if namespace_ttls is None else namespace_ttls)
+        self.default_ttl = default_ttl
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._flights: Dict[str, _Flight] = {}
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._last_sweep = time.monotonic()
         self._lock = Lock()
 
-    def get(self, key: str, ttl: int = 900) -> Optional[Any]:
+    def _resolve_ttl(self, key: str, ttl: Optional[int], depends_on: Optional[Dependencies]) -> float:
+        """获取条目的 TTL（显式指定优先；带依赖的条目不过期；其次命名空间默认值）"""
+        if ttl is not None:
+            return ttl
+        if depends_on:
+            return float("inf")
+        return self.namespace_ttls.get(_namespace(key), self.default_ttl)
+
+    def _remove(self, key: str) -> None:
+        """删除条目（调用方持有锁）"""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _expire(self, now: float, max_age: Optional[int] = None) -> int:
+        """删除过期条目（调用方持有锁），返回删除数量"""
+        expired = [
+            key for key, entry in self._entries.items()
+            if now >= entry.expires_at or (max_age is not None and now - entry.created_at >= max_age)
+        ]
+        for key in expired:
+            self._remove(key)
+            self._stats[_namespace(key)]["expirations"] += 1
+        self._last_sweep = now
+        return len(expired)
+
+    def _lookup(self, key: str, ttl: Optional[int], now: float) -> Optional[_Entry]:
+        """查找未过期的条目（调用方持有锁，不计入统计）"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if now >= entry.expires_at or (ttl is not None and now - entry.created_at >= ttl):
+            self._remove(key)
+            self._stats[_namespace(key)]["expirations"] += 1
+            return None
+        if entry.depends_on and _dependencies_changed(entry.depends_on):
+            self._remove(key)
+            self._stats[_namespace(key)]["invalidations"] += 1
+            return None
+        return entry
+
+    def get(self, key: str, ttl: Optional[int] = None) -> Optional[Any]:
         """
         获取缓存数据
 
         Args:
             key: 缓存键
-            ttl: 存活时间（秒），默认15分钟
+            ttl: 存活时间（秒），可选；指定时条目存在时间超过该值也视为过期
 
         Returns:
             缓存的值，如果不存在或已过期则返回None
         """
+        now = time.monotonic()
         with self._lock:
-            if key in self._cache:
-                # 检查是否过期
-                if time.time() - self._timestamps[key] < ttl:
-                    return self._cache[key]
-                else:
-                    # 已过期，删除缓存
-                    del self._cache[key]
-                    del self._timestamps[key]
-        return None
-
-    def set(self, key: str, value: Any) -> None:
+            if now - self._last_sweep >= _SWEEP_INTERVAL:
+                self._expire(now)
+
+            stats = self._stats[_namespace(key)]
+            entry = self._lookup(key, ttl, now)
+            if entry is None:
+                stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            stats["hits"] += 1
+            return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        depends_on: Optional[Dependencies] = None,
+    ) -> None:
         """
         设置缓存数据
 
         Args:
             key: 缓存键
             value: 缓存值
+            ttl: 存活时间（秒），默认使用命名空间的 TTL（带依赖时不过期）
+            depends_on: 依赖快照（snapshot_files 的返回值），依赖的文件变化时条目失效
         """
+        size = estimate_size(value)
+        now = time.monotonic()
+        ttl = self._resolve_ttl(key, ttl, depends_on)
+
         with self._lock:
-            self._cache[key] = value
-            self._timestamps[key] = time.time()
+            if key in self._entries:
+                self._remove(key)
+
+            stats = self._stats[_namespace(key)]
+            if size > self.max_bytes:
+                # 单个条目超过总预算，不缓存
+                stats["rejected"] += 1
+                return
+
+            self._entries[key] = _Entry(value, now, now + ttl, size, depends_on or ())
+            self._bytes += size
+            stats["sets"] += 1
+
+            # 按 LRU 淘汰，直到满足条目数与字节数上限
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                evicted_key = next(iter(self._entries))
+                self._remove(evicted_key)
+                self._stats[_namespace(evicted_key)]["evictions"] += 1
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: Optional[int] = None,
+        depends_on: Optional[Dependencies] = None,
+    ) -> Any:
+        """
+        获取缓存数据，未命中时计算并缓存（single-flight）
+
+        同一个 key 同时只有一个调用方执行 compute，其他并发调用方等待并共享结果
+        （包括异常）。compute 返回 None 时不缓存。
+
+        Args:
+            key: 缓存键
+            compute: 计算函数
+            ttl: 存活时间（秒），默认使用命名空间的 TTL（带依赖时不过期）
+            depends_on: 依赖快照（snapshot_files 的返回值，应在计算之前获取）
+
+        Returns:
+            缓存或计算得到的值
+        """
+        value = self.get(key, ttl)
+        if value is not None:
+            return value
+
+        with self._lock:
+            entry = self._lookup(key, ttl, time.monotonic())
+            if entry is not None:
+                # 在 get 之后刚被其他调用方写入
+                return entry.value
+
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self._stats[_namespace(key)]["coalesced"] += 1
+
+        if not is_leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = compute()
+            if value is not None:
+                self.set(key, value, ttl, depends_on)
+            flight.value = value
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
 
     def delete(self, key: str) -> bool:
         """
@@ -111,40 +389,29 @@ class CacheService:
             是否成功删除
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                del self._timestamps[key]
+            if key in self._entries:
+                self._remove(key)
                 return True
         return False
 
     def clear(self) -> None:
         """清空所有缓存"""
         with self._lock:
-            self._cache.clear()
-            self._timestamps.clear()
+            self._entries.clear()
+            self._bytes = 0
 
-    def cleanup_expired(self, ttl: int = 900) -> int:
+    def cleanup_expired(self, ttl: Optional[int] = None) -> int:
         """
         清理过期缓存
 
         Args:
-            ttl: 存活时间（秒）
+            ttl: 存活时间（秒），可选；指定时存在时间超过该值的条目也会被清理
 
         Returns:
             清理的条目数量
         """
         with self._lock:
-            current_time = time.time()
-            expired_keys = [
-                key for key, timestamp in self._timestamps.items()
-                if current_time - timestamp >= ttl
-            ]
-
-            for key in expired_keys:
-                del self._cache[key]
-                del self._timestamps[key]
-
-            return len(expired_keys)
+            return self._expire(time.monotonic(), ttl)
 
     def get_stats(self) -> dict:
         """
@@ -153,17 +420,39 @@ class CacheService:
         Returns:
             统计信息字典
         """
+        now = time.monotonic()
         with self._lock:
+            namespaces: Dict[str, Dict[str, int]] = {}
+            for key, entry in self._entries.items():
+                ns = namespaces.setdefault(_namespace(key), {"entries": 0, "bytes": 0})
+                ns["entries"] += 1
+                ns["bytes"] += entry.size
+
+            totals: Dict[str, int] = defaultdict(int)
+            for name, counters in self._stats.items():
+                ns = namespaces.setdefault(name, {"entries": 0, "bytes": 0})
+                for counter, value in counters.items():
+                    ns[counter] = value
+                    totals[counter] += value
+
+            lookups = totals["hits"] + totals["misses"]
+            created = [entry.created_at for entry in self._entries.values()]
+
             return {
-                "total_entries": len(self._cache),
-                "oldest_entry_age": (
-                    time.time() - min(self._timestamps.values())
-                    if self._timestamps else 0
-                ),
-                "newest_entry_age": (
-                    time.time() - max(self._timestamps.values())
-                    if self._timestamps else 0
-                )
+                "total_entries": len(self._entries),
+                "total_bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": totals["hits"],
+                "misses": totals["misses"],
+                "hit_rate": round(totals["hits"] / lookups, 4) if lookups else 0.0,
+                "evictions": totals["evictions"],
+                "expirations": totals["expirations"],
+                "invalidations": totals["invalidations"],
+                "coalesced": totals["coalesced"],
+                "oldest_entry_age": now - min(created) if created else 0,
+                "newest_entry_age": now - max(created) if created else 0,
+                "namespaces": namespaces,
             }
 
 
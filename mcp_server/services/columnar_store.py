@@ -0,0 +1,528 @@
+"""
+列式历史数据（Parquet）
+
+跨周、跨月的分析（时期对比、话题生命周期、平台活跃度、话题预测）逐天打开
+SQLite 并展开成嵌套字典，内存与耗时都随天数线性增长。
+
+ColumnarStore 把已结束日期（今天之前）的数据库导出为按日期分区的 Parquet 文件：
+- output/columnar/{db_type}/{表名}/date=YYYY-MM-DD/part-0.parquet
+- 热榜导出 news_items（附完整排名列表）、rank_history（兼容紧凑格式）、crawl_records，
+  RSS 导出 rss_items、rss_crawl_records
+- 文件内按平台排序并分行组，平台过滤可利用行组统计信息跳过无关数据
+- 与多日标题索引相同，按数据库文件状态判断是否需要重新导出，
+  数据库被删除时对应分区一并删除；今天的数据仍在写入，只在内存中读取
+- 查询只读取所需的列，日期通过分区裁剪、平台通过谓词下推过滤
+
+需要安装 pyarrow（pip install pyarrow）；未安装时调用方回退到原有的读取方式。
+"""
+
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    pa = pc = ds = pq = None
+    HAS_PYARROW = False
+
+
+# 导出格式版本（结构变化时递增，旧分区自动重新导出）
+COLUMNAR_VERSION = 1
+
+# 每个行组的最大行数（文件内按平台排序，平台过滤时可跳过整个行组）
+ROW_GROUP_SIZE = 16384
+
+# 各数据库类型导出的表及平台列
+TABLES = {
+    "news": ("news_items", "rank_history", "crawl_records"),
+    "rss": ("rss_items", "rss_crawl_records"),
+}
+PLATFORM_COLUMNS = {
+    "news_items": "platform_id",
+    "rank_history": "platform_id",
+    "rss_items": "feed_id",
+}
+
+_MANIFEST = "_manifest.json"
+
+_SCHEMAS = {}
+if HAS_PYARROW:
+    _SCHEMAS = {
+        "news_items": pa.schema([
+            ("id", pa.int64()),
+            ("platform_id", pa.string()),
+            ("platform_name", pa.string()),
+            ("title", pa.string()),
+            ("rank", pa.int32()),
+            ("ranks", pa.list_(pa.int32())),
+            ("url", pa.string()),
+            ("mobile_url", pa.string()),
+            ("first_time", pa.string()),
+            ("last_time", pa.string()),
+            ("count", pa.int32()),
+        ]),
+        "rank_history": pa.schema([
+            ("news_item_id", pa.int64()),
+            ("platform_id", pa.string()),
+            ("crawl_time", pa.string()),
+            ("rank", pa.int32()),
+        ]),
+        "crawl_records": pa.schema([
+            ("crawl_time", pa.string()),
+            ("total_items", pa.int32()),
+            ("created_at", pa.string()),
+        ]),
+        "rss_items": pa.schema([
+            ("id", pa.int64()),
+            ("feed_id", pa.string()),
+            ("feed_name", pa.string()),
+            ("title", pa.string()),
+            ("url", pa.string()),
+            ("published_at", pa.string()),
+            ("summary", pa.string()),
+            ("author", pa.string()),
+            ("first_time", pa.string()),
+            ("last_time", pa.string()),
+            ("count", pa.int32()),
+        ]),
+        "rss_crawl_records": pa.schema([
+            ("crawl_time", pa.string()),
+            ("total_items", pa.int32()),
+            ("created_at", pa.string()),
+        ]),
+    }
+
+# 某一天的所有导出表：{表名: Table}
+DayTables = Dict[str, "pa.Table"]
+
+
+def _table_exists(cursor, name: str) -> bool:
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,))
+    return cursor.fetchone() is not None
+
+
+def _read_news_tables(cursor) -> DayTables:
+    """从热榜数据库读取 news_items / rank_history / crawl_records"""
+    from trendradar.storage.rank_codec import decode_rank_entries, has_rank_packs, load_rank_map
+
+    items = {name: [] for name in _SCHEMAS["news_items"].names}
+    history = {name: [] for name in _SCHEMAS["rank_history"].names}
+    records = {name: [] for name in _SCHEMAS["crawl_records"].names}
+
+    if _table_exists(cursor, "news_items"):
+        cursor.execute("""
+            SELECT n.id, n.platform_id, p.name AS platform_name, n.title, n.rank,
+                   n.url, n.mobile_url, n.first_crawl_time, n.last_crawl_time, n.crawl_count
+            FROM news_items n
+            LEFT JOIN platforms p ON n.platform_id = p.id
+            ORDER BY n.id
+        """)
+        rows = cursor.fetchall()
+
+        # 排名列表与 read_all_titles_for_date 一致（不去重，按抓取时间顺序）
+        rank_map = load_rank_map(cursor, [row[0] for row in rows], unique=False)
+        platform_of = {}
+        for (news_id, platform_id, platform_name, title, rank,
+             url, mobile_url, first_time, last_time, count) in rows:
+            platform_of[news_id] = platform_id
+            items["id"].append(news_id)
+            items["platform_id"].append(platform_id)
+            items["platform_name"].append(platform_name or platform_id)
+            items["title"].append(title)
+            items["rank"].append(rank)
+            items["ranks"].append(rank_map.get(news_id, [rank]))
+            items["url"].append(url or "")
+            items["mobile_url"].append(mobile_url or "")
+            items["first_time"].append(first_time or "")
+            items["last_time"].append(last_time or "")
+            items["count"].append(count or 1)
+
+        entries = []
+        if _table_exists(cursor, "rank_history"):
+            cursor.execute("SELECT news_item_id, crawl_time, rank FROM rank_history")
+            entries.extend(cursor.fetchall())
+        if has_rank_packs(cursor):
+            cursor.execute("SELECT news_item_id, ranks FROM rank_packs")
+            for news_id, blob in cursor.fetchall():
+                entries.extend((news_id, crawl_time, rank) for crawl_time, rank in decode_rank_entries(blob))
+
+        for news_id, crawl_time, rank in sorted(entries, key=lambda entry: (entry[0], entry[1])):
+            history["news_item_id"].append(news_id)
+            history["platform_id"].append(platform_of.get(news_id, ""))
+            history["crawl_time"].append(crawl_time)
+            history["rank"].append(rank)
+
+    if _table_exists(cursor, "crawl_records"):
+        cursor.execute("SELECT crawl_time, total_items, created_at FROM crawl_records ORDER BY crawl_time")
+        for crawl_time, total_items, created_at in cursor.fetchall():
+            records["crawl_time"].append(crawl_time)
+            records["total_items"].append(total_items or 0)
+            records["created_at"].append(str(created_at or ""))
+
+    return {
+        "news_items": pa.table(items, schema=_SCHEMAS["news_items"]),
+        "rank_history": pa.table(history, schema=_SCHEMAS["rank_history"]),
+        "crawl_records": pa.table(records, schema=_SCHEMAS["crawl_records"]),
+    }
+
+
+def _read_rss_tables(cursor) -> DayTables:
+    """从 RSS 数据库读取 rss_items / rss_crawl_records"""
+    items = {name: [] for name in _SCHEMAS["rss_items"].names}
+    records = {name: [] for name in _SCHEMAS["rss_crawl_records"].names}
+
+    if _table_exists(cursor, "rss_items"):
+        cursor.execute("""
+            SELECT i.id, i.feed_id, f.name AS feed_name, i.title, i.url, i.published_at,
+                   i.summary, i.author, i.first_crawl_time, i.last_crawl_time, i.crawl_count
+            FROM rss_items i
+            LEFT JOIN rss_feeds f ON i.feed_id = f.id
+            ORDER BY i.id
+        """)
+        for (item_id, feed_id, feed_name, title, url, published_at,
+             summary, author, first_time, last_time, count) in cursor.fetchall():
+            items["id"].append(item_id)
+            items["feed_id"].append(feed_id)
+            items["feed_name"].append(feed_name or feed_id)
+            items["title"].append(title)
+            items["url"].append(url or "")
+            items["published_at"].append(published_at or "")
+            items["summary"].append(summary or "")
+            items["author"].append(author or "")
+            items["first_time"].append(first_time or "")
+            items["last_time"].append(last_time or "")
+            items["count"].append(count or 1)
+
+    if _table_exists(cursor, "rss_crawl_records"):
+        cursor.execute("SELECT crawl_time, total_items, created_at FROM rss_crawl_records ORDER BY crawl_time")
+        for crawl_time, total_items, created_at in cursor.fetchall():
+            records["crawl_time"].append(crawl_time)
+            records["total_items"].append(total_items or 0)
+            records["created_at"].append(str(created_at or ""))
+
+    return {
+        "rss_items": pa.table(items, schema=_SCHEMAS["rss_items"]),
+        "rss_crawl_records": pa.table(records, schema=_SCHEMAS["rss_crawl_records"]),
+    }
+
+
+class ColumnarStore:
+    """按日期分区的 Parquet 历史数据（线程安全）"""
+
+    def __init__(self, data_dir: Path, db_type: str = "news", read_pool=None):
+        """
+        初始化列式存储
+
+        Args:
+            data_dir: 数据目录（output）
+            db_type: 数据库类型 ("news" 或 "rss")
+            read_pool: 只读连接池（默认使用全局只读连接池）
+        """
+        if not HAS_PYARROW:
+            raise ImportError("列式历史数据需要安装 pyarrow: pip install pyarrow")
+
+        self.data_dir = Path(data_dir)
+        self.db_type = db_type
+        self.root = self.data_dir / "columnar" / db_type
+        self.tables = TABLES[db_type]
+        self._read_pool = read_pool
+        self._lock = threading.Lock()
+        self._manifest: Optional[Dict] = None
+        self._open_days: Dict[str, Tuple[str, DayTables]] = {}
+
+    # ==================== 导出 ====================
+
+    def _day_db_path(self, date_str: str) -> Path:
+        """获取某一天的数据库路径（已压缩归档时为归档文件路径）"""
+        from trendradar.storage.archive import find_archive
+
+        db_path = self.data_dir / self.db_type / f"{date_str}.db"
+        if db_path.exists():
+            return db_path
+        return find_archive(db_path) or db_path
+
+    def _file_state(self, date_str: str) -> Optional[str]:
+        """获取某一天数据库的文件状态（不存在返回 None）"""
+        from trendradar.storage.snapshot import get_file_state
+
+        state = get_file_state(str(self._day_db_path(date_str)))
+        return json.dumps(state) if state else None
+
+    def _read_day(self, date_str: str) -> Optional[DayTables]:
+        """从某一天的数据库读取所有导出表（数据库不存在返回 None）"""
+        from trendradar.storage.archive import resolve_db_path
+        from trendradar.storage.sqlite_profile import get_read_pool
+
+        db_path = resolve_db_path(self.data_dir / self.db_type / f"{date_str}.db")
+        if db_path is None:
+            return None
+
+        read_pool = self._read_pool or get_read_pool()
+        with read_pool.connection(str(db_path)) as conn:
+            cursor = conn.cursor()
+            if self.db_type == "news":
+                return _read_news_tables(cursor)
+            return _read_rss_tables(cursor)
+
+    def _load_manifest(self) -> Dict:
+        """读取导出清单（调用方持有锁）"""
+        if self._manifest is None:
+            manifest = {}
+            try:
+                with open(self.root / _MANIFEST, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                pass
+            if not isinstance(manifest, dict) or manifest.get("version") != COLUMNAR_VERSION:
+                manifest = {"version": COLUMNAR_VERSION, "days": {}}
+            self._manifest = manifest
+        return self._manifest
+
+    def _save_manifest(self) -> None:
+        """写入导出清单（先写临时文件再替换，调用方持有锁）"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.root / f".{_MANIFEST}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+        tmp_path.replace(self.root / _MANIFEST)
+
+    def _partition_path(self, table_name: str, date_str: str) -> Path:
+        return self.root / table_name / f"date={date_str}" / "part-0.parquet"
+
+    def _write_day(self, date_str: str, day_tables: DayTables) -> Dict[str, int]:
+        """写入某一天的所有分区，返回各表行数"""
+        row_counts = {}
+        for table_name, table in day_tables.items():
+            platform_column = PLATFORM_COLUMNS.get(table_name)
+            if platform_column and table.num_rows:
+                order_column = "news_item_id" if table_name == "rank_history" else "id"
+                table = table.sort_by([(platform_column, "ascending"), (order_column, "ascending")])
+
+            path = self._partition_path(table_name, date_str)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 以 "." 开头的临时文件不会被数据集扫描到
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            pq.write_table(table, tmp_path, compression="zstd", row_group_size=ROW_GROUP_SIZE)
+            tmp_path.replace(path)
+            row_counts[table_name] = table.num_rows
+        return row_counts
+
+    def _remove_day(self, date_str: str) -> None:
+        for table_name in self.tables:
+            shutil.rmtree(self._partition_path(table_name, date_str).parent, ignore_errors=True)
+
+    def _sync(self, dates: Iterable[str]) -> Tuple[List[str], Dict[str, DayTables]]:
+        """
+        同步指定日期（调用方持有锁）
+
+        Returns:
+            (已导出的日期, {未结束日期: 内存中的表})
+        """
+        manifest = self._load_manifest()
+        days = manifest["days"]
+        today = datetime.now().strftime("%Y-%m-%d")
+
+        exported: List[str] = []
+        open_days: Dict[str, DayTables] = {}
+        changed = False
+
+        for date_str in dates:
+            file_state = self._file_state(date_str)
+            if file_state is None:
+                if date_str in days:
+                    self._remove_day(date_str)
+                    del days[date_str]
+                    changed = True
+                self._open_days.pop(date_str, None)
+                continue
+
+            if date_str >= today:
+                # 未结束的日期仍在写入，只在内存中读取（文件未变化时复用）
+                cached = self._open_days.get(date_str)
+                if cached is None or cached[0] != file_state:
+                    day_tables = self._read_day(date_str)
+                    if day_tables is None:
+                        continue
+                    cached = self._open_days[date_str] = (file_state, day_tables)
+                open_days[date_str] = cached[1]
+                continue
+
+            self._open_days.pop(date_str, None)
+            entry = days.get(date_str)
+            if entry is None or entry.get("file_state") != file_state:
+                day_tables = self._read_day(date_str)
+                if day_tables is None:
+                    continue
+                days[date_str] = {"file_state": file_state, "rows": self._write_day(date_str, day_tables)}
+                changed = True
+            exported.append(date_str)
+
+        if changed:
+            self._save_manifest()
+
+        return exported, open_days
+
+    def sync(self, dates: Optional[List[str]] = None) -> int:
+        """
+        导出指定日期中新增或变化的已结束日期
+
+        Args:
+            dates: 日期列表（YYYY-MM-DD），None 表示全部已导出及现存的日期
+
+        Returns:
+            已导出的日期数
+        """
+        with self._lock:
+            if dates is None:
+                from trendradar.storage.archive import parse_db_date
+
+                day_files = (self.data_dir / self.db_type).glob("*.db*")
+                existing = {parse_db_date(path.name) for path in day_files} - {None}
+                dates = sorted(existing | set(self._load_manifest()["days"]))
+            exported, _ = self._sync(dates)
+            return len(exported)
+
+    # ==================== 查询 ====================
+
+    def scan(
+        self,
+        table_name: str,
+        dates: Sequence[str],
+        columns: Optional[List[str]] = None,
+        platform_ids: Optional[List[str]] = None,
+        filter: Optional["ds.Expression"] = None,
+    ) -> "pa.Table":
+        """
+        扫描多个日期的某张表（先同步这些日期）
+
+        Args:
+            table_name: 表名（如 news_items / rank_history / crawl_records）
+            dates: 日期列表（YYYY-MM-DD）
+            columns: 需要的列（默认全部列），日期列名为 date
+            platform_ids: 平台/Feed ID 列表，None 表示所有
+            filter: 额外的过滤表达式（pyarrow.dataset 表达式）
+
+        Returns:
+            pyarrow.Table，按日期升序排列
+        """
+        if table_name not in self.tables:
+            raise ValueError(f"未知的表: {table_name}")
+
+        schema = _SCHEMAS[table_name].append(pa.field("date", pa.string()))
+        columns = list(columns) if columns else schema.names
+
+        expression = filter
+        platform_column = PLATFORM_COLUMNS.get(table_name)
+        if platform_ids and platform_column:
+            platform_filter = ds.field(platform_column).isin(platform_ids)
+            expression = platform_filter if expression is None else expression & platform_filter
+
+        with self._lock:
+            exported, open_days = self._sync(sorted(set(dates)))
+
+        parts = []
+        if exported:
+            # 日期通过只打开对应分区文件裁剪，平台等条件下推到行组统计信息
+            dataset = ds.dataset(
+                [str(self._partition_path(table_name, date_str)) for date_str in exported],
+                schema=schema,
+                format="parquet",
+                partitioning=ds.partitioning(pa.schema([("date", pa.string())]), flavor="hive"),
+                partition_base_dir=str(self.root / table_name),
+            )
+            parts.append(dataset.to_table(columns=columns, filter=expression))
+
+        for date_str, day_tables in sorted(open_days.items()):
+            table = day_tables[table_name]
+            table = table.append_column("date", pa.array([date_str] * table.num_rows, pa.string()))
+            if expression is not None:
+                table = table.filter(expression)
+            parts.append(table.select(columns))
+
+        if not parts:
+            return schema.empty_table().select(columns)
+
+        result = pa.concat_tables(parts)
+        if len(parts) > 1 or len(exported) > 1:
+            result = result.sort_by([("date", "ascending")])
+        return result
+
+    def distinct_titles(
+        self,
+        dates: Sequence[str],
+        platform_ids: Optional[List[str]] = None,
+        keyword: Optional[str] = None,
+        columns: Sequence[str] = (),
+    ) -> "pa.Table":
+        """
+        获取每天每个平台的不重复标题（与 read_all_titles_for_date 的字典结构一致）
+
+        同一平台同一标题出现多次时取最后一条，顺序为：日期、平台首次出现、标题首次出现。
+
+        Args:
+            dates: 日期列表（YYYY-MM-DD）
+            platform_ids: 平台ID列表，None 表示所有
+            keyword: 只保留标题包含关键词（不区分大小写）的条目
+            columns: 除 date / platform_id / platform_name / title 外需要的列（如 ranks）
+
+        Returns:
+            pyarrow.Table
+        """
+        items_table = "news_items" if self.db_type == "news" else "rss_items"
+        platform_column = PLATFORM_COLUMNS[items_table]
+        name_column = "platform_name" if self.db_type == "news" else "feed_name"
+        base_columns = ["date", "id", platform_column, name_column, "title"]
+
+        expression = None
+        if keyword:
+            expression = pc.match_substring(pc.utf8_lower(ds.field("title")), keyword.lower())
+
+        table = self.scan(
+            items_table,
+            dates,
+            columns=base_columns + [column for column in columns if column not in base_columns],
+            platform_ids=platform_ids,
+            filter=expression,
+        )
+        if table.num_rows == 0:
+            return table.drop_columns(["id"])
+
+        # 每个 (日期, 平台, 标题) 取首次出现位置与最后一条记录。
+        # 分组与连接只使用键列和行号（join 不支持 ranks 等列表类型的非键列），
+        # 最后按行号从完整表中取出选中的行
+        keys = ["date", platform_column, "title"]
+        groups = table.group_by(keys).aggregate([("id", "min"), ("id", "max")])
+        selected = table.select(["date", "id", platform_column]).append_column(
+            "row_index", pa.array(range(table.num_rows), pa.int64())
+        )
+
+        # 平台顺序按全部条目中的首次出现（不受关键词过滤影响）
+        platform_rows = table
+        if keyword:
+            platform_rows = self.scan(items_table, dates, columns=["date", "id", platform_column], platform_ids=platform_ids)
+        platform_first = platform_rows.group_by(["date", platform_column]).aggregate([("id", "min")])
+
+        selected = selected.join(
+            groups.select(["date", "id_max", "id_min"]).rename_columns(["date", "id", "title_first"]),
+            keys=["date", "id"],
+            join_type="inner",
+        ).join(
+            platform_first.rename_columns(["date", platform_column, "platform_first"]),
+            keys=["date", platform_column],
+            join_type="inner",
+        )
+        selected = selected.sort_by([
+            ("date", "ascending"),
+            ("platform_first", "ascending"),
+            ("title_first", "ascending"),
+        ])
+        return table.take(selected["row_index"]).drop_columns(["id"])
@@ -64,11 +64,15 @@ class DataService:
             DataNotFoundError: 数据不存在
         """
         # 尝试从缓存获取
-        cache_key = f"latest_news:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=900)  # 15分钟缓存
+        today_str = datetime.now().strftime("%Y-%m-%d")
+        cache_key = f"latest_news:{today_str}:{','.join(platforms or [])}:{limit}:{include_url}"
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
+        # 读取之前记录数据文件状态，新一轮爬取写入后缓存失效
+        depends_on = self.parser.data_dependencies([today_str])
+
         # 读取今天的数据
         all_titles, id_to_name, timestamps = self.parser.read_all_titles_for_date(
             date=None,
@@ -113,7 +117,7 @@ class DataService:
         result = news_list[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, depends_on=depends_on)
 
         return result
 
@@ -150,10 +154,12 @@ class DataService:
         # 尝试从缓存获取
         date_str = target_date.strftime("%Y-%m-%d")
         cache_key = f"news_by_date:{date_str}:{','.join(platforms or [])}:{limit}:{include_url}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
+        depends_on = self.parser.data_dependencies([date_str])
+
         # 读取指定日期的数据
         all_titles, id_to_name, timestamps = self.parser.read_all_titles_for_date(
             date=target_date,
@@ -192,8 +198,8 @@ class DataService:
         # 限制返回数量
         result = news_list[:limit]
 
-        # 缓存结果(历史数据缓存更久)
-        self.cache.set(cache_key, result)
+        # 缓存结果（历史数据文件不再变化，缓存一直有效）
+        self.cache.set(cache_key, result, depends_on=depends_on)
 
         return result
 
@@ -230,14 +236,13 @@ class DataService:
         results = []
         platform_distribution = Counter()
 
-        # 遍历日期范围
+        # 遍历日期范围（全文索引只返回可能包含关键词的标题）
+        day_titles = self.parser.search_titles_for_range(keyword, start_date, end_date, platforms)
         current_date = start_date
         while current_date <= end_date:
-            try:
-                all_titles, id_to_name, _ = self.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=platforms
-                )
+            day = day_titles.get(current_date.strftime("%Y-%m-%d"))
+            if day:
+                all_titles, id_to_name = day
 
                 # 搜索包含关键词的标题
                 for platform_id, titles in all_titles.items():
@@ -262,10 +267,6 @@ class DataService:
 
                             platform_distribution[platform_id] += 1
 
-            except DataNotFoundError:
-                # 该日期没有数据,继续下一天
-                pass
-
             # 下一天
             current_date += timedelta(days=1)
 
@@ -352,11 +353,15 @@ class DataService:
             DataNotFoundError: 数据不存在
         """
         # 尝试从缓存获取
-        cache_key = f"trending_topics:{top_n}:{mode}:{extract_mode}"
-        cached = self.cache.get(cache_key, ttl=1800)  # 30分钟缓存
+        today_str = datetime.now().strftime("%Y-%m-%d")
+        cache_key = f"trending_topics:{today_str}:{top_n}:{mode}:{extract_mode}"
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
+        # 今天的数据与关注词配置变化时失效
+        depends_on = self.parser.data_dependencies([today_str]) + self.parser.config_dependencies()
+
         # 读取今天的数据
         all_titles, id_to_name, timestamps = self.parser.read_all_titles_for_date()
 
@@ -378,14 +383,16 @@ class DataService:
         word_frequency = Counter()
         keyword_to_news = {}
 
+        if extract_mode == "keywords":
+            from trendradar.core.frequency import _word_matches
+
+            word_groups = self.parser.parse_frequency_words()
+
         # 遍历要处理的标题
         for platform_id, titles in titles_to_process.items():
             for title in titles.keys():
                 if extract_mode == "keywords":
                     # 基于预设关键词统计（支持正则匹配）
-                    from trendradar.core.frequency import _word_matches
-
-                    word_groups = self.parser.parse_frequency_words()
                     title_lower = title.lower()
 
                     for group in word_groups:
@@ -439,7 +446,7 @@ class DataService:
         }
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, depends_on=depends_on)
 
         return result
 
@@ -472,10 +479,12 @@ class DataService:
         """
         # 尝试从缓存获取
         cache_key = f"config:{section}"
-        cached = self.cache.get(cache_key, ttl=3600)  # 1小时缓存
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
+        depends_on = self.parser.config_dependencies()
+
         # 解析配置文件
         config_data = self.parser.parse_yaml_config()
         word_groups = self.parser.parse_frequency_words()
@@ -545,8 +554,8 @@ class DataService:
         else:
             result = {}
 
-        # 缓存结果
-        self.cache.set(cache_key, result)
+        # 缓存结果（配置文件修改后失效）
+        self.cache.set(cache_key, result, depends_on=depends_on)
 
         return result
 
@@ -704,14 +713,17 @@ class DataService:
             DataNotFoundError: 数据不存在
         """
         days = min(max(days, 1), 30)  # 限制 1-30 天
-        cache_key = f"latest_rss:{','.join(feeds or [])}:{days}:{limit}:{include_summary}"
-        cached = self.cache.get(cache_key, ttl=900)
+        today = datetime.now()
+        date_strs = [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
+        cache_key = f"latest_rss:{date_strs[0]}:{','.join(feeds or [])}:{days}:{limit}:{include_summary}"
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
+        depends_on = self.parser.data_dependencies(date_strs, db_type="rss")
+
         rss_list = []
         seen_urls = set()  # 跨日期 URL 去重
-        today = datetime.now()
 
         for i in range(days):
             target_date = today - timedelta(days=i)
@@ -768,7 +780,7 @@ class DataService:
         result = rss_list[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, depends_on=depends_on)
 
         return result
 
@@ -793,56 +805,59 @@ class DataService:
         Returns:
             匹配的 RSS 条目列表（按 URL 去重）
         """
-        cache_key = f"search_rss:{keyword}:{','.join(feeds or [])}:{days}:{limit}:{include_summary}"
-        cached = self.cache.get(cache_key, ttl=900)
+        today = datetime.now()
+        date_strs = [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
+        cache_key = f"search_rss:{today.strftime('%Y-%m-%d')}:{keyword}:{','.join(feeds or [])}:{days}:{limit}:{include_summary}"
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
+        depends_on = self.parser.data_dependencies(date_strs, db_type="rss")
+
         results = []
         seen_urls = set()  # 用于 URL 去重
-        today = datetime.now()
+
+        # 全文索引只返回标题或摘要可能包含关键词的条目
+        day_items = self.parser.search_titles_for_range(
+            keyword, today - timedelta(days=days - 1), today, feeds, db_type="rss"
+        )
 
         for i in range(days):
             target_date = today - timedelta(days=i)
-
-            try:
-                all_items, id_to_name, _ = self.parser.read_all_titles_for_date(
-                    date=target_date,
-                    platform_ids=feeds,
-                    db_type="rss"
-                )
+            day = day_items.get(target_date.strftime("%Y-%m-%d"))
+            if day:
+                all_items, id_to_name = day
 
                 for feed_id, items in all_items.items():
                     feed_name = id_to_name.get(feed_id, feed_id)
 
                     for title, info in items.items():
-                        # 跨日期去重：如果 URL 已出现过则跳过
+                        # 关键词匹配（标题或摘要）
+                        summary = info.get("summary", "")
+                        if keyword.lower() not in title.lower() and keyword.lower() not in summary.lower():
+                            continue
+
+                        # 跨日期去重：如果 URL 已出现过则跳过（保留最新一天的匹配条目）
                         url = info.get("url", "")
                         if url and url in seen_urls:
                             continue
                         if url:
                             seen_urls.add(url)
 
-                        # 关键词匹配（标题或摘要）
-                        summary = info.get("summary", "")
-                        if keyword.lower() in title.lower() or keyword.lower() in summary.lower():
-                            rss_item = {
-                                "title": title,
-                                "feed_id": feed_id,
-                                "feed_name": feed_name,
-                                "url": url,
-                                "published_at": info.get("published_at", ""),
-                                "author": info.get("author", ""),
-                                "date": target_date.strftime("%Y-%m-%d")
-                            }
-
-                            if include_summary:
-                                rss_item["summary"] = summary
+                        rss_item = {
+                            "title": title,
+                            "feed_id": feed_id,
+                            "feed_name": feed_name,
+                            "url": url,
+                            "published_at": info.get("published_at", ""),
+                            "author": info.get("author", ""),
+                            "date": target_date.strftime("%Y-%m-%d")
+                        }
 
-                            results.append(rss_item)
+                        if include_summary:
+                            rss_item["summary"] = summary
 
-            except DataNotFoundError:
-                continue
+                        results.append(rss_item)
 
         # 按发布时间排序
         results.sort(key=lambda x: x.get("published_at", ""), reverse=True)
@@ -851,7 +866,7 @@ class DataService:
         result = results[:limit]
 
         # 缓存结果
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, depends_on=depends_on)
 
         return result
 
@@ -862,11 +877,18 @@ class DataService:
         Returns:
             RSS 源状态信息
         """
-        cache_key = "rss_feeds_status"
-        cached = self.cache.get(cache_key, ttl=300)
+        today_str = datetime.now().strftime("%Y-%m-%d")
+        cache_key = f"rss_feeds_status:{today_str}"
+        cached = self.cache.get(cache_key)
         if cached:
             return cached
 
+        # 今天的数据与可用日期列表变化时失效
+        depends_on = (
+            self.parser.data_dependencies([today_str], db_type="rss")
+            + self.parser.dates_dependencies(db_type="rss")
+        )
+
         # 获取可用的 RSS 日期
         available_dates = self.parser.get_available_dates(db_type="rss")
 
@@ -895,6 +917,6 @@ class DataService:
             "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
 
-        self.cache.set(cache_key, result)
+        self.cache.set(cache_key, result, depends_on=depends_on)
 
         return result
@@ -6,15 +6,16 @@ v2.0.0: 仅支持 SQLite 数据库，移除 TXT 文件支持
 """
 
 import re
-import sqlite3
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import yaml
 
 from ..utils.errors import FileParseError, DataNotFoundError
-from .cache_service import get_cache
+from .cache_service import Dependencies, get_cache, snapshot_files
+from .columnar_store import HAS_PYARROW, ColumnarStore
+from .title_index import TitleIndex
 
 
 class ParserService:
@@ -35,6 +36,27 @@ class ParserService:
 
         self.cache = get_cache()
 
+        from trendradar.storage.sqlite_profile import get_read_pool
+        self.read_pool = get_read_pool()
+
+        # 多日标题索引（跨天查询与关键词搜索使用）
+        self.title_indexes = {
+            db_type: TitleIndex(
+                self.project_root / "output",
+                lambda date_str, db_type=db_type: self._read_from_sqlite(
+                    datetime.strptime(date_str, "%Y-%m-%d"), db_type=db_type
+                ),
+                db_type=db_type,
+            )
+            for db_type in ("news", "rss")
+        }
+
+        # 列式历史数据（按日期范围的统计分析使用，未安装 pyarrow 时为空）
+        self.columnar_stores = {
+            db_type: ColumnarStore(self.project_root / "output", db_type, read_pool=self.read_pool)
+            for db_type in ("news", "rss")
+        } if HAS_PYARROW else {}
+
     @staticmethod
     def clean_title(title: str) -> str:
         """清理标题文本"""
@@ -61,6 +83,7 @@ class ParserService:
         获取数据库文件路径
 
         新结构：output/{type}/{date}.db
+        已压缩归档的日期（{date}.db.zst / .db.gz）返回解压缓存中的数据库路径
 
         Args:
             date: 日期对象，默认为今天
@@ -69,11 +92,52 @@ class ParserService:
         Returns:
             数据库文件路径，如果不存在则返回 None
         """
+        from trendradar.storage.archive import resolve_db_path
+
         date_str = self.get_date_folder_name(date)
-        db_path = self.project_root / "output" / db_type / f"{date_str}.db"
-        if db_path.exists():
-            return db_path
-        return None
+        return resolve_db_path(self.project_root / "output" / db_type / f"{date_str}.db")
+
+    def data_dependencies(self, date_strs: List[str], db_type: str = "news") -> Dependencies:
+        """
+        获取指定日期数据库文件的缓存依赖（文件变化即新数据写入，缓存随之失效）
+
+        Args:
+            date_strs: 日期字符串列表（YYYY-MM-DD）
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            依赖快照
+        """
+        from trendradar.storage.archive import ARCHIVE_SUFFIXES
+
+        db_dir = self.project_root / "output" / db_type
+        return snapshot_files(
+            db_dir / f"{date_str}.db{suffix}"
+            for date_str in date_strs
+            for suffix in ("",) + ARCHIVE_SUFFIXES
+        )
+
+    def dates_dependencies(self, db_type: str = "news") -> Dependencies:
+        """
+        获取数据目录的缓存依赖（新增或删除日期数据库时变化）
+
+        Args:
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            依赖快照
+        """
+        return snapshot_files([self.project_root / "output" / db_type])
+
+    def config_dependencies(self) -> Dependencies:
+        """
+        获取配置文件的缓存依赖（config.yaml 与 frequency_words.txt）
+
+        Returns:
+            依赖快照
+        """
+        config_dir = self.project_root / "config"
+        return snapshot_files([config_dir / "config.yaml", config_dir / "frequency_words.txt"])
 
     def _read_from_sqlite(
         self,
@@ -101,21 +165,18 @@ class ParserService:
         all_timestamps = {}
 
         try:
-            conn = sqlite3.connect(str(db_path))
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            # 只读连接池：爬虫写入时读取不阻塞、不报 "database is locked"
+            with self.read_pool.connection(str(db_path)) as conn:
+                cursor = conn.cursor()
 
-            if db_type == "news":
-                return self._read_news_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
-            elif db_type == "rss":
-                return self._read_rss_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
+                if db_type == "news":
+                    return self._read_news_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
+                elif db_type == "rss":
+                    return self._read_rss_from_sqlite(cursor, platform_ids, all_titles, id_to_name, all_timestamps)
 
         except Exception as e:
             print(f"Warning: 从 SQLite 读取数据失败: {e}")
             return None
-        finally:
-            if 'conn' in locals():
-                conn.close()
 
     def _read_news_from_sqlite(
         self,
@@ -157,24 +218,11 @@ class ParserService:
 
         rows = cursor.fetchall()
 
-        # 收集所有 news_item_id 用于查询历史排名
+        # 收集所有 news_item_id 用于查询历史排名（兼容行格式与紧凑格式）
+        from trendradar.storage.rank_codec import load_rank_map
+
         news_ids = [row['id'] for row in rows]
-        rank_history_map = {}
-
-        if news_ids:
-            placeholders = ",".join("?" * len(news_ids))
-            cursor.execute(f"""
-                SELECT news_item_id, rank FROM rank_history
-                WHERE news_item_id IN ({placeholders})
-                ORDER BY news_item_id, crawl_time
-            """, news_ids)
-
-            for rh_row in cursor.fetchall():
-                news_id = rh_row['news_item_id']
-                rank = rh_row['rank']
-                if news_id not in rank_history_map:
-                    rank_history_map[news_id] = []
-                rank_history_map[news_id].append(rank)
+        rank_history_map = load_rank_map(cursor, news_ids, unique=False)
 
         for row in rows:
             news_id = row['id']
@@ -324,16 +372,13 @@ class ParserService:
         platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
         cache_key = f"read_all:{db_type}:{date_str}:{platform_key}"
 
-        is_today = (date is None) or (date.date() == datetime.now().date())
-        ttl = 900 if is_today else 3600
-
-        cached = self.cache.get(cache_key, ttl=ttl)
-        if cached:
-            return cached
-
-        result = self._read_from_sqlite(date, platform_ids, db_type)
+        # 数据库文件变化时缓存失效；并发读取同一天时只查询一次数据库
+        result = self.cache.get_or_compute(
+            cache_key,
+            lambda: self._read_from_sqlite(date, platform_ids, db_type),
+            depends_on=self.data_dependencies([date_str], db_type),
+        )
         if result:
-            self.cache.set(cache_key, result)
             return result
 
         raise DataNotFoundError(
@@ -341,6 +386,166 @@ class ParserService:
             suggestion="请先运行爬虫或检查日期是否正确"
         )
 
+    def _range_dates(self, start_date: datetime, end_date: datetime) -> List[str]:
+        """获取日期范围内的日期字符串列表（包含首尾）"""
+        dates = []
+        current_date = start_date
+        while current_date.date() <= end_date.date():
+            dates.append(self.get_date_folder_name(current_date))
+            current_date += timedelta(days=1)
+        return dates
+
+    def _read_range_by_day(
+        self,
+        dates: List[str],
+        platform_ids: Optional[List[str]],
+        db_type: str
+    ) -> Dict[str, Tuple[Dict, Dict]]:
+        """逐天读取（标题索引不可用时的回退）"""
+        result = {}
+        for date_str in dates:
+            try:
+                all_titles, id_to_name, _ = self.read_all_titles_for_date(
+                    datetime.strptime(date_str, "%Y-%m-%d"), platform_ids, db_type
+                )
+                result[date_str] = (all_titles, id_to_name)
+            except DataNotFoundError:
+                pass
+        return result
+
+    def read_titles_for_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None,
+        db_type: str = "news"
+    ) -> Dict[str, Tuple[Dict, Dict]]:
+        """
+        读取日期范围内每天的标题（通过多日标题索引一次查询）
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期（包含）
+            platform_ids: 平台/Feed ID列表，None表示所有
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            {日期(YYYY-MM-DD): (all_titles, id_to_name)}，没有数据的日期不包含在内
+        """
+        dates = self._range_dates(start_date, end_date)
+
+        try:
+            return self.title_indexes[db_type].read_range(dates, platform_ids)
+        except Exception as e:
+            print(f"Warning: 多日标题索引不可用，逐天读取: {e}")
+
+        return self._read_range_by_day(dates, platform_ids, db_type)
+
+    def search_titles_for_range(
+        self,
+        keyword: str,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None,
+        db_type: str = "news"
+    ) -> Dict[str, Tuple[Dict, Dict]]:
+        """
+        获取日期范围内标题或摘要可能包含关键词的条目（全文索引候选）
+
+        结构与 read_titles_for_range 相同，但只包含候选条目；
+        调用方仍需按自己的规则（如是否区分大小写）确认匹配。
+
+        Args:
+            keyword: 搜索关键词
+            start_date: 开始日期
+            end_date: 结束日期（包含）
+            platform_ids: 平台/Feed ID列表，None表示所有
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            {日期(YYYY-MM-DD): (all_titles, id_to_name)}
+        """
+        dates = self._range_dates(start_date, end_date)
+
+        try:
+            return self.title_indexes[db_type].search(keyword, dates, platform_ids)
+        except Exception as e:
+            print(f"Warning: 多日标题索引不可用，逐天读取: {e}")
+
+        return self._read_range_by_day(dates, platform_ids, db_type)
+
+    def read_distinct_titles(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None,
+        keyword: Optional[str] = None,
+        columns: Tuple[str, ...] = (),
+        db_type: str = "news"
+    ):
+        """
+        从列式历史数据读取日期范围内每天每个平台的不重复标题
+
+        行与 read_titles_for_range 返回的字典条目一一对应（顺序相同），
+        适合只需要少数字段的统计分析。
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期（包含）
+            platform_ids: 平台ID列表，None表示所有
+            keyword: 只保留标题包含关键词（不区分大小写）的条目
+            columns: 额外需要的列（如 ranks）
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            pyarrow.Table（date、platform_id、platform_name、title 及 columns），
+            未安装 pyarrow 或读取失败时返回 None（调用方回退到 read_titles_for_range）
+        """
+        store = self.columnar_stores.get(db_type)
+        if store is None:
+            return None
+
+        try:
+            return store.distinct_titles(
+                self._range_dates(start_date, end_date), platform_ids, keyword, columns
+            )
+        except Exception as e:
+            print(f"Warning: 列式历史数据不可用，使用标题索引: {e}")
+            return None
+
+    def scan_columnar(
+        self,
+        table_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        columns: Optional[List[str]] = None,
+        platform_ids: Optional[List[str]] = None,
+        db_type: str = "news"
+    ):
+        """
+        从列式历史数据扫描日期范围内的某张表
+
+        Args:
+            table_name: 表名（news_items / rank_history / crawl_records / rss_items / rss_crawl_records）
+            start_date: 开始日期
+            end_date: 结束日期（包含）
+            columns: 需要的列（默认全部列），日期列名为 date
+            platform_ids: 平台/Feed ID 列表，None 表示所有
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            pyarrow.Table，未安装 pyarrow 或读取失败时返回 None
+        """
+        store = self.columnar_stores.get(db_type)
+        if store is None:
+            return None
+
+        try:
+            return store.scan(table_name, self._range_dates(start_date, end_date), columns, platform_ids)
+        except Exception as e:
+            print(f"Warning: 列式历史数据不可用: {e}")
+            return None
+
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
         解析YAML配置文件
@@ -418,15 +623,18 @@ class ParserService:
         Returns:
             日期字符串列表（YYYY-MM-DD 格式，降序排列）
         """
+        from trendradar.storage.archive import parse_db_date
+
         db_dir = self.project_root / "output" / db_type
         if not db_dir.exists():
             return []
 
-        dates = []
-        for db_file in db_dir.glob("*.db"):
-            date_match = re.match(r'(\d{4}-\d{2}-\d{2})\.db$', db_file.name)
-            if date_match:
-                dates.append(date_match.group(1))
+        # 同一日期可能同时存在数据库与压缩归档
+        dates = set()
+        for db_file in db_dir.glob("*.db*"):
+            date_str = parse_db_date(db_file.name)
+            if date_str:
+                dates.add(date_str)
 
         return sorted(dates, reverse=True)
 
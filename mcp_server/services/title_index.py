@@ -0,0 +1,366 @@
+"""
+多日标题索引
+
+跨天查询（关键词搜索、话题趋势、生命周期、时期对比等）原本逐天调用
+read_all_titles_for_date，每天都要打开一个数据库并展开全部排名历史。
+
+TitleIndex 把所有保留日期的标题汇总到一个本地 SQLite 文件
+（热榜 output/index/news.db，RSS output/index/rss.db）：
+- 每个 (日期, 平台, 标题) 一行，热榜附带预先聚合的排名统计（最高排名、排名次数）
+  与完整排名列表（逗号分隔），RSS 附带摘要、发布时间、作者
+- 每个日期记录数据库文件状态，文件变化（新的一天、爬虫写入、远程拉取覆盖）
+  时只重建该日期的行；数据库被删除时对应行一并删除
+- 日期范围查询只需一次按日期索引的扫描
+- 标题与摘要同时写入 FTS5 全文索引（trigram 分词，适用于中文），
+  关键词搜索先用全文索引取候选，不再逐条扫描整个日期范围
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# 索引格式版本（记录在 user_version 中，以后结构变化时据此迁移）
+INDEX_VERSION = 1
+
+# trigram 分词的最短可检索长度（更短的关键词无法使用全文索引）
+FTS_MIN_KEYWORD_LENGTH = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS indexed_days (
+    date TEXT PRIMARY KEY,
+    file_state TEXT NOT NULL,
+    title_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS titles (
+    date TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    platform_id TEXT NOT NULL,
+    platform_name TEXT NOT NULL,
+    title TEXT NOT NULL,
+    ranks TEXT NOT NULL DEFAULT '',
+    best_rank INTEGER,
+    rank_count INTEGER NOT NULL DEFAULT 0,
+    url TEXT NOT NULL DEFAULT '',
+    mobile_url TEXT NOT NULL DEFAULT '',
+    summary TEXT NOT NULL DEFAULT '',
+    published_at TEXT NOT NULL DEFAULT '',
+    author TEXT NOT NULL DEFAULT '',
+    first_time TEXT NOT NULL DEFAULT '',
+    last_time TEXT NOT NULL DEFAULT '',
+    count INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (date, seq),
+    UNIQUE (date, platform_id, title)
+);
+
+CREATE INDEX IF NOT EXISTS idx_titles_platform ON titles(platform_id, date);
+"""
+
+# 全文索引（外部内容表，由触发器与 titles 保持同步）
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS titles_fts USING fts5(
+    title, summary,
+    content='titles', content_rowid='rowid',
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS titles_fts_insert AFTER INSERT ON titles BEGIN
+    INSERT INTO titles_fts(rowid, title, summary) VALUES (new.rowid, new.title, new.summary);
+END;
+
+CREATE TRIGGER IF NOT EXISTS titles_fts_delete AFTER DELETE ON titles BEGIN
+    INSERT INTO titles_fts(titles_fts, rowid, title, summary)
+    VALUES ('delete', old.rowid, old.title, old.summary);
+END;
+"""
+
+_COLUMNS = """
+    t.date, t.platform_id, t.platform_name, t.title, t.ranks, t.url, t.mobile_url,
+    t.summary, t.published_at, t.author, t.first_time, t.last_time, t.count
+"""
+
+# load_day 的返回值：(all_titles, id_to_name, all_timestamps) 或 None
+DayLoader = Callable[[str], Optional[Tuple[Dict, Dict, Dict]]]
+DayTitles = Tuple[Dict, Dict]
+
+
+class TitleIndex:
+    """多日标题索引（线程安全）"""
+
+    def __init__(self, data_dir: Path, load_day: DayLoader, db_type: str = "news"):
+        """
+        初始化索引
+
+        Args:
+            data_dir: 数据目录（output）
+            load_day: 读取某一天全部标题的函数，参数为 YYYY-MM-DD
+            db_type: 数据库类型 ("news" 或 "rss")
+        """
+        self.data_dir = Path(data_dir)
+        self.db_type = db_type
+        self.index_path = self.data_dir / "index" / f"{db_type}.db"
+        self._load_day = load_day
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self._has_fts = False
+
+    def _day_db_path(self, date_str: str) -> Path:
+        """获取某一天的数据库路径（已压缩归档时为归档文件路径）"""
+        from trendradar.storage.archive import find_archive
+
+        db_path = self.data_dir / self.db_type / f"{date_str}.db"
+        if db_path.exists():
+            return db_path
+        return find_archive(db_path) or db_path
+
+    def _connect(self) -> sqlite3.Connection:
+        """打开索引数据库（首次打开时初始化结构）"""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.index_path), timeout=30)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+
+        if not self._schema_ready:
+            conn.executescript(_SCHEMA)
+
+            # SQLite 未编译 FTS5（或不支持 trigram）时关键词搜索退化为扫描
+            try:
+                fts_existed = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'titles_fts'"
+                ).fetchone()
+                conn.executescript(_FTS_SCHEMA)
+                if not fts_existed:
+                    # 全文索引晚于标题行创建时（如之前的 SQLite 不支持 FTS5），补建已有行
+                    conn.execute("INSERT INTO titles_fts(titles_fts) VALUES ('rebuild')")
+                self._has_fts = True
+            except sqlite3.OperationalError as e:
+                print(f"Warning: SQLite 不支持 FTS5 trigram，关键词搜索使用扫描: {e}")
+                self._has_fts = False
+
+            conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+            conn.commit()
+            self._schema_ready = True
+
+        return conn
+
+    def _file_state(self, date_str: str) -> Optional[str]:
+        """获取某一天数据库的文件状态（不存在返回 None）"""
+        from trendradar.storage.snapshot import get_file_state
+
+        state = get_file_state(str(self._day_db_path(date_str)))
+        return json.dumps(state) if state else None
+
+    def _index_day(self, conn: sqlite3.Connection, date_str: str, file_state: str) -> int:
+        """重建某一天的索引行，返回标题数"""
+        result = self._load_day(date_str)
+        conn.execute("DELETE FROM titles WHERE date = ?", (date_str,))
+        if not result:
+            # 读取失败或没有数据：不记录文件状态，下次查询时重试
+            conn.execute("DELETE FROM indexed_days WHERE date = ?", (date_str,))
+            return 0
+
+        all_titles, id_to_name = result[0], result[1]
+        rows = []
+        for platform_id, titles in all_titles.items():
+            platform_name = id_to_name.get(platform_id, platform_id)
+            for title, info in titles.items():
+                ranks = info.get("ranks") or []
+                rows.append((
+                    date_str,
+                    len(rows),
+                    platform_id,
+                    platform_name,
+                    title,
+                    ",".join(map(str, ranks)),
+                    min(ranks) if ranks else None,
+                    len(ranks),
+                    info.get("url", ""),
+                    info.get("mobileUrl", ""),
+                    info.get("summary", ""),
+                    info.get("published_at", ""),
+                    info.get("author", ""),
+                    info.get("first_time", ""),
+                    info.get("last_time", ""),
+                    info.get("count", 1),
+                ))
+
+        conn.executemany("""
+            INSERT INTO titles
+            (date, seq, platform_id, platform_name, title, ranks, best_rank, rank_count,
+             url, mobile_url, summary, published_at, author, first_time, last_time, count)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        conn.execute("""
+            INSERT OR REPLACE INTO indexed_days (date, file_state, title_count)
+            VALUES (?, ?, ?)
+        """, (date_str, file_state, len(rows)))
+        return len(rows)
+
+    def _refresh(self, conn: sqlite3.Connection, dates: Iterable[str]) -> int:
+        """同步指定日期的索引，返回重建（或删除）的日期数"""
+        indexed = {
+            row[0]: row[1]
+            for row in conn.execute("SELECT date, file_state FROM indexed_days")
+        }
+
+        refreshed = 0
+        for date_str in dates:
+            file_state = self._file_state(date_str)
+            if file_state is None:
+                if date_str in indexed:
+                    conn.execute("DELETE FROM titles WHERE date = ?", (date_str,))
+                    conn.execute("DELETE FROM indexed_days WHERE date = ?", (date_str,))
+                    refreshed += 1
+                continue
+            if indexed.get(date_str) == file_state:
+                continue
+
+            self._index_day(conn, date_str, file_state)
+            refreshed += 1
+
+        if refreshed:
+            conn.commit()
+        return refreshed
+
+    def refresh(self, dates: Optional[Iterable[str]] = None) -> int:
+        """
+        同步索引与数据库文件
+
+        Args:
+            dates: 需要同步的日期列表（YYYY-MM-DD），None 表示全部已索引及现存的日期
+
+        Returns:
+            重建（或删除）的日期数
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                if dates is None:
+                    from trendradar.storage.archive import parse_db_date
+
+                    day_files = (self.data_dir / self.db_type).glob("*.db*")
+                    existing = {parse_db_date(path.name) for path in day_files} - {None}
+                    indexed = {row[0] for row in conn.execute("SELECT date FROM indexed_days")}
+                    dates = sorted(existing | indexed)
+                return self._refresh(conn, dates)
+            finally:
+                conn.close()
+
+    def _query(
+        self,
+        dates: List[str],
+        platform_ids: Optional[List[str]],
+        keyword: Optional[str] = None,
+    ) -> Dict[str, DayTitles]:
+        """同步日期后查询（keyword 非空且可用全文索引时只返回候选行）"""
+        if not dates:
+            return {}
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                self._refresh(conn, dates)
+
+                params: List = []
+                if keyword and self._has_fts and len(keyword) >= FTS_MIN_KEYWORD_LENGTH:
+                    # 短语查询：trigram 下等价于（不区分大小写的）子串匹配
+                    sql = f"""
+                        SELECT {_COLUMNS}
+                        FROM titles_fts JOIN titles t ON t.rowid = titles_fts.rowid
+                        WHERE titles_fts MATCH ?
+                    """
+                    params.append('"' + keyword.replace('"', '""') + '"')
+                else:
+                    sql = f"SELECT {_COLUMNS} FROM titles t WHERE 1 = 1"
+
+                sql += f" AND t.date IN ({','.join('?' * len(dates))})"
+                params.extend(dates)
+                if platform_ids:
+                    sql += f" AND t.platform_id IN ({','.join('?' * len(platform_ids))})"
+                    params.extend(platform_ids)
+                sql += " ORDER BY t.date, t.seq"
+
+                rows = conn.execute(sql, params).fetchall()
+            finally:
+                conn.close()
+
+        result: Dict[str, DayTitles] = {}
+        for (date_str, platform_id, platform_name, title, ranks, url, mobile_url,
+             summary, published_at, author, first_time, last_time, count) in rows:
+            day = result.get(date_str)
+            if day is None:
+                day = result[date_str] = ({}, {})
+            all_titles, id_to_name = day
+
+            if platform_id not in id_to_name:
+                id_to_name[platform_id] = platform_name
+                all_titles[platform_id] = {}
+
+            if self.db_type == "rss":
+                info = {
+                    "url": url,
+                    "published_at": published_at,
+                    "summary": summary,
+                    "author": author,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "count": count,
+                }
+            else:
+                info = {
+                    "ranks": [int(rank) for rank in ranks.split(",")] if ranks else [],
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "count": count,
+                }
+            all_titles[platform_id][title] = info
+
+        return result
+
+    def read_range(
+        self,
+        dates: List[str],
+        platform_ids: Optional[List[str]] = None,
+    ) -> Dict[str, DayTitles]:
+        """
+        读取多个日期的标题（先同步这些日期）
+
+        返回结构与 read_all_titles_for_date 的前两项相同（包括标题与平台的顺序），
+        没有数据的日期不会出现在结果中。
+
+        Args:
+            dates: 日期列表（YYYY-MM-DD）
+            platform_ids: 平台ID列表，None 表示所有平台
+
+        Returns:
+            {日期: (all_titles, id_to_name)}
+        """
+        return self._query(dates, platform_ids)
+
+    def search(
+        self,
+        keyword: str,
+        dates: List[str],
+        platform_ids: Optional[List[str]] = None,
+    ) -> Dict[str, DayTitles]:
+        """
+        查找标题或摘要可能包含关键词的条目（结构同 read_range）
+
+        返回的是候选集合：包含所有（不区分大小写）含有关键词的条目，
+        调用方仍需按自己的匹配规则确认。关键词短于 3 个字符时无法使用
+        trigram 索引，返回范围内的全部条目。
+
+        Args:
+            keyword: 关键词
+            dates: 日期列表（YYYY-MM-DD）
+            platform_ids: 平台ID列表，None 表示所有平台
+
+        Returns:
+            {日期: (all_titles, id_to_name)}
+        """
+        return self._query(dates, platform_ids, keyword=keyword)
@@ -8,7 +8,6 @@ import re
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union
-from difflib import SequenceMatcher
 
 from ..services.data_service import DataService
 from ..utils.validators import (
@@ -17,9 +16,19 @@ from ..utils.validators import (
     validate_keyword,
     validate_top_n,
     validate_date_range,
-    validate_threshold
+    validate_threshold,
+    validate_mode
 )
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
+from ..utils.similarity import CLUSTER_MODES, cluster_similar, is_similar, text_similarity
+
+
+# 权重配置（与 config.yaml 保持一致）
+NEWS_WEIGHT_CONFIG = {
+    "RANK_WEIGHT": 0.6,
+    "FREQUENCY_WEIGHT": 0.3,
+    "HOTNESS_WEIGHT": 0.1,
+}
 
 
 def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
@@ -37,41 +46,41 @@ def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     Returns:
         权重分数（0-100之间的浮点数）
     """
-    ranks = news_data.get("ranks", [])
-    if not ranks:
-        return 0.0
+    from trendradar.core.weight import calculate_news_weight as _calculate_weight
+
+    return _calculate_weight(news_data, rank_threshold, NEWS_WEIGHT_CONFIG)
+
+
+def calculate_news_weights(news_list: List[Dict], rank_threshold: int = 5) -> List[float]:
+    """
+    批量计算新闻权重（结果与逐条调用 calculate_news_weight 相同）
 
-    count = news_data.get("count", len(ranks))
+    Args:
+        news_list: 新闻数据列表
+        rank_threshold: 高排名阈值，默认5
 
-    # 权重配置（与 config.yaml 保持一致）
-    RANK_WEIGHT = 0.6
-    FREQUENCY_WEIGHT = 0.3
-    HOTNESS_WEIGHT = 0.1
+    Returns:
+        与 news_list 一一对应的权重列表
+    """
+    from trendradar.core.weight import calculate_news_weights as _calculate_weights
 
-    # 1. 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
-    for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
+    return _calculate_weights(news_list, rank_threshold, NEWS_WEIGHT_CONFIG)
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
 
-    # 2. 频次权重：min(出现次数, 10) × 10
-    frequency_weight = min(count, 10) * 10
+def sort_news_by_weight(news_list: List[Dict], rank_threshold: int = 5) -> List[Dict]:
+    """
+    按权重从高到低排序（稳定排序，权重相同时保持原顺序）
 
-    # 3. 热度加成：高排名次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
+    Args:
+        news_list: 新闻数据列表
+        rank_threshold: 高排名阈值，默认5
 
-    # 综合权重
-    total_weight = (
-        rank_weight * RANK_WEIGHT
-        + frequency_weight * FREQUENCY_WEIGHT
-        + hotness_weight * HOTNESS_WEIGHT
-    )
+    Returns:
+        排序后的新列表
+    """
+    from trendradar.core.weight import sort_news_by_weight as _sort_by_weight
 
-    return total_weight
+    return _sort_by_weight(news_list, rank_threshold, NEWS_WEIGHT_CONFIG, tie_break=False)
 
 
 class AnalyticsTools:
@@ -308,13 +317,13 @@ class AnalyticsTools:
 
             # 收集趋势数据
             trend_data = []
+            day_titles = self.data_service.parser.read_titles_for_range(start_date, end_date)
             current_date = start_date
 
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
+                day = day_titles.get(current_date.strftime("%Y-%m-%d"))
+                if day:
+                    all_titles, _ = day
 
                     # 统计该时间点的话题出现次数
                     count = 0
@@ -332,7 +341,7 @@ class AnalyticsTools:
                         "sample_titles": matched_titles[:3]  # 只保留前3个样本
                     })
 
-                except DataNotFoundError:
+                else:
                     trend_data.append({
                         "date": current_date.strftime("%Y-%m-%d"),
                         "count": 0,
@@ -450,12 +459,12 @@ class AnalyticsTools:
             })
 
             # 遍历日期范围
+            day_titles = self.data_service.parser.read_titles_for_range(start_date, end_date)
             current_date = start_date
             while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
+                day = day_titles.get(current_date.strftime("%Y-%m-%d"))
+                if day:
+                    all_titles, id_to_name = day
 
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
@@ -472,9 +481,6 @@ class AnalyticsTools:
                             keywords = self._extract_keywords(title)
                             platform_stats[platform_name]["top_keywords"].update(keywords)
 
-                except DataNotFoundError:
-                    pass
-
                 current_date += timedelta(days=1)
 
             # 转换为可序列化的格式
@@ -697,14 +703,13 @@ class AnalyticsTools:
 
             # 收集新闻数据（支持多天）
             all_news_items = []
+            day_titles = self.data_service.parser.read_titles_for_range(start_date, end_date, platforms)
             current_date = start_date
 
             while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
+                day = day_titles.get(current_date.strftime("%Y-%m-%d"))
+                if day:
+                    all_titles, id_to_name = day
 
                     # 收集该日期的新闻
                     for platform_id, titles in all_titles.items():
@@ -729,10 +734,6 @@ class AnalyticsTools:
 
                             all_news_items.append(news_item)
 
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
-
                 # 下一天
                 current_date += timedelta(days=1)
 
@@ -759,10 +760,7 @@ class AnalyticsTools:
 
             # 按权重排序（如果启用）
             if sort_by_weight:
-                deduplicated_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
+                deduplicated_news = sort_news_by_weight(deduplicated_news)
 
             # 限制返回数量
             selected_news = deduplicated_news[:limit]
@@ -965,10 +963,10 @@ class AnalyticsTools:
                     if title == reference_title:
                         continue
 
-                    # 计算相似度
-                    similarity = self._calculate_similarity(reference_title, title)
+                    # 计算相似度（上界低于阈值时跳过完整计算）
+                    matched, similarity = is_similar(reference_title, title, threshold)
 
-                    if similarity >= threshold:
+                    if matched:
                         news_item = {
                             "title": title,
                             "platform": platform_id,
@@ -1116,10 +1114,7 @@ class AnalyticsTools:
 
             # 按权重排序（如果启用）
             if sort_by_weight:
-                related_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
+                related_news = sort_news_by_weight(related_news)
             else:
                 # 按排名排序
                 related_news.sort(key=lambda x: x["rank"])
@@ -1210,12 +1205,12 @@ class AnalyticsTools:
             all_platforms_news = defaultdict(int)
             all_titles_list = []
 
+            day_titles = self.data_service.parser.read_titles_for_range(start_date, end_date)
             current_date = start_date
             while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
+                day = day_titles.get(current_date.strftime("%Y-%m-%d"))
+                if day:
+                    all_titles, id_to_name = day
 
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
@@ -1232,9 +1227,6 @@ class AnalyticsTools:
                             keywords = self._extract_keywords(title)
                             all_keywords.update(keywords)
 
-                except DataNotFoundError:
-                    pass
-
                 current_date += timedelta(days=1)
 
             # 生成报告
@@ -1382,35 +1374,24 @@ class AnalyticsTools:
                 "hourly_distribution": Counter()
             })
 
-            # 遍历日期范围
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-
-                        platform_activity[platform_name]["news_count"] += len(titles)
-                        platform_activity[platform_name]["days_active"].add(current_date.strftime("%Y-%m-%d"))
+            # 遍历日期范围：{(日期, 平台ID, 平台名): 标题数}，{日期: [抓取时间]}
+            daily_counts, crawl_times = self._collect_platform_daily_counts(start_date, end_date)
 
-                        # 统计更新次数（基于文件数量）
-                        platform_activity[platform_name]["total_updates"] += len(timestamps)
+            for (date_str, _, platform_name), news_count in daily_counts.items():
+                platform_activity[platform_name]["news_count"] += news_count
+                platform_activity[platform_name]["days_active"].add(date_str)
 
-                        # 统计时间分布（基于文件名中的时间）
-                        for filename in timestamps.keys():
-                            # 解析文件名中的小时（格式：HHMM.txt）
-                            match = re.match(r'(\d{2})(\d{2})\.txt', filename)
-                            if match:
-                                hour = int(match.group(1))
-                                platform_activity[platform_name]["hourly_distribution"][hour] += 1
+                # 统计更新次数（基于抓取次数）
+                day_crawl_times = crawl_times.get(date_str, [])
+                platform_activity[platform_name]["total_updates"] += len(day_crawl_times)
 
-                except DataNotFoundError:
-                    pass
-
-                current_date += timedelta(days=1)
+                # 统计时间分布（基于抓取时间）
+                for crawl_time in day_crawl_times:
+                    # 解析抓取时间中的小时（格式：HH-MM 或 HH:MM）
+                    match = re.match(r'(\d{2})[-:](\d{2})', crawl_time)
+                    if match:
+                        hour = int(match.group(1))
+                        platform_activity[platform_name]["hourly_distribution"][hour] += 1
 
             # 转换为可序列化的格式
             result_activity = {}
@@ -1465,6 +1446,91 @@ class AnalyticsTools:
                 }
             }
 
+    def _collect_platform_daily_counts(
+        self,
+        start_date: datetime,
+        end_date: datetime
+    ) -> tuple:
+        """
+        统计日期范围内每天每个平台的标题数与每天的抓取时间
+
+        优先使用列式历史数据（只读取日期、平台、标题与抓取时间列），
+        不可用时逐天读取。
+
+        Returns:
+            ({(日期, 平台ID, 平台名): 标题数}, {日期: [抓取时间]})
+        """
+        parser = self.data_service.parser
+        daily_counts = {}
+        crawl_times = defaultdict(list)
+
+        titles = parser.read_distinct_titles(start_date, end_date)
+        records = parser.scan_columnar("crawl_records", start_date, end_date, ["date", "crawl_time"])
+        if titles is not None and records is not None:
+            # 单线程分组保持首次出现顺序（日期、平台）
+            counts = titles.group_by(
+                ["date", "platform_id", "platform_name"], use_threads=False
+            ).aggregate([("title", "count")])
+            for date_str, platform_id, platform_name, news_count in zip(
+                counts["date"].to_pylist(),
+                counts["platform_id"].to_pylist(),
+                counts["platform_name"].to_pylist(),
+                counts["title_count"].to_pylist(),
+            ):
+                daily_counts[(date_str, platform_id, platform_name)] = news_count
+            for date_str, crawl_time in zip(records["date"].to_pylist(), records["crawl_time"].to_pylist()):
+                crawl_times[date_str].append(crawl_time)
+            return daily_counts, crawl_times
+
+        current_date = start_date
+        while current_date <= end_date:
+            date_str = current_date.strftime("%Y-%m-%d")
+            try:
+                all_titles, id_to_name, timestamps = parser.read_all_titles_for_date(date=current_date)
+
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
+                    daily_counts[(date_str, platform_id, platform_name)] = len(titles)
+
+                # timestamps 的键为 "{抓取时间}.db"
+                crawl_times[date_str] = [filename[:-len(".db")] for filename in timestamps.keys()]
+
+            except DataNotFoundError:
+                pass
+
+            current_date += timedelta(days=1)
+
+        return daily_counts, crawl_times
+
+    def _count_topic_by_date(
+        self,
+        topic: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Counter:
+        """
+        统计日期范围内每天标题包含话题（不区分大小写）的条目数
+
+        优先使用列式历史数据（关键词过滤在扫描时完成），不可用时使用标题索引。
+
+        Returns:
+            {日期: 条目数}
+        """
+        parser = self.data_service.parser
+
+        titles = parser.read_distinct_titles(start_date, end_date, keyword=topic)
+        if titles is not None:
+            return Counter(titles["date"].to_pylist())
+
+        topic_counts = Counter()
+        day_titles = parser.read_titles_for_range(start_date, end_date)
+        for date_str, (all_titles, _) in day_titles.items():
+            for _, titles in all_titles.items():
+                for title in titles.keys():
+                    if topic.lower() in title.lower():
+                        topic_counts[date_str] += 1
+        return topic_counts
+
     def analyze_topic_lifecycle(
         self,
         topic: str,
@@ -1510,32 +1576,16 @@ class AnalyticsTools:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=6)
 
-            # 收集话题历史数据
+            # 收集话题历史数据（统计每日的话题出现次数）
             lifecycle_data = []
+            topic_counts = self._count_topic_by_date(topic, start_date, end_date)
             current_date = start_date
             while current_date <= end_date:
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    # 统计该日的话题出现次数
-                    count = 0
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            if topic.lower() in title.lower():
-                                count += 1
-
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": count
-                    })
-
-                except DataNotFoundError:
-                    lifecycle_data.append({
-                        "date": current_date.strftime("%Y-%m-%d"),
-                        "count": 0
-                    })
+                date_str = current_date.strftime("%Y-%m-%d")
+                lifecycle_data.append({
+                    "date": date_str,
+                    "count": topic_counts.get(date_str, 0)
+                })
 
                 current_date += timedelta(days=1)
 
@@ -1805,27 +1855,10 @@ class AnalyticsTools:
             # 收集最近3天的数据用于预测
             keyword_trends = defaultdict(list)
 
-            for days_ago in range(3, 0, -1):
-                date = datetime.now() - timedelta(days=days_ago)
-
-                try:
-                    all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=date
-                    )
-
-                    # 统计关键词
-                    keywords_count = Counter()
-                    for _, titles in all_titles.items():
-                        for title in titles.keys():
-                            keywords = self._extract_keywords(title)
-                            keywords_count.update(keywords)
-
-                    # 记录每个关键词的历史数据
-                    for keyword, count in keywords_count.items():
-                        keyword_trends[keyword].append(count)
-
-                except DataNotFoundError:
-                    pass
+            for keywords_count in self._past_keyword_counts(days=3):
+                # 记录每个关键词的历史数据
+                for keyword, count in keywords_count.items():
+                    keyword_trends[keyword].append(count)
 
             # 添加今天的数据
             try:
@@ -1931,6 +1964,54 @@ class AnalyticsTools:
 
     # ==================== 辅助方法 ====================
 
+    def _past_keyword_counts(self, days: int) -> List[Counter]:
+        """
+        统计今天之前 N 天每天的关键词出现次数（按日期升序，没有数据的日期跳过）
+
+        优先使用列式历史数据（只读取日期与标题列），同一标题的关键词只提取一次；
+        不可用时逐天读取。
+
+        Args:
+            days: 天数
+
+        Returns:
+            每天的关键词计数列表
+        """
+        parser = self.data_service.parser
+        now = datetime.now()
+        start_date, end_date = now - timedelta(days=days), now - timedelta(days=1)
+
+        titles = parser.read_distinct_titles(start_date, end_date)
+        if titles is not None:
+            daily_counts = {}
+            keyword_cache = {}
+            for date_str, title in zip(titles["date"].to_pylist(), titles["title"].to_pylist()):
+                keywords = keyword_cache.get(title)
+                if keywords is None:
+                    keywords = keyword_cache[title] = self._extract_keywords(title)
+                daily_counts.setdefault(date_str, Counter()).update(keywords)
+            return [daily_counts[date_str] for date_str in sorted(daily_counts)]
+
+        result = []
+        for days_ago in range(days, 0, -1):
+            date = now - timedelta(days=days_ago)
+
+            try:
+                all_titles, _, _ = parser.read_all_titles_for_date(date=date)
+
+                # 统计关键词
+                keywords_count = Counter()
+                for _, titles in all_titles.items():
+                    for title in titles.keys():
+                        keywords = self._extract_keywords(title)
+                        keywords_count.update(keywords)
+                result.append(keywords_count)
+
+            except DataNotFoundError:
+                pass
+
+        return result
+
     def _extract_keywords(self, title: str, min_length: int = 2) -> List[str]:
         """
         从标题中提取关键词（简单实现）
@@ -1971,7 +2052,7 @@ class AnalyticsTools:
             相似度分数（0-1之间）
         """
         # 使用 SequenceMatcher 计算相似度
-        return SequenceMatcher(None, text1, text2).ratio()
+        return text_similarity(text1, text2)
 
     def _find_unique_topics(self, platform_stats: Dict) -> Dict[str, List[str]]:
         """
@@ -2014,7 +2095,8 @@ class AnalyticsTools:
         platforms: Optional[List[str]] = None,
         similarity_threshold: float = 0.7,
         limit: int = 50,
-        include_url: bool = False
+        include_url: bool = False,
+        match_mode: str = "balanced"
     ) -> Dict:
         """
         跨平台新闻聚合 - 对相似新闻进行去重合并
@@ -2030,6 +2112,11 @@ class AnalyticsTools:
             similarity_threshold: 相似度阈值，0-1之间，默认0.7
             limit: 返回聚合新闻数量，默认50
             include_url: 是否包含URL链接，默认False
+            match_mode: 相似标题匹配模式（召回与耗时的取舍），默认 balanced
+                - fast: 最快，漏掉部分边缘相似标题
+                - balanced: 默认
+                - thorough: 召回更高，耗时约 2 倍
+                - exact: 逐对比较所有标题（结果精确，数据量大时很慢）
 
         Returns:
             聚合结果字典，包含：
@@ -2043,6 +2130,7 @@ class AnalyticsTools:
                 similarity_threshold, default=0.7, min_value=0.3, max_value=1.0
             )
             limit = validate_limit(limit, default=50)
+            match_mode = validate_mode(match_mode, list(CLUSTER_MODES), "balanced")
 
             # 处理日期范围
             if date_range:
@@ -2053,14 +2141,13 @@ class AnalyticsTools:
 
             # 收集所有新闻
             all_news = []
+            day_titles = self.data_service.parser.read_titles_for_range(start_date, end_date, platforms)
             current_date = start_date
 
             while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
+                day = day_titles.get(current_date.strftime("%Y-%m-%d"))
+                if day:
+                    all_titles, id_to_name = day
 
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
@@ -2080,15 +2167,14 @@ class AnalyticsTools:
                                 news_item["url"] = info.get("url", "")
                                 news_item["mobileUrl"] = info.get("mobileUrl", "")
 
-                            # 计算权重
-                            news_item["weight"] = calculate_news_weight(news_item)
                             all_news.append(news_item)
 
-                except DataNotFoundError:
-                    pass
-
                 current_date += timedelta(days=1)
 
+            # 批量计算权重
+            for news_item, weight in zip(all_news, calculate_news_weights(all_news)):
+                news_item["weight"] = weight
+
             if not all_news:
                 return {
                     "success": True,
@@ -2103,7 +2189,7 @@ class AnalyticsTools:
 
             # 执行聚合
             aggregated = self._aggregate_similar_news(
-                all_news, similarity_threshold, include_url
+                all_news, similarity_threshold, include_url, match_mode
             )
 
             # 按综合权重排序
@@ -2131,6 +2217,7 @@ class AnalyticsTools:
                     "returned": len(results),
                     "deduplication_rate": f"{dedup_rate * 100:.1f}%",
                     "similarity_threshold": similarity_threshold,
+                    "match_mode": match_mode,
                     "date_range": {
                         "start": start_date.strftime("%Y-%m-%d"),
                         "end": end_date.strftime("%Y-%m-%d")
@@ -2153,7 +2240,8 @@ class AnalyticsTools:
         self,
         news_list: List[Dict],
         threshold: float,
-        include_url: bool
+        include_url: bool,
+        match_mode: str = "balanced"
     ) -> List[Dict]:
         """
         对新闻列表进行相似度聚合
@@ -2162,6 +2250,7 @@ class AnalyticsTools:
             news_list: 新闻列表
             threshold: 相似度阈值
             include_url: 是否包含URL
+            match_mode: 匹配模式（CLUSTER_MODES 的键）
 
         Returns:
             聚合后的新闻列表
@@ -2172,12 +2261,19 @@ class AnalyticsTools:
         # 按权重排序，优先保留高权重新闻作为代表
         sorted_news = sorted(news_list, key=lambda x: x.get("weight", 0), reverse=True)
 
+        # 用 MinHash/LSH 只比较可能相似的标题，规则与逐对比较相同（exact 模式逐对比较）
+        lsh_params = CLUSTER_MODES[match_mode]
+        titles = [news["title"] for news in sorted_news]
+        if lsh_params is None:
+            clusters = cluster_similar(titles, threshold, exhaustive=True)
+        else:
+            num_perm, bands = lsh_params
+            clusters = cluster_similar(titles, threshold, num_perm=num_perm, bands=bands)
+
         aggregated = []
-        used_indices = set()
 
-        for i, news in enumerate(sorted_news):
-            if i in used_indices:
-                continue
+        for cluster in clusters:
+            news = sorted_news[cluster[0]]
 
             # 创建聚合组
             group = {
@@ -2202,45 +2298,36 @@ class AnalyticsTools:
                     "mobileUrl": news.get("mobileUrl", "")
                 }]
 
-            used_indices.add(i)
-
-            # 查找相似新闻
-            for j, other_news in enumerate(sorted_news):
-                if j in used_indices:
-                    continue
+            # 合并相似新闻
+            for j in cluster[1:]:
+                other_news = sorted_news[j]
 
-                similarity = self._calculate_similarity(news["title"], other_news["title"])
+                if other_news["platform_name"] not in group["platforms"]:
+                    group["platforms"].append(other_news["platform_name"])
+                    group["platform_ids"].append(other_news["platform"])
 
-                if similarity >= threshold:
-                    # 合并到当前组
-                    if other_news["platform_name"] not in group["platforms"]:
-                        group["platforms"].append(other_news["platform_name"])
-                        group["platform_ids"].append(other_news["platform"])
+                if other_news["date"] not in group["dates"]:
+                    group["dates"].append(other_news["date"])
 
-                    if other_news["date"] not in group["dates"]:
-                        group["dates"].append(other_news["date"])
+                group["best_rank"] = min(group["best_rank"], other_news["rank"])
+                group["total_count"] += other_news["count"]
+                group["aggregate_weight"] += other_news.get("weight", 0) * 0.5  # 额外权重
 
-                    group["best_rank"] = min(group["best_rank"], other_news["rank"])
-                    group["total_count"] += other_news["count"]
-                    group["aggregate_weight"] += other_news.get("weight", 0) * 0.5  # 额外权重
+                group["sources"].append({
+                    "platform": other_news["platform_name"],
+                    "rank": other_news["rank"],
+                    "date": other_news["date"]
+                })
 
-                    group["sources"].append({
+                if include_url and other_news.get("url"):
+                    if "urls" not in group:
+                        group["urls"] = []
+                    group["urls"].append({
                         "platform": other_news["platform_name"],
-                        "rank": other_news["rank"],
-                        "date": other_news["date"]
+                        "url": other_news.get("url", ""),
+                        "mobileUrl": other_news.get("mobileUrl", "")
                     })
 
-                    if include_url and other_news.get("url"):
-                        if "urls" not in group:
-                            group["urls"] = []
-                        group["urls"].append({
-                            "platform": other_news["platform_name"],
-                            "url": other_news.get("url", ""),
-                            "mobileUrl": other_news.get("mobileUrl", "")
-                        })
-
-                    used_indices.add(j)
-
             # 添加聚合信息
             group["platform_count"] = len(group["platforms"])
             group["is_cross_platform"] = len(group["platforms"]) > 1
@@ -2388,44 +2475,33 @@ class AnalyticsTools:
         all_keywords = Counter()
         platform_stats = Counter()
 
-        current_date = start_date
-        while current_date <= end_date:
-            try:
-                all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=platforms
-                )
-
-                for platform_id, titles in all_titles.items():
-                    platform_name = id_to_name.get(platform_id, platform_id)
-
-                    for title, info in titles.items():
-                        # 如果指定了话题，过滤不相关的新闻
-                        if topic and topic.lower() not in title.lower():
-                            continue
-
-                        news_item = {
-                            "title": title,
-                            "platform": platform_id,
-                            "platform_name": platform_name,
-                            "date": current_date.strftime("%Y-%m-%d"),
-                            "ranks": info.get("ranks", []),
-                            "rank": info["ranks"][0] if info["ranks"] else 999
-                        }
-                        news_item["weight"] = calculate_news_weight(news_item)
-                        all_news.append(news_item)
+        for date_str, platform_id, platform_name, title, ranks in self._iter_period_titles(
+            start_date, end_date, platforms, topic
+        ):
+            # 如果指定了话题，过滤不相关的新闻
+            if topic and topic.lower() not in title.lower():
+                continue
 
-                        # 统计平台
-                        platform_stats[platform_name] += 1
+            news_item = {
+                "title": title,
+                "platform": platform_id,
+                "platform_name": platform_name,
+                "date": date_str,
+                "ranks": ranks,
+                "rank": ranks[0] if ranks else 999
+            }
+            all_news.append(news_item)
 
-                        # 提取关键词
-                        keywords = self._extract_keywords(title)
-                        all_keywords.update(keywords)
+            # 统计平台
+            platform_stats[platform_name] += 1
 
-            except DataNotFoundError:
-                pass
+            # 提取关键词
+            keywords = self._extract_keywords(title)
+            all_keywords.update(keywords)
 
-            current_date += timedelta(days=1)
+        # 批量计算权重
+        for news_item, weight in zip(all_news, calculate_news_weights(all_news)):
+            news_item["weight"] = weight
 
         return {
             "news": all_news,
@@ -2435,6 +2511,49 @@ class AnalyticsTools:
             "date_range": date_range
         }
 
+    def _iter_period_titles(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platforms: Optional[List[str]],
+        topic: Optional[str]
+    ):
+        """
+        按日期顺序遍历时期内的标题
+
+        优先使用列式历史数据（只读取需要的列，话题在扫描时预先过滤），
+        不可用时使用标题索引。
+
+        Yields:
+            (日期, 平台ID, 平台名, 标题, 排名列表)
+        """
+        parser = self.data_service.parser
+
+        titles = parser.read_distinct_titles(start_date, end_date, platforms, keyword=topic, columns=("ranks",))
+        if titles is not None:
+            yield from zip(
+                titles["date"].to_pylist(),
+                titles["platform_id"].to_pylist(),
+                titles["platform_name"].to_pylist(),
+                titles["title"].to_pylist(),
+                titles["ranks"].to_pylist(),
+            )
+            return
+
+        day_titles = parser.read_titles_for_range(start_date, end_date, platforms)
+        current_date = start_date
+        while current_date <= end_date:
+            date_str = current_date.strftime("%Y-%m-%d")
+            day = day_titles.get(date_str)
+            if day:
+                all_titles, id_to_name = day
+                for platform_id, titles in all_titles.items():
+                    platform_name = id_to_name.get(platform_id, platform_id)
+                    for title, info in titles.items():
+                        yield date_str, platform_id, platform_name, title, info.get("ranks", [])
+
+            current_date += timedelta(days=1)
+
     def _compare_overview(
         self,
         data1: Dict,
@@ -7,12 +7,12 @@
 import re
 from collections import Counter
 from datetime import datetime, timedelta
-from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Tuple, Union
 
 from ..services.data_service import DataService
 from ..utils.validators import validate_keyword, validate_limit, validate_threshold, normalize_date_range
-from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
+from ..utils.errors import MCPError, InvalidParameterError
+from ..utils.similarity import is_similar, text_similarity
 
 
 class SearchTools:
@@ -119,14 +119,19 @@ class SearchTools:
 
             # 收集所有匹配的新闻
             all_matches = []
+            if search_mode == "fuzzy":
+                day_titles = self.data_service.parser.read_titles_for_range(start_date, end_date, platforms)
+            else:
+                # 关键词/实体模式：全文索引只返回可能包含关键词的标题
+                day_titles = self.data_service.parser.search_titles_for_range(
+                    query, start_date, end_date, platforms
+                )
             current_date = start_date
 
             while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
+                day = day_titles.get(current_date.strftime("%Y-%m-%d"))
+                if day:
+                    all_titles, id_to_name = day
 
                     # 根据搜索模式执行不同的搜索逻辑
                     if search_mode == "keyword":
@@ -144,10 +149,6 @@ class SearchTools:
 
                     all_matches.extend(matches)
 
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
-
                 current_date += timedelta(days=1)
 
             if not all_matches:
@@ -184,8 +185,8 @@ class SearchTools:
             if sort_by == "relevance":
                 all_matches.sort(key=lambda x: x.get("similarity_score", 1.0), reverse=True)
             elif sort_by == "weight":
-                from .analytics import calculate_news_weight
-                all_matches.sort(key=lambda x: calculate_news_weight(x), reverse=True)
+                from .analytics import sort_news_by_weight
+                all_matches = sort_news_by_weight(all_matches)
             elif sort_by == "date":
                 all_matches.sort(key=lambda x: x.get("date", ""), reverse=True)
 
@@ -413,7 +414,7 @@ class SearchTools:
             相似度分数 (0-1之间)
         """
         # 使用 difflib.SequenceMatcher 计算序列相似度
-        return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+        return text_similarity(text1.lower(), text2.lower())
 
     def _fuzzy_match(self, query: str, text: str, threshold: float = 0.3) -> Tuple[bool, float]:
         """
@@ -431,9 +432,9 @@ class SearchTools:
         if query.lower() in text.lower():
             return True, 1.0
 
-        # 计算整体相似度
-        similarity = self._calculate_similarity(query, text)
-        if similarity >= threshold:
+        # 计算整体相似度（上界低于阈值时跳过完整计算）
+        matched, similarity = is_similar(query.lower(), text.lower(), threshold)
+        if matched:
             return True, similarity
 
         # 分词后的部分匹配
@@ -609,12 +610,13 @@ class SearchTools:
 
             # 收集所有相关新闻
             all_related_news = []
+            day_titles = self.data_service.parser.read_titles_for_range(search_start, search_end)
             current_date = search_start
 
             while current_date <= search_end:
                 try:
-                    # 读取该日期的数据
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(current_date)
+                    # 读取该日期的数据（没有数据的日期为空）
+                    all_titles, id_to_name = day_titles.get(current_date.strftime("%Y-%m-%d"), ({}, {}))
 
                     # 搜索相关新闻
                     for platform_id, titles in all_titles.items():
@@ -656,9 +658,6 @@ class SearchTools:
 
                                 all_related_news.append(news_item)
 
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
                 except Exception as e:
                     # 记录错误但继续处理其他日期
                     print(f"Warning: 处理日期 {current_date.strftime('%Y-%m-%d')} 时出错: {e}")
@@ -815,10 +814,13 @@ class SearchTools:
 
             # 收集所有相关新闻
             all_related_news = []
+            day_titles = self.data_service.parser.read_titles_for_range(
+                min(search_dates), max(search_dates)
+            ) if search_dates else {}
             
             for search_date in search_dates:
                 try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(search_date)
+                    all_titles, id_to_name = day_titles.get(search_date.strftime("%Y-%m-%d"), ({}, {}))
                     
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
@@ -917,16 +919,17 @@ class SearchTools:
         """
         all_rss_matches = []
         query_lower = query.lower()
+
+        # 全文索引只返回标题或摘要可能包含关键词的条目
+        day_items = self.data_service.parser.search_titles_for_range(
+            query, start_date, end_date, db_type="rss"
+        )
         current_date = start_date
 
         while current_date <= end_date:
             try:
-                # 读取该日期的 RSS 数据
-                all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                    date=current_date,
-                    platform_ids=None,
-                    db_type="rss"
-                )
+                # 读取该日期的 RSS 数据（没有数据的日期为空）
+                all_titles, id_to_name = day_items.get(current_date.strftime("%Y-%m-%d"), ({}, {}))
 
                 for feed_id, items in all_titles.items():
                     feed_name = id_to_name.get(feed_id, feed_id)
@@ -953,9 +956,6 @@ class SearchTools:
 
                             all_rss_matches.append(rss_item)
 
-            except DataNotFoundError:
-                # 该日期没有 RSS 数据，继续下一天
-                pass
             except Exception:
                 # 其他错误，跳过
                 pass
@@ -152,7 +152,7 @@ class StorageSyncTools:
         """
         获取本地可用的日期列表
 
-        存储结构: output/{db_type}/{date}.db
+        存储结构: output/{db_type}/{date}.db（已归档为 {date}.db.zst / .db.gz）
         例如: output/news/2025-12-30.db, output/rss/2025-12-30.db
 
         Args:
@@ -167,13 +167,15 @@ class StorageSyncTools:
         if not local_dir.exists():
             return []
 
-        # 扫描 output/{db_type}/{date}.db 文件
+        from trendradar.storage.archive import parse_db_date
+
+        # 扫描 output/{db_type}/{date}.db 文件（含压缩归档）
         type_dir = local_dir / db_type
         if type_dir.exists():
             for item in type_dir.iterdir():
-                if item.is_file() and item.suffix == ".db":
-                    # 从文件名解析日期 (2025-12-30.db -> 2025-12-30)
-                    date_str = item.stem  # 去除 .db 后缀
+                # 从文件名解析日期 (2025-12-30.db / 2025-12-30.db.zst -> 2025-12-30)
+                date_str = parse_db_date(item.name) if item.is_file() else None
+                if date_str:
                     folder_date = self._parse_date_folder_name(date_str)
                     if folder_date:
                         dates.add(folder_date.strftime("%Y-%m-%d"))
@@ -248,71 +250,52 @@ class StorageSyncTools:
             local_dir = self._get_local_data_dir()
             local_dir.mkdir(parents=True, exist_ok=True)
 
-            # 获取远程可用日期
-            remote_dates = remote_backend.list_remote_dates()
-
-            # 获取本地已有日期
-            local_dates = set(self._get_local_dates())
-
             # 计算需要拉取的日期（最近 N 天）
             from trendradar.utils.time import get_configured_time
             config = self._load_config()
             timezone = config.get("app", {}).get("timezone", "Asia/Shanghai")
             now = get_configured_time(timezone)
+            target_dates = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
+
+            # 并发拉取：远程 ETag 未变化的日期跳过，已拉取但远程有更新的日期重新下载
+            max_concurrency = self._get_storage_config().get("pull", {}).get("max_concurrency", 4)
+            result = remote_backend.pull_dates(
+                target_dates, str(local_dir), max_concurrency=max_concurrency
+            )
+
+            def key_dates(keys: List[str]) -> List[str]:
+                """对象键（news/2025-12-30.db）转为去重的日期列表"""
+                return sorted({Path(key).stem for key in keys}, reverse=True)
 
-            target_dates = []
-            for i in range(days):
-                date = now - timedelta(days=i)
-                date_str = date.strftime("%Y-%m-%d")
-                if date_str in remote_dates:
-                    target_dates.append(date_str)
-
-            # 执行拉取
-            synced_dates = []
-            skipped_dates = []
-            failed_dates = []
-
-            for date_str in target_dates:
-                # 检查本地是否已存在
-                if date_str in local_dates:
-                    skipped_dates.append(date_str)
-                    continue
-
-                # 拉取单个日期
-                try:
-                    local_date_dir = local_dir / date_str
-                    local_db_path = local_date_dir / "news.db"
-                    remote_key = f"news/{date_str}.db"
-
-                    local_date_dir.mkdir(parents=True, exist_ok=True)
-                    remote_backend.s3_client.download_file(
-                        remote_backend.bucket_name,
-                        remote_key,
-                        str(local_db_path)
-                    )
-                    synced_dates.append(date_str)
-                    print(f"[存储同步] 已拉取: {date_str}")
-                except Exception as e:
-                    failed_dates.append({"date": date_str, "error": str(e)})
-                    print(f"[存储同步] 拉取失败 ({date_str}): {e}")
+            synced_dates = key_dates(result["pulled"])
+            skipped_dates = key_dates(result["skipped"] + result["kept_local"])
+            failed_dates = [
+                {"date": Path(item["key"]).stem, "db_type": item["key"].split("/", 1)[0], "error": item["error"]}
+                for item in result["failed"]
+            ]
 
             return {
                 "success": True,
                 "summary": {
                     "description": "远程存储同步结果",
-                    "synced_files": len(synced_dates),
-                    "skipped_count": len(skipped_dates),
-                    "failed_count": len(failed_dates)
+                    "synced_files": len(result["pulled"]),
+                    "skipped_count": len(result["skipped"]) + len(result["kept_local"]),
+                    "failed_count": len(failed_dates),
+                    "bytes_downloaded": result["bytes_downloaded"],
+                    "bytes_saved": result["bytes_saved"]
                 },
                 "data": {
                     "synced_dates": synced_dates,
                     "skipped_dates": skipped_dates,
-                    "failed_dates": failed_dates
+                    "failed_dates": failed_dates,
+                    "synced_files": result["pulled"],
+                    "unchanged_files": result["skipped"],
+                    "kept_local_files": result["kept_local"]
                 },
-                "message": f"成功同步 {len(synced_dates)} 天数据" + (
-                    f"，跳过 {len(skipped_dates)} 天（本地已存在）" if skipped_dates else ""
+                "message": f"成功同步 {len(synced_dates)} 天数据（{len(result['pulled'])} 个文件）" + (
+                    f"，跳过 {len(skipped_dates)} 天（远程无更新或本地已修改）" if skipped_dates else ""
                 ) + (
-                    f"，失败 {len(failed_dates)} 天" if failed_dates else ""
+                    f"，失败 {len(failed_dates)} 个文件" if failed_dates else ""
                 )
             }
 
@@ -403,6 +386,7 @@ class StorageSyncTools:
             pull_status = {
                 "enabled": pull_config.get("enabled", False),
                 "days": pull_config.get("days", 7),
+                "max_concurrency": pull_config.get("max_concurrency", 4),
             }
 
             return {
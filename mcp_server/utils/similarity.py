@@ -0,0 +1,289 @@
+"""
+标题相似度工具
+
+提供：
+- text_similarity: 两个文本的序列相似度（difflib.SequenceMatcher.ratio）
+- is_similar: 带上界剪枝的阈值判断（结果与直接比较 ratio 完全一致）
+- MinHashLSH: 字符 n-gram + MinHash + LSH 分桶的相似标题索引
+- cluster_similar: 基于索引的贪心聚类（CLUSTER_MODES 为预设的召回 / 耗时档位）
+
+两两比较 SequenceMatcher 的聚类是 O(n²)，一周的数据就要几分钟。MinHashLSH
+为每个标题计算 MinHash 签名并按"段"分桶，只有至少一个段完全相同的标题才会成为
+候选对，再用 SequenceMatcher 精确确认。因此结果不会出现误报，漏报率由签名长度
+（num_perm）与分段数（bands）决定：每段行数越少，召回越高、候选越多。
+"""
+
+import zlib
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+
+# 默认索引参数：32 个哈希值分 16 段（每段 2 行），
+# 二元组 Jaccard 相似度 0.4 的标题对约 94% 成为候选，0.5 约 99%
+DEFAULT_NUM_PERM = 32
+DEFAULT_BANDS = 16
+DEFAULT_NGRAM = 2
+
+# 聚类匹配模式 -> (num_perm, bands)，None 表示逐对比较（召回 / 耗时见 bench/similarity_check.py）
+CLUSTER_MODES: Dict[str, Optional[Tuple[int, int]]] = {
+    "fast": (32, 8),                                # 候选最少，漏掉部分边缘相似对
+    "balanced": (DEFAULT_NUM_PERM, DEFAULT_BANDS),  # 默认
+    "thorough": (64, 32),                           # 召回更高，耗时约为 balanced 的 2 倍
+    "exact": None,                                  # 与逐对比较完全一致，O(n²)
+}
+
+_HASH_MULTIPLIER = 0x9E3779B1
+_HASH_MASK = 0xFFFFFFFF
+# 空桶借用相邻桶的值时附加的偏移（大于任何桶内值，避免与真实值相撞）
+_DENSIFY_OFFSET = 1 << 32
+
+
+def text_similarity(text1: str, text2: str) -> float:
+    """
+    计算两个文本的序列相似度
+
+    Args:
+        text1: 文本1
+        text2: 文本2
+
+    Returns:
+        相似度分数（0-1之间）
+    """
+    return SequenceMatcher(None, text1, text2).ratio()
+
+
+def is_similar(text1: str, text2: str, threshold: float) -> Tuple[bool, float]:
+    """
+    判断两个文本的相似度是否达到阈值
+
+    先用 real_quick_ratio / quick_ratio（ratio 的上界）剪枝，
+    只有上界达到阈值时才计算完整的 ratio。
+
+    Args:
+        text1: 文本1
+        text2: 文本2
+        threshold: 相似度阈值
+
+    Returns:
+        (是否达到阈值, 相似度)；被剪枝时相似度返回 0.0
+    """
+    matcher = SequenceMatcher(None, text1, text2)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return False, 0.0
+    ratio = matcher.ratio()
+    return ratio >= threshold, ratio
+
+
+class MinHashLSH:
+    """
+    MinHash + LSH 相似标题索引
+
+    签名使用单次哈希的 MinHash（one permutation hashing）：每个 n-gram 只哈希一次，
+    按哈希值分到 num_perm 个桶中各取最小值，空桶借用右侧最近的非空桶（densification），
+    两个标题同一位置签名相等的概率近似为它们 n-gram 集合的 Jaccard 相似度。
+    """
+
+    def __init__(
+        self,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        ngram: int = DEFAULT_NGRAM,
+        lowercase: bool = True,
+    ):
+        """
+        初始化索引
+
+        Args:
+            num_perm: 签名长度
+            bands: LSH 分段数（必须整除 num_perm）
+            ngram: 字符 n-gram 长度
+            lowercase: 计算签名前是否转为小写
+        """
+        if num_perm <= 0 or bands <= 0 or num_perm % bands:
+            raise ValueError("num_perm 必须是 bands 的正整数倍")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.ngram = max(1, ngram)
+        self.lowercase = lowercase
+
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(bands)]
+        self._signatures: List[List[int]] = []
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _shingle_hashes(self, text: str) -> Set[int]:
+        """计算文本字符 n-gram 的哈希集合"""
+        if self.lowercase:
+            text = text.lower()
+        n = self.ngram
+        if len(text) <= n:
+            grams = {text}
+        else:
+            grams = {text[i:i + n] for i in range(len(text) - n + 1)}
+        return {zlib.crc32(gram.encode("utf-8")) for gram in grams}
+
+    def signature(self, text: str) -> List[int]:
+        """
+        计算文本的 MinHash 签名
+
+        Args:
+            text: 文本
+
+        Returns:
+            长度为 num_perm 的签名
+        """
+        k = self.num_perm
+        bins: List[Optional[int]] = [None] * k
+        for value in self._shingle_hashes(text):
+            value = (value * _HASH_MULTIPLIER) & _HASH_MASK
+            index, value = value % k, value // k
+            current = bins[index]
+            if current is None or value < current:
+                bins[index] = value
+
+        if None not in bins:
+            return bins
+
+        # 空桶：向右找最近的非空桶，附加距离偏移
+        signature = list(bins)
+        for i in range(k):
+            if bins[i] is not None:
+                continue
+            distance = 1
+            while bins[(i + distance) % k] is None:
+                distance += 1
+            signature[i] = bins[(i + distance) % k] + distance * _DENSIFY_OFFSET
+        return signature
+
+    def _band_keys(self, signature: Sequence[int]) -> List[Tuple[int, ...]]:
+        """将签名切分为各段的分桶键"""
+        rows = self.rows
+        return [tuple(signature[b * rows:(b + 1) * rows]) for b in range(self.bands)]
+
+    def add(self, text: str) -> int:
+        """
+        加入一个文本
+
+        Args:
+            text: 文本
+
+        Returns:
+            条目 ID（从 0 开始的插入序号）
+        """
+        item_id = len(self._signatures)
+        signature = self.signature(text)
+        self._signatures.append(signature)
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(item_id)
+        return item_id
+
+    def _candidates_for_signature(self, signature: Sequence[int]) -> Set[int]:
+        """与签名至少有一段相同的条目"""
+        candidates: Set[int] = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(key)
+            if bucket:
+                candidates.update(bucket)
+        return candidates
+
+    def candidates(self, text: str) -> Set[int]:
+        """
+        获取与文本可能相似的条目 ID
+
+        Args:
+            text: 查询文本
+
+        Returns:
+            候选条目 ID 集合
+        """
+        return self._candidates_for_signature(self.signature(text))
+
+    def candidates_of(self, item_id: int) -> Set[int]:
+        """获取与已加入条目可能相似的其他条目 ID"""
+        candidates = self._candidates_for_signature(self._signatures[item_id])
+        candidates.discard(item_id)
+        return candidates
+
+    def query(
+        self,
+        text: str,
+        texts: Sequence[str],
+        threshold: float,
+        similarity: Callable[[str, str], float] = text_similarity,
+    ) -> List[Tuple[int, float]]:
+        """
+        查找与文本相似的条目（候选再用 similarity 精确确认）
+
+        Args:
+            text: 查询文本
+            texts: 与条目 ID 对应的原始文本
+            threshold: 相似度阈值
+            similarity: 相似度函数
+
+        Returns:
+            [(条目 ID, 相似度)]，按相似度降序
+        """
+        results = []
+        for item_id in self.candidates(text):
+            score = similarity(text, texts[item_id])
+            if score >= threshold:
+                results.append((item_id, score))
+        results.sort(key=lambda pair: (-pair[1], pair[0]))
+        return results
+
+
+def cluster_similar(
+    texts: Sequence[str],
+    threshold: float,
+    num_perm: int = DEFAULT_NUM_PERM,
+    bands: int = DEFAULT_BANDS,
+    ngram: int = DEFAULT_NGRAM,
+    exhaustive: bool = False,
+) -> List[List[int]]:
+    """
+    贪心聚类：按顺序取未归组的文本作为代表，与其相似度达到阈值的未归组文本并入该组
+
+    与两两比较的贪心聚类规则相同（组内顺序也相同），只是比较对象限定为 LSH 候选；
+    阈值不大于 0 时所有文本都相似，直接退化为逐一比较。
+
+    Args:
+        texts: 文本列表（顺序即代表的优先级）
+        threshold: 相似度阈值（SequenceMatcher.ratio）
+        num_perm: 签名长度
+        bands: LSH 分段数
+        ngram: 字符 n-gram 长度
+        exhaustive: 不使用索引，与后面所有未归组文本逐一比较（结果与两两比较完全一致）
+
+    Returns:
+        分组列表，每组为文本下标列表（第一个为代表）
+    """
+    count = len(texts)
+    if threshold <= 0:
+        return [list(range(count))] if count else []
+
+    index = None
+    if not exhaustive:
+        index = MinHashLSH(num_perm=num_perm, bands=bands, ngram=ngram)
+        for text in texts:
+            index.add(text)
+
+    used = [False] * count
+    groups = []
+    for i in range(count):
+        if used[i]:
+            continue
+        used[i] = True
+        group = [i]
+        candidates = range(i + 1, count) if index is None else sorted(index.candidates_of(i))
+        for j in candidates:
+            if used[j]:
+                continue
+            matched, _ = is_similar(texts[i], texts[j], threshold)
+            if matched:
+                used[j] = True
+                group.append(j)
+        groups.append(group)
+    return groups
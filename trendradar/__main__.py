@@ -7,6 +7,7 @@ TrendRadar 主程序
 """
 
 import os
+import sys
 import webbrowser
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
@@ -36,8 +37,9 @@ from trendradar.context import AppContext
 from trendradar import __version__
 from trendradar.core import load_config
 from trendradar.core.analyzer import convert_keyword_stats_to_platform_stats
-from trendradar.crawler import DataFetcher
+from trendradar.crawler import DataFetcher, CircuitBreaker
 from trendradar.storage import convert_crawl_results_to_news_data
+from trendradar.storage.upload_queue import UploadIncompleteError
 from trendradar.utils.time import is_within_days
 from trendradar.ai import AIAnalyzer, AIAnalysisResult
 
@@ -130,7 +132,7 @@ class NewsAnalyzer:
         print(f"时区: {config.get('TIMEZONE', 'Asia/Shanghai')}")
 
         # 创建应用上下文
-        self.ctx = AppContext(config)
+        self.ctx = AppContext(config, persist_keyword_index=True)
 
         self.request_interval = self.ctx.config["REQUEST_INTERVAL"]
         self.report_mode = self.ctx.config["REPORT_MODE"]
@@ -140,7 +142,12 @@ class NewsAnalyzer:
         self.update_info = None
         self.proxy_url = None
         self._setup_proxy()
-        self.data_fetcher = DataFetcher(self.proxy_url)
+        self.data_fetcher = DataFetcher(
+            self.proxy_url,
+            max_concurrency=self.ctx.config.get("MAX_CONCURRENCY", 1),
+            host_interval=self.ctx.config.get("HOST_INTERVAL", 100),
+            circuit_breaker=self._create_circuit_breaker(),
+        )
 
         # 初始化存储管理器（使用 AppContext）
         self._init_storage_manager()
@@ -148,6 +155,17 @@ class NewsAnalyzer:
         if self.is_github_actions:
             self._check_version_update()
 
+    def _create_circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """根据配置创建平台熔断器"""
+        breaker_config = self.ctx.config.get("CIRCUIT_BREAKER", {})
+        if not breaker_config.get("ENABLED", False):
+            return None
+        return CircuitBreaker(
+            failure_threshold=breaker_config.get("FAILURE_THRESHOLD", 3),
+            cooldown_minutes=breaker_config.get("COOLDOWN_MINUTES", 60),
+            timezone=self.ctx.timezone,
+        )
+
     def _init_storage_manager(self) -> None:
         """初始化存储管理器（使用 AppContext）"""
         # 获取数据保留天数（支持环境变量覆盖）
@@ -898,9 +916,18 @@ class NewsAnalyzer:
         print(
             f"配置的监控平台: {[p.get('name', p['id']) for p in self.ctx.platforms]}"
         )
-        print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
+        if self.data_fetcher.max_concurrency > 1:
+            print(f"开始爬取数据，并发数 {self.data_fetcher.max_concurrency}，同主机间隔 {self.data_fetcher.host_interval} 毫秒")
+        else:
+            print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
         Path("output").mkdir(parents=True, exist_ok=True)
 
+        if self.data_fetcher.circuit_breaker:
+            self.data_fetcher.circuit_breaker.update_history(
+                self.storage_manager.get_source_failure_history()
+            )
+        self.data_fetcher.update_digests(self.storage_manager.get_platform_digests())
+
         results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
             ids, self.request_interval
         )
@@ -909,7 +936,9 @@ class NewsAnalyzer:
         crawl_time = self.ctx.format_time()
         crawl_date = self.ctx.format_date()
         news_data = convert_crawl_results_to_news_data(
-            results, id_to_name, failed_ids, crawl_time, crawl_date
+            results, id_to_name, failed_ids, crawl_time, crawl_date,
+            digests=self.data_fetcher.response_digests,
+            unchanged_ids=self.data_fetcher.unchanged_ids,
         )
 
         # 保存到存储后端（SQLite）
@@ -1002,7 +1031,12 @@ class NewsAnalyzer:
                 timezone=timezone,
                 freshness_enabled=freshness_enabled,
                 default_max_age_days=default_max_age_days,
+                max_concurrency=rss_config.get("MAX_CONCURRENCY", 1),
+                per_host_limit=rss_config.get("PER_HOST_LIMIT", 2),
+                conditional_get=rss_config.get("CONDITIONAL_GET", True),
+                stop_at_stale=rss_config.get("STOP_AT_STALE", False),
             )
+            fetcher.update_validators(self.storage_manager.get_rss_validators())
 
             # 抓取数据
             rss_data = fetcher.fetch_all()
@@ -1102,6 +1136,10 @@ class NewsAnalyzer:
                 return None, None
 
             all_items_list = self._convert_rss_items_to_list(latest_data.items, latest_data.id_to_name)
+            # 当日关键词归属索引（已匹配过的 RSS 标题不再重复匹配）
+            keyword_index = self.ctx.get_keyword_index(
+                word_groups, filter_words, global_filters, date=rss_data.date, db_type="rss"
+            )
             rss_stats, total = count_rss_frequency(
                 rss_items=all_items_list,
                 word_groups=word_groups,
@@ -1113,7 +1151,9 @@ class NewsAnalyzer:
                 timezone=timezone,
                 rank_threshold=self.rank_threshold,
                 quiet=False,
+                keyword_index=keyword_index,
             )
+            self.ctx.save_keyword_index(keyword_index, date=rss_data.date, db_type="rss")
             if not rss_stats:
                 print("[RSS] 当前榜单模式：关键词匹配后没有内容")
                 return None, None
@@ -1141,6 +1181,10 @@ class NewsAnalyzer:
                 return None, None
 
             all_items_list = self._convert_rss_items_to_list(all_data.items, all_data.id_to_name)
+            # 当日关键词归属索引（已匹配过的 RSS 标题不再重复匹配）
+            keyword_index = self.ctx.get_keyword_index(
+                word_groups, filter_words, global_filters, date=rss_data.date, db_type="rss"
+            )
             rss_stats, total = count_rss_frequency(
                 rss_items=all_items_list,
                 word_groups=word_groups,
@@ -1152,7 +1196,9 @@ class NewsAnalyzer:
                 timezone=timezone,
                 rank_threshold=self.rank_threshold,
                 quiet=False,
+                keyword_index=keyword_index,
             )
+            self.ctx.save_keyword_index(keyword_index, date=rss_data.date, db_type="rss")
             if not rss_stats:
                 print("[RSS] 当日汇总模式：关键词匹配后没有内容")
                 return None, None
@@ -1458,6 +1504,7 @@ class NewsAnalyzer:
                 raise
         finally:
             # 清理资源（包括过期数据清理和数据库连接关闭）
+            self.data_fetcher.close()
             self.ctx.cleanup()
 
 
@@ -1475,6 +1522,10 @@ def main():
         print("  • config/config.yaml")
         print("  • config/frequency_words.txt")
         print("\n参考项目文档进行正确配置")
+    except UploadIncompleteError as e:
+        # 数据已保存但未同步到远程存储，以非零状态退出让调度方（如 GitHub Actions）感知
+        print(f"❌ 远程同步未完成: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"❌ 程序运行错误: {e}")
         if debug_mode:
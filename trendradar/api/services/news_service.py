@@ -257,6 +257,7 @@ class NewsService:
             mode=req.mode,
             global_filters=global_filters,
             quiet=True,
+            date=date,
         )
 
         report_data = ctx.prepare_report(
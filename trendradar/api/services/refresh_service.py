@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional, Tuple
 
-from trendradar.crawler import DataFetcher
+from trendradar.crawler import DataFetcher, CircuitBreaker
 from trendradar.crawler.rss import RSSFetcher, RSSFeedConfig
 from trendradar.storage import convert_crawl_results_to_news_data
 from trendradar.storage.base import NewsData, RSSData
@@ -37,12 +37,31 @@ class RefreshService:
 
         # 代理策略：与 CLI 的本地行为一致（USE_PROXY 开关）
         proxy_url = ctx.config.get("DEFAULT_PROXY") if ctx.config.get("USE_PROXY") else None
-        fetcher = DataFetcher(proxy_url=proxy_url)
+        breaker = None
+        breaker_cfg = ctx.config.get("CIRCUIT_BREAKER", {})
+        if breaker_cfg.get("ENABLED", False):
+            breaker = CircuitBreaker(
+                failure_threshold=int(breaker_cfg.get("FAILURE_THRESHOLD", 3)),
+                cooldown_minutes=int(breaker_cfg.get("COOLDOWN_MINUTES", 60)),
+                timezone=ctx.timezone,
+            )
+            breaker.update_history(storage_manager.get_source_failure_history())
 
-        results, id_to_name, failed_ids = fetcher.crawl_websites(
-            ids_list=ids,
-            request_interval=int(ctx.config.get("REQUEST_INTERVAL", 100)),
+        fetcher = DataFetcher(
+            proxy_url=proxy_url,
+            max_concurrency=int(ctx.config.get("MAX_CONCURRENCY", 1)),
+            host_interval=int(ctx.config.get("HOST_INTERVAL", 100)),
+            circuit_breaker=breaker,
         )
+        fetcher.update_digests(storage_manager.get_platform_digests())
+
+        try:
+            results, id_to_name, failed_ids = fetcher.crawl_websites(
+                ids_list=ids,
+                request_interval=int(ctx.config.get("REQUEST_INTERVAL", 100)),
+            )
+        finally:
+            fetcher.close()
 
         crawl_time = ctx.format_time()
         crawl_date = ctx.format_date() if not platform_ids else ctx.format_date()  # 同一天内刷新
@@ -53,6 +72,8 @@ class RefreshService:
             failed_ids=failed_ids,
             crawl_time=crawl_time,
             crawl_date=crawl_date,
+            digests=fetcher.response_digests,
+            unchanged_ids=fetcher.unchanged_ids,
         )
 
         storage_manager.save_news_data(news_data)
@@ -100,7 +121,12 @@ class RefreshService:
             timezone=ctx.timezone,
             freshness_enabled=bool(freshness_cfg.get("ENABLED", True)),
             default_max_age_days=int(freshness_cfg.get("MAX_AGE_DAYS", 3)),
+            max_concurrency=int(rss_cfg.get("MAX_CONCURRENCY", 1)),
+            per_host_limit=int(rss_cfg.get("PER_HOST_LIMIT", 2)),
+            conditional_get=bool(rss_cfg.get("CONDITIONAL_GET", True)),
+            stop_at_stale=bool(rss_cfg.get("STOP_AT_STALE", False)),
         )
+        fetcher.update_validators(storage_manager.get_rss_validators())
 
         rss_data = fetcher.fetch_all()
         storage_manager.save_rss_data(rss_data)
@@ -76,10 +76,6 @@ def detect_latest_new_titles(
     if not latest_data or not latest_data.items:
         return {}
 
-    all_data: Optional[NewsData] = storage_manager.get_today_all_data(date)
-    if not all_data or not all_data.items:
-        return {}
-
     latest_time = latest_data.crawl_time
 
     # 最新批次标题
@@ -95,19 +91,17 @@ def detect_latest_new_titles(
                 "mobileUrl": item.mobile_url or "",
             }
 
-    # 历史标题（first_time < latest_time）
-    historical_titles: Dict[str, set] = {}
-    for source_id, news_list in all_data.items.items():
-        if platform_ids is not None and source_id not in platform_ids:
-            continue
-        historical_titles[source_id] = set()
-        for item in news_list:
-            first_time = getattr(item, "first_time", item.crawl_time)
-            if first_time < latest_time:
-                historical_titles[source_id].add(item.title)
+    # 是否存在历史批次（first_time < latest_time）
+    if not storage_manager.has_titles_before(latest_time, date, platform_ids):
+        return {}
 
-    has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
-    if not has_historical_data:
+    # 历史标题（在 SQLite 中按索引查询，只检查最新批次的标题）
+    historical_titles = storage_manager.get_historical_titles(
+        {source_id: list(titles) for source_id, titles in latest_titles.items()},
+        latest_time,
+        date,
+    )
+    if historical_titles is None:
         return {}
 
     new_titles: Dict[str, Dict] = {}
@@ -24,6 +24,8 @@ from trendradar.core import (
     detect_latest_new_titles,
     is_first_crawl_today,
     count_word_frequency,
+    KeywordMatchIndex,
+    frequency_config_hash,
 )
 from trendradar.report import (
     clean_title,
@@ -63,15 +65,20 @@ class AppContext:
         html = ctx.generate_html_report(stats, total_titles, ...)
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], persist_keyword_index: bool = False):
         """
         初始化应用上下文
 
         Args:
             config: 完整的配置字典
+            persist_keyword_index: 是否将当天新匹配的关键词归属写回数据库
+                （仅爬虫进程开启；API 等只读场景只在内存中缓存，不写入数据库）
         """
         self.config = config
+        self.persist_keyword_index = persist_keyword_index
         self._storage_manager = None
+        # 关键词归属索引缓存：(db_type, date) -> KeywordMatchIndex
+        self._keyword_indexes: Dict[Tuple[str, str], KeywordMatchIndex] = {}
 
     # === 配置访问 ===
 
@@ -152,6 +159,7 @@ class AppContext:
             remote_config = storage_config.get("REMOTE", {})
             local_config = storage_config.get("LOCAL", {})
             pull_config = storage_config.get("PULL", {})
+            archive_config = storage_config.get("ARCHIVE", {})
 
             self._storage_manager = get_storage_manager(
                 backend_type=storage_config.get("BACKEND", "auto"),
@@ -164,12 +172,21 @@ class AppContext:
                     "secret_access_key": remote_config.get("SECRET_ACCESS_KEY", ""),
                     "endpoint_url": remote_config.get("ENDPOINT_URL", ""),
                     "region": remote_config.get("REGION", ""),
+                    "replication": remote_config.get("REPLICATION", "full"),
+                    "compact_segments": remote_config.get("COMPACT_SEGMENTS", 24),
+                    "background_upload": remote_config.get("BACKGROUND_UPLOAD", "auto"),
+                    "upload_flush_timeout": remote_config.get("UPLOAD_FLUSH_TIMEOUT", 120),
+                    "base_cache_dir": remote_config.get("BASE_CACHE_DIR", ""),
                 },
                 local_retention_days=local_config.get("RETENTION_DAYS", 0),
                 remote_retention_days=remote_config.get("RETENTION_DAYS", 0),
                 pull_enabled=pull_config.get("ENABLED", False),
                 pull_days=pull_config.get("DAYS", 7),
+                pull_concurrency=pull_config.get("MAX_CONCURRENCY", 4),
+                archive_enabled=archive_config.get("ENABLED", False),
+                archive_level=archive_config.get("LEVEL", 0),
                 timezone=self.timezone,
+                sqlite_profile=storage_config.get("SQLITE"),
             )
         return self._storage_manager
 
@@ -220,6 +237,69 @@ class AppContext:
         """检查标题是否匹配词组规则"""
         return matches_word_groups(title, word_groups, filter_words, global_filters)
 
+    def get_keyword_index(
+        self,
+        word_groups: List[Dict],
+        filter_words: List[str],
+        global_filters: Optional[List[str]] = None,
+        date: Optional[str] = None,
+        db_type: str = "news",
+    ) -> Optional[KeywordMatchIndex]:
+        """
+        获取当日关键词归属索引（进程内缓存，首次使用时从存储加载）
+
+        Args:
+            word_groups: 词组列表
+            filter_words: 过滤词列表
+            global_filters: 全局过滤词列表
+            date: 日期字符串，默认为今天
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            KeywordMatchIndex 实例，未配置词组时返回 None
+        """
+        if not word_groups:
+            return None
+
+        config_hash = frequency_config_hash(word_groups, filter_words, global_filters)
+        cache_key = (db_type, date or self.format_date())
+
+        index = self._keyword_indexes.get(cache_key)
+        if index is None or index.config_hash != config_hash:
+            matches = self.get_storage_manager().get_keyword_matches(
+                config_hash, cache_key[1], db_type
+            )
+            index = KeywordMatchIndex(config_hash, matches)
+            self._keyword_indexes.pop(cache_key, None)
+            self._keyword_indexes[cache_key] = index
+            # 只保留最近使用的几天
+            while len(self._keyword_indexes) > 4:
+                self._keyword_indexes.pop(next(iter(self._keyword_indexes)))
+
+        return index
+
+    def save_keyword_index(
+        self,
+        index: Optional[KeywordMatchIndex],
+        date: Optional[str] = None,
+        db_type: str = "news",
+    ) -> None:
+        """
+        将索引中新匹配的标题写回存储
+
+        只有爬虫进程写回今天的数据：之前的日期已不再写入（可能已压缩归档），
+        写入会恢复归档并改变文件状态，导致多日索引与列式存储重新导出；
+        其余情况新记录只保留在进程内的索引中。
+        """
+        if index is None:
+            return
+        pending = index.take_pending()
+        today = self.format_date()
+        if pending and self.persist_keyword_index and (date or today) == today:
+            self.get_storage_manager().save_keyword_matches(
+                index.config_hash, pending, today, db_type
+            )
+
     # === 统计分析 ===
 
     def count_frequency(
@@ -233,9 +313,13 @@ class AppContext:
         mode: str = "daily",
         global_filters: Optional[List[str]] = None,
         quiet: bool = False,
+        date: Optional[str] = None,
     ) -> Tuple[List[Dict], int]:
-        """统计词频"""
-        return count_word_frequency(
+        """统计词频（date 为数据所属日期，用于复用当日关键词归属索引）"""
+        keyword_index = self.get_keyword_index(
+            word_groups, filter_words, global_filters, date=date
+        )
+        result = count_word_frequency(
             results=results,
             word_groups=word_groups,
             filter_words=filter_words,
@@ -251,7 +335,10 @@ class AppContext:
             is_first_crawl_func=self.is_first_crawl,
             convert_time_func=self.convert_time_display,
             quiet=quiet,
+            keyword_index=keyword_index,
         )
+        self.save_keyword_index(keyword_index, date=date)
+        return result
 
     # === 报告生成 ===
 
@@ -447,6 +534,10 @@ class AppContext:
     def cleanup(self):
         """清理资源"""
         if self._storage_manager:
-            self._storage_manager.cleanup_old_data()
-            self._storage_manager.cleanup()
-            self._storage_manager = None
+            try:
+                self._storage_manager.cleanup_old_data()
+                self._storage_manager.archive_closed_days()
+                # 上传未完成时抛出 UploadIncompleteError（由 main 以非零状态退出）
+                self._storage_manager.cleanup()
+            finally:
+                self._storage_manager = None
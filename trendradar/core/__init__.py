@@ -10,7 +10,16 @@ from trendradar.core.config import (
     get_account_at_index,
 )
 from trendradar.core.loader import load_config
-from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.core.frequency import (
+    load_frequency_words,
+    matches_word_groups,
+    WordGroupMatcher,
+    get_word_group_matcher,
+)
+from trendradar.core.keyword_index import (
+    KeywordMatchIndex,
+    frequency_config_hash,
+)
 from trendradar.core.data import (
     save_titles_to_file,
     read_all_today_titles_from_storage,
@@ -19,6 +28,10 @@ from trendradar.core.data import (
     detect_latest_new_titles,
     is_first_crawl_today,
 )
+from trendradar.core.weight import (
+    calculate_news_weights,
+    sort_news_by_weight,
+)
 from trendradar.core.analyzer import (
     calculate_news_weight,
     format_time_display,
@@ -34,6 +47,10 @@ __all__ = [
     "load_config",
     "load_frequency_words",
     "matches_word_groups",
+    "WordGroupMatcher",
+    "get_word_group_matcher",
+    "KeywordMatchIndex",
+    "frequency_config_hash",
     # 数据处理
     "save_titles_to_file",
     "read_all_today_titles_from_storage",
@@ -43,6 +60,8 @@ __all__ = [
     "is_first_crawl_today",
     # 统计分析
     "calculate_news_weight",
+    "calculate_news_weights",
+    "sort_news_by_weight",
     "format_time_display",
     "count_word_frequency",
     "count_rss_frequency",
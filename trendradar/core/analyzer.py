@@ -3,61 +3,28 @@
 统计分析模块
 
 提供新闻统计和分析功能：
-- calculate_news_weight: 计算新闻权重
+- calculate_news_weight: 计算新闻权重（实现见 weight 模块）
 - format_time_display: 格式化时间显示
 - count_word_frequency: 统计词频
 """
 
 from typing import Dict, List, Tuple, Optional, Callable
 
-from trendradar.core.frequency import matches_word_groups, _word_matches
+from trendradar.core.frequency import WordGroupMatcher, get_word_group_matcher
+from trendradar.core.keyword_index import NO_GROUP, KeywordMatchIndex
+from trendradar.core.weight import calculate_news_weight, sort_news_by_weight
 
 
-def calculate_news_weight(
-    title_data: Dict,
-    rank_threshold: int,
-    weight_config: Dict,
-) -> float:
-    """
-    计算新闻权重，用于排序
-
-    Args:
-        title_data: 标题数据，包含 ranks 和 count
-        rank_threshold: 排名阈值
-        weight_config: 权重配置 {RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT}
-
-    Returns:
-        float: 计算出的权重值
-    """
-    ranks = title_data.get("ranks", [])
-    if not ranks:
-        return 0.0
-
-    count = title_data.get("count", len(ranks))
-
-    # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
-    for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
-
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
-
-    # 频次权重：min(出现次数, 10) × 10
-    frequency_weight = min(count, 10) * 10
-
-    # 热度加成：高排名次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
-
-    total_weight = (
-        rank_weight * weight_config["RANK_WEIGHT"]
-        + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
-        + hotness_weight * weight_config["HOTNESS_WEIGHT"]
-    )
-
-    return total_weight
+def _first_group_index(
+    title: str,
+    matcher: WordGroupMatcher,
+    keyword_index: Optional[KeywordMatchIndex] = None,
+) -> int:
+    """获取标题命中的第一个词组下标（有索引时优先复用已记录的结果），未命中返回 NO_GROUP"""
+    if keyword_index is not None:
+        return keyword_index.group_index(title, matcher)
+    group_indices = matcher.match_group_indices(title)
+    return group_indices[0] if group_indices else NO_GROUP
 
 
 def format_time_display(
@@ -103,6 +70,7 @@ def count_word_frequency(
     is_first_crawl_func: Optional[Callable[[], bool]] = None,
     convert_time_func: Optional[Callable[[str], str]] = None,
     quiet: bool = False,
+    keyword_index: Optional[KeywordMatchIndex] = None,
 ) -> Tuple[List[Dict], int]:
     """
     统计词频，支持必须词、频率词、过滤词、全局过滤词，并标记新增标题
@@ -123,6 +91,8 @@ def count_word_frequency(
         is_first_crawl_func: 检测是否是当天第一次爬取的函数
         convert_time_func: 时间格式转换函数
         quiet: 是否静默模式（不打印日志）
+        keyword_index: 当日关键词归属索引（可选，已记录的标题不再重复匹配；
+            只复用词组归属，各词组的统计仍按本次数据汇总）
 
     Returns:
         Tuple[List[Dict], int]: (统计结果列表, 总标题数)
@@ -164,27 +134,31 @@ def count_word_frequency(
     elif mode == "current":
         # current 模式：只处理当前时间批次的新闻，但统计信息来自全部历史
         if title_info:
-            latest_time = None
-            for source_titles in title_info.values():
-                for title_data in source_titles.values():
-                    last_time = title_data.get("last_time", "")
-                    if last_time:
-                        if latest_time is None or last_time > latest_time:
-                            latest_time = last_time
+            # 最新批次时间（单次遍历）
+            latest_time = max(
+                (
+                    title_data.get("last_time") or ""
+                    for source_titles in title_info.values()
+                    for title_data in source_titles.values()
+                ),
+                default="",
+            )
 
             # 只处理 last_time 等于最新时间的新闻
             if latest_time:
                 results_to_process = {}
                 for source_id, source_titles in results.items():
-                    if source_id in title_info:
-                        filtered_titles = {}
-                        for title, title_data in source_titles.items():
-                            if title in title_info[source_id]:
-                                info = title_info[source_id][title]
-                                if info.get("last_time") == latest_time:
-                                    filtered_titles[title] = title_data
-                        if filtered_titles:
-                            results_to_process[source_id] = filtered_titles
+                    source_info = title_info.get(source_id)
+                    if not source_info:
+                        continue
+                    filtered_titles = {
+                        title: title_data
+                        for title, title_data in source_titles.items()
+                        if title in source_info
+                        and source_info[title].get("last_time") == latest_time
+                    }
+                    if filtered_titles:
+                        results_to_process[source_id] = filtered_titles
 
                 if not quiet:
                     print(
@@ -209,7 +183,6 @@ def count_word_frequency(
 
     word_stats = {}
     total_titles = 0
-    processed_titles = {}
     matched_new_count = 0
 
     if title_info is None:
@@ -221,143 +194,81 @@ def count_word_frequency(
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": {}}
 
+    # 编译后的匹配器：一次扫描同时完成过滤判断与词组归属
+    matcher = get_word_group_matcher(word_groups, filter_words, global_filters)
+    if keyword_index is not None and not keyword_index.accepts(word_groups, filter_words, global_filters):
+        keyword_index = None
+
+    # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
+    count_matched_new = (mode == "incremental" and all_news_are_new) or (
+        mode == "current" and is_first_today
+    )
+
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
 
-        if source_id not in processed_titles:
-            processed_titles[source_id] = {}
+        # 每个来源只查找一次
+        source_info = title_info.get(source_id) or {}
+        source_new_titles = new_titles.get(source_id) or ()
+        source_name = id_to_name.get(source_id, source_id)
 
         for title, title_data in titles_data.items():
-            if title in processed_titles.get(source_id, {}):
+            # 一个标题只归入第一个匹配的词组
+            group_index = _first_group_index(title, matcher, keyword_index)
+            if group_index == NO_GROUP:
                 continue
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words, global_filters
-            )
-
-            if not matches_frequency_words:
-                continue
-
-            # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
-            if (mode == "incremental" and all_news_are_new) or (
-                mode == "current" and is_first_today
-            ):
+            if count_matched_new:
                 matched_new_count += 1
 
-            source_ranks = title_data.get("ranks", [])
+            group_key = word_groups[group_index]["group_key"]
+            group_stats = word_stats[group_key]
+            group_stats["count"] += 1
+
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # 找到匹配的词组（防御性转换确保类型安全）
-            title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑（支持正则语法）
-                    if required_words:
-                        all_required_present = all(
-                            _word_matches(req_item, title_lower)
-                            for req_item in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            _word_matches(normal_item, title_lower)
-                            for normal_item in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time, convert_time_func)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
-
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
-
-                break
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = title_data.get("ranks", []) or []
+            url = source_url
+            mobile_url = source_mobile_url
+
+            # 从历史统计信息中获取完整数据
+            info = source_info.get(title)
+            if info is not None:
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time, convert_time_func)
+
+            # 判断是否为新增（增量模式下所有处理的新闻都是新增）
+            is_new = all_news_are_new or title in source_new_titles
+
+            group_stats["titles"].setdefault(source_id, []).append(
+                {
+                    "title": title,
+                    "source_name": source_name,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "time_display": time_display,
+                    "count": count_info,
+                    "ranks": ranks,
+                    "rank_threshold": rank_threshold,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                    "is_new": is_new,
+                }
+            )
 
     # 最后统一打印汇总信息
     if mode == "incremental":
@@ -431,24 +342,16 @@ def count_word_frequency(
         for source_id, title_list in data["titles"].items():
             all_titles.extend(title_list)
 
-        # 按权重排序
-        sorted_titles = sorted(
-            all_titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold, weight_config),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
-
         # 应用最大显示数量限制（优先级：单独配置 > 全局配置）
         group_max_count = group_key_to_max_count.get(group_key, 0)
         if group_max_count == 0:
             # 使用全局配置
             group_max_count = max_news_per_keyword
 
-        if group_max_count > 0:
-            sorted_titles = sorted_titles[:group_max_count]
+        # 按权重排序（批量计算权重，有数量限制时只取前 N 条）
+        sorted_titles = sort_news_by_weight(
+            all_titles, rank_threshold, weight_config, top_k=group_max_count
+        )
 
         # 优先使用 display_name，否则使用 group_key
         display_word = group_key_to_display_name.get(group_key) or group_key
@@ -495,6 +398,7 @@ def count_rss_frequency(
     timezone: str = "Asia/Shanghai",
     rank_threshold: int = 5,
     quiet: bool = False,
+    keyword_index: Optional[KeywordMatchIndex] = None,
 ) -> Tuple[List[Dict], int]:
     """
     按关键词分组统计 RSS 条目（与热榜统计格式一致）
@@ -514,6 +418,7 @@ def count_rss_frequency(
         sort_by_position_first: 是否优先按配置位置排序
         timezone: 时区名称（用于时间格式化）
         quiet: 是否静默模式
+        keyword_index: 当日关键词归属索引（可选，已记录的标题不再重复匹配）
 
     Returns:
         Tuple[List[Dict], int]: (统计结果列表, 总条目数)
@@ -577,6 +482,10 @@ def count_rss_frequency(
     )
     url_to_rank = {item.get("url", ""): idx + 1 for idx, item in enumerate(sorted_items)}
 
+    matcher = get_word_group_matcher(word_groups, filter_words, global_filters)
+    if keyword_index is not None and not keyword_index.accepts(word_groups, filter_words, global_filters):
+        keyword_index = None
+
     for item in rss_items:
         title = item.get("title", "")
         url = item.get("url", "")
@@ -587,67 +496,36 @@ def count_rss_frequency(
         if url:
             processed_urls.add(url)
 
-        # 使用统一的匹配逻辑
-        if not matches_word_groups(title, word_groups, filter_words, global_filters):
+        # 一个条目只归入第一个匹配的词组
+        group_index = _first_group_index(title, matcher, keyword_index)
+        if group_index == NO_GROUP:
             continue
 
-        # 找到匹配的词组
-        title_lower = title.lower()
-        for group in word_groups:
-            required_words = group["required"]
-            normal_words = group["normal"]
-            group_key = group["group_key"]
-
-            # "全部 RSS" 模式：所有条目都匹配
-            if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部 RSS":
-                matched = True
-            else:
-                # 检查必须词（支持正则语法）
-                if required_words:
-                    all_required_present = all(
-                        _word_matches(req_item, title_lower)
-                        for req_item in required_words
-                    )
-                    if not all_required_present:
-                        continue
-
-                # 检查普通词（支持正则语法）
-                if normal_words:
-                    any_normal_present = any(
-                        _word_matches(normal_item, title_lower)
-                        for normal_item in normal_words
-                    )
-                    if not any_normal_present:
-                        continue
-
-                matched = True
-
-            if matched:
-                word_stats[group_key]["count"] += 1
-
-                # 格式化时间显示
-                published_at = item.get("published_at", "")
-                time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
-
-                # 判断是否为新增
-                is_new = url in new_urls if url else False
-
-                # 获取排名（基于发布时间顺序）
-                rank = url_to_rank.get(url, 99) if url else 99
-
-                title_data = {
-                    "title": title,
-                    "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
-                    "time_display": time_display,
-                    "count": 1,  # RSS 条目通常只出现一次
-                    "ranks": [rank],
-                    "rank_threshold": rank_threshold,
-                    "url": url,
-                    "mobile_url": "",
-                    "is_new": is_new,
-                }
-                word_stats[group_key]["titles"].append(title_data)
-                break  # 一个条目只匹配第一个词组
+        group_key = word_groups[group_index]["group_key"]
+        word_stats[group_key]["count"] += 1
+
+        # 格式化时间显示
+        published_at = item.get("published_at", "")
+        time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
+
+        # 判断是否为新增
+        is_new = url in new_urls if url else False
+
+        # 获取排名（基于发布时间顺序）
+        rank = url_to_rank.get(url, 99) if url else 99
+
+        title_data = {
+            "title": title,
+            "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
+            "time_display": time_display,
+            "count": 1,  # RSS 条目通常只出现一次
+            "ranks": [rank],
+            "rank_threshold": rank_threshold,
+            "url": url,
+            "mobile_url": "",
+            "is_new": is_new,
+        }
+        word_stats[group_key]["titles"].append(title_data)
 
     # 构建统计结果
     stats = []
@@ -747,14 +625,7 @@ def convert_keyword_stats_to_platform_stats(
 
     # 3. 按权重排序每个平台内的新闻
     for source_name, titles in platform_map.items():
-        platform_map[source_name] = sorted(
-            titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold, weight_config),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
+        platform_map[source_name] = sort_news_by_weight(titles, rank_threshold, weight_config)
 
     # 4. 构建平台统计结果
     platform_stats = []
@@ -199,12 +199,6 @@ def detect_latest_new_titles_from_storage(
         if not latest_data or not latest_data.items:
             return {}
 
-        # 获取所有历史数据
-        all_data = storage_manager.get_today_all_data()
-        if not all_data or not all_data.items:
-            # 没有历史数据（第一次抓取），不应该有"新增"标题
-            return {}
-
         # 获取最新批次时间
         latest_time = latest_data.crawl_time
 
@@ -221,25 +215,19 @@ def detect_latest_new_titles_from_storage(
                     "mobileUrl": item.mobile_url or "",
                 }
 
-        # 步骤2：收集历史标题
+        # 检查是否是当天第一次抓取（没有任何历史标题）
+        # 如果没有任何首次出现时间早于最新批次的记录，说明只有一个抓取批次，不应该有"新增"标题
+        if not storage_manager.has_titles_before(latest_time, platform_ids=current_platform_ids):
+            return {}
+
+        # 步骤2：收集历史标题（由存储后端在 SQLite 中按索引查询，只检查最新批次的标题）
         # 关键逻辑：一个标题只要其 first_crawl_time < latest_time，就是历史标题
         # 这样即使同一标题有多条记录（URL 不同），只要任何一条是历史的，该标题就算历史
-        historical_titles = {}
-        for source_id, news_list in all_data.items.items():
-            if current_platform_ids is not None and source_id not in current_platform_ids:
-                continue
-
-            historical_titles[source_id] = set()
-            for item in news_list:
-                first_time = getattr(item, 'first_time', item.crawl_time)
-                # 如果该记录的首次出现时间早于最新批次，则该标题是历史标题
-                if first_time < latest_time:
-                    historical_titles[source_id].add(item.title)
-
-        # 检查是否是当天第一次抓取（没有任何历史标题）
-        # 如果所有平台的历史标题集合都为空，说明只有一个抓取批次，不应该有"新增"标题
-        has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
-        if not has_historical_data:
+        historical_titles = storage_manager.get_historical_titles(
+            {source_id: list(titles) for source_id, titles in latest_titles.items()},
+            latest_time,
+        )
+        if historical_titles is None:
             return {}
 
         # 步骤3：找出新增标题 = 最新批次标题 - 历史标题
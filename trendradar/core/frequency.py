@@ -11,12 +11,18 @@
 - 正则表达式（/pattern/ 语法）
 - 显示名称（=> 别名 语法）
 - 组别名（[组别名] 语法，作为词组第一行）
+
+并提供编译后的词组匹配器（WordGroupMatcher）：普通词构建 Aho-Corasick 自动机、
+正则词合并为一个交替表达式预筛，每个标题只扫描一遍即可得到命中的全部词组。
 """
 
+import hashlib
 import os
 import re
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Dict, List, Tuple, Optional, Set, Union
 
 
 def _parse_word(word: str) -> Dict:
@@ -89,6 +95,11 @@ def _word_matches(word_config: Union[str, Dict], title_lower: str) -> bool:
         return word_config["word"].lower() in title_lower
 
 
+# 已解析的频率词配置：绝对路径 -> ((修改时间, 大小), 内容哈希, 解析结果)
+_frequency_cache: Dict[str, Tuple[Tuple[int, int], str, Tuple[List[Dict], List[Dict], List[str]]]] = {}
+_frequency_cache_lock = threading.Lock()
+
+
 def load_frequency_words(
     frequency_file: Optional[str] = None,
 ) -> Tuple[List[Dict], List[str], List[str]]:
@@ -106,6 +117,9 @@ def load_frequency_words(
     - !词：过滤词，匹配则排除
     - @数字：该词组最多显示的条数
 
+    解析结果按文件路径缓存在进程内（以修改时间、大小、内容哈希判断是否变化），
+    文件未变化时直接返回同一份结果，调用方不应修改返回的列表。
+
     Args:
         frequency_file: 频率词配置文件路径，默认从环境变量 FREQUENCY_WORDS_PATH 获取或使用 config/frequency_words.txt
 
@@ -121,12 +135,44 @@ def load_frequency_words(
         )
 
     frequency_path = Path(frequency_file)
-    if not frequency_path.exists():
+    try:
+        stat = frequency_path.stat()
+    except OSError:
         raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
 
+    cache_key = str(frequency_path.resolve())
+    file_state = (stat.st_mtime_ns, stat.st_size)
+
+    with _frequency_cache_lock:
+        cached = _frequency_cache.get(cache_key)
+    if cached is not None and cached[0] == file_state:
+        return cached[2]
+
     with open(frequency_path, "r", encoding="utf-8") as f:
         content = f.read()
 
+    # 文件被触碰但内容未变时，沿用已解析的结果
+    content_hash = hashlib.sha1(content.encode("utf-8")).hexdigest()
+    if cached is not None and cached[1] == content_hash:
+        result = cached[2]
+    else:
+        result = _parse_frequency_content(content)
+
+    with _frequency_cache_lock:
+        _frequency_cache[cache_key] = (file_state, content_hash, result)
+    return result
+
+
+def _parse_frequency_content(content: str) -> Tuple[List[Dict], List[Dict], List[str]]:
+    """
+    解析频率词配置文件内容
+
+    Args:
+        content: 配置文件文本
+
+    Returns:
+        (词组列表, 词组内过滤词, 全局过滤词)
+    """
     word_groups = [group.strip() for group in content.split("\n\n") if group.strip()]
 
     processed_groups = []
@@ -236,6 +282,338 @@ def load_frequency_words(
     return processed_groups, filter_words, global_filters
 
 
+# 正则元字符（用于识别"字面量交替"形式的正则，如 /华为|鸿蒙|\bHarmonyOS\b/）
+_REGEX_META_CHARS = set(".^$*+?{}[]()\\|")
+
+# 忽略大小写时会与 ASCII 字母互相匹配、但小写化后仍不相同的字符（ı ↔ i，ſ ↔ s）
+_CASE_FOLD_EXCEPTIONS = {"\u0131", "\u017f"}
+
+
+def _regex_literals(pattern: str) -> Optional[Set[str]]:
+    """
+    提取正则表达式的必要字面量
+
+    只处理"字面量交替"形式（各分支为不含元字符的文本，可带 \\b、^、$），
+    此时正则能匹配的前提是标题包含其中至少一个字面量。
+
+    Args:
+        pattern: 正则表达式字符串
+
+    Returns:
+        小写字面量集合；无法提取时返回 None
+    """
+    literals = set()
+    for branch in pattern.split("|"):
+        branch = branch.replace("\\b", "")
+        if branch.startswith("^"):
+            branch = branch[1:]
+        if branch.endswith("$"):
+            branch = branch[:-1]
+        if not branch or any(ch in _REGEX_META_CHARS for ch in branch):
+            return None
+        # 只接受 ASCII 或无大小写的字符（如中文），保证小写子串判断与 IGNORECASE 等价
+        if any(not ch.isascii() and ch.lower() != ch.upper() for ch in branch):
+            return None
+        literals.add(branch.lower())
+    return literals
+
+
+class _AhoCorasick:
+    """Aho-Corasick 多模式子串匹配自动机（模式与文本均已小写）"""
+
+    def __init__(self, patterns: Dict[str, int]):
+        """
+        构建自动机
+
+        Args:
+            patterns: {小写模式串: 模式 ID}，模式串不能为空
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        outputs: List[Set[int]] = [set()]
+
+        for pattern, pattern_id in patterns.items():
+            state = 0
+            for ch in pattern:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(pattern_id)
+
+        # 广度优先计算失败指针，并把失败链上的输出合并到当前状态
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                outputs[next_state] |= outputs[self._fail[next_state]]
+
+        self._outputs: List[Tuple[int, ...]] = [tuple(output) for output in outputs]
+
+    def search(self, text: str) -> Set[int]:
+        """返回在 text 中出现过的全部模式 ID"""
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        found: Set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+
+class WordGroupMatcher:
+    """
+    编译后的词组匹配器
+
+    由 load_frequency_words 的返回值构建一次，之后对每个标题：
+    - 普通词（含过滤词、全局过滤词）通过 Aho-Corasick 自动机一次扫描全部命中
+    - "字面量交替"形式的正则，其字面量也放入自动机，只有字面量命中时才确认正则
+    - 其余正则先用合并后的交替表达式预筛，命中后才逐个确认
+    - 只检查包含已命中词的词组
+
+    匹配语义与 matches_word_groups / _word_matches 完全一致。
+    """
+
+    def __init__(
+        self,
+        word_groups: List[Dict],
+        filter_words: List,
+        global_filters: Optional[List[str]] = None,
+    ):
+        """
+        编译匹配器
+
+        Args:
+            word_groups: 词组列表
+            filter_words: 过滤词列表（可以是字符串列表或字典列表）
+            global_filters: 全局过滤词列表
+        """
+        self.word_groups = word_groups
+        self.filter_words = filter_words
+        self.global_filters = global_filters
+
+        self._plain_ids: Dict[str, int] = {}
+        self._regex_ids: Dict[Tuple[str, int], int] = {}
+        self._regexes: List[Tuple[int, "re.Pattern"]] = []
+        self._always_ids: Set[int] = set()  # 空字符串：总是命中
+        self._word_count = 0
+
+        self._global_filter_ids = {
+            self._register(global_word) for global_word in (global_filters or [])
+        }
+        self._filter_ids = {self._register(filter_item) for filter_item in filter_words}
+
+        # 词组：(必须词 ID 集合, 普通词 ID 集合)；词 ID -> 包含该词的词组下标
+        self._groups: List[Tuple[frozenset, frozenset]] = []
+        self._word_to_groups: Dict[int, List[int]] = {}
+        self._wordless_groups: List[int] = []  # 没有任何词的词组（如"全部新闻"）总是命中
+
+        for index, group in enumerate(word_groups):
+            required_ids = frozenset(self._register(w) for w in group["required"])
+            normal_ids = frozenset(self._register(w) for w in group["normal"])
+            self._groups.append((required_ids, normal_ids))
+            if not required_ids and not normal_ids:
+                self._wordless_groups.append(index)
+            for word_id in required_ids | normal_ids:
+                self._word_to_groups.setdefault(word_id, []).append(index)
+
+        # 自动机模式：普通词 + 正则的必要字面量（字面量命中 -> 候选正则）
+        automaton_words = {word: word_id for word, word_id in self._plain_ids.items() if word}
+        self._literal_to_regexes: Dict[int, List[Tuple[int, "re.Pattern"]]] = {}
+        other_regexes = []
+        for word_id, pattern in self._regexes:
+            literals = _regex_literals(pattern.pattern)
+            if literals is None:
+                other_regexes.append((word_id, pattern))
+                continue
+            for literal in literals:
+                literal_id = automaton_words.setdefault(literal, self._word_count + len(automaton_words))
+                self._literal_to_regexes.setdefault(literal_id, []).append((word_id, pattern))
+
+        self._anchored_regexes = [
+            entry for entries in self._literal_to_regexes.values() for entry in entries
+        ]
+        self._automaton = _AhoCorasick(automaton_words) if automaton_words else None
+
+        # 正则预筛：没有捕获组的正则可以安全地合并为一个交替表达式
+        self._combined_regex = None
+        self._other_regexes = other_regexes
+        self._standalone_regexes = other_regexes
+        combinable = [pattern for _, pattern in other_regexes if pattern.groups == 0]
+        if combinable:
+            try:
+                self._combined_regex = re.compile(
+                    "|".join(f"(?:{pattern.pattern})" for pattern in combinable), re.IGNORECASE
+                )
+                self._standalone_regexes = [
+                    (word_id, pattern) for word_id, pattern in other_regexes if pattern.groups
+                ]
+            except re.error:
+                self._combined_regex = None
+
+    def _register(self, word_config: Union[str, Dict]) -> int:
+        """登记一个词并返回词 ID（相同的词共用一个 ID）"""
+        if isinstance(word_config, dict) and word_config.get("is_regex") and word_config.get("pattern"):
+            pattern = word_config["pattern"]
+            key = (pattern.pattern, pattern.flags)
+            if key not in self._regex_ids:
+                self._regex_ids[key] = self._word_count
+                self._regexes.append((self._word_count, pattern))
+                self._word_count += 1
+            return self._regex_ids[key]
+
+        word = word_config if isinstance(word_config, str) else word_config["word"]
+        word_lower = word.lower()
+        if word_lower not in self._plain_ids:
+            if not word_lower:
+                self._always_ids.add(self._word_count)
+            self._plain_ids[word_lower] = self._word_count
+            self._word_count += 1
+        return self._plain_ids[word_lower]
+
+    def _matched_word_ids(self, title_lower: str) -> Set[int]:
+        """单次扫描得到标题中命中的全部词 ID"""
+        hits = self._automaton.search(title_lower) if self._automaton else set()
+        matched = hits | self._always_ids
+
+        # 字面量命中的正则才需要确认（标题含 ı / ſ 时小写子串判断不再可靠，全部确认）
+        if not _CASE_FOLD_EXCEPTIONS.isdisjoint(title_lower):
+            candidates = list(self._anchored_regexes)
+        else:
+            candidates = []
+            for literal_id in hits:
+                candidates.extend(self._literal_to_regexes.get(literal_id, ()))
+
+        if self._combined_regex is not None and self._combined_regex.search(title_lower):
+            candidates.extend(self._other_regexes)
+        else:
+            candidates.extend(self._standalone_regexes)
+
+        for word_id, pattern in candidates:
+            if word_id not in matched and pattern.search(title_lower):
+                matched.add(word_id)
+
+        return matched
+
+    def match_group_indices(self, title: str) -> List[int]:
+        """
+        返回标题命中的全部词组下标（按配置顺序）
+
+        被全局过滤词或过滤词排除的标题返回空列表；未配置词组时返回空列表
+        （此时是否匹配由 matches 判断）。
+
+        Args:
+            title: 标题文本
+
+        Returns:
+            命中的词组下标列表
+        """
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return []
+
+        matched = self._matched_word_ids(title.lower())
+
+        if matched & self._global_filter_ids or not self.word_groups:
+            return []
+        if matched & self._filter_ids:
+            return []
+
+        candidates = set(self._wordless_groups)
+        for word_id in matched:
+            candidates.update(self._word_to_groups.get(word_id, ()))
+
+        result = []
+        for index in sorted(candidates):
+            required_ids, normal_ids = self._groups[index]
+            if required_ids and not required_ids <= matched:
+                continue
+            if normal_ids and not normal_ids & matched:
+                continue
+            result.append(index)
+        return result
+
+    def match_groups(self, title: str) -> List[Dict]:
+        """返回标题命中的全部词组（按配置顺序）"""
+        return [self.word_groups[index] for index in self.match_group_indices(title)]
+
+    def matched_group_keys(self, title: str) -> Set[str]:
+        """返回标题命中的全部词组 group_key"""
+        return {self.word_groups[index]["group_key"] for index in self.match_group_indices(title)}
+
+    def matches(self, title: str) -> bool:
+        """检查标题是否匹配词组规则（与 matches_word_groups 语义一致）"""
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+        if not title.strip():
+            return False
+
+        if not self.word_groups:
+            # 未配置词组：只检查全局过滤词
+            if not self._global_filter_ids:
+                return True
+            return not self._matched_word_ids(title.lower()) & self._global_filter_ids
+
+        return bool(self.match_group_indices(title))
+
+
+# 最近一次编译的匹配器（调用方通常对同一份配置逐条调用 matches_word_groups）
+_matcher_cache: Optional[WordGroupMatcher] = None
+_matcher_cache_sizes: Tuple[int, int, int] = (0, 0, 0)
+_matcher_cache_lock = threading.Lock()
+
+
+def get_word_group_matcher(
+    word_groups: List[Dict],
+    filter_words: List,
+    global_filters: Optional[List[str]] = None,
+) -> WordGroupMatcher:
+    """
+    获取词组匹配器（同一组配置对象只编译一次）
+
+    Args:
+        word_groups: 词组列表
+        filter_words: 过滤词列表
+        global_filters: 全局过滤词列表
+
+    Returns:
+        WordGroupMatcher 实例
+    """
+    global _matcher_cache, _matcher_cache_sizes
+
+    sizes = (len(word_groups), len(filter_words), len(global_filters or ()))
+    with _matcher_cache_lock:
+        matcher = _matcher_cache
+        if (
+            matcher is not None
+            and matcher.word_groups is word_groups
+            and matcher.filter_words is filter_words
+            and matcher.global_filters is global_filters
+            and _matcher_cache_sizes == sizes
+        ):
+            return matcher
+
+    matcher = WordGroupMatcher(word_groups, filter_words, global_filters)
+    with _matcher_cache_lock:
+        _matcher_cache = matcher
+        _matcher_cache_sizes = sizes
+    return matcher
+
+
 def matches_word_groups(
     title: str,
     word_groups: List[Dict],
@@ -245,6 +623,8 @@ def matches_word_groups(
     """
     检查标题是否匹配词组规则
 
+    使用编译后的匹配器（见 WordGroupMatcher），同一组配置只编译一次。
+
     Args:
         title: 标题文本
         word_groups: 词组列表
@@ -254,6 +634,16 @@ def matches_word_groups(
     Returns:
         是否匹配
     """
+    return get_word_group_matcher(word_groups, filter_words, global_filters).matches(title)
+
+
+def _matches_word_groups_linear(
+    title: str,
+    word_groups: List[Dict],
+    filter_words: List,
+    global_filters: Optional[List[str]] = None
+) -> bool:
+    """逐词检查的参考实现（WordGroupMatcher 的语义基准）"""
     # 防御性类型检查：确保 title 是有效字符串
     if not isinstance(title, str):
         title = str(title) if title is not None else ""
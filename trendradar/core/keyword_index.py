@@ -0,0 +1,134 @@
+# coding=utf-8
+"""
+关键词归属索引模块
+
+当日汇总模式下，每次运行都要对当天全部标题重新做词组匹配，而两次运行之间
+真正变化的只有新抓取的那一批标题。标题属于哪个词组只取决于标题文本与频率词
+配置，因此可以按天持久化（存放在当日数据库的 keyword_matches 表中）：
+
+- 每行记录：配置哈希、标题、命中的第一个词组下标（-1 表示未命中）
+- 统计时已记录的标题直接复用结果，只有新标题需要匹配
+- 配置哈希由解析后的词组、过滤词、全局过滤词计算，frequency_words.txt
+  内容变化时哈希随之变化，旧记录自动失效
+
+范围：只持久化标题 -> 词组的归属，各词组的命中条数、排名等统计仍由
+count_word_frequency 每次根据当天数据汇总。这些统计随每次抓取变化（出现次数、
+排名、是否新增），且已经存放在 news_items / rank_history 中；复用归属后，
+汇总只是对标题的一次字典查找与已命中标题的排序，2 万条标题约 10ms，
+远小于读取当天数据本身的开销。
+"""
+
+import hashlib
+import json
+import threading
+from typing import Dict, List, Optional, Union
+
+from trendradar.core.frequency import WordGroupMatcher
+
+
+# 未命中任何词组
+NO_GROUP = -1
+
+
+def _word_signature(word_config: Union[str, Dict]) -> List:
+    """提取单个词中影响匹配结果的部分"""
+    if isinstance(word_config, dict):
+        pattern = word_config.get("pattern")
+        if word_config.get("is_regex") and pattern:
+            return ["re", pattern.pattern, pattern.flags]
+        return ["word", word_config["word"]]
+    return ["word", word_config]
+
+
+def frequency_config_hash(
+    word_groups: List[Dict],
+    filter_words: List,
+    global_filters: Optional[List[str]] = None,
+) -> str:
+    """
+    计算频率词配置的内容哈希（只包含影响匹配结果的部分）
+
+    Args:
+        word_groups: 词组列表
+        filter_words: 过滤词列表
+        global_filters: 全局过滤词列表
+
+    Returns:
+        16 位十六进制哈希
+    """
+    payload = {
+        "groups": [
+            [
+                [_word_signature(word) for word in group["required"]],
+                [_word_signature(word) for word in group["normal"]],
+            ]
+            for group in word_groups
+        ],
+        "filters": [_word_signature(word) for word in filter_words],
+        "global_filters": list(global_filters or []),
+    }
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+class KeywordMatchIndex:
+    """
+    某一天、某一份频率词配置下的标题 -> 词组下标索引
+
+    由存储中已记录的结果初始化；统计过程中新匹配的标题暂存在 pending 中，
+    由调用方通过 take_pending 取出并写回存储。
+    """
+
+    def __init__(self, config_hash: str, matches: Optional[Dict[str, int]] = None):
+        """
+        初始化索引
+
+        Args:
+            config_hash: 频率词配置哈希（见 frequency_config_hash）
+            matches: 已记录的 {标题: 词组下标}
+        """
+        self.config_hash = config_hash
+        self._matches: Dict[str, int] = dict(matches or {})
+        self._pending: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def accepts(
+        self,
+        word_groups: List[Dict],
+        filter_words: List,
+        global_filters: Optional[List[str]] = None,
+    ) -> bool:
+        """检查索引是否属于给定的频率词配置"""
+        return self.config_hash == frequency_config_hash(word_groups, filter_words, global_filters)
+
+    def group_index(self, title: str, matcher: WordGroupMatcher) -> int:
+        """
+        获取标题命中的第一个词组下标（未记录时用匹配器计算并记录）
+
+        Args:
+            title: 标题文本
+            matcher: 与本索引配置一致的词组匹配器
+
+        Returns:
+            词组下标，未命中返回 NO_GROUP
+        """
+        if not isinstance(title, str):
+            title = str(title) if title is not None else ""
+
+        index = self._matches.get(title)
+        if index is None:
+            group_indices = matcher.match_group_indices(title)
+            index = group_indices[0] if group_indices else NO_GROUP
+            with self._lock:
+                self._matches[title] = index
+                self._pending[title] = index
+        return index
+
+    def take_pending(self) -> Dict[str, int]:
+        """取出尚未写回存储的新记录"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
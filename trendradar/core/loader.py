@@ -66,8 +66,16 @@ def _load_crawler_config(config_data: Dict) -> Dict:
     advanced = config_data.get("advanced", {})
     crawler_config = advanced.get("crawler", {})
     enable_crawler_env = _get_env_bool("ENABLE_CRAWLER")
+    circuit_breaker = crawler_config.get("circuit_breaker", {})
     return {
         "REQUEST_INTERVAL": crawler_config.get("request_interval", 100),
+        "MAX_CONCURRENCY": _get_env_int("CRAWLER_MAX_CONCURRENCY") or crawler_config.get("max_concurrency", 1),
+        "HOST_INTERVAL": crawler_config.get("host_interval", 100),
+        "CIRCUIT_BREAKER": {
+            "ENABLED": circuit_breaker.get("enabled", False),
+            "FAILURE_THRESHOLD": circuit_breaker.get("failure_threshold", 3),
+            "COOLDOWN_MINUTES": circuit_breaker.get("cooldown_minutes", 60),
+        },
         "USE_PROXY": crawler_config.get("use_proxy", False),
         "DEFAULT_PROXY": crawler_config.get("default_proxy", ""),
         "ENABLE_CRAWLER": enable_crawler_env if enable_crawler_env is not None else crawler_config.get("enabled", True),
@@ -172,6 +180,10 @@ def _load_rss_config(config_data: Dict) -> Dict:
     return {
         "ENABLED": rss.get("enabled", False),
         "REQUEST_INTERVAL": advanced_rss.get("request_interval", 2000),
+        "MAX_CONCURRENCY": advanced_rss.get("max_concurrency", 1),
+        "PER_HOST_LIMIT": advanced_rss.get("per_host_limit", 2),
+        "CONDITIONAL_GET": advanced_rss.get("conditional_get", True),
+        "STOP_AT_STALE": advanced_rss.get("stop_at_stale", False),
         "TIMEOUT": advanced_rss.get("timeout", 15),
         "USE_PROXY": advanced_rss.get("use_proxy", False),
         "PROXY_URL": rss_proxy_url,
@@ -227,10 +239,14 @@ def _load_storage_config(config_data: Dict) -> Dict:
     local = storage.get("local", {})
     remote = storage.get("remote", {})
     pull = storage.get("pull", {})
+    sqlite = storage.get("sqlite", {})
+    archive = storage.get("archive", {})
 
     txt_enabled_env = _get_env_bool("STORAGE_TXT_ENABLED")
     html_enabled_env = _get_env_bool("STORAGE_HTML_ENABLED")
     pull_enabled_env = _get_env_bool("PULL_ENABLED")
+    archive_enabled_env = _get_env_bool("STORAGE_ARCHIVE_ENABLED")
+    background_upload_env = _get_env_bool("REMOTE_BACKGROUND_UPLOAD")
 
     return {
         "BACKEND": _get_env_str("STORAGE_BACKEND") or storage.get("backend", "auto"),
@@ -250,10 +266,33 @@ def _load_storage_config(config_data: Dict) -> Dict:
             "SECRET_ACCESS_KEY": _get_env_str("S3_SECRET_ACCESS_KEY") or remote.get("secret_access_key", ""),
             "REGION": _get_env_str("S3_REGION") or remote.get("region", ""),
             "RETENTION_DAYS": _get_env_int("REMOTE_RETENTION_DAYS") or remote.get("retention_days", 0),
+            "REPLICATION": _get_env_str("REMOTE_REPLICATION") or remote.get("replication", "full"),
+            "COMPACT_SEGMENTS": remote.get("compact_segments", 24),
+            "BACKGROUND_UPLOAD": (
+                background_upload_env if background_upload_env is not None
+                else remote.get("background_upload", "auto")
+            ),
+            "UPLOAD_FLUSH_TIMEOUT": remote.get("upload_flush_timeout", 120),
+            "BASE_CACHE_DIR": _get_env_str("REMOTE_BASE_CACHE_DIR") or remote.get("base_cache_dir", ""),
         },
         "PULL": {
             "ENABLED": pull_enabled_env if pull_enabled_env is not None else pull.get("enabled", False),
             "DAYS": _get_env_int("PULL_DAYS") or pull.get("days", 7),
+            "MAX_CONCURRENCY": pull.get("max_concurrency", 4),
+        },
+        "ARCHIVE": {
+            "ENABLED": archive_enabled_env if archive_enabled_env is not None else archive.get("enabled", False),
+            "LEVEL": archive.get("level", 0),
+        },
+        "SQLITE": {
+            "JOURNAL_MODE": _get_env_str("SQLITE_JOURNAL_MODE") or sqlite.get("journal_mode", "wal"),
+            "SYNCHRONOUS": sqlite.get("synchronous", "normal"),
+            "CACHE_SIZE_MB": sqlite.get("cache_size_mb", 32),
+            "MMAP_SIZE_MB": sqlite.get("mmap_size_mb", 128),
+            "TEMP_STORE": sqlite.get("temp_store", "memory"),
+            "BUSY_TIMEOUT_MS": sqlite.get("busy_timeout_ms", 5000),
+            "READ_POOL_SIZE": sqlite.get("read_pool_size", 4),
+            "RANK_HISTORY": _get_env_str("SQLITE_RANK_HISTORY") or sqlite.get("rank_history", "rows"),
         },
     }
 
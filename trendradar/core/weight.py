@@ -0,0 +1,228 @@
+# coding=utf-8
+"""
+新闻权重计算模块
+
+提供：
+- calculate_news_weight: 计算单条新闻权重（标量实现，语义基准）
+- calculate_news_weights: 批量计算权重
+- sort_news_by_weight: 按权重排序（可只取前 top_k 条）
+
+报告生成时每个词组都要对全部标题排序，MCP 的跨天分析更是一次处理数十万条。
+批量接口把所有标题的排名展平为一个数组（配合每条的偏移量），安装了 NumPy 时
+一次向量化计算出全部权重，取前 top_k 条时先做部分排序再精排；未安装 NumPy
+或条目很少时回退为逐条计算。两种方式的运算顺序一致，结果逐位相同。
+"""
+
+import heapq
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+# 条目数少于该值时逐条计算（向量化的固定开销更大）
+_VECTORIZE_MIN_ITEMS = 64
+
+# 没有排名时用于排序的最小排名
+_MISSING_RANK = 999
+
+
+def calculate_news_weight(
+    title_data: Dict,
+    rank_threshold: int,
+    weight_config: Dict,
+) -> float:
+    """
+    计算新闻权重，用于排序
+
+    Args:
+        title_data: 标题数据，包含 ranks 和 count
+        rank_threshold: 排名阈值
+        weight_config: 权重配置 {RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT}
+
+    Returns:
+        float: 计算出的权重值
+    """
+    ranks = title_data.get("ranks", [])
+    if not ranks:
+        return 0.0
+
+    count = title_data.get("count", len(ranks))
+
+    # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
+    rank_scores = []
+    for rank in ranks:
+        score = 11 - min(rank, 10)
+        rank_scores.append(score)
+
+    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+
+    # 频次权重：min(出现次数, 10) × 10
+    frequency_weight = min(count, 10) * 10
+
+    # 热度加成：高排名次数 / 总出现次数 × 100
+    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
+    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
+    hotness_weight = hotness_ratio * 100
+
+    total_weight = (
+        rank_weight * weight_config["RANK_WEIGHT"]
+        + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
+        + hotness_weight * weight_config["HOTNESS_WEIGHT"]
+    )
+
+    return total_weight
+
+
+def flatten_ranks(items: Sequence[Dict]) -> Tuple[List[int], List[int], List[int]]:
+    """
+    将各条目的排名展平
+
+    Args:
+        items: 标题数据列表（包含 ranks 和 count）
+
+    Returns:
+        (全部排名, 各条目排名个数, 各条目出现次数)
+    """
+    flat: List[int] = []
+    lengths: List[int] = []
+    counts: List[int] = []
+    for item in items:
+        ranks = item.get("ranks") or ()
+        flat.extend(ranks)
+        lengths.append(len(ranks))
+        counts.append(item.get("count", len(ranks)))
+    return flat, lengths, counts
+
+
+def _score_arrays(
+    items: Sequence[Dict],
+    rank_threshold: int,
+    weight_config: Dict,
+) -> Optional[Tuple["np.ndarray", "np.ndarray", "np.ndarray"]]:
+    """
+    向量化计算权重、最小排名、出现次数
+
+    Returns:
+        (权重, 最小排名, 出现次数) 三个数组；排名或次数不是整数时返回 None
+    """
+    flat, lengths, counts = flatten_ranks(items)
+
+    lengths_arr = np.asarray(lengths, dtype=np.int64)
+    counts_arr = np.asarray(counts)
+    rank_arr = np.asarray(flat) if flat else np.zeros(0, dtype=np.int64)
+    if rank_arr.dtype.kind not in "iu" or counts_arr.dtype.kind not in "iu":
+        return None
+
+    weights = np.zeros(len(items), dtype=np.float64)
+    min_ranks = np.full(len(items), _MISSING_RANK, dtype=np.int64)
+
+    nonempty = lengths_arr > 0
+    if rank_arr.size:
+        starts = (np.cumsum(lengths_arr) - lengths_arr)[nonempty]
+        sizes = lengths_arr[nonempty]
+
+        # 每段的整数和是精确的，除法与标量实现一样只舍入一次
+        rank_sum = np.add.reduceat(11 - np.minimum(rank_arr, 10), starts)
+        high_rank_count = np.add.reduceat((rank_arr <= rank_threshold).astype(np.int64), starts)
+
+        rank_weight = rank_sum / sizes
+        frequency_weight = np.minimum(counts_arr[nonempty], 10) * 10
+        hotness_weight = high_rank_count / sizes * 100
+
+        weights[nonempty] = (
+            rank_weight * weight_config["RANK_WEIGHT"]
+            + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
+            + hotness_weight * weight_config["HOTNESS_WEIGHT"]
+        )
+        min_ranks[nonempty] = np.minimum.reduceat(rank_arr, starts)
+
+    return weights, min_ranks, counts_arr
+
+
+def calculate_news_weights(
+    items: Sequence[Dict],
+    rank_threshold: int,
+    weight_config: Dict,
+) -> List[float]:
+    """
+    批量计算新闻权重（结果与逐条调用 calculate_news_weight 相同）
+
+    Args:
+        items: 标题数据列表
+        rank_threshold: 排名阈值
+        weight_config: 权重配置
+
+    Returns:
+        与 items 一一对应的权重列表
+    """
+    if HAS_NUMPY and len(items) >= _VECTORIZE_MIN_ITEMS:
+        arrays = _score_arrays(items, rank_threshold, weight_config)
+        if arrays is not None:
+            return arrays[0].tolist()
+
+    return [calculate_news_weight(item, rank_threshold, weight_config) for item in items]
+
+
+def sort_news_by_weight(
+    items: Sequence[Dict],
+    rank_threshold: int,
+    weight_config: Dict,
+    top_k: int = 0,
+    tie_break: bool = True,
+) -> List[Dict]:
+    """
+    按权重从高到低排序（稳定排序）
+
+    tie_break 为 True 时与报告排序一致：权重相同再按最小排名升序、出现次数降序；
+    为 False 时只按权重排序。
+
+    Args:
+        items: 标题数据列表
+        rank_threshold: 排名阈值
+        weight_config: 权重配置
+        top_k: 只返回前 top_k 条（0 = 全部）
+        tie_break: 是否使用最小排名、出现次数作为次级排序键
+
+    Returns:
+        排序后的列表（与 sorted(...)[:top_k] 的结果相同）
+    """
+    items = list(items)
+    limited = 0 < top_k < len(items)
+
+    if HAS_NUMPY and len(items) >= _VECTORIZE_MIN_ITEMS:
+        arrays = _score_arrays(items, rank_threshold, weight_config)
+        if arrays is not None:
+            weights, min_ranks, counts = arrays
+            neg_weights = -weights
+            # np.lexsort 以最后一个键为主键，且是稳定排序
+            keys = (-counts, min_ranks, neg_weights) if tie_break else (neg_weights,)
+
+            if limited:
+                # 部分排序：只精排权重不低于第 top_k 名的条目（含并列）
+                kth = np.partition(neg_weights, top_k - 1)[top_k - 1]
+                candidates = np.flatnonzero(neg_weights <= kth)
+                order = candidates[np.lexsort(tuple(key[candidates] for key in keys))][:top_k]
+            else:
+                order = np.lexsort(keys)
+            return [items[i] for i in order.tolist()]
+
+    if tie_break:
+        def sort_key(item: Dict) -> Tuple:
+            ranks = item.get("ranks")
+            return (
+                -calculate_news_weight(item, rank_threshold, weight_config),
+                min(ranks) if ranks else _MISSING_RANK,
+                -item.get("count", len(ranks or ())),
+            )
+    else:
+        def sort_key(item: Dict) -> Tuple:
+            return (-calculate_news_weight(item, rank_threshold, weight_config),)
+
+    if limited:
+        return heapq.nsmallest(top_k, items, key=sort_key)
+    return sorted(items, key=sort_key)
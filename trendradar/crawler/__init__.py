@@ -3,6 +3,7 @@
 爬虫模块 - 数据抓取功能
 """
 
+from trendradar.crawler.circuit_breaker import CircuitBreaker
 from trendradar.crawler.fetcher import DataFetcher
 
-__all__ = ["DataFetcher"]
+__all__ = ["DataFetcher", "CircuitBreaker"]
@@ -0,0 +1,99 @@
+# coding=utf-8
+"""
+平台熔断器模块
+
+根据存储中的抓取状态历史（crawl_source_status）识别持续失败的平台：
+- 连续失败次数达到阈值且仍在冷却期内：本轮跳过（熔断打开）
+- 冷却期已过：移到队尾，只尝试一次且不重试（半开探测）
+- 探测成功后失败计数自然清零（历史中出现 success）
+"""
+
+from datetime import datetime
+from typing import Dict, List, Set, Tuple, Union
+
+from trendradar.utils.time import get_configured_time, DEFAULT_TIMEZONE
+
+
+class CircuitBreaker:
+    """平台熔断器"""
+
+    TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown_minutes: int = 60,
+        timezone: str = DEFAULT_TIMEZONE,
+    ):
+        """
+        初始化熔断器
+
+        Args:
+            failure_threshold: 触发熔断的连续失败次数
+            cooldown_minutes: 熔断冷却时间（分钟）
+            timezone: 时区配置（与存储中 created_at 一致）
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_minutes = max(0, cooldown_minutes)
+        self.timezone = timezone
+        self._history: Dict[str, Dict] = {}
+
+    def update_history(self, history: Dict[str, Dict]) -> None:
+        """
+        更新失败历史
+
+        Args:
+            history: {platform_id: {"failures": 连续失败次数, "last_failed_at": "YYYY-MM-DD HH:MM:SS"}}
+        """
+        self._history = history or {}
+
+    def _minutes_since(self, time_str: str, now: datetime) -> float:
+        """计算距离指定时间的分钟数，解析失败视为冷却已过"""
+        try:
+            last = datetime.strptime(time_str, self.TIME_FORMAT)
+        except (TypeError, ValueError):
+            return float("inf")
+        return (now - last).total_seconds() / 60
+
+    def plan(
+        self, ids_list: List[Union[str, Tuple[str, str]]]
+    ) -> Tuple[List[Union[str, Tuple[str, str]]], List[str], Set[str]]:
+        """
+        根据失败历史规划本轮抓取
+
+        Args:
+            ids_list: 平台ID列表，每个元素可以是字符串或 (平台ID, 别名) 元组
+
+        Returns:
+            (调整顺序后的抓取列表, 跳过的平台ID列表, 半开探测的平台ID集合) 元组
+        """
+        if not self._history:
+            return list(ids_list), [], set()
+
+        now = get_configured_time(self.timezone).replace(tzinfo=None)
+
+        normal = []
+        probes = []
+        skipped: List[str] = []
+        probe_ids: Set[str] = set()
+
+        for id_info in ids_list:
+            id_value = id_info[0] if isinstance(id_info, tuple) else id_info
+            record = self._history.get(id_value)
+
+            if not record or record.get("failures", 0) < self.failure_threshold:
+                normal.append(id_info)
+                continue
+
+            if self._minutes_since(record.get("last_failed_at", ""), now) < self.cooldown_minutes:
+                skipped.append(id_value)
+            else:
+                probes.append(id_info)
+                probe_ids.add(id_value)
+
+        if skipped:
+            print(f"[熔断] 跳过持续失败的平台（冷却 {self.cooldown_minutes} 分钟）: {skipped}")
+        if probe_ids:
+            print(f"[熔断] 冷却结束，探测平台（不重试）: {sorted(probe_ids)}")
+
+        return normal + probes, skipped, probe_ids
@@ -4,17 +4,53 @@
 
 负责从 NewsNow API 抓取新闻数据，支持：
 - 单个平台数据获取
-- 批量平台数据爬取
+- 批量平台数据爬取（串行 / 异步并发）
 - 自动重试机制
 - 代理支持
+- 连接池复用（keep-alive）
+- 持续失败平台熔断
+- 响应内容摘要（识别未变化的榜单）
 """
 
+import asyncio
+import hashlib
 import json
 import random
 import time
-from typing import Dict, List, Tuple, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Tuple, Optional, Union
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from trendradar.crawler.circuit_breaker import CircuitBreaker
+
+
+class _HostThrottle:
+    """
+    按主机的请求节流器（异步模式使用）
+
+    保证同一主机相邻两次请求的发起时间间隔不小于 interval_ms，
+    不同主机之间互不影响。
+    """
+
+    def __init__(self, interval_ms: int):
+        self.interval = max(0, interval_ms) / 1000
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last_start: Dict[str, float] = {}
+
+    async def wait(self, host: str) -> None:
+        """等待直到允许向 host 发起下一次请求"""
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            loop = asyncio.get_running_loop()
+            last = self._last_start.get(host)
+            if last is not None:
+                delay = last + self.interval - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            self._last_start[host] = loop.time()
 
 
 class DataFetcher:
@@ -36,6 +72,9 @@ class DataFetcher:
         self,
         proxy_url: Optional[str] = None,
         api_url: Optional[str] = None,
+        max_concurrency: int = 1,
+        host_interval: int = 100,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ):
         """
         初始化数据获取器
@@ -43,9 +82,115 @@ class DataFetcher:
         Args:
             proxy_url: 代理服务器 URL（可选）
             api_url: API 基础 URL（可选，默认使用 DEFAULT_API_URL）
+            max_concurrency: 最大并发请求数（<=1 时使用串行模式）
+            host_interval: 异步模式下同一主机的最小请求间隔（毫秒）
+            circuit_breaker: 平台熔断器（可选，None 表示不启用）
         """
         self.proxy_url = proxy_url
         self.api_url = api_url or self.DEFAULT_API_URL
+        self.max_concurrency = max(1, int(max_concurrency or 1))
+        self.host_interval = host_interval
+        self.circuit_breaker = circuit_breaker
+        self.skipped_ids: List[str] = []
+
+        # 响应摘要：上次抓取的摘要（由调用方从存储加载）与本次抓取结果
+        self.previous_digests: Dict[str, str] = {}
+        self.response_digests: Dict[str, str] = {}
+        self.unchanged_ids: List[str] = []
+
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """
+        创建请求会话
+
+        会话在多次请求（含重试）之间复用 TCP/TLS 连接，
+        连接池大小随并发数调整，避免并发模式下连接被丢弃重建。
+        """
+        session = requests.Session()
+        session.headers.update(self.DEFAULT_HEADERS)
+
+        pool_size = max(10, self.max_concurrency)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        proxies = self._get_proxies()
+        if proxies:
+            session.proxies = proxies
+
+        return session
+
+    def close(self) -> None:
+        """关闭会话，释放连接池"""
+        try:
+            self.session.close()
+        except Exception:
+            pass
+
+    def update_digests(self, digests: Dict[str, str]) -> None:
+        """
+        设置各平台上次响应的摘要
+
+        Args:
+            digests: {platform_id: digest}，通常来自存储的 platform_digests 表
+        """
+        self.previous_digests = digests or {}
+
+    @staticmethod
+    def compute_digest(data: Dict) -> str:
+        """
+        计算响应条目的内容摘要
+
+        只对 items 计算（忽略 status、updatedTime 等随请求变化的字段）。
+        """
+        payload = json.dumps(data.get("items", []), ensure_ascii=False, sort_keys=True)
+        return hashlib.md5(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _split_id_info(id_info: Union[str, Tuple[str, str]]) -> Tuple[str, str]:
+        """拆分平台ID与别名"""
+        if isinstance(id_info, tuple):
+            return id_info[0], id_info[1]
+        return id_info, id_info
+
+    def _get_proxies(self) -> Optional[Dict[str, str]]:
+        """获取代理配置"""
+        if self.proxy_url:
+            return {"http": self.proxy_url, "https": self.proxy_url}
+        return None
+
+    def _request_once(self, url: str) -> Tuple[str, str]:
+        """
+        发起一次请求并校验响应
+
+        Args:
+            url: 请求地址
+
+        Returns:
+            (响应文本, 响应状态) 元组
+
+        Raises:
+            请求失败或响应状态异常时抛出异常
+        """
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+
+        data_text = response.text
+        data_json = json.loads(data_text)
+
+        status = data_json.get("status", "未知")
+        if status not in ["success", "cache"]:
+            raise ValueError(f"响应状态异常: {status}")
+
+        return data_text, status
+
+    @staticmethod
+    def _get_retry_wait(retries: int, min_retry_wait: int, max_retry_wait: int) -> float:
+        """计算第 retries 次重试前的等待时间（秒）"""
+        base_wait = random.uniform(min_retry_wait, max_retry_wait)
+        additional_wait = (retries - 1) * random.uniform(1, 2)
+        return base_wait + additional_wait
 
     def fetch_data(
         self,
@@ -66,35 +211,66 @@ class DataFetcher:
         Returns:
             (响应文本, 平台ID, 别名) 元组，失败时响应文本为 None
         """
-        if isinstance(id_info, tuple):
-            id_value, alias = id_info
-        else:
-            id_value = id_info
-            alias = id_value
-
+        id_value, alias = self._split_id_info(id_info)
         url = f"{self.api_url}?id={id_value}&latest"
 
-        proxies = None
-        if self.proxy_url:
-            proxies = {"http": self.proxy_url, "https": self.proxy_url}
-
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
-                    url,
-                    proxies=proxies,
-                    headers=self.DEFAULT_HEADERS,
-                    timeout=10,
-                )
-                response.raise_for_status()
+                data_text, status = self._request_once(url)
+
+                status_info = "最新数据" if status == "success" else "缓存数据"
+                print(f"获取 {id_value} 成功（{status_info}）")
+                return data_text, id_value, alias
+
+            except Exception as e:
+                retries += 1
+                if retries <= max_retries:
+                    wait_time = self._get_retry_wait(retries, min_retry_wait, max_retry_wait)
+                    print(f"请求 {id_value} 失败: {e}. {wait_time:.2f}秒后重试...")
+                    time.sleep(wait_time)
+                else:
+                    print(f"请求 {id_value} 失败: {e}")
+                    return None, id_value, alias
+
+        return None, id_value, alias
+
+    async def fetch_data_async(
+        self,
+        id_info: Union[str, Tuple[str, str]],
+        semaphore: asyncio.Semaphore,
+        throttle: _HostThrottle,
+        max_retries: int = 2,
+        min_retry_wait: int = 3,
+        max_retry_wait: int = 5,
+    ) -> Tuple[Optional[str], str, str]:
+        """
+        异步获取指定ID数据，支持重试
+
+        请求本身在线程池中执行；重试等待使用 asyncio.sleep 且不占用并发名额，
+        因此单个平台的失败重试不会阻塞其他平台。
+
+        Args:
+            id_info: 平台ID 或 (平台ID, 别名) 元组
+            semaphore: 并发控制信号量
+            throttle: 按主机的请求节流器
+            max_retries: 最大重试次数
+            min_retry_wait: 最小重试等待时间（秒）
+            max_retry_wait: 最大重试等待时间（秒）
 
-                data_text = response.text
-                data_json = json.loads(data_text)
+        Returns:
+            (响应文本, 平台ID, 别名) 元组，失败时响应文本为 None
+        """
+        id_value, alias = self._split_id_info(id_info)
+        url = f"{self.api_url}?id={id_value}&latest"
+        host = urlparse(url).netloc
 
-                status = data_json.get("status", "未知")
-                if status not in ["success", "cache"]:
-                    raise ValueError(f"响应状态异常: {status}")
+        retries = 0
+        while retries <= max_retries:
+            try:
+                async with semaphore:
+                    await throttle.wait(host)
+                    data_text, status = await asyncio.to_thread(self._request_once, url)
 
                 status_info = "最新数据" if status == "success" else "缓存数据"
                 print(f"获取 {id_value} 成功（{status_info}）")
@@ -103,17 +279,75 @@ class DataFetcher:
             except Exception as e:
                 retries += 1
                 if retries <= max_retries:
-                    base_wait = random.uniform(min_retry_wait, max_retry_wait)
-                    additional_wait = (retries - 1) * random.uniform(1, 2)
-                    wait_time = base_wait + additional_wait
+                    wait_time = self._get_retry_wait(retries, min_retry_wait, max_retry_wait)
                     print(f"请求 {id_value} 失败: {e}. {wait_time:.2f}秒后重试...")
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 else:
                     print(f"请求 {id_value} 失败: {e}")
                     return None, id_value, alias
 
         return None, id_value, alias
 
+    @staticmethod
+    def _parse_items(data: Dict) -> Dict[str, Dict]:
+        """
+        将 API 响应解析为 {标题: {ranks, url, mobileUrl}} 结构
+
+        Args:
+            data: API 响应 JSON
+
+        Returns:
+            标题数据字典
+        """
+        titles: Dict[str, Dict] = {}
+
+        for index, item in enumerate(data.get("items", []), 1):
+            title = item.get("title")
+            # 跳过无效标题（None、float、空字符串）
+            if title is None or isinstance(title, float) or not str(title).strip():
+                continue
+            title = str(title).strip()
+            url = item.get("url", "")
+            mobile_url = item.get("mobileUrl", "")
+
+            if title in titles:
+                titles[title]["ranks"].append(index)
+            else:
+                titles[title] = {
+                    "ranks": [index],
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                }
+
+        return titles
+
+    def _collect_response(
+        self,
+        id_value: str,
+        response: Optional[str],
+        results: Dict,
+        failed_ids: List,
+    ) -> None:
+        """解析单个平台的响应并写入结果/失败列表"""
+        if not response:
+            failed_ids.append(id_value)
+            return
+
+        try:
+            data = json.loads(response)
+            results[id_value] = self._parse_items(data)
+
+            digest = self.compute_digest(data)
+            self.response_digests[id_value] = digest
+            if self.previous_digests.get(id_value) == digest:
+                self.unchanged_ids.append(id_value)
+        except json.JSONDecodeError:
+            print(f"解析 {id_value} 响应失败")
+            failed_ids.append(id_value)
+        except Exception as e:
+            print(f"处理 {id_value} 数据出错: {e}")
+            failed_ids.append(id_value)
+
     def crawl_websites(
         self,
         ids_list: List[Union[str, Tuple[str, str]]],
@@ -122,57 +356,34 @@ class DataFetcher:
         """
         爬取多个网站数据
 
+        max_concurrency > 1 时自动切换为异步并发模式（见 crawl_websites_async），
+        返回结构与串行模式一致。
+
         Args:
             ids_list: 平台ID列表，每个元素可以是字符串或 (平台ID, 别名) 元组
-            request_interval: 请求间隔（毫秒）
+            request_interval: 请求间隔（毫秒，仅串行模式使用）
 
         Returns:
             (结果字典, ID到名称的映射, 失败ID列表) 元组
         """
+        ids_list, probe_ids = self._apply_circuit_breaker(ids_list)
+        self.response_digests = {}
+        self.unchanged_ids = []
+
+        if self.max_concurrency > 1 and len(ids_list) > 1:
+            return self._run_coroutine(self.crawl_websites_async(ids_list, probe_ids))
+
         results = {}
         id_to_name = {}
         failed_ids = []
 
         for i, id_info in enumerate(ids_list):
-            if isinstance(id_info, tuple):
-                id_value, name = id_info
-            else:
-                id_value = id_info
-                name = id_value
-
+            id_value, name = self._split_id_info(id_info)
             id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
-
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item.get("title")
-                        # 跳过无效标题（None、float、空字符串）
-                        if title is None or isinstance(title, float) or not str(title).strip():
-                            continue
-                        title = str(title).strip()
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"处理 {id_value} 数据出错: {e}")
-                    failed_ids.append(id_value)
-            else:
-                failed_ids.append(id_value)
+
+            max_retries = 0 if id_value in probe_ids else 2
+            response, _, _ = self.fetch_data(id_info, max_retries=max_retries)
+            self._collect_response(id_value, response, results, failed_ids)
 
             # 请求间隔（除了最后一个）
             if i < len(ids_list) - 1:
@@ -181,4 +392,95 @@ class DataFetcher:
                 time.sleep(actual_interval / 1000)
 
         print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        if self.unchanged_ids:
+            print(f"内容未变化: {self.unchanged_ids}")
         return results, id_to_name, failed_ids
+
+    async def crawl_websites_async(
+        self,
+        ids_list: List[Union[str, Tuple[str, str]]],
+        probe_ids: Optional[Set[str]] = None,
+    ) -> Tuple[Dict, Dict, List]:
+        """
+        异步并发爬取多个网站数据
+
+        - 最多同时进行 max_concurrency 个请求
+        - 同一主机的请求发起间隔不小于 host_interval 毫秒
+        - 重试等待不阻塞其他平台
+
+        Args:
+            ids_list: 平台ID列表，每个元素可以是字符串或 (平台ID, 别名) 元组
+            probe_ids: 熔断半开探测的平台ID集合（只尝试一次，不重试）
+
+        Returns:
+            (结果字典, ID到名称的映射, 失败ID列表) 元组，顺序与 ids_list 一致
+        """
+        probe_ids = probe_ids or set()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        throttle = _HostThrottle(self.host_interval)
+
+        print(f"异步并发爬取 {len(ids_list)} 个平台（并发数 {self.max_concurrency}）")
+        start = time.monotonic()
+
+        responses = await asyncio.gather(
+            *(
+                self.fetch_data_async(
+                    id_info,
+                    semaphore,
+                    throttle,
+                    max_retries=0 if self._split_id_info(id_info)[0] in probe_ids else 2,
+                )
+                for id_info in ids_list
+            )
+        )
+
+        results = {}
+        id_to_name = {}
+        failed_ids = []
+
+        for id_info, (response, _, _) in zip(ids_list, responses):
+            id_value, name = self._split_id_info(id_info)
+            id_to_name[id_value] = name
+            self._collect_response(id_value, response, results, failed_ids)
+
+        print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        if self.unchanged_ids:
+            print(f"内容未变化: {self.unchanged_ids}")
+        print(f"爬取耗时 {time.monotonic() - start:.2f} 秒")
+        return results, id_to_name, failed_ids
+
+    def _apply_circuit_breaker(
+        self, ids_list: List[Union[str, Tuple[str, str]]]
+    ) -> Tuple[List[Union[str, Tuple[str, str]]], Set[str]]:
+        """
+        应用熔断规则
+
+        被熔断的平台本轮不请求（记录在 skipped_ids 中，不计入失败列表，
+        以免刷新失败时间导致永远无法结束冷却）；冷却结束的平台排到最后探测。
+
+        Returns:
+            (实际抓取列表, 半开探测平台ID集合) 元组
+        """
+        self.skipped_ids = []
+        if not self.circuit_breaker:
+            return ids_list, set()
+
+        planned, skipped, probe_ids = self.circuit_breaker.plan(ids_list)
+        self.skipped_ids = skipped
+        return planned, probe_ids
+
+    @staticmethod
+    def _run_coroutine(coro):
+        """
+        在同步上下文中执行协程
+
+        若当前线程已有运行中的事件循环（如在异步框架内调用），
+        则在独立线程中创建新的事件循环执行。
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
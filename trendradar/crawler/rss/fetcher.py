@@ -2,16 +2,22 @@
 """
 RSS 抓取器
 
-负责从配置的 RSS 源抓取数据并转换为标准格式
+负责从配置的 RSS 源抓取数据并转换为标准格式，支持：
+- 串行 / 异步并发抓取（并发模式下限制同一主机的同时请求数）
+- 条件请求（If-None-Match / If-Modified-Since），304 时跳过下载与解析
 """
 
+import asyncio
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple, Callable
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .parser import RSSParser, ParsedRSSItem
 from trendradar.storage.base import RSSItem, RSSData
@@ -42,19 +48,28 @@ class RSSFetcher:
         timezone: str = DEFAULT_TIMEZONE,
         freshness_enabled: bool = True,
         default_max_age_days: int = 3,
+        max_concurrency: int = 1,
+        per_host_limit: int = 2,
+        conditional_get: bool = True,
+        stop_at_stale: bool = False,
     ):
         """
         初始化抓取器
 
         Args:
             feeds: RSS 源配置列表
-            request_interval: 请求间隔（毫秒）
+            request_interval: 请求间隔（毫秒，串行模式使用）
             timeout: 请求超时（秒）
             use_proxy: 是否使用代理
             proxy_url: 代理 URL
             timezone: 时区配置（如 'Asia/Shanghai'）
             freshness_enabled: 是否启用新鲜度过滤
             default_max_age_days: 默认最大文章年龄（天）
+            max_concurrency: 最大并发请求数（<=1 时使用串行模式）
+            per_host_limit: 并发模式下同一主机的最大同时请求数
+            conditional_get: 是否发送条件请求（ETag / Last-Modified）
+            stop_at_stale: 解析时遇到第一条超出新鲜度窗口的文章即停止
+                （适用于按时间倒序输出的源；开启后过旧文章不再入库）
         """
         self.feeds = [f for f in feeds if f.enabled]
         self.request_interval = request_interval
@@ -64,12 +79,25 @@ class RSSFetcher:
         self.timezone = timezone
         self.freshness_enabled = freshness_enabled
         self.default_max_age_days = default_max_age_days
+        self.max_concurrency = max(1, int(max_concurrency or 1))
+        self.per_host_limit = max(1, int(per_host_limit or 1))
+        self.conditional_get = conditional_get
+        self.stop_at_stale = stop_at_stale
+
+        # 缓存校验信息：上次抓取的校验值（由调用方从存储加载）与本次抓取结果
+        self.previous_validators: Dict[str, Dict[str, str]] = {}
+        self.response_validators: Dict[str, Dict[str, str]] = {}
+        self.not_modified_ids: List[str] = []
 
         self.parser = RSSParser()
         self.session = self._create_session()
 
     def _create_session(self) -> requests.Session:
-        """创建请求会话"""
+        """
+        创建请求会话
+
+        连接池大小随并发数调整，避免并发模式下连接被丢弃重建。
+        """
         session = requests.Session()
         session.headers.update({
             "User-Agent": "TrendRadar/2.0 RSS Reader (https://github.com/trendradar)",
@@ -77,6 +105,11 @@ class RSSFetcher:
             "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
         })
 
+        pool_size = max(10, self.max_concurrency)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
         if self.use_proxy and self.proxy_url:
             session.proxies = {
                 "http": self.proxy_url,
@@ -85,6 +118,29 @@ class RSSFetcher:
 
         return session
 
+    def update_validators(self, validators: Dict[str, Dict[str, str]]) -> None:
+        """
+        设置各 RSS 源上次响应的缓存校验信息
+
+        Args:
+            validators: {feed_id: {"etag": ..., "last_modified": ...}}，
+                通常来自存储的 rss_feed_validators 表
+        """
+        self.previous_validators = validators or {}
+
+    def _build_conditional_headers(self, feed: RSSFeedConfig) -> Dict[str, str]:
+        """根据上次的校验信息构建条件请求头"""
+        if not self.conditional_get:
+            return {}
+
+        validator = self.previous_validators.get(feed.id) or {}
+        headers = {}
+        if validator.get("etag"):
+            headers["If-None-Match"] = validator["etag"]
+        if validator.get("last_modified"):
+            headers["If-Modified-Since"] = validator["last_modified"]
+        return headers
+
     def _filter_by_freshness(
         self,
         items: List[RSSItem],
@@ -127,6 +183,27 @@ class RSSFetcher:
         filtered_count = len(items) - len(filtered)
         return filtered, filtered_count
 
+    def _build_stale_check(self, feed: RSSFeedConfig) -> Optional[Callable[[str], bool]]:
+        """
+        构建解析阶段的过期判断函数（未开启 stop_at_stale 或禁用过滤时返回 None）
+
+        Args:
+            feed: RSS 源配置
+
+        Returns:
+            参数为 published_at、返回是否过期的函数
+        """
+        if not (self.stop_at_stale and self.freshness_enabled):
+            return None
+
+        max_days = feed.max_age_days
+        if max_days is None:
+            max_days = self.default_max_age_days
+        if max_days <= 0:
+            return None
+
+        return lambda published_at: not is_within_days(published_at, max_days, self.timezone)
+
     def fetch_feed(self, feed: RSSFeedConfig) -> Tuple[List[RSSItem], Optional[str]]:
         """
         抓取单个 RSS 源
@@ -135,17 +212,29 @@ class RSSFetcher:
             feed: RSS 源配置
 
         Returns:
-            (条目列表, 错误信息) 元组
+            (条目列表, 错误信息) 元组；服务器返回 304 时条目列表为空，
+            源 ID 记录在 not_modified_ids 中
         """
         try:
-            response = self.session.get(feed.url, timeout=self.timeout)
-            response.raise_for_status()
+            conditional_headers = self._build_conditional_headers(feed)
+            response = self.session.get(feed.url, timeout=self.timeout, headers=conditional_headers)
+
+            # 304：内容未修改，跳过解析（沿用上次的校验信息）
+            if response.status_code == 304 and conditional_headers:
+                self.response_validators[feed.id] = dict(self.previous_validators[feed.id])
+                self.not_modified_ids.append(feed.id)
+                print(f"[RSS] {feed.name}: 未修改 (304)")
+                return [], None
 
-            parsed_items = self.parser.parse(response.text, feed.url)
+            response.raise_for_status()
 
-            # 限制条目数量（0=不限制）
-            if feed.max_items > 0:
-                parsed_items = parsed_items[:feed.max_items]
+            # 达到条目数量上限（0=不限制）后停止解析
+            parsed_items = self.parser.parse(
+                response.text,
+                feed.url,
+                max_items=feed.max_items,
+                is_stale=self._build_stale_check(feed),
+            )
 
             # 转换为 RSSItem（使用配置的时区）
             now = get_configured_time(self.timezone)
@@ -168,6 +257,17 @@ class RSSFetcher:
                 )
                 items.append(item)
 
+            # 只有解析出条目的响应才记录校验信息：之后的 304 会沿用该源上次存储的条目，
+            # 空响应若记录校验信息，304 时会把更早抓取的旧条目当作当前内容。
+            # 空响应记录空值，清除之前的校验信息，下次请求不带条件头
+            if items:
+                self.response_validators[feed.id] = {
+                    "etag": response.headers.get("ETag", ""),
+                    "last_modified": response.headers.get("Last-Modified", ""),
+                }
+            else:
+                self.response_validators[feed.id] = {"etag": "", "last_modified": ""}
+
             # 注意：新鲜度过滤已移至推送阶段（_convert_rss_items_to_list）
             # 这样所有文章都会存入数据库，但旧文章不会推送
             print(f"[RSS] {feed.name}: 获取 {len(items)} 条")
@@ -209,26 +309,40 @@ class RSSFetcher:
         crawl_time = now.strftime("%H:%M")
         crawl_date = now.strftime("%Y-%m-%d")
 
-        print(f"[RSS] 开始抓取 {len(self.feeds)} 个 RSS 源...")
-
-        for i, feed in enumerate(self.feeds):
-            # 请求间隔（带随机波动）
-            if i > 0:
-                interval = self.request_interval / 1000
-                jitter = random.uniform(-0.2, 0.2) * interval
-                time.sleep(interval + jitter)
-
-            items, error = self.fetch_feed(feed)
-
+        self.response_validators = {}
+        self.not_modified_ids = []
+
+        if self.max_concurrency > 1 and len(self.feeds) > 1:
+            print(f"[RSS] 开始并发抓取 {len(self.feeds)} 个 RSS 源（并发数 {self.max_concurrency}，同主机 {self.per_host_limit}）...")
+            start = time.monotonic()
+            results = self._run_coroutine(self._fetch_all_async())
+            print(f"[RSS] 抓取耗时 {time.monotonic() - start:.2f} 秒")
+        else:
+            print(f"[RSS] 开始抓取 {len(self.feeds)} 个 RSS 源...")
+            results = []
+            for i, feed in enumerate(self.feeds):
+                # 请求间隔（带随机波动）
+                if i > 0:
+                    interval = self.request_interval / 1000
+                    jitter = random.uniform(-0.2, 0.2) * interval
+                    time.sleep(interval + jitter)
+
+                results.append(self.fetch_feed(feed))
+
+        not_modified = set(self.not_modified_ids)
+        for feed, (items, error) in zip(self.feeds, results):
             id_to_name[feed.id] = feed.name
 
             if error:
                 failed_ids.append(feed.id)
-            else:
+            elif feed.id not in not_modified:
                 all_items[feed.id] = items
 
         total_items = sum(len(items) for items in all_items.values())
-        print(f"[RSS] 抓取完成: {len(all_items)} 个源成功, {len(failed_ids)} 个失败, 共 {total_items} 条")
+        summary = f"[RSS] 抓取完成: {len(all_items)} 个源成功, {len(failed_ids)} 个失败, 共 {total_items} 条"
+        if not_modified:
+            summary += f", {len(not_modified)} 个源未修改"
+        print(summary)
 
         return RSSData(
             date=crawl_date,
@@ -236,8 +350,48 @@ class RSSFetcher:
             items=all_items,
             id_to_name=id_to_name,
             failed_ids=failed_ids,
+            validators=dict(self.response_validators),
+            unchanged_ids=[feed.id for feed in self.feeds if feed.id in not_modified],
         )
 
+    async def _fetch_all_async(self) -> List[Tuple[List[RSSItem], Optional[str]]]:
+        """
+        异步并发抓取所有 RSS 源
+
+        - 最多同时进行 max_concurrency 个请求
+        - 同一主机最多同时进行 per_host_limit 个请求
+
+        Returns:
+            与 self.feeds 顺序一致的 (条目列表, 错误信息) 列表
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        async def fetch_one(feed: RSSFeedConfig) -> Tuple[List[RSSItem], Optional[str]]:
+            host = urlparse(feed.url).netloc
+            host_semaphore = host_semaphores.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+            async with host_semaphore:
+                async with semaphore:
+                    return await asyncio.to_thread(self.fetch_feed, feed)
+
+        return await asyncio.gather(*(fetch_one(feed) for feed in self.feeds))
+
+    @staticmethod
+    def _run_coroutine(coro):
+        """
+        在同步上下文中执行协程
+
+        若当前线程已有运行中的事件循环（如在异步框架内调用），
+        则在独立线程中创建新的事件循环执行。
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
     @classmethod
     def from_config(cls, config: Dict) -> "RSSFetcher":
         """
@@ -248,6 +402,10 @@ class RSSFetcher:
                 {
                     "enabled": true,
                     "request_interval": 2000,
+                    "max_concurrency": 8,
+                    "per_host_limit": 2,
+                    "conditional_get": true,
+                    "stop_at_stale": false,
                     "freshness_filter": {
                         "enabled": true,
                         "max_age_days": 3
@@ -302,4 +460,8 @@ class RSSFetcher:
             timezone=config.get("timezone", DEFAULT_TIMEZONE),
             freshness_enabled=freshness_enabled,
             default_max_age_days=default_max_age_days,
+            max_concurrency=config.get("max_concurrency", 1),
+            per_host_limit=config.get("per_host_limit", 2),
+            conditional_get=config.get("conditional_get", True),
+            stop_at_stale=config.get("stop_at_stale", False),
         )
@@ -3,14 +3,20 @@
 RSS 解析器
 
 支持 RSS 2.0、Atom 和 JSON Feed 1.1 格式的解析
+
+标准 RSS 2.0 / Atom 文档优先使用流式 XML 解析（XMLPullParser），
+条目转换为与 feedparser 相同结构的字典后复用同一套后处理逻辑；
+遇到格式错误或快速路径不支持的结构时回退到 feedparser。
+修改回退规则或升级 feedparser 后，用 bench/rss_parser_check.py 重新做差异校验。
 """
 
 import re
 import html
 import json
+import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any
 from email.utils import parsedate_to_datetime
 
 try:
@@ -20,6 +26,75 @@ except ImportError:
     HAS_FEEDPARSER = False
     feedparser = None
 
+# 快速路径与 feedparser 使用同一个日期解析函数，保证 published_at 一致
+try:
+    from feedparser.datetimes import _parse_date as _feedparser_parse_date
+    HAS_FAST_PATH = True
+except ImportError:
+    _feedparser_parse_date = None
+    HAS_FAST_PATH = False
+
+
+# XML 命名空间
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+_DC_NS = "{http://purl.org/dc/elements/1.1/}"
+_XML_BASE = "{http://www.w3.org/XML/1998/namespace}base"
+
+# RSS 2.0 条目子元素 -> feedparser 字段
+_RSS_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "guid": "guid",
+    "pubDate": "published",
+    "description": "summary",
+    "author": "author",
+    f"{_DC_NS}creator": "author",
+    f"{_DC_NS}date": "updated",
+    f"{_CONTENT_NS}encoded": "content",
+}
+
+# RSS 2.0 条目中不影响解析结果的子元素
+_RSS_IGNORED = {
+    "category",
+    "comments",
+    "enclosure",
+    f"{_DC_NS}subject",
+    "{http://wellformedweb.org/CommentAPI/}commentRss",
+    "{http://purl.org/rss/1.0/modules/slash/}comments",
+}
+
+# Atom 条目子元素 -> feedparser 字段（link / author 单独处理）
+_ATOM_FIELDS = {
+    f"{_ATOM_NS}title": "title",
+    f"{_ATOM_NS}id": "id",
+    f"{_ATOM_NS}published": "published",
+    f"{_ATOM_NS}updated": "updated",
+    f"{_ATOM_NS}summary": "summary",
+    f"{_ATOM_NS}content": "content",
+}
+
+# feedparser 会连同内容一起移除的 HTML 元素
+_UNSAFE_HTML_PATTERN = re.compile(
+    r"<(script|style|applet)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+
+# 快速路径能与 feedparser 得到相同结果的 HTML 标记：普通标签（属性值中没有 < >）与注释；
+# 裸 "<"、属性值中的 ">" 等情况 feedparser 的清理结果难以复现，交给 feedparser
+_SIMPLE_HTML_MARKUP_PATTERN = re.compile(
+    r"</?[A-Za-z][\w:-]*"
+    r"(?:\s+[^\s\"'<>/=]+(?:\s*=\s*(?:\"[^\"<>]*\"|'[^'<>]*'|[^\s\"'<>=`]+))?)*"
+    r"\s*/?>"
+    r"|<!--[^<>]*-->"
+)
+
+# 流式解析每次送入的字符数
+_FEED_CHUNK_SIZE = 64 * 1024
+
+
+class _UnsupportedFeed(Exception):
+    """快速路径不支持的文档结构（回退到 feedparser）"""
+
 
 @dataclass
 class ParsedRSSItem:
@@ -47,20 +122,38 @@ class RSSParser:
 
         self.max_summary_length = max_summary_length
 
-    def parse(self, content: str, feed_url: str = "") -> List[ParsedRSSItem]:
+    def parse(
+        self,
+        content: str,
+        feed_url: str = "",
+        max_items: int = 0,
+        is_stale: Optional[Callable[[str], bool]] = None,
+    ) -> List[ParsedRSSItem]:
         """
         解析 RSS/Atom/JSON Feed 内容
 
         Args:
             content: Feed 内容（XML 或 JSON）
             feed_url: Feed URL（用于错误提示）
+            max_items: 最大条目数（0=不限制），达到后停止解析
+            is_stale: 过期判断函数（参数为 published_at），遇到第一条过期条目时停止解析
 
         Returns:
             解析后的条目列表
         """
         # 先尝试检测 JSON Feed
         if self._is_json_feed(content):
-            return self._parse_json_feed(content, feed_url)
+            return self._collect_items(self._parse_json_feed(content, feed_url), max_items, is_stale)
+
+        # 标准 RSS 2.0 / Atom：流式快速解析
+        if HAS_FAST_PATH:
+            try:
+                entries = self._iter_xml_entries(content)
+                return self._collect_items(
+                    (self._parse_entry(entry) for entry in entries), max_items, is_stale
+                )
+            except (ET.ParseError, _UnsupportedFeed):
+                pass
 
         # 使用 feedparser 解析 RSS/Atom
         feed = feedparser.parse(content)
@@ -68,13 +161,191 @@ class RSSParser:
         if feed.bozo and not feed.entries:
             raise ValueError(f"RSS 解析失败 ({feed_url}): {feed.bozo_exception}")
 
-        items = []
-        for entry in feed.entries:
-            item = self._parse_entry(entry)
-            if item:
-                items.append(item)
+        return self._collect_items(
+            (self._parse_entry(entry) for entry in feed.entries), max_items, is_stale
+        )
 
-        return items
+    @staticmethod
+    def _collect_items(
+        items: Iterable[Optional[ParsedRSSItem]],
+        max_items: int = 0,
+        is_stale: Optional[Callable[[str], bool]] = None,
+    ) -> List[ParsedRSSItem]:
+        """收集有效条目，达到数量上限或遇到过期条目时停止（不再消费后续条目）"""
+        collected = []
+        for item in items:
+            if not item:
+                continue
+            if is_stale and item.published_at and is_stale(item.published_at):
+                break
+            collected.append(item)
+            if 0 < max_items <= len(collected):
+                break
+        return collected
+
+    def _iter_xml_entries(self, content: str) -> Iterator[Dict[str, Any]]:
+        """
+        流式解析 RSS 2.0 / Atom 文档，逐条产出与 feedparser 结构一致的条目字典
+
+        按块送入解析器，调用方停止迭代后剩余内容不再解析。
+
+        Raises:
+            ET.ParseError: XML 格式错误
+            _UnsupportedFeed: 非 RSS 2.0 / Atom 文档或包含不支持的结构
+        """
+        parser = ET.XMLPullParser(events=("start", "end"))
+        content = content.lstrip("\ufeff \t\r\n")
+        root_kind = None
+
+        for offset in [*range(0, len(content), _FEED_CHUNK_SIZE), None]:
+            if offset is None:
+                parser.close()
+            else:
+                parser.feed(content[offset:offset + _FEED_CHUNK_SIZE])
+
+            for event, elem in parser.read_events():
+                if event == "start":
+                    if _XML_BASE in elem.attrib:
+                        raise _UnsupportedFeed("xml:base")
+                    if root_kind is None:
+                        if elem.tag == "rss":
+                            root_kind = "rss"
+                        elif elem.tag == f"{_ATOM_NS}feed":
+                            root_kind = "atom"
+                        else:
+                            raise _UnsupportedFeed(elem.tag)
+                elif root_kind == "rss" and elem.tag == "item":
+                    yield self._rss_item_to_entry(elem)
+                    elem.clear()
+                elif root_kind == "atom" and elem.tag == f"{_ATOM_NS}entry":
+                    yield self._atom_entry_to_entry(elem)
+                    elem.clear()
+
+        if root_kind is None:
+            raise _UnsupportedFeed("empty document")
+
+    def _rss_item_to_entry(self, item: ET.Element) -> Dict[str, Any]:
+        """将 RSS 2.0 的 item 元素转换为 feedparser 结构的条目字典"""
+        fields: Dict[str, str] = {}
+        guid_is_permalink = True
+
+        for child in item:
+            if child.tag in _RSS_IGNORED:
+                continue
+            key = _RSS_FIELDS.get(child.tag)
+            if key is None or key in fields or len(child):
+                raise _UnsupportedFeed(child.tag)
+            fields[key] = (child.text or "").strip()
+            if key == "guid":
+                guid_is_permalink = child.get("isPermaLink", "true").lower() != "false"
+
+        # pubDate 与 dc:date 同时存在时 feedparser 的取值规则较复杂，交给 feedparser
+        if "published" in fields and "updated" in fields:
+            raise _UnsupportedFeed("pubDate + dc:date")
+
+        entry: Dict[str, Any] = {"title": fields.get("title", "")}
+
+        link = fields.get("link", "")
+        if not link and guid_is_permalink:
+            link = fields.get("guid", "")
+        if not link:
+            raise _UnsupportedFeed("item without link")
+        entry["link"] = link
+
+        if fields.get("guid"):
+            entry["id"] = fields["guid"]
+        if "published" in fields:
+            self._set_date(entry, "published", fields["published"])
+            self._set_date(entry, "updated", fields["published"])
+        if "updated" in fields:
+            self._set_date(entry, "updated", fields["updated"])
+        # RSS 的 description / content:encoded 按 HTML 处理（feedparser 会清理）
+        if "summary" in fields:
+            entry["summary"] = self._strip_unsafe_html(fields["summary"])
+        if "content" in fields:
+            entry["content"] = [{"value": self._strip_unsafe_html(fields["content"])}]
+        if fields.get("author"):
+            entry["author"] = fields["author"]
+
+        return entry
+
+    def _atom_entry_to_entry(self, atom_entry: ET.Element) -> Dict[str, Any]:
+        """将 Atom 的 entry 元素转换为 feedparser 结构的条目字典"""
+        fields: Dict[str, str] = {}
+        alternate_links: List[str] = []
+        authors: List[ET.Element] = []
+
+        for child in atom_entry:
+            tag = child.tag
+            if tag == f"{_ATOM_NS}category":
+                continue
+            if tag == f"{_ATOM_NS}link":
+                href = child.get("href")
+                if not href:
+                    raise _UnsupportedFeed("link without href")
+                if child.get("rel", "alternate") == "alternate":
+                    alternate_links.append(href.strip())
+                continue
+            if tag == f"{_ATOM_NS}author":
+                authors.append(child)
+                continue
+
+            key = _ATOM_FIELDS.get(tag)
+            if key is None or key in fields or len(child):
+                raise _UnsupportedFeed(tag)
+            content_type = child.get("type", "text")
+            if content_type not in ("text", "html") or child.get("src"):
+                raise _UnsupportedFeed(f"{tag} type")
+            fields[key] = (child.text or "").strip()
+            # feedparser 只清理 type="html" 的内容
+            if content_type == "html":
+                fields[key] = self._strip_unsafe_html(fields[key])
+
+        # feedparser 取最后一个 alternate 链接
+        if not alternate_links or len(authors) > 1:
+            raise _UnsupportedFeed("links / authors")
+
+        entry: Dict[str, Any] = {"title": fields.get("title", ""), "link": alternate_links[-1]}
+
+        if fields.get("id"):
+            entry["id"] = fields["id"]
+        for key in ("published", "updated"):
+            if key in fields:
+                self._set_date(entry, key, fields[key])
+        if "summary" in fields:
+            entry["summary"] = fields["summary"]
+        if "content" in fields:
+            entry["content"] = [{"value": fields["content"]}]
+
+        if authors:
+            name = (authors[0].findtext(f"{_ATOM_NS}name") or "").strip()
+            email = (authors[0].findtext(f"{_ATOM_NS}email") or "").strip()
+            if not name:
+                raise _UnsupportedFeed("author without name")
+            entry["author"] = f"{name} ({email})" if email else name
+
+        return entry
+
+    @staticmethod
+    def _set_date(entry: Dict[str, Any], key: str, value: str) -> None:
+        """设置日期字段（与 feedparser 一致：原始字符串 + UTC 时间结构）"""
+        entry[key] = value
+        entry[f"{key}_parsed"] = _feedparser_parse_date(value) if value else None
+
+    @staticmethod
+    def _strip_unsafe_html(text: str) -> str:
+        """
+        移除 script/style/applet 元素及其内容（与 feedparser 的 HTML 清理一致）
+
+        Raises:
+            _UnsupportedFeed: 包含快速路径无法保证一致的 HTML 标记
+        """
+        if "<" not in text:
+            return text
+        text = _UNSAFE_HTML_PATTERN.sub("", text)
+        if "<" in _SIMPLE_HTML_MARKUP_PATTERN.sub("", text):
+            raise _UnsupportedFeed("html markup")
+        return text
 
     def _is_json_feed(self, content: str) -> bool:
         """
@@ -0,0 +1,340 @@
+# coding=utf-8
+"""
+历史数据库压缩归档
+
+今天之前的日期数据库不再写入，可以整理（VACUUM）后压缩存储：
+- output/news/2025-12-28.db → output/news/2025-12-28.db.zst（未安装 zstandard 时为 .db.gz）
+- 远程存储同理：news/2025-12-28.db → news/2025-12-28.db.zst
+
+读取方通过 resolve_db_path 透明访问：未压缩的数据库优先，其次从解压缓存中
+打开归档（首次访问时解压，缓存按总大小 LRU 淘汰）。
+"""
+
+import gzip
+import hashlib
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    zstandard = None
+    HAS_ZSTD = False
+
+
+# 支持读取的归档后缀（写入时优先 zstd）
+ARCHIVE_SUFFIXES = (".zst", ".gz")
+
+# 默认压缩级别
+DEFAULT_ZSTD_LEVEL = 10
+DEFAULT_GZIP_LEVEL = 9
+
+# 解压缓存默认上限
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+
+# 日期数据库文件名（未压缩或归档）
+_DB_NAME_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})\.db(?:\.zst|\.gz)?$")
+
+
+def archive_suffix() -> str:
+    """写入归档时使用的后缀"""
+    return ".zst" if HAS_ZSTD else ".gz"
+
+
+def parse_db_date(name: str) -> Optional[str]:
+    """
+    从数据库文件名解析日期（兼容归档文件）
+
+    Args:
+        name: 文件名，如 2025-12-28.db / 2025-12-28.db.zst
+
+    Returns:
+        日期字符串（YYYY-MM-DD），不是日期数据库时返回 None
+    """
+    match = _DB_NAME_PATTERN.match(name)
+    return match.group(1) if match else None
+
+
+def find_archive(db_path: Path) -> Optional[Path]:
+    """
+    查找数据库对应的归档文件
+
+    Args:
+        db_path: 未压缩数据库路径
+
+    Returns:
+        归档文件路径，不存在返回 None
+    """
+    for suffix in ARCHIVE_SUFFIXES:
+        archive_path = db_path.with_name(db_path.name + suffix)
+        if archive_path.exists():
+            return archive_path
+    return None
+
+
+def compress_file(src: Path, dst: Path, level: Optional[int] = None) -> None:
+    """
+    压缩文件（按 dst 后缀选择 zstd 或 gzip）
+
+    Args:
+        src: 源文件
+        dst: 目标文件（.zst 或 .gz）
+        level: 压缩级别，默认使用各格式的默认级别
+    """
+    with open(src, "rb") as fin:
+        if dst.name.endswith(".zst"):
+            if not HAS_ZSTD:
+                raise ImportError("zstd 归档需要安装 zstandard: pip install zstandard")
+            compressor = zstandard.ZstdCompressor(level=level or DEFAULT_ZSTD_LEVEL)
+            with open(dst, "wb") as fout:
+                compressor.copy_stream(fin, fout, size=os.fstat(fin.fileno()).st_size)
+        else:
+            with gzip.open(dst, "wb", compresslevel=level or DEFAULT_GZIP_LEVEL) as fout:
+                shutil.copyfileobj(fin, fout, 1024 * 1024)
+
+
+def decompress_file(src: Path, dst: Path) -> None:
+    """
+    解压归档文件（按 src 后缀选择 zstd 或 gzip）
+
+    Args:
+        src: 归档文件
+        dst: 目标文件
+    """
+    with open(dst, "wb") as fout:
+        if src.name.endswith(".zst"):
+            if not HAS_ZSTD:
+                raise ImportError("读取 zstd 归档需要安装 zstandard: pip install zstandard")
+            with open(src, "rb") as fin:
+                zstandard.ZstdDecompressor().copy_stream(fin, fout)
+        else:
+            with gzip.open(src, "rb") as fin:
+                shutil.copyfileobj(fin, fout, 1024 * 1024)
+
+
+def discard_stale_copies(db_path: Path, keep: Optional[Path] = None) -> None:
+    """
+    删除同一日期除 keep 之外的其他形式（未压缩数据库及其 -wal / -shm 文件、各格式归档）
+
+    Args:
+        db_path: 未压缩数据库路径
+        keep: 保留的文件（None 表示全部删除）
+    """
+    candidates = [db_path, db_path.with_name(db_path.name + "-wal"), db_path.with_name(db_path.name + "-shm")]
+    candidates += [db_path.with_name(db_path.name + suffix) for suffix in ARCHIVE_SUFFIXES]
+    for path in candidates:
+        if path != keep and path.exists():
+            path.unlink()
+
+
+def archive_db(db_path: Path, level: Optional[int] = None) -> Optional[Path]:
+    """
+    整理并压缩数据库，成功后删除原文件
+
+    VACUUM INTO 生成紧凑副本（同时合并 WAL 中的内容），副本改为 DELETE 日志模式，
+    解压后以只读方式打开时不需要 -wal / -shm 文件。调用方需先关闭该数据库的连接。
+
+    Args:
+        db_path: 数据库路径
+        level: 压缩级别
+
+    Returns:
+        归档文件路径，数据库不存在返回 None
+    """
+    if not db_path.exists():
+        return None
+
+    archive_path = db_path.with_name(db_path.name + archive_suffix())
+    vacuum_path = db_path.with_name(db_path.name + ".vacuum")
+    tmp_archive = archive_path.with_name(archive_path.name + ".tmp")
+
+    try:
+        if vacuum_path.exists():
+            vacuum_path.unlink()
+
+        conn = sqlite3.connect(str(db_path))
+        try:
+            conn.execute("VACUUM INTO ?", (str(vacuum_path),))
+        finally:
+            conn.close()
+
+        conn = sqlite3.connect(str(vacuum_path))
+        try:
+            conn.execute("PRAGMA journal_mode = DELETE")
+        finally:
+            conn.close()
+
+        compress_file(vacuum_path, tmp_archive, level)
+        tmp_archive.replace(archive_path)
+    finally:
+        for path in (vacuum_path, tmp_archive):
+            if path.exists():
+                path.unlink()
+
+    # 删除原数据库及同一日期的其他格式归档
+    discard_stale_copies(db_path, archive_path)
+    return archive_path
+
+
+def restore_db(db_path: Path) -> bool:
+    """
+    将归档解压回未压缩数据库（需要写入已归档日期时使用），成功后删除归档
+
+    Args:
+        db_path: 未压缩数据库路径
+
+    Returns:
+        是否从归档恢复
+    """
+    archive_path = find_archive(db_path)
+    if archive_path is None or db_path.exists():
+        return False
+
+    tmp_path = db_path.with_name(db_path.name + ".restore")
+    try:
+        decompress_file(archive_path, tmp_path)
+        tmp_path.replace(db_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    archive_path.unlink()
+    return True
+
+
+class ArchiveCache:
+    """
+    归档解压缓存（线程安全）
+
+    归档首次被读取时解压到缓存目录，之后直接复用；归档文件变化（如重新拉取）时
+    使用新的缓存文件。缓存总大小超出上限时删除最久未使用的文件
+    （已打开的连接在 Linux/macOS 上不受影响）。
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_CACHE_BYTES):
+        """
+        初始化解压缓存
+
+        Args:
+            cache_dir: 缓存目录，默认为系统临时目录下的 trendradar_archive_cache
+            max_bytes: 缓存总大小上限
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(tempfile.gettempdir()) / "trendradar_archive_cache"
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def _load_existing(self) -> None:
+        """登记之前进程留下的缓存文件（按修改时间排列，调用方持有锁）"""
+        self._loaded = True
+        if not self.cache_dir.exists():
+            return
+        files = sorted(self.cache_dir.glob("*.db"), key=lambda path: path.stat().st_mtime)
+        for path in files:
+            self._entries[path.name] = path.stat().st_size
+
+    def _cache_name(self, archive_path: Path) -> Tuple[str, Tuple[int, int]]:
+        """缓存文件名（包含归档路径与修改时间、大小，归档变化后自动失效）"""
+        stat = archive_path.stat()
+        identity = (stat.st_mtime_ns, stat.st_size)
+        digest = hashlib.sha1(f"{archive_path.resolve()}:{identity}".encode("utf-8")).hexdigest()[:16]
+        date_str = parse_db_date(archive_path.name) or "archive"
+        return f"{date_str}-{digest}.db", identity
+
+    def open(self, archive_path: Path) -> Path:
+        """
+        获取归档解压后的数据库路径（未缓存时解压）
+
+        Args:
+            archive_path: 归档文件路径
+
+        Returns:
+            解压后的数据库路径（只读使用）
+        """
+        name, _ = self._cache_name(archive_path)
+        cached_path = self.cache_dir / name
+
+        with self._lock:
+            if not self._loaded:
+                self._load_existing()
+            key_lock = self._locks.setdefault(name, threading.Lock())
+
+        # 同一归档只解压一次
+        with key_lock:
+            if cached_path.exists():
+                with self._lock:
+                    self._entries[name] = cached_path.stat().st_size
+                    self._entries.move_to_end(name)
+                return cached_path
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cached_path.with_name(f"{name}.{threading.get_ident()}.tmp")
+            try:
+                decompress_file(archive_path, tmp_path)
+                tmp_path.replace(cached_path)
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+
+            with self._lock:
+                self._entries[name] = cached_path.stat().st_size
+                self._evict(keep=name)
+
+        return cached_path
+
+    def _evict(self, keep: str) -> None:
+        """淘汰最久未使用的缓存文件（调用方持有锁）"""
+        total = sum(self._entries.values())
+        for name in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            total -= self._entries.pop(name)
+            self._locks.pop(name, None)
+            try:
+                (self.cache_dir / name).unlink()
+            except OSError:
+                pass
+
+
+# 全局解压缓存
+_archive_cache: Optional[ArchiveCache] = None
+_archive_cache_lock = threading.Lock()
+
+
+def get_archive_cache() -> ArchiveCache:
+    """获取全局解压缓存"""
+    global _archive_cache
+    with _archive_cache_lock:
+        if _archive_cache is None:
+            _archive_cache = ArchiveCache()
+        return _archive_cache
+
+
+def resolve_db_path(db_path: Path) -> Optional[Path]:
+    """
+    获取可读取的数据库路径：未压缩文件优先，其次为归档的解压缓存
+
+    Args:
+        db_path: 未压缩数据库路径
+
+    Returns:
+        可读取的数据库路径，两者都不存在返回 None
+    """
+    if db_path.exists():
+        return db_path
+    archive_path = find_archive(db_path)
+    if archive_path is None:
+        return None
+    return get_archive_cache().open(archive_path)
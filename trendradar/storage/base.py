@@ -133,6 +133,10 @@ class RSSData:
     id_to_name: Dict[str, str] = field(default_factory=dict)   # ID到名称映射
     failed_ids: List[str] = field(default_factory=list)        # 失败的ID
 
+    # 抓取元数据（运行时使用，不参与序列化）
+    validators: Dict[str, Dict[str, str]] = field(default_factory=dict)  # feed_id 到缓存校验信息的映射
+    unchanged_ids: List[str] = field(default_factory=list)     # 服务器返回 304 的 feed_id
+
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
         items_dict = {}
@@ -187,6 +191,10 @@ class NewsData:
     id_to_name: Dict[str, str] = field(default_factory=dict)   # ID到名称映射
     failed_ids: List[str] = field(default_factory=list)        # 失败的ID
 
+    # 抓取元数据（运行时使用，不参与序列化）
+    digests: Dict[str, str] = field(default_factory=dict)      # 来源ID到响应摘要的映射
+    unchanged_ids: List[str] = field(default_factory=list)     # 响应与上次相同的来源ID
+
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
         items_dict = {}
@@ -466,6 +474,8 @@ def convert_crawl_results_to_news_data(
     failed_ids: List[str],
     crawl_time: str,
     crawl_date: str,
+    digests: Optional[Dict[str, str]] = None,
+    unchanged_ids: Optional[List[str]] = None,
 ) -> NewsData:
     """
     将爬虫结果转换为 NewsData 格式
@@ -476,6 +486,8 @@ def convert_crawl_results_to_news_data(
         failed_ids: 失败的来源ID
         crawl_time: 抓取时间（HH:MM）
         crawl_date: 抓取日期（YYYY-MM-DD）
+        digests: 来源ID到响应摘要的映射（可选）
+        unchanged_ids: 响应与上次相同的来源ID列表（可选）
 
     Returns:
         NewsData 对象
@@ -522,6 +534,8 @@ def convert_crawl_results_to_news_data(
         items=items,
         id_to_name=id_to_name,
         failed_ids=failed_ids,
+        digests=digests or {},
+        unchanged_ids=unchanged_ids or [],
     )
 
 
@@ -0,0 +1,215 @@
+# coding=utf-8
+"""
+SQLite 页级增量复制
+
+远程存储 delta 模式下，每天的数据库由"基线 + 增量段"组成：
+- 基线：{db_type}/{date}.db（完整数据库文件，与 full 模式相同）
+- 增量段：{db_type}/{date}.db.delta/{序号}.seg，每次上传一个，只包含本次改动的页
+
+增量段格式：MAGIC + zlib 压缩的 (头部 + 若干 [页号 + 页内容])，头部记录
+应用前（parent）与应用后（result）整个文件的 SHA-256、页大小和文件大小。
+读取方从基线开始，按序号依次应用 parent 与当前内容一致的段。压实（上传新基线后
+删除旧段）期间读到的旧段 parent 不匹配，会被跳过，因此不会把数据库拼坏。
+"""
+
+import hashlib
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Tuple, Union
+
+# 增量段魔数（含格式版本）
+SEGMENT_MAGIC = b"TRDELTA1"
+
+# 头部：parent 摘要、result 摘要、页大小、文件大小、页数
+_HEADER = struct.Struct(">32s32sIQI")
+_PAGE_NO = struct.Struct(">I")
+
+# SQLite 默认页大小（文件头不可读时使用）
+DEFAULT_PAGE_SIZE = 4096
+
+
+class ReplicaState(NamedTuple):
+    """已复制到远程的文件状态（用于计算下一次的改动页）"""
+
+    digest: bytes
+    page_size: int
+    size: int
+    page_digests: Tuple[bytes, ...]
+
+
+class Segment(NamedTuple):
+    """解码后的增量段"""
+
+    parent: bytes
+    result: bytes
+    page_size: int
+    size: int
+    pages: List[Tuple[int, bytes]]
+
+
+def read_page_size(data: bytes) -> int:
+    """
+    从 SQLite 文件头读取页大小
+
+    Args:
+        data: 文件开头（至少 18 字节）
+
+    Returns:
+        页大小（字节）
+    """
+    if len(data) < 18 or not data.startswith(b"SQLite format 3\x00"):
+        return DEFAULT_PAGE_SIZE
+    page_size = int.from_bytes(data[16:18], "big")
+    # 文件头中 1 表示 65536
+    return 65536 if page_size == 1 else (page_size or DEFAULT_PAGE_SIZE)
+
+
+def _page_digest(page: bytes) -> bytes:
+    return hashlib.blake2b(page, digest_size=16).digest()
+
+
+def _read_pages(data: bytes, page_size: int) -> List[bytes]:
+    return [data[offset:offset + page_size] for offset in range(0, len(data), page_size)]
+
+
+def capture_state(path: Union[str, Path]) -> ReplicaState:
+    """
+    记录文件当前状态
+
+    Args:
+        path: 数据库文件路径
+
+    Returns:
+        文件状态
+    """
+    data = Path(path).read_bytes()
+    page_size = read_page_size(data)
+    return ReplicaState(
+        digest=hashlib.sha256(data).digest(),
+        page_size=page_size,
+        size=len(data),
+        page_digests=tuple(_page_digest(page) for page in _read_pages(data, page_size)),
+    )
+
+
+def build_segment(path: Union[str, Path], state: ReplicaState) -> Tuple[bytes, ReplicaState, int]:
+    """
+    生成从 state 到文件当前内容的增量段
+
+    Args:
+        path: 数据库文件路径
+        state: 上次复制时的文件状态
+
+    Returns:
+        (增量段字节，文件当前状态，改动页数)；文件没有变化时增量段为空字节串
+    """
+    data = Path(path).read_bytes()
+    digest = hashlib.sha256(data).digest()
+    page_size = read_page_size(data)
+    pages = _read_pages(data, page_size)
+    page_digests = tuple(_page_digest(page) for page in pages)
+    new_state = ReplicaState(digest, page_size, len(data), page_digests)
+
+    if digest == state.digest:
+        return b"", new_state, 0
+
+    # 页大小变化（如 VACUUM 后）时所有页都视为改动
+    old_digests = state.page_digests if page_size == state.page_size else ()
+    changed = [
+        (page_no, page)
+        for page_no, (page, page_digest) in enumerate(zip(pages, page_digests))
+        if page_no >= len(old_digests) or old_digests[page_no] != page_digest
+    ]
+
+    payload = [_HEADER.pack(state.digest, digest, page_size, len(data), len(changed))]
+    for page_no, page in changed:
+        payload.append(_PAGE_NO.pack(page_no))
+        payload.append(page)
+
+    return SEGMENT_MAGIC + zlib.compress(b"".join(payload), 6), new_state, len(changed)
+
+
+def decode_segment(blob: bytes) -> Segment:
+    """
+    解码增量段
+
+    Args:
+        blob: 增量段字节
+
+    Returns:
+        增量段
+
+    Raises:
+        ValueError: 格式不正确
+    """
+    if not blob.startswith(SEGMENT_MAGIC):
+        raise ValueError("不是有效的增量段")
+
+    payload = zlib.decompress(blob[len(SEGMENT_MAGIC):])
+    parent, result, page_size, size, count = _HEADER.unpack_from(payload, 0)
+    offset = _HEADER.size
+    pages = []
+    for _ in range(count):
+        (page_no,) = _PAGE_NO.unpack_from(payload, offset)
+        offset += _PAGE_NO.size
+        # 最后一页可能不足一整页
+        page_len = min(page_size, size - page_no * page_size)
+        pages.append((page_no, payload[offset:offset + page_len]))
+        offset += page_len
+
+    if offset != len(payload):
+        raise ValueError("增量段长度不一致")
+
+    return Segment(parent, result, page_size, size, pages)
+
+
+def replay_segments(path: Union[str, Path], blobs: Iterable[bytes]) -> Tuple[int, int]:
+    """
+    在基线文件上按顺序应用增量段（跳过 parent 与当前内容不一致的段）
+
+    Args:
+        path: 基线数据库文件路径（原地修改）
+        blobs: 按序号排列的增量段字节
+
+    Returns:
+        (已应用段数, 跳过段数)
+    """
+    path = Path(path)
+    data = bytearray(path.read_bytes())
+    digest = hashlib.sha256(data).digest()
+    applied = skipped = 0
+
+    for blob in blobs:
+        try:
+            segment = decode_segment(blob)
+        except (ValueError, zlib.error, struct.error):
+            skipped += 1
+            continue
+
+        if segment.parent != digest:
+            skipped += 1
+            continue
+
+        candidate = bytearray(data)
+        if len(candidate) < segment.size:
+            candidate.extend(b"\x00" * (segment.size - len(candidate)))
+        for page_no, page in segment.pages:
+            offset = page_no * segment.page_size
+            candidate[offset:offset + len(page)] = page
+        del candidate[segment.size:]
+
+        candidate_digest = hashlib.sha256(candidate).digest()
+        if candidate_digest != segment.result:
+            skipped += 1
+            continue
+
+        data, digest = candidate, candidate_digest
+        applied += 1
+
+    if applied:
+        tmp_path = path.with_name(path.name + ".replay")
+        tmp_path.write_bytes(bytes(data))
+        tmp_path.replace(path)
+
+    return applied, skipped
@@ -9,11 +9,24 @@ import sqlite3
 import shutil
 import pytz
 import re
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
+from trendradar.storage.archive import archive_db, parse_db_date, resolve_db_path, restore_db
 from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+from trendradar.storage.rank_codec import (
+    append_rank_entries,
+    load_rank_map,
+    normalize_rank_format,
+)
+from trendradar.storage.snapshot import DaySnapshotCache
+from trendradar.storage.sqlite_profile import (
+    ReadOnlyConnectionPool,
+    apply_pragmas,
+    resolve_profile,
+)
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
@@ -32,12 +45,17 @@ class LocalStorageBackend(StorageBackend):
     - HTML 报告生成
     """
 
+    # 批量查询时每条 SQL 的最大参数个数（低于 SQLite 默认上限 999）
+    SQL_BATCH_SIZE = 500
+
     def __init__(
         self,
         data_dir: str = "output",
         enable_txt: bool = True,
         enable_html: bool = True,
         timezone: str = "Asia/Shanghai",
+        sqlite_profile: Optional[Dict] = None,
+        rank_history_format: str = "rows",
     ):
         """
         初始化本地存储后端
@@ -47,13 +65,25 @@ class LocalStorageBackend(StorageBackend):
             enable_txt: 是否启用 TXT 快照
             enable_html: 是否启用 HTML 报告
             timezone: 时区配置（默认 Asia/Shanghai）
+            sqlite_profile: SQLite 存储配置（WAL、PRAGMA、只读连接池，默认见 DEFAULT_SQLITE_PROFILE）
+            rank_history_format: 排名历史存储格式（rows: 每次抓取一行 / packed: 每条新闻一个紧凑 blob）
         """
         self.data_dir = Path(data_dir)
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
+        self.sqlite_profile = resolve_profile(sqlite_profile)
+        self.rank_format = normalize_rank_format(rank_history_format)
         self._db_connections: Dict[str, sqlite3.Connection] = {}
 
+        # 当日数据快照（get_today_all_data 增量读取）
+        self._day_snapshots = DaySnapshotCache()
+
+        # 只读连接池：读取（API / MCP / 报告生成）不占用写连接
+        self._read_pool: Optional[ReadOnlyConnectionPool] = None
+        if int(self.sqlite_profile.get("READ_POOL_SIZE", 0)) > 0:
+            self._read_pool = ReadOnlyConnectionPool(self.sqlite_profile)
+
     @property
     def backend_name(self) -> str:
         return "local"
@@ -108,13 +138,67 @@ class LocalStorageBackend(StorageBackend):
         db_path = str(self._get_db_path(date, db_type))
 
         if db_path not in self._db_connections:
-            conn = sqlite3.connect(db_path)
+            # 写入已归档的日期：先解压回未压缩数据库
+            if restore_db(Path(db_path)):
+                print(f"[本地存储] 已从归档恢复: {db_path}")
+
+            timeout = int(self.sqlite_profile.get("BUSY_TIMEOUT_MS", 5000)) / 1000
+            conn = sqlite3.connect(db_path, timeout=timeout)
             conn.row_factory = sqlite3.Row
+            apply_pragmas(conn, self.sqlite_profile)
             self._init_tables(conn, db_type)
             self._db_connections[db_path] = conn
 
         return self._db_connections[db_path]
 
+    def _resolve_db_path(self, date: Optional[str] = None, db_type: str = "news") -> Optional[Path]:
+        """
+        获取可读取的数据库路径（已归档的日期返回解压缓存中的路径）
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            数据库路径，数据库与归档都不存在时返回 None
+        """
+        return resolve_db_path(self._get_db_path(date, db_type))
+
+    @contextmanager
+    def _read_connection(self, date: Optional[str] = None, db_type: str = "news") -> Iterator[sqlite3.Connection]:
+        """
+        获取只读数据库连接（上下文管理器）
+
+        数据库文件已存在且启用了连接池时，从只读连接池借用连接；
+        已归档的日期以只读方式打开解压缓存中的数据库；
+        否则回退到带缓存的读写连接（与写入共用）。
+
+        Args:
+            date: 日期字符串
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Yields:
+            数据库连接
+        """
+        db_path = self._get_db_path(date, db_type)
+        read_path = db_path if db_path.exists() else self._resolve_db_path(date, db_type)
+
+        if read_path is None or (self._read_pool is None and read_path == db_path):
+            yield self._get_connection(date, db_type)
+            return
+
+        if self._read_pool is not None:
+            with self._read_pool.connection(str(read_path)) as conn:
+                yield conn
+            return
+
+        conn = sqlite3.connect(f"file:{read_path}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
     def _get_schema_path(self, db_type: str = "news") -> Path:
         """
         获取 schema.sql 文件路径
@@ -148,6 +232,241 @@ class LocalStorageBackend(StorageBackend):
 
         conn.commit()
 
+    def _save_source_items(
+        self,
+        cursor: sqlite3.Cursor,
+        source_id: str,
+        news_list: List[NewsItem],
+        crawl_time: str,
+        now_str: str,
+    ) -> Tuple[int, int, int]:
+        """
+        批量写入单个来源的新闻条目（以标准化 URL + platform_id 为唯一标识）
+
+        流程：预先标准化 URL → 一次查询已有记录 → executemany 写入 news_items
+        （INSERT ... ON CONFLICT / UPDATE）→ 批量写入排名历史 / title_changes。结果与逐条处理一致：
+        同批次内重复出现的 URL 视为更新，URL 为空的条目直接插入（不做去重）。
+
+        Args:
+            cursor: 数据库游标
+            source_id: 来源ID
+            news_list: 新闻条目列表
+            crawl_time: 抓取时间
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数, 标题变更数) 元组
+        """
+        if not news_list:
+            return 0, 0, 0
+
+        # 标准化 URL（去除动态参数，如微博的 band_rank）
+        entries = [
+            (item, normalize_url(item.url, source_id) if item.url else "")
+            for item in news_list
+        ]
+
+        # 一次性查询已存在的记录
+        item_ids = self._lookup_news_ids(cursor, source_id, [url for _, url in entries if url])
+        current_titles = {url: title for url, (_, title) in item_ids.items()}
+
+        # 按原顺序推演新增 / 更新 / 标题变更
+        insert_entries = []
+        update_entries = []
+        title_changes = []
+        for item, url in entries:
+            if url and url in current_titles:
+                if current_titles[url] != item.title:
+                    title_changes.append((url, current_titles[url], item.title))
+                update_entries.append((item, url))
+            else:
+                insert_entries.append((item, url))
+            if url:
+                current_titles[url] = item.title
+
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM news_items")
+        max_id_before = cursor.fetchone()[0]
+
+        # 批量插入新记录（存储标准化后的 URL）
+        # 只对首次出现的 URL 插入，冲突分支仅作兜底，避免 upsert 消耗自增 ID
+        cursor.executemany("""
+            INSERT INTO news_items
+            (title, platform_id, rank, url, mobile_url,
+             first_crawl_time, last_crawl_time, crawl_count,
+             created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+            ON CONFLICT(url, platform_id) WHERE url != '' DO UPDATE SET
+                title = excluded.title,
+                rank = excluded.rank,
+                mobile_url = excluded.mobile_url,
+                last_crawl_time = excluded.last_crawl_time,
+                crawl_count = crawl_count + 1,
+                updated_at = excluded.updated_at
+        """, [
+            (item.title, source_id, item.rank, url, item.mobile_url,
+             crawl_time, crawl_time, now_str, now_str)
+            for item, url in insert_entries
+        ])
+
+        # 补齐新插入记录的 ID
+        new_urls = [url for _, url in insert_entries if url]
+        item_ids.update(self._lookup_news_ids(cursor, source_id, new_urls))
+
+        cursor.execute("""
+            SELECT id FROM news_items
+            WHERE id > ? AND platform_id = ? AND url = ''
+            ORDER BY id
+        """, (max_id_before, source_id))
+        empty_url_ids = iter([row[0] for row in cursor.fetchall()])
+
+        # 批量更新已有记录
+        cursor.executemany("""
+            UPDATE news_items SET
+                title = ?,
+                rank = ?,
+                mobile_url = ?,
+                last_crawl_time = ?,
+                crawl_count = crawl_count + 1,
+                updated_at = ?
+            WHERE id = ?
+        """, [
+            (item.title, item.rank, item.mobile_url, crawl_time, now_str, item_ids[url][0])
+            for item, url in update_entries
+        ])
+
+        # 批量记录排名历史
+        rank_entries = []
+        for item, url in entries:
+            news_item_id = item_ids[url][0] if url else next(empty_url_ids)
+            rank_entries.append((news_item_id, item.rank))
+        append_rank_entries(cursor, rank_entries, crawl_time, now_str, self.rank_format)
+
+        # 批量记录标题变更
+        if title_changes:
+            cursor.executemany("""
+                INSERT INTO title_changes
+                (news_item_id, old_title, new_title, changed_at)
+                VALUES (?, ?, ?, ?)
+            """, [
+                (item_ids[url][0], old_title, new_title, now_str)
+                for url, old_title, new_title in title_changes
+            ])
+
+        return len(insert_entries), len(update_entries), len(title_changes)
+
+    def _lookup_news_ids(
+        self, cursor: sqlite3.Cursor, source_id: str, urls: List[str]
+    ) -> Dict[str, Tuple[int, str]]:
+        """
+        按标准化 URL 批量查询已有新闻记录
+
+        Args:
+            cursor: 数据库游标
+            source_id: 来源ID
+            urls: 标准化后的 URL 列表
+
+        Returns:
+            {url: (id, title)}
+        """
+        result: Dict[str, Tuple[int, str]] = {}
+        unique_urls = list(dict.fromkeys(urls))
+        for i in range(0, len(unique_urls), self.SQL_BATCH_SIZE):
+            chunk = unique_urls[i:i + self.SQL_BATCH_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"""
+                SELECT id, url, title FROM news_items
+                WHERE platform_id = ? AND url IN ({placeholders})
+            """, [source_id] + chunk)
+            for row in cursor.fetchall():
+                result[row[1]] = (row[0], row[2])
+        return result
+
+    def _get_fast_path_sources(self, cursor: sqlite3.Cursor, data: NewsData) -> Dict[str, str]:
+        """
+        找出可走快速路径的来源（本次响应摘要与上次入库时一致）
+
+        Args:
+            cursor: 数据库游标
+            data: 新闻数据
+
+        Returns:
+            {platform_id: 上次入库的抓取时间}
+        """
+        if not data.unchanged_ids:
+            return {}
+
+        cursor.execute("SELECT platform_id, digest, crawl_time FROM platform_digests")
+        stored = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
+        sources = {}
+        for source_id in data.unchanged_ids:
+            digest = data.digests.get(source_id)
+            record = stored.get(source_id)
+            # 同一抓取时间重复写入时不走快速路径，避免重复记录排名
+            if digest and record and record[0] == digest and record[1] != data.crawl_time:
+                sources[source_id] = record[1]
+        return sources
+
+    def _carry_forward_source(
+        self,
+        cursor: sqlite3.Cursor,
+        source_id: str,
+        news_list: List[NewsItem],
+        prev_crawl_time: str,
+        crawl_time: str,
+        now_str: str,
+    ) -> int:
+        """
+        将未变化来源上次抓取的记录续写到本次抓取（批量 SQL，不逐条比对）
+
+        仅处理带 URL 的条目；URL 为空的条目本来就不去重，仍按常规逻辑插入。
+        只有上次入库的记录与本次响应逐条一致（标准化 URL 不重复，标题、排名、移动端 URL
+        相同）时才续写，结果与常规逻辑完全相同；否则返回 0 由调用方走常规逻辑
+        （如同一 URL 出现多次时，常规逻辑会多次计数并记录标题变更）。
+
+        Args:
+            cursor: 数据库游标
+            source_id: 来源ID
+            news_list: 本次响应的新闻条目
+            prev_crawl_time: 上次入库的抓取时间
+            crawl_time: 本次抓取时间
+            now_str: 当前时间字符串
+
+        Returns:
+            续写的条目数（0 表示未命中，调用方应回退到逐条处理）
+        """
+        expected = {}
+        for item in news_list:
+            if not item.url:
+                continue
+            url = normalize_url(item.url, source_id)
+            if url in expected:
+                return 0
+            expected[url] = (item.title, item.rank, item.mobile_url or "")
+
+        cursor.execute("""
+            SELECT id, url, title, rank, mobile_url FROM news_items
+            WHERE platform_id = ? AND last_crawl_time = ? AND url != ''
+        """, (source_id, prev_crawl_time))
+        rows = cursor.fetchall()
+        if not rows or len(rows) != len(expected):
+            return 0
+        for row in rows:
+            if expected.get(row[1]) != (row[2], row[3], row[4] or ""):
+                return 0
+
+        append_rank_entries(
+            cursor, [(row[0], row[3]) for row in rows], crawl_time, now_str, self.rank_format
+        )
+        cursor.execute("""
+            UPDATE news_items SET
+                last_crawl_time = ?,
+                crawl_count = crawl_count + 1,
+                updated_at = ?
+            WHERE platform_id = ? AND last_crawl_time = ? AND url != ''
+        """, (crawl_time, now_str, source_id, prev_crawl_time))
+        return cursor.rowcount
+
     def save_news_data(self, data: NewsData) -> bool:
         """
         保存新闻数据到 SQLite（以 URL 为唯一标识，支持标题更新检测）
@@ -181,97 +500,36 @@ class LocalStorageBackend(StorageBackend):
             title_changed_count = 0
             success_sources = []
 
+            # 响应未变化的来源：批量续写上次的记录，跳过逐条比对
+            fast_path_sources = self._get_fast_path_sources(cursor, data)
+
             for source_id, news_list in data.items.items():
                 success_sources.append(source_id)
 
-                for item in news_list:
-                    try:
-                        # 标准化 URL（去除动态参数，如微博的 band_rank）
-                        normalized_url = normalize_url(item.url, source_id) if item.url else ""
-
-                        # 检查是否已存在（通过标准化 URL + platform_id）
-                        if normalized_url:
-                            cursor.execute("""
-                                SELECT id, title FROM news_items
-                                WHERE url = ? AND platform_id = ?
-                            """, (normalized_url, source_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id, existing_title = existing
-
-                                # 检查标题是否变化
-                                if existing_title != item.title:
-                                    # 记录标题变更
-                                    cursor.execute("""
-                                        INSERT INTO title_changes
-                                        (news_item_id, old_title, new_title, changed_at)
-                                        VALUES (?, ?, ?, ?)
-                                    """, (existing_id, existing_title, item.title, now_str))
-                                    title_changed_count += 1
-
-                                # 记录排名历史
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (existing_id, item.rank, data.crawl_time, now_str))
-
-                                # 更新现有记录
-                                cursor.execute("""
-                                    UPDATE news_items SET
-                                        title = ?,
-                                        rank = ?,
-                                        mobile_url = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.rank, item.mobile_url,
-                                      data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录（存储标准化后的 URL）
-                                cursor.execute("""
-                                    INSERT INTO news_items
-                                    (title, platform_id, rank, url, mobile_url,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, source_id, item.rank, normalized_url,
-                                      item.mobile_url, data.crawl_time, data.crawl_time,
-                                      now_str, now_str))
-                                new_id = cursor.lastrowid
-                                # 记录初始排名
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (new_id, item.rank, data.crawl_time, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空的情况，直接插入（不做去重）
-                            cursor.execute("""
-                                INSERT INTO news_items
-                                (title, platform_id, rank, url, mobile_url,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, source_id, item.rank, "",
-                                  item.mobile_url, data.crawl_time, data.crawl_time,
-                                  now_str, now_str))
-                            new_id = cursor.lastrowid
-                            # 记录初始排名
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, ?, ?, ?)
-                            """, (new_id, item.rank, data.crawl_time, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"保存新闻条目失败 [{item.title[:30]}...]: {e}")
+                try:
+                    cursor.execute("SAVEPOINT save_source")
+
+                    fast_count = 0
+                    if source_id in fast_path_sources:
+                        fast_count = self._carry_forward_source(
+                            cursor, source_id, news_list, fast_path_sources[source_id],
+                            data.crawl_time, now_str
+                        )
+                        # 快速路径已处理所有带 URL 的条目
+                        if fast_count > 0:
+                            news_list = [item for item in news_list if not item.url]
+
+                    source_new, source_updated, source_changed = self._save_source_items(
+                        cursor, source_id, news_list, data.crawl_time, now_str
+                    )
+                    cursor.execute("RELEASE SAVEPOINT save_source")
+                    new_count += source_new
+                    updated_count += source_updated + fast_count
+                    title_changed_count += source_changed
+                except sqlite3.Error as e:
+                    cursor.execute("ROLLBACK TO SAVEPOINT save_source")
+                    cursor.execute("RELEASE SAVEPOINT save_source")
+                    print(f"保存新闻条目失败 [{source_id}]: {e}")
 
             total_items = new_count + updated_count
 
@@ -312,7 +570,24 @@ class LocalStorageBackend(StorageBackend):
                         VALUES (?, ?, 'failed')
                     """, (crawl_record_id, failed_id))
 
+            # 记录成功来源的响应摘要
+            digest_rows = [
+                (source_id, data.digests[source_id], data.crawl_time, now_str)
+                for source_id in success_sources
+                if data.digests.get(source_id)
+            ]
+            if digest_rows:
+                cursor.executemany("""
+                    INSERT INTO platform_digests (platform_id, digest, crawl_time, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(platform_id) DO UPDATE SET
+                        digest = excluded.digest,
+                        crawl_time = excluded.crawl_time,
+                        updated_at = excluded.updated_at
+                """, digest_rows)
+
             conn.commit()
+            self._day_snapshots.invalidate(str(self._get_db_path(data.date)))
 
             # 输出详细的存储统计日志
             log_parts = [f"[本地存储] 处理完成：新增 {new_count} 条"]
@@ -339,106 +614,17 @@ class LocalStorageBackend(StorageBackend):
             合并后的新闻数据
         """
         try:
-            db_path = self._get_db_path(date)
-            if not db_path.exists():
-                return None
-
-            conn = self._get_connection(date)
-            cursor = conn.cursor()
-
-            # 获取所有新闻数据（包含 id 用于查询排名历史）
-            cursor.execute("""
-                SELECT n.id, n.title, n.platform_id, p.name as platform_name,
-                       n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                FROM news_items n
-                LEFT JOIN platforms p ON n.platform_id = p.id
-                ORDER BY n.platform_id, n.last_crawl_time
-            """)
-
-            rows = cursor.fetchall()
-            if not rows:
+            db_path = self._resolve_db_path(date)
+            if db_path is None:
                 return None
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
-
-            # 按 platform_id 分组
-            items: Dict[str, List[NewsItem]] = {}
-            id_to_name: Dict[str, str] = {}
-            crawl_date = self._format_date_folder(date)
-
-            for row in rows:
-                news_id = row[0]
-                platform_id = row[2]
-                title = row[1]
-                platform_name = row[3] or platform_id
-
-                id_to_name[platform_id] = platform_name
-
-                if platform_id not in items:
-                    items[platform_id] = []
-
-                # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
-
-                items[platform_id].append(NewsItem(
-                    title=title,
-                    source_id=platform_id,
-                    source_name=platform_name,
-                    rank=row[4],
-                    url=row[5] or "",
-                    mobile_url=row[6] or "",
-                    crawl_time=row[8],  # last_crawl_time
-                    ranks=ranks,
-                    first_time=row[7],  # first_crawl_time
-                    last_time=row[8],   # last_crawl_time
-                    count=row[9],       # crawl_count
-                ))
-
-            final_items = items
-
-            # 获取失败的来源
-            cursor.execute("""
-                SELECT DISTINCT css.platform_id
-                FROM crawl_source_status css
-                JOIN crawl_records cr ON css.crawl_record_id = cr.id
-                WHERE css.status = 'failed'
-            """)
-            failed_ids = [row[0] for row in cursor.fetchall()]
-
-            # 获取最新的抓取时间
-            cursor.execute("""
-                SELECT crawl_time FROM crawl_records
-                ORDER BY crawl_time DESC
-                LIMIT 1
-            """)
+            # 进程内快照：首次全量加载，之后只同步增量
+            snapshot = self._day_snapshots.get(str(db_path))
+            with self._read_connection(date) as conn:
+                snapshot.sync(conn)
 
-            time_row = cursor.fetchone()
-            crawl_time = time_row[0] if time_row else self._format_time_filename()
-
-            return NewsData(
-                date=crawl_date,
-                crawl_time=crawl_time,
-                items=final_items,
-                id_to_name=id_to_name,
-                failed_ids=failed_ids,
+            return snapshot.to_news_data(
+                self._format_date_folder(date), self._format_time_filename()
             )
 
         except Exception as e:
@@ -456,106 +642,93 @@ class LocalStorageBackend(StorageBackend):
             最新抓取的新闻数据
         """
         try:
-            db_path = self._get_db_path(date)
-            if not db_path.exists():
-                return None
-
-            conn = self._get_connection(date)
-            cursor = conn.cursor()
-
-            # 获取最新的抓取时间
-            cursor.execute("""
-                SELECT crawl_time FROM crawl_records
-                ORDER BY crawl_time DESC
-                LIMIT 1
-            """)
-
-            time_row = cursor.fetchone()
-            if not time_row:
+            db_path = self._resolve_db_path(date)
+            if db_path is None:
                 return None
 
-            latest_time = time_row[0]
-
-            # 获取该时间的新闻数据（包含 id 用于查询排名历史）
-            cursor.execute("""
-                SELECT n.id, n.title, n.platform_id, p.name as platform_name,
-                       n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                FROM news_items n
-                LEFT JOIN platforms p ON n.platform_id = p.id
-                WHERE n.last_crawl_time = ?
-            """, (latest_time,))
-
-            rows = cursor.fetchall()
-            if not rows:
-                return None
+            with self._read_connection(date) as conn:
+                cursor = conn.cursor()
 
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
+                # 获取最新的抓取时间
+                cursor.execute("""
+                    SELECT crawl_time FROM crawl_records
+                    ORDER BY crawl_time DESC
+                    LIMIT 1
+                """)
 
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
-
-            items: Dict[str, List[NewsItem]] = {}
-            id_to_name: Dict[str, str] = {}
-            crawl_date = self._format_date_folder(date)
-
-            for row in rows:
-                news_id = row[0]
-                platform_id = row[2]
-                platform_name = row[3] or platform_id
-                id_to_name[platform_id] = platform_name
-
-                if platform_id not in items:
-                    items[platform_id] = []
-
-                # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
-
-                items[platform_id].append(NewsItem(
-                    title=row[1],
-                    source_id=platform_id,
-                    source_name=platform_name,
-                    rank=row[4],
-                    url=row[5] or "",
-                    mobile_url=row[6] or "",
-                    crawl_time=row[8],  # last_crawl_time
-                    ranks=ranks,
-                    first_time=row[7],  # first_crawl_time
-                    last_time=row[8],   # last_crawl_time
-                    count=row[9],       # crawl_count
-                ))
-
-            # 获取失败的来源（针对最新一次抓取）
-            cursor.execute("""
-                SELECT css.platform_id
-                FROM crawl_source_status css
-                JOIN crawl_records cr ON css.crawl_record_id = cr.id
-                WHERE cr.crawl_time = ? AND css.status = 'failed'
-            """, (latest_time,))
+                time_row = cursor.fetchone()
+                if not time_row:
+                    return None
 
-            failed_ids = [row[0] for row in cursor.fetchall()]
+                latest_time = time_row[0]
 
-            return NewsData(
-                date=crawl_date,
-                crawl_time=latest_time,
-                items=items,
-                id_to_name=id_to_name,
-                failed_ids=failed_ids,
-            )
+                # 获取该时间的新闻数据（包含 id 用于查询排名历史）
+                cursor.execute("""
+                    SELECT n.id, n.title, n.platform_id, p.name as platform_name,
+                           n.rank, n.url, n.mobile_url,
+                           n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                    FROM news_items n
+                    LEFT JOIN platforms p ON n.platform_id = p.id
+                    WHERE n.last_crawl_time = ?
+                """, (latest_time,))
+
+                rows = cursor.fetchall()
+                if not rows:
+                    return None
+
+                # 收集所有 news_item_id
+                news_ids = [row[0] for row in rows]
+
+                # 批量查询排名历史（兼容行格式与紧凑格式）
+                rank_history_map = load_rank_map(cursor, news_ids)
+
+                items: Dict[str, List[NewsItem]] = {}
+                id_to_name: Dict[str, str] = {}
+                crawl_date = self._format_date_folder(date)
+
+                for row in rows:
+                    news_id = row[0]
+                    platform_id = row[2]
+                    platform_name = row[3] or platform_id
+                    id_to_name[platform_id] = platform_name
+
+                    if platform_id not in items:
+                        items[platform_id] = []
+
+                    # 获取排名历史，如果没有则使用当前排名
+                    ranks = rank_history_map.get(news_id, [row[4]])
+
+                    items[platform_id].append(NewsItem(
+                        title=row[1],
+                        source_id=platform_id,
+                        source_name=platform_name,
+                        rank=row[4],
+                        url=row[5] or "",
+                        mobile_url=row[6] or "",
+                        crawl_time=row[8],  # last_crawl_time
+                        ranks=ranks,
+                        first_time=row[7],  # first_crawl_time
+                        last_time=row[8],   # last_crawl_time
+                        count=row[9],       # crawl_count
+                    ))
+
+                # 获取失败的来源（针对最新一次抓取）
+                cursor.execute("""
+                    SELECT css.platform_id
+                    FROM crawl_source_status css
+                    JOIN crawl_records cr ON css.crawl_record_id = cr.id
+                    WHERE cr.crawl_time = ? AND css.status = 'failed'
+                """, (latest_time,))
+
+                failed_ids = [row[0] for row in cursor.fetchall()]
+
+                return NewsData(
+                    date=crawl_date,
+                    crawl_time=latest_time,
+                    items=items,
+                    id_to_name=id_to_name,
+                    failed_ids=failed_ids,
+                )
 
         except Exception as e:
             print(f"[本地存储] 获取最新数据失败: {e}")
@@ -567,6 +740,8 @@ class LocalStorageBackend(StorageBackend):
 
         该方法比较当前抓取数据与历史数据，找出新增的标题。
         关键逻辑：只有在历史批次中从未出现过的标题才算新增。
+        直接在 SQLite 中按 (platform_id, title, first_crawl_time) 索引查询，
+        开销与当前批次大小成正比，而不是当天的全部数据。
 
         Args:
             current_data: 当前抓取的数据
@@ -574,35 +749,42 @@ class LocalStorageBackend(StorageBackend):
         Returns:
             新增的标题数据 {source_id: {title: NewsItem}}
         """
-        try:
-            # 获取历史数据
-            historical_data = self.get_today_all_data(current_data.date)
-
-            if not historical_data:
-                # 没有历史数据，所有都是新的
-                new_titles = {}
-                for source_id, news_list in current_data.items.items():
-                    new_titles[source_id] = {item.title: item for item in news_list}
-                return new_titles
+        all_new = {
+            source_id: {item.title: item for item in news_list}
+            for source_id, news_list in current_data.items.items()
+        }
 
-            # 获取当前批次时间
-            current_time = current_data.crawl_time
+        try:
+            db_path = self._resolve_db_path(current_data.date)
+            if db_path is None:
+                return all_new
 
-            # 收集历史标题（first_time < current_time 的标题）
-            # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
-            historical_titles: Dict[str, set] = {}
-            for source_id, news_list in historical_data.items.items():
-                historical_titles[source_id] = set()
-                for item in news_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        historical_titles[source_id].add(item.title)
+            with self._read_connection(current_data.date) as conn:
+                cursor = conn.cursor()
 
-            # 检查是否有历史数据
-            has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
-            if not has_historical_data:
-                # 第一次抓取，没有"新增"概念
-                return {}
+                # 没有历史数据，所有都是新的
+                cursor.execute("SELECT 1 FROM news_items LIMIT 1")
+                if cursor.fetchone() is None:
+                    return all_new
+
+                # 获取当前批次时间
+                current_time = current_data.crawl_time
+
+                # 检查是否有历史数据（first_time < current_time 的标题）
+                if not self._has_titles_before(cursor, current_time):
+                    # 第一次抓取，没有"新增"概念
+                    return {}
+
+                # 收集历史标题（只查询当前批次中的标题）
+                # 同一标题因 URL 变化而产生多条记录时，任一条早于当前批次即视为历史标题
+                historical_titles = self._query_historical_titles(
+                    cursor,
+                    {
+                        source_id: [item.title for item in news_list]
+                        for source_id, news_list in current_data.items.items()
+                    },
+                    current_time,
+                )
 
             # 检测新增
             new_titles = {}
@@ -620,6 +802,194 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 检测新标题失败: {e}")
             return {}
 
+    def has_titles_before(
+        self,
+        before_time: str,
+        date: Optional[str] = None,
+        platform_ids: Optional[List[str]] = None,
+    ) -> bool:
+        """
+        检查是否存在首次抓取时间早于指定时间的新闻（即是否有历史批次）
+
+        Args:
+            before_time: 抓取时间（HH-MM）
+            date: 日期字符串，默认为今天
+            platform_ids: 限定的平台ID列表，None 表示所有平台
+
+        Returns:
+            是否存在历史新闻
+        """
+        try:
+            db_path = self._resolve_db_path(date)
+            if db_path is None:
+                return False
+
+            with self._read_connection(date) as conn:
+                cursor = conn.cursor()
+                return self._has_titles_before(cursor, before_time, platform_ids)
+
+        except Exception as e:
+            print(f"[本地存储] 查询历史标题失败: {e}")
+            return False
+
+    def get_historical_titles(
+        self,
+        titles_by_source: Dict[str, List[str]],
+        before_time: str,
+        date: Optional[str] = None,
+    ) -> Optional[Dict[str, Set[str]]]:
+        """
+        找出给定标题中首次抓取时间早于指定时间的标题（历史标题）
+
+        Args:
+            titles_by_source: 待检查的标题 {source_id: [title, ...]}
+            before_time: 抓取时间（HH-MM）
+            date: 日期字符串，默认为今天
+
+        Returns:
+            {source_id: 历史标题集合}，查询失败返回 None
+        """
+        try:
+            db_path = self._resolve_db_path(date)
+            if db_path is None:
+                return {source_id: set() for source_id in titles_by_source}
+
+            with self._read_connection(date) as conn:
+                cursor = conn.cursor()
+                return self._query_historical_titles(cursor, titles_by_source, before_time)
+
+        except Exception as e:
+            print(f"[本地存储] 查询历史标题失败: {e}")
+            return None
+
+    def _has_titles_before(
+        self,
+        cursor: sqlite3.Cursor,
+        before_time: str,
+        platform_ids: Optional[List[str]] = None,
+    ) -> bool:
+        """检查是否存在 first_crawl_time 早于指定时间的新闻（可限定平台）"""
+        if platform_ids is None:
+            cursor.execute("""
+                SELECT 1 FROM news_items WHERE first_crawl_time < ? LIMIT 1
+            """, (before_time,))
+            return cursor.fetchone() is not None
+
+        for platform_id in platform_ids:
+            cursor.execute("""
+                SELECT 1 FROM news_items
+                WHERE platform_id = ? AND first_crawl_time < ?
+                LIMIT 1
+            """, (platform_id, before_time))
+            if cursor.fetchone() is not None:
+                return True
+        return False
+
+    def _query_historical_titles(
+        self,
+        cursor: sqlite3.Cursor,
+        titles_by_source: Dict[str, List[str]],
+        before_time: str,
+    ) -> Dict[str, Set[str]]:
+        """
+        按 (platform_id, title, first_crawl_time) 索引查询历史标题
+
+        Args:
+            cursor: 数据库游标
+            titles_by_source: 待检查的标题 {source_id: [title, ...]}
+            before_time: 抓取时间（HH-MM）
+
+        Returns:
+            {source_id: 历史标题集合}
+        """
+        historical_titles: Dict[str, Set[str]] = {}
+        for source_id, titles in titles_by_source.items():
+            found: Set[str] = set()
+            unique_titles = list(dict.fromkeys(titles))
+            for i in range(0, len(unique_titles), self.SQL_BATCH_SIZE):
+                chunk = unique_titles[i:i + self.SQL_BATCH_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"""
+                    SELECT DISTINCT title FROM news_items
+                    WHERE platform_id = ? AND title IN ({placeholders})
+                      AND first_crawl_time < ?
+                """, [source_id] + chunk + [before_time])
+                found.update(row[0] for row in cursor.fetchall())
+            historical_titles[source_id] = found
+        return historical_titles
+
+    def get_source_failure_history(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        获取各平台的连续失败历史（用于熔断判断）
+
+        按抓取时间倒序遍历 crawl_source_status，统计每个平台最近一次成功之后的
+        连续失败次数，以及最近一次失败的记录时间。
+
+        Args:
+            date: 日期字符串，默认为今天
+
+        Returns:
+            {platform_id: {"failures": 连续失败次数, "last_failed_at": "YYYY-MM-DD HH:MM:SS"}}
+            仅包含连续失败次数大于 0 的平台
+        """
+        try:
+            db_path = self._get_db_path(date)
+            if not db_path.exists():
+                return {}
+
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT css.platform_id, css.status, cr.created_at
+                FROM crawl_source_status css
+                JOIN crawl_records cr ON css.crawl_record_id = cr.id
+                ORDER BY cr.crawl_time DESC
+            """)
+
+            history: Dict[str, Dict] = {}
+            recovered = set()
+            for platform_id, status, created_at in cursor.fetchall():
+                if platform_id in recovered:
+                    continue
+                if status != "failed":
+                    recovered.add(platform_id)
+                    continue
+                record = history.setdefault(
+                    platform_id, {"failures": 0, "last_failed_at": created_at}
+                )
+                record["failures"] += 1
+
+            return history
+
+        except Exception as e:
+            print(f"[本地存储] 读取平台失败历史失败: {e}")
+            return {}
+
+    def get_platform_digests(self, date: Optional[str] = None) -> Dict[str, str]:
+        """
+        获取各平台最近一次成功响应的内容摘要
+
+        Args:
+            date: 日期字符串，默认为今天
+
+        Returns:
+            {platform_id: digest}
+        """
+        try:
+            db_path = self._get_db_path(date)
+            if not db_path.exists():
+                return {}
+
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+            cursor.execute("SELECT platform_id, digest FROM platform_digests")
+            return {row[0]: row[1] for row in cursor.fetchall()}
+
+        except Exception as e:
+            print(f"[本地存储] 读取平台响应摘要失败: {e}")
+            return {}
+
     def save_txt_snapshot(self, data: NewsData) -> Optional[str]:
         """
         保存 TXT 快照
@@ -755,20 +1125,20 @@ class LocalStorageBackend(StorageBackend):
             抓取时间列表（按时间排序）
         """
         try:
-            db_path = self._get_db_path(date)
-            if not db_path.exists():
+            db_path = self._resolve_db_path(date)
+            if db_path is None:
                 return []
 
-            conn = self._get_connection(date)
-            cursor = conn.cursor()
+            with self._read_connection(date) as conn:
+                cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT crawl_time FROM crawl_records
-                ORDER BY crawl_time
-            """)
+                cursor.execute("""
+                    SELECT crawl_time FROM crawl_records
+                    ORDER BY crawl_time
+                """)
 
-            rows = cursor.fetchall()
-            return [row[0] for row in rows]
+                rows = cursor.fetchall()
+                return [row[0] for row in rows]
 
         except Exception as e:
             print(f"[本地存储] 获取抓取时间列表失败: {e}")
@@ -785,13 +1155,17 @@ class LocalStorageBackend(StorageBackend):
 
         self._db_connections.clear()
 
+        read_pool = getattr(self, "_read_pool", None)
+        if read_pool:
+            read_pool.close_all()
+
     def cleanup_old_data(self, retention_days: int) -> int:
         """
         清理过期数据
 
         新结构清理逻辑：
-        - output/news/{date}.db  -> 删除过期的 .db 文件
-        - output/rss/{date}.db   -> 删除过期的 .db 文件
+        - output/news/{date}.db  -> 删除过期的 .db 文件（含 .db.zst / .db.gz 归档）
+        - output/rss/{date}.db   -> 删除过期的 .db 文件（含 .db.zst / .db.gz 归档）
         - output/txt/{date}/     -> 删除过期的日期目录
         - output/html/{date}/    -> 删除过期的日期目录
 
@@ -844,7 +1218,9 @@ class LocalStorageBackend(StorageBackend):
                 if not db_dir.exists():
                     continue
 
-                for db_file in db_dir.glob("*.db"):
+                for db_file in db_dir.glob("*.db*"):
+                    if not parse_db_date(db_file.name):
+                        continue
                     file_date = parse_date_from_name(db_file.name)
                     if file_date and file_date < cutoff_date:
                         # 先关闭数据库连接
@@ -855,10 +1231,16 @@ class LocalStorageBackend(StorageBackend):
                                 del self._db_connections[db_path]
                             except Exception:
                                 pass
+                        if self._read_pool:
+                            self._read_pool.discard(db_path)
 
-                        # 删除文件
+                        # 删除文件（连同 WAL 模式的 -wal / -shm 文件）
                         try:
                             db_file.unlink()
+                            for suffix in ("-wal", "-shm"):
+                                sidecar = db_file.with_name(db_file.name + suffix)
+                                if sidecar.exists():
+                                    sidecar.unlink()
                             deleted_count += 1
                             print(f"[本地存储] 清理过期数据: {db_type}/{db_file.name}")
                         except Exception as e:
@@ -892,6 +1274,62 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 清理过期数据失败: {e}")
             return deleted_count
 
+    def archive_closed_days(self, level: Optional[int] = None) -> int:
+        """
+        压缩归档今天之前的日期数据库
+
+        output/news/2025-12-28.db → output/news/2025-12-28.db.zst（无 zstandard 时为 .db.gz），
+        读取时透明解压，之后再写入该日期会自动恢复为未压缩数据库。
+
+        Args:
+            level: 压缩级别（默认使用各格式的默认级别）
+
+        Returns:
+            归档的数据库数量
+        """
+        today = self._format_date_folder()
+        archived_count = 0
+
+        for db_type in ["news", "rss"]:
+            db_dir = self.data_dir / db_type
+            if not db_dir.exists():
+                continue
+
+            for db_file in sorted(db_dir.glob("*.db")):
+                date_str = parse_db_date(db_file.name)
+                if not date_str or date_str >= today:
+                    continue
+
+                # 先关闭数据库连接
+                db_path = str(db_file)
+                if db_path in self._db_connections:
+                    try:
+                        self._db_connections.pop(db_path).close()
+                    except Exception:
+                        pass
+                if self._read_pool:
+                    self._read_pool.discard(db_path)
+
+                try:
+                    # WAL 模式下尚未检查点的数据在 -wal 文件中
+                    wal_file = db_file.with_name(db_file.name + "-wal")
+                    original_size = db_file.stat().st_size + (wal_file.stat().st_size if wal_file.exists() else 0)
+                    archive_path = archive_db(db_file, level)
+                    if archive_path is None:
+                        continue
+                    archived_count += 1
+                    print(
+                        f"[本地存储] 已归档: {db_type}/{archive_path.name} "
+                        f"({original_size / 1024:.1f}KB → {archive_path.stat().st_size / 1024:.1f}KB)"
+                    )
+                except Exception as e:
+                    print(f"[本地存储] 归档失败 {db_file}: {e}")
+
+        if archived_count > 0:
+            print(f"[本地存储] 共归档 {archived_count} 个数据库")
+
+        return archived_count
+
     def has_pushed_today(self, date: Optional[str] = None) -> bool:
         """
         检查指定日期是否已推送过
@@ -957,6 +1395,86 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 记录推送失败: {e}")
             return False
 
+    def get_keyword_matches(
+        self,
+        config_hash: str,
+        date: Optional[str] = None,
+        db_type: str = "news",
+    ) -> Dict[str, int]:
+        """
+        读取指定频率词配置下已记录的关键词归属
+
+        Args:
+            config_hash: 频率词配置哈希
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            {标题: 词组下标}，-1 表示未命中
+        """
+        try:
+            db_path = self._resolve_db_path(date, db_type)
+            if db_path is None:
+                return {}
+
+            with self._read_connection(date, db_type) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT title, group_index FROM keyword_matches
+                    WHERE config_hash = ?
+                """, (config_hash,))
+                return {row[0]: row[1] for row in cursor.fetchall()}
+
+        except Exception as e:
+            print(f"[本地存储] 读取关键词归属失败: {e}")
+            return {}
+
+    def save_keyword_matches(
+        self,
+        config_hash: str,
+        matches: Dict[str, int],
+        date: Optional[str] = None,
+        db_type: str = "news",
+    ) -> bool:
+        """
+        追加关键词归属记录，并清除其他配置哈希的旧记录
+
+        关键词归属只是缓存：数据库不存在（或已压缩归档）时不写入，
+        避免为此创建数据库或把归档恢复为未压缩文件。
+
+        Args:
+            config_hash: 频率词配置哈希
+            matches: {标题: 词组下标}
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            是否保存成功
+        """
+        if not matches:
+            return True
+        if not self._get_db_path(date, db_type).exists():
+            return False
+
+        try:
+            conn = self._get_connection(date, db_type)
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                DELETE FROM keyword_matches WHERE config_hash != ?
+            """, (config_hash,))
+            cursor.executemany("""
+                INSERT OR IGNORE INTO keyword_matches (config_hash, title, group_index)
+                VALUES (?, ?, ?)
+            """, [(config_hash, title, index) for title, index in matches.items()])
+
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"[本地存储] 保存关键词归属失败: {e}")
+            return False
+
     # ========================================
     # RSS 数据存储方法
     # ========================================
@@ -991,6 +1509,10 @@ class LocalStorageBackend(StorageBackend):
             new_count = 0
             updated_count = 0
 
+            # 服务器返回 304 的源：内容未修改，沿用上次抓取的条目
+            for feed_id in data.unchanged_ids:
+                updated_count += self._carry_forward_feed(cursor, feed_id, data.crawl_time, now_str)
+
             for feed_id, rss_list in data.items.items():
                 for item in rss_list:
                     try:
@@ -1063,8 +1585,8 @@ class LocalStorageBackend(StorageBackend):
             if record_row:
                 crawl_record_id = record_row[0]
 
-                # 记录成功的源
-                for feed_id in data.items.keys():
+                # 记录成功的源（含返回 304 的源）
+                for feed_id in list(data.items.keys()) + data.unchanged_ids:
                     cursor.execute("""
                         INSERT OR REPLACE INTO rss_crawl_status
                         (crawl_record_id, feed_id, status)
@@ -1084,6 +1606,23 @@ class LocalStorageBackend(StorageBackend):
                         VALUES (?, ?, 'failed')
                     """, (crawl_record_id, failed_id))
 
+            # 记录缓存校验信息（供下次条件请求使用）
+            if data.validators:
+                cursor.executemany("""
+                    INSERT INTO rss_feed_validators
+                    (feed_id, etag, last_modified, crawl_time, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(feed_id) DO UPDATE SET
+                        etag = excluded.etag,
+                        last_modified = excluded.last_modified,
+                        crawl_time = excluded.crawl_time,
+                        updated_at = excluded.updated_at
+                """, [
+                    (feed_id, validator.get("etag", ""), validator.get("last_modified", ""),
+                     data.crawl_time, now_str)
+                    for feed_id, validator in data.validators.items()
+                ])
+
             conn.commit()
 
             # 输出统计日志
@@ -1098,86 +1637,142 @@ class LocalStorageBackend(StorageBackend):
             print(f"[本地存储] 保存 RSS 数据失败: {e}")
             return False
 
-    def get_rss_data(self, date: Optional[str] = None) -> Optional[RSSData]:
+    def _carry_forward_feed(
+        self, cursor: sqlite3.Cursor, feed_id: str, crawl_time: str, now_str: str
+    ) -> int:
         """
-        获取指定日期的所有 RSS 数据
+        将未修改（304）的源的上次抓取条目延续到本次抓取
+
+        上次成功抓取的条目 last_crawl_time 都等于该源的最大 last_crawl_time，
+        与重新解析同一响应后逐条更新的结果一致。
 
         Args:
-            date: 日期字符串（YYYY-MM-DD），默认为今天
+            cursor: 数据库游标
+            feed_id: RSS 源 ID
+            crawl_time: 本次抓取时间
+            now_str: 当前时间字符串
 
         Returns:
-            RSSData 对象，如果没有数据返回 None
+            延续的条目数
+        """
+        cursor.execute("""
+            UPDATE rss_items SET
+                last_crawl_time = ?,
+                crawl_count = crawl_count + 1,
+                updated_at = ?
+            WHERE feed_id = ? AND last_crawl_time = (
+                SELECT MAX(last_crawl_time) FROM rss_items WHERE feed_id = ?
+            )
+        """, (crawl_time, now_str, feed_id, feed_id))
+        return cursor.rowcount
+
+    def get_rss_validators(self, date: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+        """
+        获取各 RSS 源最近一次成功响应的缓存校验信息
+
+        Args:
+            date: 日期字符串，默认为今天
+
+        Returns:
+            {feed_id: {"etag": ..., "last_modified": ...}}
         """
         try:
+            db_path = self._get_db_path(date, db_type="rss")
+            if not db_path.exists():
+                return {}
+
             conn = self._get_connection(date, db_type="rss")
             cursor = conn.cursor()
+            cursor.execute("SELECT feed_id, etag, last_modified FROM rss_feed_validators")
+            return {
+                row[0]: {"etag": row[1] or "", "last_modified": row[2] or ""}
+                for row in cursor.fetchall()
+            }
 
-            # 获取所有 RSS 数据
-            cursor.execute("""
-                SELECT i.id, i.title, i.feed_id, f.name as feed_name,
-                       i.url, i.published_at, i.summary, i.author,
-                       i.first_crawl_time, i.last_crawl_time, i.crawl_count
-                FROM rss_items i
-                LEFT JOIN rss_feeds f ON i.feed_id = f.id
-                ORDER BY i.published_at DESC
-            """)
+        except Exception as e:
+            print(f"[本地存储] 读取 RSS 缓存校验信息失败: {e}")
+            return {}
 
-            rows = cursor.fetchall()
-            if not rows:
-                return None
+    def get_rss_data(self, date: Optional[str] = None) -> Optional[RSSData]:
+        """
+        获取指定日期的所有 RSS 数据
 
-            items: Dict[str, List[RSSItem]] = {}
-            id_to_name: Dict[str, str] = {}
-            crawl_date = self._format_date_folder(date)
-
-            for row in rows:
-                feed_id = row[2]
-                feed_name = row[3] or feed_id
-
-                id_to_name[feed_id] = feed_name
-
-                if feed_id not in items:
-                    items[feed_id] = []
-
-                items[feed_id].append(RSSItem(
-                    title=row[1],
-                    feed_id=feed_id,
-                    feed_name=feed_name,
-                    url=row[4] or "",
-                    published_at=row[5] or "",
-                    summary=row[6] or "",
-                    author=row[7] or "",
-                    crawl_time=row[9],
-                    first_time=row[8],
-                    last_time=row[9],
-                    count=row[10],
-                ))
-
-            # 获取最新的抓取时间
-            cursor.execute("""
-                SELECT crawl_time FROM rss_crawl_records
-                ORDER BY crawl_time DESC
-                LIMIT 1
-            """)
-            time_row = cursor.fetchone()
-            crawl_time = time_row[0] if time_row else self._format_time_filename()
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
 
-            # 获取失败的源
-            cursor.execute("""
-                SELECT DISTINCT cs.feed_id
-                FROM rss_crawl_status cs
-                JOIN rss_crawl_records cr ON cs.crawl_record_id = cr.id
-                WHERE cs.status = 'failed'
-            """)
-            failed_ids = [row[0] for row in cursor.fetchall()]
-
-            return RSSData(
-                date=crawl_date,
-                crawl_time=crawl_time,
-                items=items,
-                id_to_name=id_to_name,
-                failed_ids=failed_ids,
-            )
+        Returns:
+            RSSData 对象，如果没有数据返回 None
+        """
+        try:
+            with self._read_connection(date, db_type="rss") as conn:
+                cursor = conn.cursor()
+
+                # 获取所有 RSS 数据
+                cursor.execute("""
+                    SELECT i.id, i.title, i.feed_id, f.name as feed_name,
+                           i.url, i.published_at, i.summary, i.author,
+                           i.first_crawl_time, i.last_crawl_time, i.crawl_count
+                    FROM rss_items i
+                    LEFT JOIN rss_feeds f ON i.feed_id = f.id
+                    ORDER BY i.published_at DESC
+                """)
+
+                rows = cursor.fetchall()
+                if not rows:
+                    return None
+
+                items: Dict[str, List[RSSItem]] = {}
+                id_to_name: Dict[str, str] = {}
+                crawl_date = self._format_date_folder(date)
+
+                for row in rows:
+                    feed_id = row[2]
+                    feed_name = row[3] or feed_id
+
+                    id_to_name[feed_id] = feed_name
+
+                    if feed_id not in items:
+                        items[feed_id] = []
+
+                    items[feed_id].append(RSSItem(
+                        title=row[1],
+                        feed_id=feed_id,
+                        feed_name=feed_name,
+                        url=row[4] or "",
+                        published_at=row[5] or "",
+                        summary=row[6] or "",
+                        author=row[7] or "",
+                        crawl_time=row[9],
+                        first_time=row[8],
+                        last_time=row[9],
+                        count=row[10],
+                    ))
+
+                # 获取最新的抓取时间
+                cursor.execute("""
+                    SELECT crawl_time FROM rss_crawl_records
+                    ORDER BY crawl_time DESC
+                    LIMIT 1
+                """)
+                time_row = cursor.fetchone()
+                crawl_time = time_row[0] if time_row else self._format_time_filename()
+
+                # 获取失败的源
+                cursor.execute("""
+                    SELECT DISTINCT cs.feed_id
+                    FROM rss_crawl_status cs
+                    JOIN rss_crawl_records cr ON cs.crawl_record_id = cr.id
+                    WHERE cs.status = 'failed'
+                """)
+                failed_ids = [row[0] for row in cursor.fetchall()]
+
+                return RSSData(
+                    date=crawl_date,
+                    crawl_time=crawl_time,
+                    items=items,
+                    id_to_name=id_to_name,
+                    failed_ids=failed_ids,
+                )
 
         except Exception as e:
             print(f"[本地存储] 读取 RSS 数据失败: {e}")
@@ -1251,85 +1846,85 @@ class LocalStorageBackend(StorageBackend):
             最新抓取的 RSS 数据，如果没有数据返回 None
         """
         try:
-            db_path = self._get_db_path(date, db_type="rss")
-            if not db_path.exists():
+            db_path = self._resolve_db_path(date, db_type="rss")
+            if db_path is None:
                 return None
 
-            conn = self._get_connection(date, db_type="rss")
-            cursor = conn.cursor()
+            with self._read_connection(date, db_type="rss") as conn:
+                cursor = conn.cursor()
 
-            # 获取最新的抓取时间
-            cursor.execute("""
-                SELECT crawl_time FROM rss_crawl_records
-                ORDER BY crawl_time DESC
-                LIMIT 1
-            """)
+                # 获取最新的抓取时间
+                cursor.execute("""
+                    SELECT crawl_time FROM rss_crawl_records
+                    ORDER BY crawl_time DESC
+                    LIMIT 1
+                """)
 
-            time_row = cursor.fetchone()
-            if not time_row:
-                return None
+                time_row = cursor.fetchone()
+                if not time_row:
+                    return None
 
-            latest_time = time_row[0]
+                latest_time = time_row[0]
 
-            # 获取该时间的 RSS 数据
-            cursor.execute("""
-                SELECT i.id, i.title, i.feed_id, f.name as feed_name,
-                       i.url, i.published_at, i.summary, i.author,
-                       i.first_crawl_time, i.last_crawl_time, i.crawl_count
-                FROM rss_items i
-                LEFT JOIN rss_feeds f ON i.feed_id = f.id
-                WHERE i.last_crawl_time = ?
-                ORDER BY i.published_at DESC
-            """, (latest_time,))
-
-            rows = cursor.fetchall()
-            if not rows:
-                return None
-
-            items: Dict[str, List[RSSItem]] = {}
-            id_to_name: Dict[str, str] = {}
-            crawl_date = self._format_date_folder(date)
-
-            for row in rows:
-                feed_id = row[2]
-                feed_name = row[3] or feed_id
-
-                id_to_name[feed_id] = feed_name
-
-                if feed_id not in items:
-                    items[feed_id] = []
-
-                items[feed_id].append(RSSItem(
-                    title=row[1],
-                    feed_id=feed_id,
-                    feed_name=feed_name,
-                    url=row[4] or "",
-                    published_at=row[5] or "",
-                    summary=row[6] or "",
-                    author=row[7] or "",
-                    crawl_time=row[9],
-                    first_time=row[8],
-                    last_time=row[9],
-                    count=row[10],
-                ))
-
-            # 获取失败的源（针对最新一次抓取）
-            cursor.execute("""
-                SELECT cs.feed_id
-                FROM rss_crawl_status cs
-                JOIN rss_crawl_records cr ON cs.crawl_record_id = cr.id
-                WHERE cr.crawl_time = ? AND cs.status = 'failed'
-            """, (latest_time,))
-
-            failed_ids = [row[0] for row in cursor.fetchall()]
-
-            return RSSData(
-                date=crawl_date,
-                crawl_time=latest_time,
-                items=items,
-                id_to_name=id_to_name,
-                failed_ids=failed_ids,
-            )
+                # 获取该时间的 RSS 数据
+                cursor.execute("""
+                    SELECT i.id, i.title, i.feed_id, f.name as feed_name,
+                           i.url, i.published_at, i.summary, i.author,
+                           i.first_crawl_time, i.last_crawl_time, i.crawl_count
+                    FROM rss_items i
+                    LEFT JOIN rss_feeds f ON i.feed_id = f.id
+                    WHERE i.last_crawl_time = ?
+                    ORDER BY i.published_at DESC
+                """, (latest_time,))
+
+                rows = cursor.fetchall()
+                if not rows:
+                    return None
+
+                items: Dict[str, List[RSSItem]] = {}
+                id_to_name: Dict[str, str] = {}
+                crawl_date = self._format_date_folder(date)
+
+                for row in rows:
+                    feed_id = row[2]
+                    feed_name = row[3] or feed_id
+
+                    id_to_name[feed_id] = feed_name
+
+                    if feed_id not in items:
+                        items[feed_id] = []
+
+                    items[feed_id].append(RSSItem(
+                        title=row[1],
+                        feed_id=feed_id,
+                        feed_name=feed_name,
+                        url=row[4] or "",
+                        published_at=row[5] or "",
+                        summary=row[6] or "",
+                        author=row[7] or "",
+                        crawl_time=row[9],
+                        first_time=row[8],
+                        last_time=row[9],
+                        count=row[10],
+                    ))
+
+                # 获取失败的源（针对最新一次抓取）
+                cursor.execute("""
+                    SELECT cs.feed_id
+                    FROM rss_crawl_status cs
+                    JOIN rss_crawl_records cr ON cs.crawl_record_id = cr.id
+                    WHERE cr.crawl_time = ? AND cs.status = 'failed'
+                """, (latest_time,))
+
+                failed_ids = [row[0] for row in cursor.fetchall()]
+
+                return RSSData(
+                    date=crawl_date,
+                    crawl_time=latest_time,
+                    items=items,
+                    id_to_name=id_to_name,
+                    failed_ids=failed_ids,
+                )
 
         except Exception as e:
             print(f"[本地存储] 获取最新 RSS 数据失败: {e}")
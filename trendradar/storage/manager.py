@@ -26,6 +26,9 @@ class StorageManager:
     - 支持从远程拉取数据到本地
     """
 
+    # 后台上传队列目录（位于本地数据目录）
+    UPLOAD_QUEUE_DIR = ".upload_queue"
+
     def __init__(
         self,
         backend_type: str = "auto",
@@ -38,6 +41,10 @@ class StorageManager:
         pull_enabled: bool = False,
         pull_days: int = 0,
         timezone: str = "Asia/Shanghai",
+        sqlite_profile: Optional[dict] = None,
+        pull_concurrency: int = 4,
+        archive_enabled: bool = False,
+        archive_level: int = 0,
     ):
         """
         初始化存储管理器
@@ -47,12 +54,16 @@ class StorageManager:
             data_dir: 本地数据目录
             enable_txt: 是否启用 TXT 快照
             enable_html: 是否启用 HTML 报告
-            remote_config: 远程存储配置（endpoint_url, bucket_name, access_key_id 等）
+            remote_config: 远程存储配置（endpoint_url, bucket_name, access_key_id、background_upload 等）
             local_retention_days: 本地数据保留天数（0 = 无限制）
             remote_retention_days: 远程数据保留天数（0 = 无限制）
             pull_enabled: 是否启用启动时自动拉取
             pull_days: 拉取最近 N 天的数据
             timezone: 时区配置（默认 Asia/Shanghai）
+            sqlite_profile: 本地 SQLite 存储配置（WAL、PRAGMA、只读连接池）
+            pull_concurrency: 拉取时的最大并发下载数
+            archive_enabled: 是否压缩归档今天之前的日期数据库
+            archive_level: 归档压缩级别（0 = 默认级别）
         """
         self.backend_type = backend_type
         self.data_dir = data_dir
@@ -63,7 +74,11 @@ class StorageManager:
         self.remote_retention_days = remote_retention_days
         self.pull_enabled = pull_enabled
         self.pull_days = pull_days
+        self.pull_concurrency = pull_concurrency
+        self.archive_enabled = archive_enabled
+        self.archive_level = archive_level
         self.timezone = timezone
+        self.sqlite_profile = sqlite_profile
 
         self._backend: Optional[StorageBackend] = None
         self._remote_backend: Optional[StorageBackend] = None
@@ -123,8 +138,37 @@ class StorageManager:
 
         return has_config
 
-    def _create_remote_backend(self) -> Optional[StorageBackend]:
-        """创建远程存储后端"""
+    def _rank_history_format(self) -> str:
+        """排名历史存储格式（rows / packed）"""
+        return (self.sqlite_profile or {}).get("RANK_HISTORY", "rows")
+
+    def _background_upload_enabled(self) -> bool:
+        """
+        是否使用后台上传队列
+
+        队列保存在数据目录中，只有数据目录在运行之间保留时，超时未完成的上传才能在下次运行继续。
+        auto（默认）在 GitHub Actions 中关闭（工作流不保留 output/），改为同步上传。
+        """
+        setting = self.remote_config.get("background_upload", "auto")
+        if setting == "auto":
+            if self.is_github_actions():
+                print("[存储管理器] GitHub Actions 环境不保留数据目录，使用同步上传")
+                return False
+            return True
+        return bool(setting)
+
+    def _create_remote_backend(self, background_upload: bool = False) -> Optional[StorageBackend]:
+        """
+        创建远程存储后端
+
+        Args:
+            background_upload: 是否使用后台上传队列（仅写入数据的主后端需要，
+                拉取 / 清理使用的后端不上传数据库）
+        """
+        upload_queue_dir = None
+        if background_upload and self._background_upload_enabled():
+            upload_queue_dir = os.path.join(self.data_dir, self.UPLOAD_QUEUE_DIR)
+
         try:
             from trendradar.storage.remote import RemoteStorageBackend
 
@@ -137,6 +181,12 @@ class StorageManager:
                 enable_txt=self.enable_txt,
                 enable_html=self.enable_html,
                 timezone=self.timezone,
+                rank_history_format=self._rank_history_format(),
+                replication=self.remote_config.get("replication", "full"),
+                compact_segments=self.remote_config.get("compact_segments", 24),
+                upload_queue_dir=upload_queue_dir,
+                upload_flush_timeout=self.remote_config.get("upload_flush_timeout", 120),
+                base_cache_dir=self.remote_config.get("base_cache_dir") or None,
             )
         except ImportError as e:
             print(f"[存储管理器] 远程后端导入失败: {e}")
@@ -152,7 +202,7 @@ class StorageManager:
             resolved_type = self._resolve_backend_type()
 
             if resolved_type == "remote":
-                self._backend = self._create_remote_backend()
+                self._backend = self._create_remote_backend(background_upload=True)
                 if self._backend:
                     print(f"[存储管理器] 使用远程存储后端")
                 else:
@@ -167,6 +217,8 @@ class StorageManager:
                     enable_txt=self.enable_txt,
                     enable_html=self.enable_html,
                     timezone=self.timezone,
+                    sqlite_profile=self.sqlite_profile,
+                    rank_history_format=self._rank_history_format(),
                 )
                 print(f"[存储管理器] 使用本地存储后端 (数据目录: {self.data_dir})")
 
@@ -195,7 +247,9 @@ class StorageManager:
             return 0
 
         # 调用拉取方法
-        return self._remote_backend.pull_recent_days(self.pull_days, self.data_dir)
+        return self._remote_backend.pull_recent_days(
+            self.pull_days, self.data_dir, max_concurrency=self.pull_concurrency
+        )
 
     def save_news_data(self, data: NewsData) -> bool:
         """保存新闻数据"""
@@ -205,6 +259,22 @@ class StorageManager:
         """保存 RSS 数据"""
         return self.get_backend().save_rss_data(data)
 
+    def get_rss_validators(self, date: Optional[str] = None) -> dict:
+        """获取各 RSS 源最近一次响应的缓存校验信息（用于条件请求）"""
+        return self.get_backend().get_rss_validators(date)
+
+    def get_keyword_matches(
+        self, config_hash: str, date: Optional[str] = None, db_type: str = "news"
+    ) -> dict:
+        """获取指定频率词配置下已记录的关键词归属 {标题: 词组下标}"""
+        return self.get_backend().get_keyword_matches(config_hash, date, db_type)
+
+    def save_keyword_matches(
+        self, config_hash: str, matches: dict, date: Optional[str] = None, db_type: str = "news"
+    ) -> bool:
+        """追加关键词归属记录"""
+        return self.get_backend().save_keyword_matches(config_hash, matches, date, db_type)
+
     def get_rss_data(self, date: Optional[str] = None) -> Optional[RSSData]:
         """获取指定日期的所有 RSS 数据（当日汇总模式）"""
         return self.get_backend().get_rss_data(date)
@@ -229,6 +299,29 @@ class StorageManager:
         """检测新增标题"""
         return self.get_backend().detect_new_titles(current_data)
 
+    def has_titles_before(
+        self,
+        before_time: str,
+        date: Optional[str] = None,
+        platform_ids: Optional[list] = None,
+    ) -> bool:
+        """检查是否存在首次抓取时间早于指定时间的新闻"""
+        return self.get_backend().has_titles_before(before_time, date, platform_ids)
+
+    def get_historical_titles(
+        self, titles_by_source: dict, before_time: str, date: Optional[str] = None
+    ) -> Optional[dict]:
+        """找出给定标题中首次抓取时间早于指定时间的历史标题"""
+        return self.get_backend().get_historical_titles(titles_by_source, before_time, date)
+
+    def get_source_failure_history(self, date: Optional[str] = None) -> dict:
+        """获取各平台连续失败历史（用于熔断判断）"""
+        return self.get_backend().get_source_failure_history(date)
+
+    def get_platform_digests(self, date: Optional[str] = None) -> dict:
+        """获取各平台最近一次响应的内容摘要（用于识别未变化的榜单）"""
+        return self.get_backend().get_platform_digests(date)
+
     def save_txt_snapshot(self, data: NewsData) -> Optional[str]:
         """保存 TXT 快照"""
         return self.get_backend().save_txt_snapshot(data)
@@ -242,11 +335,25 @@ class StorageManager:
         return self.get_backend().is_first_crawl_today(date)
 
     def cleanup(self) -> None:
-        """清理资源"""
-        if self._backend:
-            self._backend.cleanup()
-        if self._remote_backend:
-            self._remote_backend.cleanup()
+        """
+        清理资源（远程后端先等待后台上传队列完成）
+
+        Raises:
+            UploadIncompleteError: 等待超时后上传队列中仍有未完成的对象
+        """
+        pending = 0
+        for backend in (self._backend, self._remote_backend):
+            if backend:
+                backend.cleanup()
+                pending += getattr(backend, "pending_uploads", 0)
+
+        if pending:
+            from trendradar.storage.upload_queue import UploadIncompleteError
+
+            raise UploadIncompleteError(
+                f"{pending} 个数据库尚未上传到远程存储（已保留在 "
+                f"{os.path.join(self.data_dir, self.UPLOAD_QUEUE_DIR)}，数据目录不保留时将会丢失）"
+            )
 
     def cleanup_old_data(self) -> int:
         """
@@ -270,6 +377,21 @@ class StorageManager:
 
         return total_deleted
 
+    def archive_closed_days(self) -> int:
+        """
+        压缩归档当前后端中今天之前的日期数据库（未启用归档时不处理）
+
+        Returns:
+            归档的数据库数量
+        """
+        if not self.archive_enabled:
+            return 0
+
+        backend = self.get_backend()
+        if not hasattr(backend, "archive_closed_days"):
+            return 0
+        return backend.archive_closed_days(self.archive_level or None)
+
     @property
     def backend_name(self) -> str:
         """获取当前后端名称"""
@@ -319,7 +441,11 @@ def get_storage_manager(
     pull_enabled: bool = False,
     pull_days: int = 0,
     timezone: str = "Asia/Shanghai",
+    sqlite_profile: Optional[dict] = None,
     force_new: bool = False,
+    pull_concurrency: int = 4,
+    archive_enabled: bool = False,
+    archive_level: int = 0,
 ) -> StorageManager:
     """
     获取存储管理器单例
@@ -335,7 +461,11 @@ def get_storage_manager(
         pull_enabled: 是否启用启动时自动拉取
         pull_days: 拉取最近 N 天的数据
         timezone: 时区配置（默认 Asia/Shanghai）
+        sqlite_profile: 本地 SQLite 存储配置（WAL、PRAGMA、只读连接池）
         force_new: 是否强制创建新实例
+        pull_concurrency: 拉取时的最大并发下载数
+        archive_enabled: 是否压缩归档今天之前的日期数据库
+        archive_level: 归档压缩级别（0 = 默认级别）
 
     Returns:
         StorageManager 实例
@@ -354,6 +484,10 @@ def get_storage_manager(
             pull_enabled=pull_enabled,
             pull_days=pull_days,
             timezone=timezone,
+            sqlite_profile=sqlite_profile,
+            pull_concurrency=pull_concurrency,
+            archive_enabled=archive_enabled,
+            archive_level=archive_level,
         )
 
     return _storage_manager
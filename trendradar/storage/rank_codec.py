@@ -0,0 +1,228 @@
+# coding=utf-8
+"""
+排名历史紧凑存储模块
+
+rank_history 表每次抓取、每条新闻写入一行（rank + crawl_time + created_at），
+到晚上一天可达十万行，读取时还要逐行还原成 Python 列表。
+
+紧凑格式（rank_packs 表）为每条新闻保存一个二进制 blob：
+- 每次抓取追加 4 字节：(抓取时间槽, 排名)，均为小端 uint16
+- 抓取时间槽 = 当天分钟数（HH-MM → HH * 60 + MM），无法解析时记为 UNKNOWN_SLOT
+- 追加在 SQL 中完成：ranks = CAST(ranks || ? AS BLOB)
+
+读取方统一使用 load_rank_map，同时兼容行格式与紧凑格式（可能在同一天切换）。
+"""
+
+import sqlite3
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# 排名历史存储格式
+RANK_FORMAT_ROWS = "rows"        # rank_history 表，每次抓取一行（默认）
+RANK_FORMAT_PACKED = "packed"    # rank_packs 表，每条新闻一个紧凑 blob
+RANK_FORMATS = (RANK_FORMAT_ROWS, RANK_FORMAT_PACKED)
+
+UNKNOWN_SLOT = 0xFFFF
+
+_ENTRY = struct.Struct("<HH")
+_NEEDS_BYTESWAP = sys.byteorder != "little"
+
+# 批量查询时每条 SQL 的最大参数个数
+_SQL_BATCH_SIZE = 500
+
+
+def normalize_rank_format(value: Optional[str]) -> str:
+    """规范化排名历史存储格式配置，未知值回退为行格式"""
+    value = (value or "").strip().lower()
+    return value if value in RANK_FORMATS else RANK_FORMAT_ROWS
+
+
+def crawl_time_to_slot(crawl_time: str) -> int:
+    """
+    将抓取时间转换为时间槽（当天分钟数）
+
+    Args:
+        crawl_time: 抓取时间（HH-MM 或 HH:MM）
+
+    Returns:
+        时间槽，无法解析时返回 UNKNOWN_SLOT
+    """
+    try:
+        hour, minute = int(crawl_time[0:2]), int(crawl_time[3:5])
+    except (TypeError, ValueError):
+        return UNKNOWN_SLOT
+    if 0 <= hour < 24 and 0 <= minute < 60:
+        return hour * 60 + minute
+    return UNKNOWN_SLOT
+
+
+def slot_to_crawl_time(slot: int) -> str:
+    """将时间槽还原为抓取时间（HH-MM），未知时间槽返回空字符串"""
+    if slot == UNKNOWN_SLOT:
+        return ""
+    return f"{slot // 60:02d}-{slot % 60:02d}"
+
+
+def encode_rank_entry(crawl_time: str, rank: int) -> bytes:
+    """
+    编码一条排名记录
+
+    Args:
+        crawl_time: 抓取时间
+        rank: 排名（超出 uint16 范围时截断到 65535）
+
+    Returns:
+        4 字节的紧凑记录
+    """
+    return _ENTRY.pack(crawl_time_to_slot(crawl_time), min(max(int(rank), 0), 0xFFFF))
+
+
+def _decode_array(blob: Optional[bytes]) -> array:
+    """将 blob 解码为扁平的 uint16 数组 [slot, rank, slot, rank, ...]"""
+    values = array("H")
+    if blob:
+        data = bytes(blob)
+        values.frombytes(data[:len(data) - len(data) % _ENTRY.size])
+        if _NEEDS_BYTESWAP:
+            values.byteswap()
+    return values
+
+
+def decode_ranks(blob: Optional[bytes], unique: bool = True) -> List[int]:
+    """
+    解码排名列表（按追加顺序，即抓取时间顺序）
+
+    Args:
+        blob: 紧凑格式的排名历史
+        unique: 是否去重（保留首次出现顺序）
+
+    Returns:
+        排名列表
+    """
+    ranks = _decode_array(blob)[1::2]
+    if unique:
+        return list(dict.fromkeys(ranks))
+    return ranks.tolist()
+
+
+def decode_rank_entries(blob: Optional[bytes]) -> List[Tuple[str, int]]:
+    """
+    解码完整的排名记录
+
+    Args:
+        blob: 紧凑格式的排名历史
+
+    Returns:
+        [(抓取时间 HH-MM, 排名), ...]
+    """
+    values = _decode_array(blob)
+    return [
+        (slot_to_crawl_time(values[i]), values[i + 1])
+        for i in range(0, len(values), 2)
+    ]
+
+
+def has_rank_packs(cursor: sqlite3.Cursor) -> bool:
+    """检查数据库中是否存在且使用了 rank_packs 表（兼容旧数据库）"""
+    cursor.execute("""
+        SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'rank_packs'
+    """)
+    if cursor.fetchone() is None:
+        return False
+    cursor.execute("SELECT 1 FROM rank_packs LIMIT 1")
+    return cursor.fetchone() is not None
+
+
+def append_rank_entries(
+    cursor: sqlite3.Cursor,
+    entries: Iterable[Tuple[int, int]],
+    crawl_time: str,
+    now_str: str,
+    rank_format: str = RANK_FORMAT_ROWS,
+) -> None:
+    """
+    批量写入一次抓取的排名历史
+
+    Args:
+        cursor: 数据库游标
+        entries: [(news_item_id, rank), ...]
+        crawl_time: 抓取时间
+        now_str: 当前时间字符串
+        rank_format: 存储格式（rows / packed）
+    """
+    entries = list(entries)
+    if not entries:
+        return
+
+    if rank_format == RANK_FORMAT_PACKED:
+        cursor.executemany("""
+            INSERT INTO rank_packs (news_item_id, ranks)
+            VALUES (?, ?)
+            ON CONFLICT(news_item_id) DO UPDATE SET
+                ranks = CAST(rank_packs.ranks || excluded.ranks AS BLOB)
+        """, [
+            (news_item_id, encode_rank_entry(crawl_time, rank))
+            for news_item_id, rank in entries
+        ])
+        return
+
+    cursor.executemany("""
+        INSERT INTO rank_history
+        (news_item_id, rank, crawl_time, created_at)
+        VALUES (?, ?, ?, ?)
+    """, [
+        (news_item_id, rank, crawl_time, now_str)
+        for news_item_id, rank in entries
+    ])
+
+
+def load_rank_map(
+    cursor: sqlite3.Cursor,
+    news_ids: List[int],
+    unique: bool = True,
+) -> Dict[int, List[int]]:
+    """
+    批量读取新闻的排名历史（兼容行格式与紧凑格式）
+
+    Args:
+        cursor: 数据库游标
+        news_ids: 新闻 ID 列表
+        unique: 是否去重（保留首次出现顺序）
+
+    Returns:
+        {news_item_id: [rank, ...]}，按抓取时间顺序
+    """
+    rank_map: Dict[int, List[int]] = {}
+    if not news_ids:
+        return rank_map
+
+    use_packs = has_rank_packs(cursor)
+
+    for i in range(0, len(news_ids), _SQL_BATCH_SIZE):
+        chunk = news_ids[i:i + _SQL_BATCH_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+
+        cursor.execute(f"""
+            SELECT news_item_id, rank FROM rank_history
+            WHERE news_item_id IN ({placeholders})
+            ORDER BY news_item_id, crawl_time
+        """, chunk)
+        for news_id, rank in cursor.fetchall():
+            rank_map.setdefault(news_id, []).append(rank)
+
+        if use_packs:
+            cursor.execute(f"""
+                SELECT news_item_id, ranks FROM rank_packs
+                WHERE news_item_id IN ({placeholders})
+            """, chunk)
+            for news_id, blob in cursor.fetchall():
+                rank_map.setdefault(news_id, []).extend(decode_ranks(blob, unique=False))
+
+    if unique:
+        for news_id, ranks in rank_map.items():
+            rank_map[news_id] = list(dict.fromkeys(ranks))
+
+    return rank_map
@@ -5,17 +5,36 @@
 支持 Cloudflare R2、阿里云 OSS、腾讯云 COS、AWS S3、MinIO 等
 使用 S3 兼容 API (boto3) 访问对象存储
 数据流程：下载当天 SQLite → 合并新数据 → 上传回远程
+
+复制模式：
+- full: 每次上传完整数据库文件
+- delta: 只上传本次改动的页（压缩的增量段，见 trendradar.storage.delta），
+  增量段积累到一定数量或大小后上传完整数据库并删除增量段（压实）
+
+今天之前的数据库可以压缩归档（{db_type}/{date}.db.zst 或 .db.gz，见 trendradar.storage.archive），
+读取时远程只有归档则下载后解压。
+
+启用后台上传时，数据库（或增量段）先写入本地持久化队列，由后台线程上传并在失败时重试
+（见 trendradar.storage.upload_queue），运行结束时 cleanup 等待队列清空。
+
+下载数据库时默认每次都下载完整基线和全部增量段（delta 模式只减少上传量）。
+配置基线缓存目录后，基线按 ETag 缓存在本地，远程基线未变化时只下载增量段；
+临时运行环境（如 GitHub Actions）需要在运行之间保留该目录（如 actions/cache）才有效果。
 """
 
+import hashlib
+import json
 import pytz
 import re
 import shutil
 import sys
 import tempfile
+import time
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 try:
     import boto3
@@ -28,7 +47,22 @@ except ImportError:
     BotoConfig = None
     ClientError = Exception
 
+from trendradar.storage.archive import (
+    ARCHIVE_SUFFIXES,
+    archive_db,
+    decompress_file,
+    discard_stale_copies,
+    find_archive,
+    resolve_db_path,
+)
 from trendradar.storage.base import StorageBackend, NewsItem, NewsData, RSSItem, RSSData
+from trendradar.storage.delta import build_segment, capture_state, replay_segments
+from trendradar.storage.rank_codec import (
+    append_rank_entries,
+    normalize_rank_format,
+)
+from trendradar.storage.snapshot import DaySnapshotCache, get_file_state
+from trendradar.storage.upload_queue import UploadEntry, UploadQueue
 from trendradar.utils.time import (
     get_configured_time,
     format_date_folder,
@@ -50,6 +84,27 @@ class RemoteStorageBackend(StorageBackend):
     - 运行结束后自动清理临时文件
     """
 
+    # 批量查询时每条 SQL 的最大参数个数（低于 SQLite 默认上限 999）
+    SQL_BATCH_SIZE = 500
+
+    # 复制模式
+    REPLICATION_MODES = ("full", "delta")
+
+    # 增量段总大小超过基线的该比例时压实
+    COMPACT_SIZE_RATIO = 0.5
+
+    # 大于该大小的对象按 Range 分段并发下载
+    MULTIPART_THRESHOLD = 16 * 1024 * 1024
+    MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+    MULTIPART_CONCURRENCY = 4
+
+    # 基线缓存中超过该天数未使用的文件在 cleanup 时删除
+    BASE_CACHE_MAX_AGE_DAYS = 2
+    BASE_CACHE_ETAG_SUFFIX = ".etag"
+
+    # 拉取清单（位于本地数据目录，记录每个数据库拉取时的远程 ETag 与本地文件状态）
+    PULL_MANIFEST = ".remote_manifest.json"
+
     def __init__(
         self,
         bucket_name: str,
@@ -61,6 +116,12 @@ class RemoteStorageBackend(StorageBackend):
         enable_html: bool = True,
         temp_dir: Optional[str] = None,
         timezone: str = "Asia/Shanghai",
+        rank_history_format: str = "rows",
+        replication: str = "full",
+        compact_segments: int = 24,
+        upload_queue_dir: Optional[str] = None,
+        upload_flush_timeout: float = 120,
+        base_cache_dir: Optional[str] = None,
     ):
         """
         初始化远程存储后端
@@ -75,6 +136,12 @@ class RemoteStorageBackend(StorageBackend):
             enable_html: 是否启用 HTML 报告
             temp_dir: 临时目录路径（默认使用系统临时目录）
             timezone: 时区配置（默认 Asia/Shanghai）
+            rank_history_format: 排名历史存储格式（rows: 每次抓取一行 / packed: 每条新闻一个紧凑 blob）
+            replication: 复制模式（full: 每次上传完整数据库 / delta: 只上传改动页）
+            compact_segments: delta 模式下增量段达到该数量时压实为完整数据库
+            upload_queue_dir: 后台上传队列目录（None 表示同步上传）
+            upload_flush_timeout: cleanup 时等待上传队列清空的最长秒数
+            base_cache_dir: 基线缓存目录（None 表示不缓存，每次下载完整基线）
         """
         if not HAS_BOTO3:
             raise ImportError("远程存储后端需要安装 boto3: pip install boto3")
@@ -85,6 +152,14 @@ class RemoteStorageBackend(StorageBackend):
         self.enable_txt = enable_txt
         self.enable_html = enable_html
         self.timezone = timezone
+        self.rank_format = normalize_rank_format(rank_history_format)
+
+        replication = str(replication or "full").lower()
+        if replication not in self.REPLICATION_MODES:
+            print(f"[远程存储] 未知的复制模式 '{replication}'，使用 full")
+            replication = "full"
+        self.replication = replication
+        self.compact_segments = max(1, int(compact_segments))
 
         # 创建临时目录
         self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.mkdtemp(prefix="trendradar_"))
@@ -118,7 +193,27 @@ class RemoteStorageBackend(StorageBackend):
         self._downloaded_files: List[Path] = []
         self._db_connections: Dict[str, sqlite3.Connection] = {}
 
-        print(f"[远程存储] 初始化完成，存储桶: {bucket_name}，签名版本: {signature_version}")
+        # 当日数据快照（get_today_all_data 增量读取）
+        self._day_snapshots = DaySnapshotCache()
+
+        # 已下载数据库的复制状态（本地路径 -> 远程基线之上的增量段信息）
+        self._replicas: Dict[str, Dict] = {}
+
+        # 后台上传队列（载入上次未完成的对象后立即开始上传）
+        self.upload_flush_timeout = upload_flush_timeout
+        self._upload_queue: Optional[UploadQueue] = None
+        # cleanup 时等待超时后仍未上传的对象数量
+        self.pending_uploads = 0
+        if upload_queue_dir:
+            self._upload_queue = UploadQueue(upload_queue_dir, self._process_upload)
+
+        # 基线缓存（对象键 -> 基线文件 + ETag），远程基线未变化时不再重复下载
+        self.base_cache_dir = Path(base_cache_dir) if base_cache_dir else None
+
+        print(
+            f"[远程存储] 初始化完成，存储桶: {bucket_name}，签名版本: {signature_version}，"
+            f"复制模式: {self.replication}，上传方式: {'后台队列' if self._upload_queue else '同步'}"
+        )
 
     @property
     def backend_name(self) -> str:
@@ -128,6 +223,11 @@ class RemoteStorageBackend(StorageBackend):
     def supports_txt(self) -> bool:
         return self.enable_txt
 
+    @property
+    def _sync_action(self) -> str:
+        """上传成功后的日志描述（后台上传时只是加入了队列）"""
+        return "加入上传队列" if self._upload_queue else "同步到远程存储"
+
     def _get_configured_time(self) -> datetime:
         """获取配置时区的当前时间"""
         return get_configured_time(self.timezone)
@@ -195,6 +295,328 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 检查对象存在性异常 ({r2_key}): {e}")
             return False
 
+    def _read_object(self, r2_key: str) -> bytes:
+        """
+        读取远程对象内容（iter_chunks 处理 chunked transfer encoding）
+
+        Args:
+            r2_key: 远程对象键
+
+        Returns:
+            对象内容
+        """
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=r2_key)
+        return b"".join(response['Body'].iter_chunks(chunk_size=1024*1024))
+
+    def _list_objects(self, prefix: str) -> Dict[str, Dict]:
+        """
+        列出前缀下的所有对象
+
+        Args:
+            prefix: 对象键前缀
+
+        Returns:
+            {对象键: {"etag": ETag, "size": 大小}}
+        """
+        objects = {}
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                objects[obj['Key']] = {"etag": obj.get('ETag', ''), "size": obj.get('Size', 0)}
+        return objects
+
+    def _filter_segment_keys(self, r2_key: str, remote_objects: Dict[str, Dict]) -> List[str]:
+        """从已列出的对象中筛选数据库的增量段对象键（按序号排列）"""
+        prefix = f"{r2_key}.delta/"
+        keys = [key for key in remote_objects if key.startswith(prefix) and re.fullmatch(r'\d+\.seg', key[len(prefix):])]
+        return sorted(keys, key=lambda key: int(key[len(prefix):-len(".seg")]))
+
+    def _list_segment_keys(self, r2_key: str) -> List[str]:
+        """
+        列出数据库的增量段对象键（按序号排列）
+
+        Args:
+            r2_key: 数据库对象键
+
+        Returns:
+            增量段对象键列表
+        """
+        return self._filter_segment_keys(r2_key, self._list_objects(f"{r2_key}.delta/"))
+
+    def _delete_objects(self, keys: List[str]) -> None:
+        """批量删除远程对象（每次最多 1000 个，失败只打印警告）"""
+        for i in range(0, len(keys), 1000):
+            batch = [{'Key': key} for key in keys[i:i + 1000]]
+            try:
+                self.s3_client.delete_objects(Bucket=self.bucket_name, Delete={'Objects': batch})
+            except Exception as e:
+                print(f"[远程存储] 删除对象失败: {e}")
+
+    def _download_ranged(self, r2_key: str, local_path: Path, size: int, etag: Optional[str]) -> None:
+        """
+        按 Range 分段并发下载大对象
+
+        各段携带 If-Match，下载期间对象被覆盖时请求失败，不会拼出新旧混合的文件。
+
+        Args:
+            r2_key: 远程对象键
+            local_path: 本地目标路径
+            size: 对象大小
+            etag: 对象 ETag（可选）
+        """
+        chunk_size = self.MULTIPART_CHUNK_SIZE
+        ranges = [(start, min(start + chunk_size, size) - 1) for start in range(0, size, chunk_size)]
+
+        with open(local_path, 'wb') as f:
+            f.truncate(size)
+
+        def fetch_range(byte_range: Tuple[int, int]) -> None:
+            start, end = byte_range
+            kwargs = {"Bucket": self.bucket_name, "Key": r2_key, "Range": f"bytes={start}-{end}"}
+            if etag:
+                kwargs["IfMatch"] = etag
+            response = self.s3_client.get_object(**kwargs)
+            with open(local_path, 'r+b') as f:
+                f.seek(start)
+                for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
+                    f.write(chunk)
+
+        with ThreadPoolExecutor(max_workers=min(self.MULTIPART_CONCURRENCY, len(ranges))) as executor:
+            for future in [executor.submit(fetch_range, byte_range) for byte_range in ranges]:
+                future.result()
+
+        if local_path.stat().st_size != size:
+            raise IOError(f"分段下载大小不一致: {r2_key}")
+
+    def _fetch_db(
+        self,
+        r2_key: str,
+        local_path: Path,
+        size: Optional[int] = None,
+        etag: Optional[str] = None,
+        segment_keys: Optional[List[str]] = None,
+    ) -> Optional[Dict]:
+        """
+        下载远程数据库基线并应用增量段
+
+        先写入临时文件，完成后再替换目标文件，中途失败不会留下不完整的数据库。
+        配置了基线缓存时，远程基线 ETag 与缓存一致则直接使用缓存，只下载增量段。
+
+        Args:
+            r2_key: 数据库对象键
+            local_path: 本地目标路径
+            size: 基线大小（已知时，超过阈值的大对象分段并发下载）
+            etag: 基线 ETag（分段下载时用于 If-Match，也用于比较基线缓存）
+            segment_keys: 增量段对象键（已列出时传入，避免重复 LIST）
+
+        Returns:
+            复制状态字典（增量段列表、下一个序号、基线大小、下载字节数），远程不存在返回 None
+        """
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = local_path.with_name(local_path.name + ".download")
+        cached = self._get_cached_base(r2_key)
+        base_downloaded = True
+
+        try:
+            if cached and etag is not None and cached[1] == etag:
+                base_downloaded = False
+            elif size is not None and size > self.MULTIPART_THRESHOLD:
+                self._download_ranged(r2_key, tmp_path, size, etag)
+            else:
+                # 使用 get_object + iter_chunks 替代 download_file
+                # iter_chunks 会自动处理 chunked transfer encoding
+                request = {"Bucket": self.bucket_name, "Key": r2_key}
+                if cached:
+                    # 基线未变化时远程返回 304，不传输内容
+                    request["IfNoneMatch"] = cached[1]
+                try:
+                    response = self.s3_client.get_object(**request)
+                except ClientError as e:
+                    if not cached or e.response.get("Error", {}).get("Code", "") not in ("304", "NotModified", "Not Modified"):
+                        raise
+                    response = None
+
+                if response is None:
+                    base_downloaded = False
+                else:
+                    etag = response.get("ETag", etag)
+                    with open(tmp_path, 'wb') as f:
+                        for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
+                            f.write(chunk)
+
+            if base_downloaded:
+                self._store_cached_base(r2_key, tmp_path, etag)
+            else:
+                shutil.copyfile(cached[0], tmp_path)
+                self._touch_cached_base(cached[0])
+                print(f"[远程存储] 基线未变化，使用缓存: {r2_key}")
+        except ClientError as e:
+            tmp_path.unlink(missing_ok=True)
+            error_code = e.response.get("Error", {}).get("Code", "")
+            # S3 兼容存储可能返回不同的错误码
+            if error_code in ("404", "NoSuchKey", "Not Found"):
+                # 已归档的日期只有压缩归档
+                if not r2_key.endswith(ARCHIVE_SUFFIXES):
+                    return self._fetch_archived_db(r2_key, local_path)
+                return None
+            raise
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        base_size = tmp_path.stat().st_size
+        segment_bytes = 0
+        try:
+            if segment_keys is None:
+                segment_keys = self._list_segment_keys(r2_key)
+            if segment_keys:
+                blobs = []
+                for key in segment_keys:
+                    try:
+                        blobs.append(self._read_object(key))
+                    except ClientError as e:
+                        # 列出后被压实删除的增量段
+                        if e.response.get("Error", {}).get("Code", "") not in ("404", "NoSuchKey", "Not Found"):
+                            raise
+                segment_bytes = sum(len(blob) for blob in blobs)
+                applied, skipped = replay_segments(tmp_path, blobs)
+                print(f"[远程存储] 已应用增量段: {r2_key}（应用 {applied} 个，跳过 {skipped} 个）")
+
+            tmp_path.replace(local_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        prefix_len = len(f"{r2_key}.delta/")
+        next_seq = int(segment_keys[-1][prefix_len:-len(".seg")]) + 1 if segment_keys else 1
+        return {
+            "segment_keys": segment_keys,
+            "segment_bytes": segment_bytes,
+            "next_seq": next_seq,
+            "base_size": base_size,
+            "downloaded_bytes": (base_size if base_downloaded else 0) + segment_bytes,
+        }
+
+    def _cached_base_paths(self, r2_key: str) -> Tuple[Path, Path]:
+        """基线缓存中对象键对应的 (基线文件, ETag 文件)"""
+        base_path = self.base_cache_dir / r2_key
+        return base_path, base_path.with_name(base_path.name + self.BASE_CACHE_ETAG_SUFFIX)
+
+    def _get_cached_base(self, r2_key: str) -> Optional[Tuple[Path, str]]:
+        """
+        读取基线缓存
+
+        Args:
+            r2_key: 数据库对象键
+
+        Returns:
+            (缓存的基线文件, 缓存时的远程 ETag)，未配置缓存或没有缓存返回 None
+        """
+        if not self.base_cache_dir:
+            return None
+        base_path, etag_path = self._cached_base_paths(r2_key)
+        try:
+            etag = etag_path.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        if not etag or not base_path.exists():
+            return None
+        return base_path, etag
+
+    def _store_cached_base(self, r2_key: str, source_path: Path, etag: Optional[str]) -> None:
+        """
+        写入基线缓存（失败只打印警告，不影响下载 / 上传）
+
+        Args:
+            r2_key: 数据库对象键
+            source_path: 与远程基线内容相同的本地文件
+            etag: 远程基线 ETag（未知时不缓存）
+        """
+        if not self.base_cache_dir or not etag:
+            return
+        base_path, etag_path = self._cached_base_paths(r2_key)
+        try:
+            base_path.parent.mkdir(parents=True, exist_ok=True)
+            # 先删除 ETag，写入中途失败不会留下与 ETag 不符的基线
+            etag_path.unlink(missing_ok=True)
+            tmp_path = base_path.with_name(base_path.name + ".tmp")
+            shutil.copyfile(source_path, tmp_path)
+            tmp_path.replace(base_path)
+            etag_path.write_text(etag, encoding="utf-8")
+        except OSError as e:
+            print(f"[远程存储] 写入基线缓存失败: {r2_key}: {e}")
+
+    def _touch_cached_base(self, base_path: Path) -> None:
+        """更新缓存文件的修改时间，避免仍在使用的基线被清理"""
+        try:
+            base_path.touch()
+            base_path.with_name(base_path.name + self.BASE_CACHE_ETAG_SUFFIX).touch()
+        except OSError:
+            pass
+
+    def _prune_base_cache(self) -> None:
+        """删除基线缓存中超过 BASE_CACHE_MAX_AGE_DAYS 天未使用的文件（通常是之前日期的数据库）"""
+        if not self.base_cache_dir or not self.base_cache_dir.exists():
+            return
+        cutoff = time.time() - self.BASE_CACHE_MAX_AGE_DAYS * 86400
+        removed = 0
+        for path in self.base_cache_dir.rglob("*"):
+            try:
+                if path.is_file() and path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            print(f"[远程存储] 已清理 {removed} 个过期的基线缓存文件")
+
+    def _fetch_archived_db(self, r2_key: str, local_path: Path) -> Optional[Dict]:
+        """
+        下载远程压缩归档并解压为数据库
+
+        Args:
+            r2_key: 数据库对象键（不含归档后缀）
+            local_path: 本地目标路径
+
+        Returns:
+            复制状态字典（同 _fetch_db，额外记录归档对象键），远程没有归档返回 None
+        """
+        for suffix in ARCHIVE_SUFFIXES:
+            archive_key = r2_key + suffix
+            archive_path = local_path.with_name(local_path.name + suffix)
+            replica = self._fetch_db(archive_key, archive_path, segment_keys=[])
+            if replica is None:
+                continue
+
+            tmp_path = local_path.with_name(local_path.name + ".download")
+            try:
+                decompress_file(archive_path, tmp_path)
+                tmp_path.replace(local_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+                archive_path.unlink(missing_ok=True)
+
+            print(f"[远程存储] 已解压归档: {archive_key}")
+            replica["base_size"] = local_path.stat().st_size
+            replica["archive_key"] = archive_key
+            return replica
+
+        return None
+
+    def download_db(self, date: str, db_type: str, local_path: Path) -> bool:
+        """
+        下载指定日期的完整数据库（基线 + 增量段）到本地
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD）
+            db_type: 数据库类型 ("news" 或 "rss")
+            local_path: 本地目标路径
+
+        Returns:
+            远程存在且下载成功返回 True，远程不存在返回 False
+        """
+        return self._fetch_db(f"{db_type}/{date}.db", Path(local_path)) is not None
+
     def _download_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> Optional[Path]:
         """
         从远程存储下载当天的 SQLite 文件到本地临时目录
@@ -212,40 +634,39 @@ class RemoteStorageBackend(StorageBackend):
         r2_key = self._get_remote_db_key(date, db_type)
         local_path = self._get_local_db_path(date, db_type)
 
-        # 确保目录存在
-        local_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # 先检查文件是否存在
-        if not self._check_object_exists(r2_key):
-            print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
-            return None
+        # 先等待该数据库在队列中的上传完成，否则会下载到旧版本
+        if self._upload_queue and not self._upload_queue.wait(r2_key, timeout=self.upload_flush_timeout):
+            print(f"[远程存储] 警告: {r2_key} 仍有未完成的上传，下载的可能不是最新版本")
 
         try:
-            # 使用 get_object + iter_chunks 替代 download_file
-            # iter_chunks 会自动处理 chunked transfer encoding
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=r2_key)
-            with open(local_path, 'wb') as f:
-                for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
-                    f.write(chunk)
-            self._downloaded_files.append(local_path)
-            print(f"[远程存储] 已下载: {r2_key} -> {local_path}")
-            return local_path
+            replica = self._fetch_db(r2_key, local_path)
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
-            # S3 兼容存储可能返回不同的错误码
-            if error_code in ("404", "NoSuchKey", "Not Found"):
-                print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
-                return None
-            else:
-                print(f"[远程存储] 下载失败 (错误码: {error_code}): {e}")
-                raise
+            print(f"[远程存储] 下载失败 (错误码: {error_code}): {e}")
+            raise
         except Exception as e:
             print(f"[远程存储] 下载异常: {e}")
             raise
 
+        if replica is None:
+            print(f"[远程存储] 文件不存在，将创建新数据库: {r2_key}")
+            return None
+
+        # delta 模式记录下载后的文件状态，上传时只发送之后改动的页
+        if self.replication == "delta":
+            replica["state"] = capture_state(local_path)
+        self._replicas[str(local_path)] = replica
+
+        self._downloaded_files.append(local_path)
+        print(f"[远程存储] 已下载: {r2_key} -> {local_path}")
+        return local_path
+
     def _upload_sqlite(self, date: Optional[str] = None, db_type: str = "news") -> bool:
         """
-        上传本地 SQLite 文件到远程存储
+        上传本地 SQLite 文件到远程存储（启用后台上传时加入上传队列）
+
+        delta 模式下只上传改动页组成的增量段；远程还没有基线（含只有压缩归档）
+        或增量段需要压实时上传完整文件。
 
         Args:
             date: 日期字符串
@@ -261,38 +682,168 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 本地文件不存在，无法上传: {local_path}")
             return False
 
+        replica = self._replicas.get(str(local_path))
+
         try:
-            # 获取本地文件大小
-            local_size = local_path.stat().st_size
-            print(f"[远程存储] 准备上传: {local_path} ({local_size} bytes) -> {r2_key}")
+            if (
+                self.replication == "delta"
+                and replica is not None
+                and replica.get("state") is not None
+                and not replica.get("archive_key")
+                and not self._should_compact(replica)
+            ):
+                return self._upload_segment(local_path, r2_key, replica)
+            return self._upload_full(local_path, r2_key, replica)
 
-            # 读取文件内容为 bytes 后上传
-            # 避免传入文件对象时 requests 库使用 chunked transfer encoding
-            # 腾讯云 COS 等 S3 兼容服务可能无法正确处理 chunked encoding
-            with open(local_path, 'rb') as f:
-                file_content = f.read()
-
-            # 使用 put_object 并明确设置 ContentLength，确保不使用 chunked encoding
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=r2_key,
-                Body=file_content,
-                ContentLength=local_size,
-                ContentType='application/x-sqlite3',
+        except Exception as e:
+            print(f"[远程存储] 上传失败: {e}")
+            return False
+
+    def _should_compact(self, replica: Dict) -> bool:
+        """增量段数量或总大小超过阈值时压实为完整数据库"""
+        return (
+            len(replica["segment_keys"]) >= self.compact_segments
+            or replica["segment_bytes"] > replica["base_size"] * self.COMPACT_SIZE_RATIO
+        )
+
+    def _upload_full(self, local_path: Path, r2_key: str, replica: Optional[Dict]) -> bool:
+        """
+        上传完整数据库文件，并删除已被新基线覆盖的增量段
+
+        Args:
+            local_path: 本地数据库路径
+            r2_key: 远程对象键
+            replica: 当前复制状态（无则为 None）
+
+        Returns:
+            是否上传成功
+        """
+        # 获取本地文件大小
+        local_size = local_path.stat().st_size
+
+        # 新基线已包含所有增量段的内容；序号继续递增，避免与未删除的旧段重名
+        stale_keys = replica["segment_keys"] if replica else []
+        # 写入了已归档的日期：未压缩数据库优先读取，旧归档不再需要
+        if replica and replica.get("archive_key"):
+            stale_keys = stale_keys + [replica["archive_key"]]
+
+        if self._upload_queue:
+            # 复制当前文件到队列，上传成功后再删除被覆盖的对象
+            self._upload_queue.enqueue(
+                r2_key, local_path, content_type='application/x-sqlite3', delete_keys=stale_keys
             )
+            print(f"[远程存储] 已加入上传队列: {local_path} ({local_size} bytes) -> {r2_key}")
+        else:
+            print(f"[远程存储] 准备上传: {local_path} ({local_size} bytes) -> {r2_key}")
+            with open(local_path, 'rb') as f:
+                etag = self._put_object(r2_key, f.read(), 'application/x-sqlite3')
             print(f"[远程存储] 已上传: {local_path} -> {r2_key}")
+            # 新基线就是本地文件，下次运行无需重新下载
+            self._store_cached_base(r2_key, local_path, etag)
+            if stale_keys:
+                self._delete_objects(stale_keys)
+                print(f"[远程存储] 已删除 {len(stale_keys)} 个被新基线覆盖的对象: {r2_key}")
+
+        self._replicas[str(local_path)] = {
+            "segment_keys": [],
+            "segment_bytes": 0,
+            "next_seq": replica["next_seq"] if replica else 1,
+            "base_size": local_size,
+            "state": capture_state(local_path) if self.replication == "delta" else None,
+        }
+        return True
 
-            # 验证上传成功
-            if self._check_object_exists(r2_key):
-                print(f"[远程存储] 上传验证成功: {r2_key}")
-                return True
-            else:
-                print(f"[远程存储] 上传验证失败: 文件未在远程存储中找到")
-                return False
+    def _upload_segment(self, local_path: Path, r2_key: str, replica: Dict) -> bool:
+        """
+        上传自上次复制以来改动页组成的增量段
 
-        except Exception as e:
-            print(f"[远程存储] 上传失败: {e}")
-            return False
+        Args:
+            local_path: 本地数据库路径
+            r2_key: 远程对象键
+            replica: 当前复制状态
+
+        Returns:
+            是否上传成功
+        """
+        segment, new_state, page_count = build_segment(local_path, replica["state"])
+        if not segment:
+            print(f"[远程存储] 数据库无变化，跳过上传: {r2_key}")
+            return True
+
+        segment_key = f"{r2_key}.delta/{replica['next_seq']:06d}.seg"
+        if self._upload_queue:
+            # 同一数据库的增量段按顺序上传，排在之前入队的基线之后
+            self._upload_queue.enqueue(segment_key, segment, group=r2_key)
+        else:
+            self._put_object(segment_key, segment, 'application/octet-stream')
+
+        replica["segment_keys"].append(segment_key)
+        replica["segment_bytes"] += len(segment)
+        replica["next_seq"] += 1
+        replica["state"] = new_state
+        action = "已加入上传队列" if self._upload_queue else "已上传"
+        print(f"[远程存储] 增量段{action}: {segment_key}（{page_count} 页，{len(segment)} bytes）")
+        return True
+
+    def _put_object(self, r2_key: str, body: bytes, content_type: str) -> Optional[str]:
+        """
+        上传对象内容
+
+        传入 bytes 并明确设置 ContentLength，避免传入文件对象时使用 chunked transfer encoding
+        （腾讯云 COS 等 S3 兼容服务可能无法正确处理）；put_object 失败会抛出异常，无需再用 HEAD 验证。
+
+        Args:
+            r2_key: 远程对象键
+            body: 对象内容
+            content_type: 内容类型
+
+        Returns:
+            上传后对象的 ETag（服务商未返回时为 None）
+        """
+        response = self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=r2_key,
+            Body=body,
+            ContentLength=len(body),
+            ContentType=content_type,
+        )
+        return (response or {}).get("ETag")
+
+    def _process_upload(self, entry: UploadEntry) -> None:
+        """
+        上传队列中的一个对象（后台线程调用，失败时抛出异常由队列重试）
+
+        Args:
+            entry: 队列条目
+        """
+        with open(entry.data_path, 'rb') as f:
+            body = f.read()
+        etag = self._put_object(entry.key, body, entry.content_type)
+        print(f"[远程存储] 后台上传完成: {entry.key} ({len(body)} bytes)")
+        if entry.content_type == 'application/x-sqlite3':
+            self._store_cached_base(entry.key, entry.data_path, etag)
+
+        if entry.delete_keys:
+            self._delete_objects(entry.delete_keys)
+            print(f"[远程存储] 已删除 {len(entry.delete_keys)} 个被新基线覆盖的对象: {entry.key}")
+
+    def flush_uploads(self, timeout: Optional[float] = None) -> bool:
+        """
+        等待后台上传队列清空（未启用后台上传时直接返回）
+
+        Args:
+            timeout: 最长等待秒数（默认使用 upload_flush_timeout）
+
+        Returns:
+            是否全部上传完成（未完成的对象保留在队列目录中，下次运行继续上传）
+        """
+        if not self._upload_queue:
+            return True
+        pending = self._upload_queue.pending_count()
+        if pending:
+            print(f"[远程存储] 等待后台上传队列完成（{pending} 个对象）...")
+        self.pending_uploads = self._upload_queue.close(self.upload_flush_timeout if timeout is None else timeout)
+        return self.pending_uploads == 0
 
     def _get_connection(self, date: Optional[str] = None, db_type: str = "news") -> sqlite3.Connection:
         """
@@ -356,6 +907,241 @@ class RemoteStorageBackend(StorageBackend):
 
         conn.commit()
 
+    def _save_source_items(
+        self,
+        cursor: sqlite3.Cursor,
+        source_id: str,
+        news_list: List[NewsItem],
+        crawl_time: str,
+        now_str: str,
+    ) -> Tuple[int, int, int]:
+        """
+        批量写入单个来源的新闻条目（以标准化 URL + platform_id 为唯一标识）
+
+        流程：预先标准化 URL → 一次查询已有记录 → executemany 写入 news_items
+        （INSERT ... ON CONFLICT / UPDATE）→ 批量写入排名历史 / title_changes。结果与逐条处理一致：
+        同批次内重复出现的 URL 视为更新，URL 为空的条目直接插入（不做去重）。
+
+        Args:
+            cursor: 数据库游标
+            source_id: 来源ID
+            news_list: 新闻条目列表
+            crawl_time: 抓取时间
+            now_str: 当前时间字符串
+
+        Returns:
+            (新增数, 更新数, 标题变更数) 元组
+        """
+        if not news_list:
+            return 0, 0, 0
+
+        # 标准化 URL（去除动态参数，如微博的 band_rank）
+        entries = [
+            (item, normalize_url(item.url, source_id) if item.url else "")
+            for item in news_list
+        ]
+
+        # 一次性查询已存在的记录
+        item_ids = self._lookup_news_ids(cursor, source_id, [url for _, url in entries if url])
+        current_titles = {url: title for url, (_, title) in item_ids.items()}
+
+        # 按原顺序推演新增 / 更新 / 标题变更
+        insert_entries = []
+        update_entries = []
+        title_changes = []
+        for item, url in entries:
+            if url and url in current_titles:
+                if current_titles[url] != item.title:
+                    title_changes.append((url, current_titles[url], item.title))
+                update_entries.append((item, url))
+            else:
+                insert_entries.append((item, url))
+            if url:
+                current_titles[url] = item.title
+
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM news_items")
+        max_id_before = cursor.fetchone()[0]
+
+        # 批量插入新记录（存储标准化后的 URL）
+        # 只对首次出现的 URL 插入，冲突分支仅作兜底，避免 upsert 消耗自增 ID
+        cursor.executemany("""
+            INSERT INTO news_items
+            (title, platform_id, rank, url, mobile_url,
+             first_crawl_time, last_crawl_time, crawl_count,
+             created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+            ON CONFLICT(url, platform_id) WHERE url != '' DO UPDATE SET
+                title = excluded.title,
+                rank = excluded.rank,
+                mobile_url = excluded.mobile_url,
+                last_crawl_time = excluded.last_crawl_time,
+                crawl_count = crawl_count + 1,
+                updated_at = excluded.updated_at
+        """, [
+            (item.title, source_id, item.rank, url, item.mobile_url,
+             crawl_time, crawl_time, now_str, now_str)
+            for item, url in insert_entries
+        ])
+
+        # 补齐新插入记录的 ID
+        new_urls = [url for _, url in insert_entries if url]
+        item_ids.update(self._lookup_news_ids(cursor, source_id, new_urls))
+
+        cursor.execute("""
+            SELECT id FROM news_items
+            WHERE id > ? AND platform_id = ? AND url = ''
+            ORDER BY id
+        """, (max_id_before, source_id))
+        empty_url_ids = iter([row[0] for row in cursor.fetchall()])
+
+        # 批量更新已有记录
+        cursor.executemany("""
+            UPDATE news_items SET
+                title = ?,
+                rank = ?,
+                mobile_url = ?,
+                last_crawl_time = ?,
+                crawl_count = crawl_count + 1,
+                updated_at = ?
+            WHERE id = ?
+        """, [
+            (item.title, item.rank, item.mobile_url, crawl_time, now_str, item_ids[url][0])
+            for item, url in update_entries
+        ])
+
+        # 批量记录排名历史
+        rank_entries = []
+        for item, url in entries:
+            news_item_id = item_ids[url][0] if url else next(empty_url_ids)
+            rank_entries.append((news_item_id, item.rank))
+        append_rank_entries(cursor, rank_entries, crawl_time, now_str, self.rank_format)
+
+        # 批量记录标题变更
+        if title_changes:
+            cursor.executemany("""
+                INSERT INTO title_changes
+                (news_item_id, old_title, new_title, changed_at)
+                VALUES (?, ?, ?, ?)
+            """, [
+                (item_ids[url][0], old_title, new_title, now_str)
+                for url, old_title, new_title in title_changes
+            ])
+
+        return len(insert_entries), len(update_entries), len(title_changes)
+
+    def _lookup_news_ids(
+        self, cursor: sqlite3.Cursor, source_id: str, urls: List[str]
+    ) -> Dict[str, Tuple[int, str]]:
+        """
+        按标准化 URL 批量查询已有新闻记录
+
+        Args:
+            cursor: 数据库游标
+            source_id: 来源ID
+            urls: 标准化后的 URL 列表
+
+        Returns:
+            {url: (id, title)}
+        """
+        result: Dict[str, Tuple[int, str]] = {}
+        unique_urls = list(dict.fromkeys(urls))
+        for i in range(0, len(unique_urls), self.SQL_BATCH_SIZE):
+            chunk = unique_urls[i:i + self.SQL_BATCH_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"""
+                SELECT id, url, title FROM news_items
+                WHERE platform_id = ? AND url IN ({placeholders})
+            """, [source_id] + chunk)
+            for row in cursor.fetchall():
+                result[row[1]] = (row[0], row[2])
+        return result
+
+    def _get_fast_path_sources(self, cursor: sqlite3.Cursor, data: NewsData) -> Dict[str, str]:
+        """
+        找出可走快速路径的来源（本次响应摘要与上次入库时一致）
+
+        Args:
+            cursor: 数据库游标
+            data: 新闻数据
+
+        Returns:
+            {platform_id: 上次入库的抓取时间}
+        """
+        if not data.unchanged_ids:
+            return {}
+
+        cursor.execute("SELECT platform_id, digest, crawl_time FROM platform_digests")
+        stored = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
+        sources = {}
+        for source_id in data.unchanged_ids:
+            digest = data.digests.get(source_id)
+            record = stored.get(source_id)
+            # 同一抓取时间重复写入时不走快速路径，避免重复记录排名
+            if digest and record and record[0] == digest and record[1] != data.crawl_time:
+                sources[source_id] = record[1]
+        return sources
+
+    def _carry_forward_source(
+        self,
+        cursor: sqlite3.Cursor,
+        source_id: str,
+        news_list: List[NewsItem],
+        prev_crawl_time: str,
+        crawl_time: str,
+        now_str: str,
+    ) -> int:
+        """
+        将未变化来源上次抓取的记录续写到本次抓取（批量 SQL，不逐条比对）
+
+        仅处理带 URL 的条目；URL 为空的条目本来就不去重，仍按常规逻辑插入。
+        只有上次入库的记录与本次响应逐条一致（标准化 URL 不重复，标题、排名、移动端 URL
+        相同）时才续写，结果与常规逻辑完全相同；否则返回 0 由调用方走常规逻辑
+        （如同一 URL 出现多次时，常规逻辑会多次计数并记录标题变更）。
+
+        Args:
+            cursor: 数据库游标
+            source_id: 来源ID
+            news_list: 本次响应的新闻条目
+            prev_crawl_time: 上次入库的抓取时间
+            crawl_time: 本次抓取时间
+            now_str: 当前时间字符串
+
+        Returns:
+            续写的条目数（0 表示未命中，调用方应回退到逐条处理）
+        """
+        expected = {}
+        for item in news_list:
+            if not item.url:
+                continue
+            url = normalize_url(item.url, source_id)
+            if url in expected:
+                return 0
+            expected[url] = (item.title, item.rank, item.mobile_url or "")
+
+        cursor.execute("""
+            SELECT id, url, title, rank, mobile_url FROM news_items
+            WHERE platform_id = ? AND last_crawl_time = ? AND url != ''
+        """, (source_id, prev_crawl_time))
+        rows = cursor.fetchall()
+        if not rows or len(rows) != len(expected):
+            return 0
+        for row in rows:
+            if expected.get(row[1]) != (row[2], row[3], row[4] or ""):
+                return 0
+
+        append_rank_entries(
+            cursor, [(row[0], row[3]) for row in rows], crawl_time, now_str, self.rank_format
+        )
+        cursor.execute("""
+            UPDATE news_items SET
+                last_crawl_time = ?,
+                crawl_count = crawl_count + 1,
+                updated_at = ?
+            WHERE platform_id = ? AND last_crawl_time = ? AND url != ''
+        """, (crawl_time, now_str, source_id, prev_crawl_time))
+        return cursor.rowcount
+
     def save_news_data(self, data: NewsData) -> bool:
         """
         保存新闻数据到远程存储（以 URL 为唯一标识，支持标题更新检测）
@@ -398,97 +1184,36 @@ class RemoteStorageBackend(StorageBackend):
             title_changed_count = 0
             success_sources = []
 
+            # 响应未变化的来源：批量续写上次的记录，跳过逐条比对
+            fast_path_sources = self._get_fast_path_sources(cursor, data)
+
             for source_id, news_list in data.items.items():
                 success_sources.append(source_id)
 
-                for item in news_list:
-                    try:
-                        # 标准化 URL（去除动态参数，如微博的 band_rank）
-                        normalized_url = normalize_url(item.url, source_id) if item.url else ""
+                try:
+                    cursor.execute("SAVEPOINT save_source")
 
-                        # 检查是否已存在（通过标准化 URL + platform_id）
-                        if normalized_url:
-                            cursor.execute("""
-                                SELECT id, title FROM news_items
-                                WHERE url = ? AND platform_id = ?
-                            """, (normalized_url, source_id))
-                            existing = cursor.fetchone()
-
-                            if existing:
-                                # 已存在，更新记录
-                                existing_id, existing_title = existing
-
-                                # 检查标题是否变化
-                                if existing_title != item.title:
-                                    # 记录标题变更
-                                    cursor.execute("""
-                                        INSERT INTO title_changes
-                                        (news_item_id, old_title, new_title, changed_at)
-                                        VALUES (?, ?, ?, ?)
-                                    """, (existing_id, existing_title, item.title, now_str))
-                                    title_changed_count += 1
-
-                                # 记录排名历史
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (existing_id, item.rank, data.crawl_time, now_str))
-
-                                # 更新现有记录
-                                cursor.execute("""
-                                    UPDATE news_items SET
-                                        title = ?,
-                                        rank = ?,
-                                        mobile_url = ?,
-                                        last_crawl_time = ?,
-                                        crawl_count = crawl_count + 1,
-                                        updated_at = ?
-                                    WHERE id = ?
-                                """, (item.title, item.rank, item.mobile_url,
-                                      data.crawl_time, now_str, existing_id))
-                                updated_count += 1
-                            else:
-                                # 不存在，插入新记录（存储标准化后的 URL）
-                                cursor.execute("""
-                                    INSERT INTO news_items
-                                    (title, platform_id, rank, url, mobile_url,
-                                     first_crawl_time, last_crawl_time, crawl_count,
-                                     created_at, updated_at)
-                                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                                """, (item.title, source_id, item.rank, normalized_url,
-                                      item.mobile_url, data.crawl_time, data.crawl_time,
-                                      now_str, now_str))
-                                new_id = cursor.lastrowid
-                                # 记录初始排名
-                                cursor.execute("""
-                                    INSERT INTO rank_history
-                                    (news_item_id, rank, crawl_time, created_at)
-                                    VALUES (?, ?, ?, ?)
-                                """, (new_id, item.rank, data.crawl_time, now_str))
-                                new_count += 1
-                        else:
-                            # URL 为空的情况，直接插入（不做去重）
-                            cursor.execute("""
-                                INSERT INTO news_items
-                                (title, platform_id, rank, url, mobile_url,
-                                 first_crawl_time, last_crawl_time, crawl_count,
-                                 created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                            """, (item.title, source_id, item.rank, "",
-                                  item.mobile_url, data.crawl_time, data.crawl_time,
-                                  now_str, now_str))
-                            new_id = cursor.lastrowid
-                            # 记录初始排名
-                            cursor.execute("""
-                                INSERT INTO rank_history
-                                (news_item_id, rank, crawl_time, created_at)
-                                VALUES (?, ?, ?, ?)
-                            """, (new_id, item.rank, data.crawl_time, now_str))
-                            new_count += 1
-
-                    except sqlite3.Error as e:
-                        print(f"[远程存储] 保存新闻条目失败 [{item.title[:30]}...]: {e}")
+                    fast_count = 0
+                    if source_id in fast_path_sources:
+                        fast_count = self._carry_forward_source(
+                            cursor, source_id, news_list, fast_path_sources[source_id],
+                            data.crawl_time, now_str
+                        )
+                        # 快速路径已处理所有带 URL 的条目
+                        if fast_count > 0:
+                            news_list = [item for item in news_list if not item.url]
+
+                    source_new, source_updated, source_changed = self._save_source_items(
+                        cursor, source_id, news_list, data.crawl_time, now_str
+                    )
+                    cursor.execute("RELEASE SAVEPOINT save_source")
+                    new_count += source_new
+                    updated_count += source_updated + fast_count
+                    title_changed_count += source_changed
+                except sqlite3.Error as e:
+                    cursor.execute("ROLLBACK TO SAVEPOINT save_source")
+                    cursor.execute("RELEASE SAVEPOINT save_source")
+                    print(f"[远程存储] 保存新闻条目失败 [{source_id}]: {e}")
 
             total_items = new_count + updated_count
 
@@ -529,7 +1254,24 @@ class RemoteStorageBackend(StorageBackend):
                         VALUES (?, ?, 'failed')
                     """, (crawl_record_id, failed_id))
 
+            # 记录成功来源的响应摘要
+            digest_rows = [
+                (source_id, data.digests[source_id], data.crawl_time, now_str)
+                for source_id in success_sources
+                if data.digests.get(source_id)
+            ]
+            if digest_rows:
+                cursor.executemany("""
+                    INSERT INTO platform_digests (platform_id, digest, crawl_time, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(platform_id) DO UPDATE SET
+                        digest = excluded.digest,
+                        crawl_time = excluded.crawl_time,
+                        updated_at = excluded.updated_at
+                """, digest_rows)
+
             conn.commit()
+            self._day_snapshots.invalidate(str(self._get_local_db_path(data.date)))
 
             # 查询合并后的总记录数
             cursor.execute("SELECT COUNT(*) as count FROM news_items")
@@ -547,7 +1289,7 @@ class RemoteStorageBackend(StorageBackend):
 
             # 上传到远程存储
             if self._upload_sqlite(data.date):
-                print(f"[远程存储] 数据已同步到远程存储")
+                print(f"[远程存储] 数据已{self._sync_action}")
                 return True
             else:
                 print(f"[远程存储] 上传远程存储失败")
@@ -561,101 +1303,13 @@ class RemoteStorageBackend(StorageBackend):
         """获取指定日期的所有新闻数据（合并后）"""
         try:
             conn = self._get_connection(date)
-            cursor = conn.cursor()
-
-            # 获取所有新闻数据（包含 id 用于查询排名历史）
-            cursor.execute("""
-                SELECT n.id, n.title, n.platform_id, p.name as platform_name,
-                       n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
-                FROM news_items n
-                LEFT JOIN platforms p ON n.platform_id = p.id
-                ORDER BY n.platform_id, n.last_crawl_time
-            """)
-
-            rows = cursor.fetchall()
-            if not rows:
-                return None
-
-            # 收集所有 news_item_id
-            news_ids = [row[0] for row in rows]
-
-            # 批量查询排名历史
-            rank_history_map: Dict[int, List[int]] = {}
-            if news_ids:
-                placeholders = ",".join("?" * len(news_ids))
-                cursor.execute(f"""
-                    SELECT news_item_id, rank FROM rank_history
-                    WHERE news_item_id IN ({placeholders})
-                    ORDER BY news_item_id, crawl_time
-                """, news_ids)
-                for rh_row in cursor.fetchall():
-                    news_id, rank = rh_row[0], rh_row[1]
-                    if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
-                    if rank not in rank_history_map[news_id]:
-                        rank_history_map[news_id].append(rank)
-
-            # 按 platform_id 分组
-            items: Dict[str, List[NewsItem]] = {}
-            id_to_name: Dict[str, str] = {}
-            crawl_date = self._format_date_folder(date)
-
-            for row in rows:
-                news_id = row[0]
-                platform_id = row[2]
-                title = row[1]
-                platform_name = row[3] or platform_id
-
-                id_to_name[platform_id] = platform_name
-
-                if platform_id not in items:
-                    items[platform_id] = []
-
-                # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
-
-                items[platform_id].append(NewsItem(
-                    title=title,
-                    source_id=platform_id,
-                    source_name=platform_name,
-                    rank=row[4],
-                    url=row[5] or "",
-                    mobile_url=row[6] or "",
-                    crawl_time=row[8],  # last_crawl_time
-                    ranks=ranks,
-                    first_time=row[7],  # first_crawl_time
-                    last_time=row[8],   # last_crawl_time
-                    count=row[9],       # crawl_count
-                ))
-
-            final_items = items
-
-            # 获取失败的来源
-            cursor.execute("""
-                SELECT DISTINCT css.platform_id
-                FROM crawl_source_status css
-                JOIN crawl_records cr ON css.crawl_record_id = cr.id
-                WHERE css.status = 'failed'
-            """)
-            failed_ids = [row[0] for row in cursor.fetchall()]
-
-            # 获取最新的抓取时间
-            cursor.execute("""
-                SELECT crawl_time FROM crawl_records
-                ORDER BY crawl_time DESC
-                LIMIT 1
-            """)
 
-            time_row = cursor.fetchone()
-            crawl_time = time_row[0] if time_row else self._format_time_filename()
+            # 进程内快照：首次全量加载，之后只同步增量
+            snapshot = self._day_snapshots.get(str(self._get_local_db_path(date)))
+            snapshot.sync(conn)
 
-            return NewsData(
-                date=crawl_date,
-                crawl_time=crawl_time,
-                items=final_items,
-                id_to_name=id_to_name,
-                failed_ids=failed_ids,
+            return snapshot.to_news_data(
+                self._format_date_folder(date), self._format_time_filename()
             )
 
         except Exception as e:
@@ -729,68 +1383,254 @@ class RemoteStorageBackend(StorageBackend):
                 WHERE cr.crawl_time = ? AND css.status = 'failed'
             """, (latest_time,))
 
-            failed_ids = [row[0] for row in cursor.fetchall()]
+            failed_ids = [row[0] for row in cursor.fetchall()]
+
+            return NewsData(
+                date=crawl_date,
+                crawl_time=latest_time,
+                items=items,
+                id_to_name=id_to_name,
+                failed_ids=failed_ids,
+            )
+
+        except Exception as e:
+            print(f"[远程存储] 获取最新数据失败: {e}")
+            return None
+
+    def detect_new_titles(self, current_data: NewsData) -> Dict[str, Dict]:
+        """
+        检测新增的标题
+
+        该方法比较当前抓取数据与历史数据，找出新增的标题。
+        关键逻辑：只有在历史批次中从未出现过的标题才算新增。
+        直接在 SQLite 中按 (platform_id, title, first_crawl_time) 索引查询，
+        开销与当前批次大小成正比，而不是当天的全部数据。
+
+        Args:
+            current_data: 当前抓取的数据
+
+        Returns:
+            新增的标题数据 {source_id: {title: NewsItem}}
+        """
+        all_new = {
+            source_id: {item.title: item for item in news_list}
+            for source_id, news_list in current_data.items.items()
+        }
+
+        try:
+            conn = self._get_connection(current_data.date)
+            cursor = conn.cursor()
+
+            # 没有历史数据，所有都是新的
+            cursor.execute("SELECT 1 FROM news_items LIMIT 1")
+            if cursor.fetchone() is None:
+                return all_new
+
+            # 获取当前批次时间
+            current_time = current_data.crawl_time
+
+            # 检查是否有历史数据（first_time < current_time 的标题）
+            if not self._has_titles_before(cursor, current_time):
+                # 第一次抓取，没有"新增"概念
+                return {}
+
+            # 收集历史标题（只查询当前批次中的标题）
+            # 同一标题因 URL 变化而产生多条记录时，任一条早于当前批次即视为历史标题
+            historical_titles = self._query_historical_titles(
+                cursor,
+                {
+                    source_id: [item.title for item in news_list]
+                    for source_id, news_list in current_data.items.items()
+                },
+                current_time,
+            )
+
+            # 检测新增
+            new_titles = {}
+            for source_id, news_list in current_data.items.items():
+                hist_set = historical_titles.get(source_id, set())
+                for item in news_list:
+                    if item.title not in hist_set:
+                        if source_id not in new_titles:
+                            new_titles[source_id] = {}
+                        new_titles[source_id][item.title] = item
+
+            return new_titles
+
+        except Exception as e:
+            print(f"[远程存储] 检测新标题失败: {e}")
+            return {}
+
+    def has_titles_before(
+        self,
+        before_time: str,
+        date: Optional[str] = None,
+        platform_ids: Optional[List[str]] = None,
+    ) -> bool:
+        """
+        检查是否存在首次抓取时间早于指定时间的新闻（即是否有历史批次）
+
+        Args:
+            before_time: 抓取时间（HH-MM）
+            date: 日期字符串，默认为今天
+            platform_ids: 限定的平台ID列表，None 表示所有平台
+
+        Returns:
+            是否存在历史新闻
+        """
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+            return self._has_titles_before(cursor, before_time, platform_ids)
+
+        except Exception as e:
+            print(f"[远程存储] 查询历史标题失败: {e}")
+            return False
 
-            return NewsData(
-                date=crawl_date,
-                crawl_time=latest_time,
-                items=items,
-                id_to_name=id_to_name,
-                failed_ids=failed_ids,
-            )
+    def get_historical_titles(
+        self,
+        titles_by_source: Dict[str, List[str]],
+        before_time: str,
+        date: Optional[str] = None,
+    ) -> Optional[Dict[str, Set[str]]]:
+        """
+        找出给定标题中首次抓取时间早于指定时间的标题（历史标题）
+
+        Args:
+            titles_by_source: 待检查的标题 {source_id: [title, ...]}
+            before_time: 抓取时间（HH-MM）
+            date: 日期字符串，默认为今天
+
+        Returns:
+            {source_id: 历史标题集合}，查询失败返回 None
+        """
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+            return self._query_historical_titles(cursor, titles_by_source, before_time)
 
         except Exception as e:
-            print(f"[远程存储] 获取最新数据失败: {e}")
+            print(f"[远程存储] 查询历史标题失败: {e}")
             return None
 
-    def detect_new_titles(self, current_data: NewsData) -> Dict[str, Dict]:
+    def _has_titles_before(
+        self,
+        cursor: sqlite3.Cursor,
+        before_time: str,
+        platform_ids: Optional[List[str]] = None,
+    ) -> bool:
+        """检查是否存在 first_crawl_time 早于指定时间的新闻（可限定平台）"""
+        if platform_ids is None:
+            cursor.execute("""
+                SELECT 1 FROM news_items WHERE first_crawl_time < ? LIMIT 1
+            """, (before_time,))
+            return cursor.fetchone() is not None
+
+        for platform_id in platform_ids:
+            cursor.execute("""
+                SELECT 1 FROM news_items
+                WHERE platform_id = ? AND first_crawl_time < ?
+                LIMIT 1
+            """, (platform_id, before_time))
+            if cursor.fetchone() is not None:
+                return True
+        return False
+
+    def _query_historical_titles(
+        self,
+        cursor: sqlite3.Cursor,
+        titles_by_source: Dict[str, List[str]],
+        before_time: str,
+    ) -> Dict[str, Set[str]]:
         """
-        检测新增的标题
+        按 (platform_id, title, first_crawl_time) 索引查询历史标题
 
-        该方法比较当前抓取数据与历史数据，找出新增的标题。
-        关键逻辑：只有在历史批次中从未出现过的标题才算新增。
+        Args:
+            cursor: 数据库游标
+            titles_by_source: 待检查的标题 {source_id: [title, ...]}
+            before_time: 抓取时间（HH-MM）
+
+        Returns:
+            {source_id: 历史标题集合}
+        """
+        historical_titles: Dict[str, Set[str]] = {}
+        for source_id, titles in titles_by_source.items():
+            found: Set[str] = set()
+            unique_titles = list(dict.fromkeys(titles))
+            for i in range(0, len(unique_titles), self.SQL_BATCH_SIZE):
+                chunk = unique_titles[i:i + self.SQL_BATCH_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"""
+                    SELECT DISTINCT title FROM news_items
+                    WHERE platform_id = ? AND title IN ({placeholders})
+                      AND first_crawl_time < ?
+                """, [source_id] + chunk + [before_time])
+                found.update(row[0] for row in cursor.fetchall())
+            historical_titles[source_id] = found
+        return historical_titles
+
+    def get_source_failure_history(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        获取各平台的连续失败历史（用于熔断判断）
+
+        按抓取时间倒序遍历 crawl_source_status，统计每个平台最近一次成功之后的
+        连续失败次数，以及最近一次失败的记录时间。
+
+        Args:
+            date: 日期字符串，默认为今天
+
+        Returns:
+            {platform_id: {"failures": 连续失败次数, "last_failed_at": "YYYY-MM-DD HH:MM:SS"}}
+            仅包含连续失败次数大于 0 的平台
         """
         try:
-            historical_data = self.get_today_all_data(current_data.date)
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
 
-            if not historical_data:
-                new_titles = {}
-                for source_id, news_list in current_data.items.items():
-                    new_titles[source_id] = {item.title: item for item in news_list}
-                return new_titles
+            cursor.execute("""
+                SELECT css.platform_id, css.status, cr.created_at
+                FROM crawl_source_status css
+                JOIN crawl_records cr ON css.crawl_record_id = cr.id
+                ORDER BY cr.crawl_time DESC
+            """)
 
-            # 获取当前批次时间
-            current_time = current_data.crawl_time
+            history: Dict[str, Dict] = {}
+            recovered = set()
+            for platform_id, status, created_at in cursor.fetchall():
+                if platform_id in recovered:
+                    continue
+                if status != "failed":
+                    recovered.add(platform_id)
+                    continue
+                record = history.setdefault(
+                    platform_id, {"failures": 0, "last_failed_at": created_at}
+                )
+                record["failures"] += 1
 
-            # 收集历史标题（first_time < current_time 的标题）
-            # 这样可以正确处理同一标题因 URL 变化而产生多条记录的情况
-            historical_titles: Dict[str, set] = {}
-            for source_id, news_list in historical_data.items.items():
-                historical_titles[source_id] = set()
-                for item in news_list:
-                    first_time = getattr(item, 'first_time', item.crawl_time)
-                    if first_time < current_time:
-                        historical_titles[source_id].add(item.title)
+            return history
 
-            # 检查是否有历史数据
-            has_historical_data = any(len(titles) > 0 for titles in historical_titles.values())
-            if not has_historical_data:
-                # 第一次抓取，没有"新增"概念
-                return {}
+        except Exception as e:
+            print(f"[远程存储] 读取平台失败历史失败: {e}")
+            return {}
 
-            new_titles = {}
-            for source_id, news_list in current_data.items.items():
-                hist_set = historical_titles.get(source_id, set())
-                for item in news_list:
-                    if item.title not in hist_set:
-                        if source_id not in new_titles:
-                            new_titles[source_id] = {}
-                        new_titles[source_id][item.title] = item
+    def get_platform_digests(self, date: Optional[str] = None) -> Dict[str, str]:
+        """
+        获取各平台最近一次成功响应的内容摘要
 
-            return new_titles
+        Args:
+            date: 日期字符串，默认为今天
+
+        Returns:
+            {platform_id: digest}
+        """
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+            cursor.execute("SELECT platform_id, digest FROM platform_digests")
+            return {row[0]: row[1] for row in cursor.fetchall()}
 
         except Exception as e:
-            print(f"[远程存储] 检测新标题失败: {e}")
+            print(f"[远程存储] 读取平台响应摘要失败: {e}")
             return {}
 
     def save_txt_snapshot(self, data: NewsData) -> Optional[str]:
@@ -881,11 +1721,18 @@ class RemoteStorageBackend(StorageBackend):
             return True
 
     def cleanup(self) -> None:
-        """清理资源（关闭连接和删除临时文件）"""
+        """清理资源（等待后台上传完成、关闭连接和删除临时文件）"""
         # 检查 Python 是否正在关闭
         if sys.meta_path is None:
             return
 
+        # 队列中的对象已复制到队列目录，之后删除临时目录不受影响
+        if getattr(self, "_upload_queue", None):
+            self.flush_uploads()
+
+        if getattr(self, "base_cache_dir", None):
+            self._prune_base_cache()
+
         # 关闭数据库连接
         db_connections = getattr(self, "_db_connections", {})
         for db_path, conn in list(db_connections.items()):
@@ -947,10 +1794,11 @@ class RemoteStorageBackend(StorageBackend):
                     key = obj['Key']
 
                     # 解析日期（格式: news/YYYY-MM-DD.db 或 news/YYYY年MM月DD日.db）
+                    # delta 模式的增量段（news/YYYY-MM-DD.db.delta/NNNNNN.seg）与压缩归档随数据库一起清理
                     folder_date = None
                     try:
                         # ISO 格式: news/YYYY-MM-DD.db
-                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})\.db$', key)
+                        date_match = re.match(r'news/(\d{4})-(\d{2})-(\d{2})\.db(?:\.delta/\d+\.seg|\.zst|\.gz)?$', key)
                         if date_match:
                             folder_date = datetime(
                                 int(date_match.group(1)),
@@ -1003,6 +1851,87 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 清理过期数据失败: {e}")
             return deleted_count
 
+    def archive_closed_days(self, level: Optional[int] = None) -> int:
+        """
+        压缩归档远程存储上今天之前的日期数据库
+
+        下载基线并应用增量段，整理压缩后上传 {db_type}/{date}.db.zst（无 zstandard 时为 .db.gz），
+        再删除原数据库与增量段。
+
+        Args:
+            level: 压缩级别（默认使用各格式的默认级别）
+
+        Returns:
+            归档的数据库数量
+        """
+        today = self._format_date_folder()
+        archive_dir = self.temp_dir / "archive"
+        archived_count = 0
+
+        # 归档基于远程当前内容，先等待队列中的上传完成
+        if self._upload_queue and not self._upload_queue.wait(timeout=self.upload_flush_timeout):
+            print("[远程存储] 上传队列未清空，跳过本次归档")
+            return 0
+
+        for db_type in ["news", "rss"]:
+            try:
+                remote_objects = self._list_objects(f"{db_type}/")
+            except Exception as e:
+                print(f"[远程存储] 列出远程对象失败 ({db_type}): {e}")
+                continue
+
+            for r2_key in sorted(remote_objects):
+                date_match = re.fullmatch(rf'{db_type}/(\d{{4}}-\d{{2}}-\d{{2}})\.db', r2_key)
+                if not date_match or date_match.group(1) >= today:
+                    continue
+
+                local_path = archive_dir / r2_key
+                try:
+                    segment_keys = self._filter_segment_keys(r2_key, remote_objects)
+                    replica = self._fetch_db(
+                        r2_key,
+                        local_path,
+                        size=remote_objects[r2_key]["size"],
+                        etag=remote_objects[r2_key]["etag"],
+                        segment_keys=segment_keys,
+                    )
+                    if replica is None:
+                        continue
+
+                    original_size = local_path.stat().st_size
+                    archive_path = archive_db(local_path, level)
+                    archive_key = r2_key + archive_path.name[len(local_path.name):]
+                    archive_size = archive_path.stat().st_size
+                    with open(archive_path, 'rb') as f:
+                        self.s3_client.put_object(
+                            Bucket=self.bucket_name,
+                            Key=archive_key,
+                            Body=f.read(),
+                            ContentLength=archive_size,
+                            ContentType='application/octet-stream',
+                        )
+
+                    # 归档上传成功后才删除原数据库（同一日期的其他格式归档一并删除）
+                    stale_keys = [r2_key] + segment_keys + [
+                        r2_key + suffix for suffix in ARCHIVE_SUFFIXES
+                        if r2_key + suffix != archive_key and r2_key + suffix in remote_objects
+                    ]
+                    self._delete_objects(stale_keys)
+                    archived_count += 1
+                    print(
+                        f"[远程存储] 已归档: {archive_key} "
+                        f"({original_size / 1024:.1f}KB → {archive_size / 1024:.1f}KB)"
+                    )
+                except Exception as e:
+                    print(f"[远程存储] 归档失败 {r2_key}: {e}")
+                finally:
+                    discard_stale_copies(local_path)
+
+        if archived_count > 0:
+            print(f"[远程存储] 共归档 {archived_count} 个数据库")
+
+        return archived_count
+
     def has_pushed_today(self, date: Optional[str] = None) -> bool:
         """
         检查指定日期是否已推送过
@@ -1065,7 +1994,7 @@ class RemoteStorageBackend(StorageBackend):
 
             # 上传到远程存储 确保记录持久化
             if self._upload_sqlite(date):
-                print(f"[远程存储] 推送记录已同步到远程存储")
+                print(f"[远程存储] 推送记录已{self._sync_action}")
                 return True
             else:
                 print(f"[远程存储] 推送记录同步到远程存储失败")
@@ -1075,6 +2004,87 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 记录推送失败: {e}")
             return False
 
+    def get_keyword_matches(
+        self,
+        config_hash: str,
+        date: Optional[str] = None,
+        db_type: str = "news",
+    ) -> Dict[str, int]:
+        """
+        读取指定频率词配置下已记录的关键词归属
+
+        Args:
+            config_hash: 频率词配置哈希
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            {标题: 词组下标}，-1 表示未命中
+        """
+        try:
+            conn = self._get_connection(date, db_type)
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT title, group_index FROM keyword_matches
+                WHERE config_hash = ?
+            """, (config_hash,))
+            return {row[0]: row[1] for row in cursor.fetchall()}
+
+        except Exception as e:
+            print(f"[远程存储] 读取关键词归属失败: {e}")
+            return {}
+
+    def save_keyword_matches(
+        self,
+        config_hash: str,
+        matches: Dict[str, int],
+        date: Optional[str] = None,
+        db_type: str = "news",
+    ) -> bool:
+        """
+        追加关键词归属记录，并清除其他配置哈希的旧记录
+
+        save_news_data / save_rss_data 已在此之前上传了数据库，
+        有新记录时再上传一次（delta 模式只上传改动页），下次运行才能读到。
+
+        Args:
+            config_hash: 频率词配置哈希
+            matches: {标题: 词组下标}
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+            db_type: 数据库类型 ("news" 或 "rss")
+
+        Returns:
+            是否保存成功
+        """
+        if not matches:
+            return True
+
+        try:
+            conn = self._get_connection(date, db_type)
+            cursor = conn.cursor()
+            changes_before = conn.total_changes
+
+            cursor.execute("""
+                DELETE FROM keyword_matches WHERE config_hash != ?
+            """, (config_hash,))
+            cursor.executemany("""
+                INSERT OR IGNORE INTO keyword_matches (config_hash, title, group_index)
+                VALUES (?, ?, ?)
+            """, [(config_hash, title, index) for title, index in matches.items()])
+
+            conn.commit()
+
+            if conn.total_changes == changes_before:
+                return True
+            if not self._upload_sqlite(date, db_type):
+                print("[远程存储] 关键词归属同步到远程存储失败")
+                return False
+            return True
+
+        except Exception as e:
+            print(f"[远程存储] 保存关键词归属失败: {e}")
+            return False
+
     # ========================================
     # RSS 数据存储方法
     # ========================================
@@ -1111,6 +2121,10 @@ class RemoteStorageBackend(StorageBackend):
             new_count = 0
             updated_count = 0
 
+            # 服务器返回 304 的源：内容未修改，沿用上次抓取的条目
+            for feed_id in data.unchanged_ids:
+                updated_count += self._carry_forward_feed(cursor, feed_id, data.crawl_time, now_str)
+
             for feed_id, rss_list in data.items.items():
                 for item in rss_list:
                     try:
@@ -1183,8 +2197,8 @@ class RemoteStorageBackend(StorageBackend):
             if record_row:
                 crawl_record_id = record_row[0]
 
-                # 记录成功的源
-                for feed_id in data.items.keys():
+                # 记录成功的源（含返回 304 的源）
+                for feed_id in list(data.items.keys()) + data.unchanged_ids:
                     cursor.execute("""
                         INSERT OR REPLACE INTO rss_crawl_status
                         (crawl_record_id, feed_id, status)
@@ -1204,6 +2218,23 @@ class RemoteStorageBackend(StorageBackend):
                         VALUES (?, ?, 'failed')
                     """, (crawl_record_id, failed_id))
 
+            # 记录缓存校验信息（供下次条件请求使用）
+            if data.validators:
+                cursor.executemany("""
+                    INSERT INTO rss_feed_validators
+                    (feed_id, etag, last_modified, crawl_time, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(feed_id) DO UPDATE SET
+                        etag = excluded.etag,
+                        last_modified = excluded.last_modified,
+                        crawl_time = excluded.crawl_time,
+                        updated_at = excluded.updated_at
+                """, [
+                    (feed_id, validator.get("etag", ""), validator.get("last_modified", ""),
+                     data.crawl_time, now_str)
+                    for feed_id, validator in data.validators.items()
+                ])
+
             conn.commit()
 
             # 输出统计日志
@@ -1214,7 +2245,7 @@ class RemoteStorageBackend(StorageBackend):
 
             # 上传到远程存储
             if self._upload_sqlite(data.date, db_type="rss"):
-                print(f"[远程存储] RSS 数据已同步到远程存储")
+                print(f"[远程存储] RSS 数据已{self._sync_action}")
                 return True
             else:
                 print(f"[远程存储] RSS 上传远程存储失败")
@@ -1224,6 +2255,58 @@ class RemoteStorageBackend(StorageBackend):
             print(f"[远程存储] 保存 RSS 数据失败: {e}")
             return False
 
+    def _carry_forward_feed(
+        self, cursor: sqlite3.Cursor, feed_id: str, crawl_time: str, now_str: str
+    ) -> int:
+        """
+        将未修改（304）的源的上次抓取条目延续到本次抓取
+
+        上次成功抓取的条目 last_crawl_time 都等于该源的最大 last_crawl_time，
+        与重新解析同一响应后逐条更新的结果一致。
+
+        Args:
+            cursor: 数据库游标
+            feed_id: RSS 源 ID
+            crawl_time: 本次抓取时间
+            now_str: 当前时间字符串
+
+        Returns:
+            延续的条目数
+        """
+        cursor.execute("""
+            UPDATE rss_items SET
+                last_crawl_time = ?,
+                crawl_count = crawl_count + 1,
+                updated_at = ?
+            WHERE feed_id = ? AND last_crawl_time = (
+                SELECT MAX(last_crawl_time) FROM rss_items WHERE feed_id = ?
+            )
+        """, (crawl_time, now_str, feed_id, feed_id))
+        return cursor.rowcount
+
+    def get_rss_validators(self, date: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+        """
+        获取各 RSS 源最近一次成功响应的缓存校验信息
+
+        Args:
+            date: 日期字符串，默认为今天
+
+        Returns:
+            {feed_id: {"etag": ..., "last_modified": ...}}
+        """
+        try:
+            conn = self._get_connection(date, db_type="rss")
+            cursor = conn.cursor()
+            cursor.execute("SELECT feed_id, etag, last_modified FROM rss_feed_validators")
+            return {
+                row[0]: {"etag": row[1] or "", "last_modified": row[2] or ""}
+                for row in cursor.fetchall()
+            }
+
+        except Exception as e:
+            print(f"[远程存储] 读取 RSS 缓存校验信息失败: {e}")
+            return {}
+
     def get_rss_data(self, date: Optional[str] = None) -> Optional[RSSData]:
         """
         获取指定日期的所有 RSS 数据
@@ -1468,63 +2551,298 @@ class RemoteStorageBackend(StorageBackend):
             # Python 关闭时可能会出错，忽略即可
             pass
 
-    def pull_recent_days(self, days: int, local_data_dir: str = "output") -> int:
+    def _load_pull_manifest(self, manifest_path: Path) -> Dict[str, Dict]:
+        """读取拉取清单（不存在或损坏时返回空清单）"""
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _matches_remote(self, local_file: Path, object_key: str, base: Dict, segment_keys: List[str]) -> bool:
         """
-        从远程拉取最近 N 天的数据到本地
+        检查本地文件是否与远程对象完全一致（单段上传的 ETag 即内容 MD5）
 
         Args:
-            days: 拉取天数
-            local_data_dir: 本地数据目录
+            local_file: 本地文件（数据库或归档）
+            object_key: 远程对象键
+            base: 远程对象信息（etag、size）
+            segment_keys: 远程增量段（有增量段时无法直接比较）
 
         Returns:
-            成功拉取的数据库文件数量
+            是否一致（无法判断时返回 False）
         """
-        if days <= 0:
-            return 0
+        etag = str(base.get("etag", "")).strip('"')
+        if segment_keys or local_file.name != object_key.rsplit("/", 1)[-1]:
+            return False
+        if len(etag) != 32 or "-" in etag:
+            return False
+        try:
+            if local_file.stat().st_size != base["size"]:
+                return False
+            digest = hashlib.md5()
+            with open(local_file, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            return digest.hexdigest() == etag
+        except OSError:
+            return False
 
-        local_dir = Path(local_data_dir)
-        local_dir.mkdir(parents=True, exist_ok=True)
+    @staticmethod
+    def _read_crawl_times(db_path: Path, db_type: str) -> Set[str]:
+        """读取数据库中的全部抓取时间"""
+        table = "rss_crawl_records" if db_type == "rss" else "crawl_records"
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            return {row[0] for row in conn.execute(f"SELECT crawl_time FROM {table}")}
+        except sqlite3.OperationalError:
+            return set()
+        finally:
+            conn.close()
 
-        pulled_count = 0
-        now = self._get_configured_time()
+    def _covers_local(self, db_type: str, local_path: Path, fetched_path: Path) -> bool:
+        """
+        检查下载的远程版本是否包含本地数据库的全部抓取（可以安全替换本地文件）
 
-        print(f"[远程存储] 开始拉取最近 {days} 天的数据...")
+        Args:
+            db_type: 数据库类型 ("news" 或 "rss")
+            local_path: 本地数据库路径（已归档时读取归档）
+            fetched_path: 下载的远程数据库或归档
 
-        for i in range(days):
-            date = now - timedelta(days=i)
-            date_str = date.strftime("%Y-%m-%d")
+        Returns:
+            远程是否包含本地的全部抓取
+        """
+        local_db = resolve_db_path(local_path)
+        if local_db is None:
+            return True
 
-            # 本地目标路径
-            local_date_dir = local_dir / date_str
-            local_db_path = local_date_dir / "news.db"
+        remote_db = fetched_path
+        if fetched_path.name.endswith(ARCHIVE_SUFFIXES):
+            remote_db = fetched_path.with_name(fetched_path.name + ".check")
+            decompress_file(fetched_path, remote_db)
+        try:
+            return self._read_crawl_times(local_db, db_type) <= self._read_crawl_times(remote_db, db_type)
+        finally:
+            if remote_db != fetched_path:
+                remote_db.unlink(missing_ok=True)
 
-            # 如果本地已存在，跳过
-            if local_db_path.exists():
-                print(f"[远程存储] 跳过（本地已存在）: {date_str}")
-                continue
+    def _save_pull_manifest(self, manifest_path: Path, manifest: Dict[str, Dict]) -> None:
+        """写入拉取清单（先写临时文件再替换）"""
+        try:
+            tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+            tmp_path.replace(manifest_path)
+        except OSError as e:
+            print(f"[远程存储] 保存拉取清单失败: {e}")
+
+    def pull_dates(
+        self,
+        dates: List[str],
+        local_data_dir: str = "output",
+        db_types: Tuple[str, ...] = ("news", "rss"),
+        max_concurrency: int = 4,
+    ) -> Dict:
+        """
+        并发拉取指定日期的数据库到本地（output/{db_type}/{date}.db）
+
+        只用一次 LIST 获取远程对象的 ETag 与大小，与本地拉取清单比较：
+        - 远程未变化且本地文件仍是上次拉取的内容：跳过（计入节省字节数）
+        - 远程已变化且本地文件未被修改：重新下载
+        - 本地文件不在清单中（清单启用前拉取或本地写入），或拉取后被本地修改：
+          与远程内容一致（ETag 即 MD5）时直接登记到清单；否则下载远程版本比较抓取记录，
+          远程包含本地的全部抓取时替换（如过期的当天数据库），本地有远程没有的抓取时保留本地数据。
+          比较结果记入清单，远程与本地都没有变化时不再重复比较
+        大对象按 Range 分段并发下载。远程只有压缩归档的日期原样下载归档
+        （output/{db_type}/{date}.db.zst），读取时透明解压。
 
-            # 远程对象键
-            remote_key = f"news/{date_str}.db"
+        Args:
+            dates: 日期字符串列表（YYYY-MM-DD）
+            local_data_dir: 本地数据目录
+            db_types: 数据库类型
+            max_concurrency: 最大并发下载数
 
-            # 检查远程是否存在
-            if not self._check_object_exists(remote_key):
-                print(f"[远程存储] 跳过（远程不存在）: {date_str}")
-                continue
+        Returns:
+            {
+                "pulled": [对象键], "skipped": [对象键], "kept_local": [对象键],
+                "missing": [对象键], "failed": [{"key": 对象键, "error": 错误}],
+                "bytes_downloaded": 下载字节数, "bytes_saved": 跳过未变化对象节省的字节数
+            }
+        """
+        local_dir = Path(local_data_dir)
+        local_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = local_dir / self.PULL_MANIFEST
+        manifest = self._load_pull_manifest(manifest_path)
 
-            # 下载（使用 get_object + iter_chunks 处理 chunked encoding）
+        result = {
+            "pulled": [], "skipped": [], "kept_local": [], "missing": [], "failed": [],
+            "bytes_downloaded": 0, "bytes_saved": 0,
+        }
+        manifest_changed = False
+
+        tasks = []
+        for db_type in db_types:
+            # 一次 LIST 代替逐日 HEAD
             try:
-                local_date_dir.mkdir(parents=True, exist_ok=True)
-                response = self.s3_client.get_object(Bucket=self.bucket_name, Key=remote_key)
-                with open(local_db_path, 'wb') as f:
-                    for chunk in response['Body'].iter_chunks(chunk_size=1024*1024):
-                        f.write(chunk)
-                print(f"[远程存储] 已拉取: {remote_key} -> {local_db_path}")
-                pulled_count += 1
+                remote_objects = self._list_objects(f"{db_type}/")
             except Exception as e:
-                print(f"[远程存储] 拉取失败 ({date_str}): {e}")
+                print(f"[远程存储] 列出远程对象失败 ({db_type}): {e}")
+                result["failed"].extend({"key": f"{db_type}/{date}.db", "error": str(e)} for date in dates)
+                continue
+
+            for date in dates:
+                r2_key = f"{db_type}/{date}.db"
+                local_path = local_dir / db_type / f"{date}.db"
+                target_path = local_path
+                object_key = r2_key
+                base = remote_objects.get(r2_key)
+                if base is None:
+                    # 已归档的日期：原样下载压缩归档
+                    for suffix in ARCHIVE_SUFFIXES:
+                        if r2_key + suffix in remote_objects:
+                            object_key = r2_key + suffix
+                            target_path = local_path.with_name(local_path.name + suffix)
+                            base = remote_objects[object_key]
+                            break
+                if base is None:
+                    result["missing"].append(r2_key)
+                    continue
+
+                segment_keys = self._filter_segment_keys(r2_key, remote_objects) if object_key == r2_key else []
+                remote_size = base["size"] + sum(remote_objects[key]["size"] for key in segment_keys)
+                validator = [base["etag"], base["size"]] + [
+                    [key, remote_objects[key]["etag"]] for key in segment_keys
+                ]
+                if object_key != r2_key:
+                    validator.append(object_key)
+
+                # 本地现有文件（未压缩数据库优先，其次为归档）
+                local_file = local_path if local_path.exists() else find_archive(local_path)
+                local_state = get_file_state(str(local_file)) if local_file else None
+                entry = manifest.get(r2_key)
+                verify = False
+                if local_state is not None:
+                    same_local = entry is not None and entry.get("local_state") == list(local_state)
+                    if same_local and entry.get("validator") == validator:
+                        if entry.get("kept"):
+                            result["kept_local"].append(r2_key)
+                        else:
+                            result["skipped"].append(r2_key)
+                            result["bytes_saved"] += remote_size
+                        continue
+
+                    if entry is None and self._matches_remote(local_file, object_key, base, segment_keys):
+                        manifest[r2_key] = {"validator": validator, "local_state": list(local_state)}
+                        manifest_changed = True
+                        result["skipped"].append(r2_key)
+                        result["bytes_saved"] += remote_size
+                        continue
+
+                    # 不确定本地文件是否比远程新：下载后比较，不直接覆盖
+                    verify = entry is None or not same_local or bool(entry.get("kept"))
+
+                tasks.append((db_type, r2_key, object_key, local_path, target_path, base, segment_keys, validator, verify))
 
-        print(f"[远程存储] 拉取完成，共下载 {pulled_count} 个数据库文件")
-        return pulled_count
+        if tasks:
+            print(f"[远程存储] 开始拉取 {len(tasks)} 个数据库（并发数 {max(1, max_concurrency)}）...")
+
+        def pull_one(task):
+            db_type, _, object_key, local_path, target_path, base, segment_keys, _, verify = task
+            fetch_path = target_path.with_name(".pull-" + target_path.name) if verify else target_path
+            replica = self._fetch_db(
+                object_key, fetch_path, size=base["size"], etag=base["etag"], segment_keys=segment_keys
+            )
+            if replica is None:
+                return None
+
+            if verify:
+                try:
+                    if not self._covers_local(db_type, local_path, fetch_path):
+                        replica["kept_local"] = True
+                        return replica
+                    fetch_path.replace(target_path)
+                finally:
+                    fetch_path.unlink(missing_ok=True)
+
+            # 删除上次拉取留下的其他形式（如归档前拉取的未压缩数据库）
+            discard_stale_copies(local_path, target_path)
+            return replica
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            futures = {executor.submit(pull_one, task): task for task in tasks}
+            for done, future in enumerate(as_completed(futures), 1):
+                _, r2_key, _, local_path, target_path, _, _, validator, _ = futures[future]
+                try:
+                    replica = future.result()
+                except Exception as e:
+                    result["failed"].append({"key": r2_key, "error": str(e)})
+                    print(f"[远程存储] 拉取失败 ({done}/{len(tasks)}): {r2_key}: {e}")
+                    continue
+
+                if replica is None:
+                    result["missing"].append(r2_key)
+                    continue
+
+                result["bytes_downloaded"] += replica["downloaded_bytes"]
+                manifest_changed = True
+                if replica.get("kept_local"):
+                    # 本地有远程没有的抓取：保留，远程或本地变化后再比较
+                    local_file = local_path if local_path.exists() else find_archive(local_path)
+                    result["kept_local"].append(r2_key)
+                    manifest[r2_key] = {
+                        "validator": validator,
+                        "local_state": list(get_file_state(str(local_file)) or ()) if local_file else [],
+                        "kept": True,
+                    }
+                    print(f"[远程存储] 保留本地数据 ({done}/{len(tasks)}): {r2_key}（本地有远程没有的抓取记录）")
+                    continue
+
+                result["pulled"].append(r2_key)
+                manifest[r2_key] = {
+                    "validator": validator,
+                    "local_state": list(get_file_state(str(target_path)) or ()),
+                }
+                print(f"[远程存储] 已拉取 ({done}/{len(tasks)}): {r2_key} ({replica['downloaded_bytes']} bytes)")
+
+        if manifest_changed:
+            self._save_pull_manifest(manifest_path, manifest)
+
+        return result
+
+    def pull_recent_days(
+        self,
+        days: int,
+        local_data_dir: str = "output",
+        max_concurrency: int = 4,
+    ) -> int:
+        """
+        从远程拉取最近 N 天的数据到本地
+
+        Args:
+            days: 拉取天数
+            local_data_dir: 本地数据目录
+            max_concurrency: 最大并发下载数
+
+        Returns:
+            成功拉取的数据库文件数量
+        """
+        if days <= 0:
+            return 0
+
+        now = self._get_configured_time()
+        dates = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
+
+        print(f"[远程存储] 开始拉取最近 {days} 天的数据...")
+        result = self.pull_dates(dates, local_data_dir, max_concurrency=max_concurrency)
+
+        print(
+            f"[远程存储] 拉取完成，共下载 {len(result['pulled'])} 个数据库文件"
+            f"（{result['bytes_downloaded']} bytes），"
+            f"未变化跳过 {len(result['skipped'])} 个（节省 {result['bytes_saved']} bytes），"
+            f"保留本地修改 {len(result['kept_local'])} 个，失败 {len(result['failed'])} 个"
+        )
+        return len(result["pulled"])
 
     def list_remote_dates(self) -> List[str]:
         """
@@ -1545,12 +2863,12 @@ class RemoteStorageBackend(StorageBackend):
 
                 for obj in page['Contents']:
                     key = obj['Key']
-                    # 解析日期
-                    date_match = re.match(r'news/(\d{4}-\d{2}-\d{2})\.db$', key)
+                    # 解析日期（含压缩归档）
+                    date_match = re.match(r'news/(\d{4}-\d{2}-\d{2})\.db(?:\.zst|\.gz)?$', key)
                     if date_match:
                         dates.append(date_match.group(1))
 
-            return sorted(dates, reverse=True)
+            return sorted(set(dates), reverse=True)
 
         except Exception as e:
             print(f"[远程存储] 列出远程日期失败: {e}")
@@ -62,6 +62,32 @@ CREATE TABLE IF NOT EXISTS rss_crawl_status (
     FOREIGN KEY (feed_id) REFERENCES rss_feeds(id)
 );
 
+-- ============================================
+-- RSS 源缓存校验表
+-- 记录各源最近一次成功响应的 ETag / Last-Modified，用于条件请求
+-- （只读取当天数据库，新的一天首次抓取总是完整下载）
+-- ============================================
+CREATE TABLE IF NOT EXISTS rss_feed_validators (
+    feed_id TEXT PRIMARY KEY,
+    etag TEXT DEFAULT '',                     -- 响应头 ETag
+    last_modified TEXT DEFAULT '',            -- 响应头 Last-Modified
+    crawl_time TEXT NOT NULL,                 -- 记录该校验信息的抓取时间
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (feed_id) REFERENCES rss_feeds(id)
+);
+
+-- ============================================
+-- 关键词归属表
+-- 记录标题命中的第一个词组下标（-1 表示未命中），按频率词配置哈希区分，
+-- 统计时已记录的标题不再重复匹配
+-- ============================================
+CREATE TABLE IF NOT EXISTS keyword_matches (
+    config_hash TEXT NOT NULL,               -- 频率词配置哈希
+    title TEXT NOT NULL,
+    group_index INTEGER NOT NULL,            -- 词组下标（-1 = 未命中）
+    PRIMARY KEY (config_hash, title)
+);
+
 -- ============================================
 -- 推送记录表
 -- 用于 push_window once_per_day 功能
@@ -56,6 +56,17 @@ CREATE TABLE IF NOT EXISTS rank_history (
     FOREIGN KEY (news_item_id) REFERENCES news_items(id)
 );
 
+-- ============================================
+-- 排名历史紧凑表（storage.sqlite.rank_history = packed 时代替 rank_history）
+-- 每条新闻一个 blob，每次抓取追加 4 字节：(抓取时间槽, 排名)，小端 uint16
+-- 编解码见 trendradar/storage/rank_codec.py
+-- ============================================
+CREATE TABLE IF NOT EXISTS rank_packs (
+    news_item_id INTEGER PRIMARY KEY,
+    ranks BLOB NOT NULL,
+    FOREIGN KEY (news_item_id) REFERENCES news_items(id)
+);
+
 -- ============================================
 -- 抓取记录表
 -- 记录每次抓取的时间和数量
@@ -80,6 +91,30 @@ CREATE TABLE IF NOT EXISTS crawl_source_status (
     FOREIGN KEY (platform_id) REFERENCES platforms(id)
 );
 
+-- ============================================
+-- 平台响应摘要表
+-- 记录各平台最近一次成功响应的内容摘要，用于识别未变化的榜单
+-- ============================================
+CREATE TABLE IF NOT EXISTS platform_digests (
+    platform_id TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    crawl_time TEXT NOT NULL,            -- 记录该摘要的抓取时间
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (platform_id) REFERENCES platforms(id)
+);
+
+-- ============================================
+-- 关键词归属表
+-- 记录标题命中的第一个词组下标（-1 表示未命中），按频率词配置哈希区分，
+-- 统计时已记录的标题不再重复匹配
+-- ============================================
+CREATE TABLE IF NOT EXISTS keyword_matches (
+    config_hash TEXT NOT NULL,           -- 频率词配置哈希
+    title TEXT NOT NULL,
+    group_index INTEGER NOT NULL,        -- 词组下标（-1 = 未命中）
+    PRIMARY KEY (config_hash, title)
+);
+
 -- ============================================
 -- 推送记录表
 -- 用于 push_window once_per_day 功能
@@ -106,6 +141,10 @@ CREATE INDEX IF NOT EXISTS idx_news_crawl_time ON news_items(last_crawl_time);
 -- 标题索引（用于标题搜索）
 CREATE INDEX IF NOT EXISTS idx_news_title ON news_items(title);
 
+-- 平台 + 标题 + 首次抓取时间索引（用于 SQL 侧新增标题检测）
+CREATE INDEX IF NOT EXISTS idx_news_platform_title_first
+    ON news_items(platform_id, title, first_crawl_time);
+
 -- URL + platform_id 唯一索引（仅对非空 URL，实现去重）
 CREATE UNIQUE INDEX IF NOT EXISTS idx_news_url_platform
     ON news_items(url, platform_id) WHERE url != '';
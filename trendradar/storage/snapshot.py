@@ -0,0 +1,289 @@
+# coding=utf-8
+"""
+当日数据快照模块
+
+get_today_all_data 在一次运行中会被调用多次（新增检测、报告生成、AI 分析），
+API 服务进程更是长期存活。每次都全量读取 news_items 并用巨大的 IN 查询
+rank_history，耗时随当天数据量线性增长。
+
+DaySnapshot 在进程内缓存某个日期数据库的当日数据：
+- 首次读取时全量加载
+- 之后只读取增量（rank_history.id / news_items.id 水位线之后的记录；
+  紧凑格式的 rank_packs 按 last_crawl_time 水位线重新读取有变化的条目）
+- 以数据库文件标识（设备号 + inode）和修改时间判断是否需要同步，
+  文件被替换（如从远程拉取覆盖）时自动全量重建
+"""
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.rank_codec import decode_ranks, has_rank_packs
+
+
+# 批量查询时每条 SQL 的最大参数个数
+_SQL_BATCH_SIZE = 500
+
+FileState = Tuple[int, int, int, int, int, int]
+
+
+def get_file_state(db_path: str) -> Optional[FileState]:
+    """
+    获取数据库文件状态（WAL 模式下同时考虑 -wal 文件）
+
+    Args:
+        db_path: 数据库文件路径
+
+    Returns:
+        (设备号, inode, 修改时间, 大小, wal 修改时间, wal 大小)，文件不存在返回 None
+    """
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+
+    try:
+        wal_stat = os.stat(f"{db_path}-wal")
+        wal_state = (wal_stat.st_mtime_ns, wal_stat.st_size)
+    except OSError:
+        wal_state = (0, 0)
+
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size) + wal_state
+
+
+class DaySnapshot:
+    """单个日期数据库的当日数据快照（线程安全）"""
+
+    def __init__(self, db_path: str):
+        """
+        初始化快照
+
+        Args:
+            db_path: 数据库文件路径
+        """
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        """清空快照，下次同步时全量加载"""
+        self._state: Optional[FileState] = None
+        self._identity: Optional[Tuple[int, int]] = None
+        # news_item_id -> (title, platform_id, rank, url, mobile_url,
+        #                  first_crawl_time, last_crawl_time, crawl_count)
+        self._news: Dict[int, Tuple] = {}
+        # 行格式排名（dict 作为有序集合，O(1) 去重）与紧凑格式排名
+        self._ranks: Dict[int, Dict[int, None]] = {}
+        self._packed_ranks: Dict[int, List[int]] = {}
+        self._platform_names: Dict[str, str] = {}
+        self._failed_ids: List[str] = []
+        self._latest_crawl_time: Optional[str] = None
+        self._max_news_id = 0
+        self._max_rank_id = 0
+
+    def invalidate(self) -> None:
+        """标记快照需要同步（写入后调用，下次读取时拉取增量）"""
+        with self._lock:
+            self._state = None
+
+    def sync(self, conn: sqlite3.Connection) -> None:
+        """
+        将快照同步到数据库当前状态
+
+        文件状态未变化时直接返回；文件被替换时全量重建；否则只读取增量。
+
+        Args:
+            conn: 数据库连接（只读或读写均可）
+        """
+        state = get_file_state(self.db_path)
+
+        with self._lock:
+            if state is not None and state == self._state:
+                return
+
+            if state is None or state[:2] != self._identity:
+                self._reset()
+
+            cursor = conn.cursor()
+
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM rank_history")
+            max_rank_id = cursor.fetchone()[0]
+            if max_rank_id < self._max_rank_id:
+                # 水位线倒退，说明文件内容被整体重写
+                self._reset()
+
+            # 增量排名历史（每次更新/插入新闻都会写入一条）
+            cursor.execute("""
+                SELECT news_item_id, rank FROM rank_history
+                WHERE id > ? AND id <= ?
+                ORDER BY news_item_id, crawl_time
+            """, (self._max_rank_id, max_rank_id))
+            changed_ids = set()
+            for news_id, rank in cursor.fetchall():
+                changed_ids.add(news_id)
+                self._ranks.setdefault(news_id, {})[rank] = None
+            self._max_rank_id = max_rank_id
+
+            # 紧凑格式：重新读取上次同步以来有抓取的条目（每次写入都会更新 last_crawl_time）
+            if has_rank_packs(cursor):
+                if self._latest_crawl_time is None:
+                    cursor.execute("SELECT news_item_id, ranks FROM rank_packs")
+                else:
+                    cursor.execute("""
+                        SELECT rp.news_item_id, rp.ranks
+                        FROM rank_packs rp
+                        JOIN news_items n ON n.id = rp.news_item_id
+                        WHERE n.last_crawl_time >= ?
+                    """, (self._latest_crawl_time,))
+                for news_id, blob in cursor.fetchall():
+                    changed_ids.add(news_id)
+                    self._packed_ranks[news_id] = decode_ranks(blob, unique=False)
+
+            # 增量新闻记录：新插入的 + 本轮有更新的
+            news_columns = """
+                SELECT id, title, platform_id, rank, url, mobile_url,
+                       first_crawl_time, last_crawl_time, crawl_count
+                FROM news_items
+            """
+            cursor.execute(news_columns + " WHERE id > ?", (self._max_news_id,))
+            rows = cursor.fetchall()
+
+            updated_ids = [news_id for news_id in changed_ids if news_id <= self._max_news_id]
+            for i in range(0, len(updated_ids), _SQL_BATCH_SIZE):
+                chunk = updated_ids[i:i + _SQL_BATCH_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(news_columns + f" WHERE id IN ({placeholders})", chunk)
+                rows.extend(cursor.fetchall())
+
+            for row in rows:
+                self._news[row[0]] = tuple(row[1:])
+                self._max_news_id = max(self._max_news_id, row[0])
+
+            # 平台、失败来源、最新抓取时间（小表，直接全量读取）
+            cursor.execute("SELECT id, name FROM platforms")
+            self._platform_names = {row[0]: row[1] for row in cursor.fetchall()}
+
+            cursor.execute("""
+                SELECT DISTINCT css.platform_id
+                FROM crawl_source_status css
+                JOIN crawl_records cr ON css.crawl_record_id = cr.id
+                WHERE css.status = 'failed'
+            """)
+            self._failed_ids = [row[0] for row in cursor.fetchall()]
+
+            cursor.execute("""
+                SELECT crawl_time FROM crawl_records
+                ORDER BY crawl_time DESC
+                LIMIT 1
+            """)
+            time_row = cursor.fetchone()
+            self._latest_crawl_time = time_row[0] if time_row else None
+
+            self._state = state
+            self._identity = state[:2] if state else None
+
+    def to_news_data(self, crawl_date: str, default_crawl_time: str) -> Optional[NewsData]:
+        """
+        由快照构建 NewsData（与全量读取的结果一致，每次返回新对象）
+
+        Args:
+            crawl_date: 日期字符串
+            default_crawl_time: 没有抓取记录时使用的抓取时间
+
+        Returns:
+            合并后的新闻数据，没有数据时返回 None
+        """
+        with self._lock:
+            if not self._news:
+                return None
+
+            # 与全量读取一致：按 platform_id、last_crawl_time 排序
+            ordered = sorted(
+                self._news.items(),
+                key=lambda entry: (entry[1][1], entry[1][6], entry[0]),
+            )
+
+            items: Dict[str, List[NewsItem]] = {}
+            id_to_name: Dict[str, str] = {}
+
+            for news_id, row in ordered:
+                title, platform_id, rank, url, mobile_url, first_time, last_time, count = row
+                platform_name = self._platform_names.get(platform_id) or platform_id
+                id_to_name[platform_id] = platform_name
+
+                if platform_id not in items:
+                    items[platform_id] = []
+
+                # 获取排名历史，如果没有则使用当前排名
+                row_ranks = self._ranks.get(news_id)
+                packed_ranks = self._packed_ranks.get(news_id)
+                if packed_ranks is None:
+                    ranks = list(row_ranks) if row_ranks else [rank]
+                else:
+                    ranks = list(dict.fromkeys([*(row_ranks or ()), *packed_ranks]))
+
+                items[platform_id].append(NewsItem(
+                    title=title,
+                    source_id=platform_id,
+                    source_name=platform_name,
+                    rank=rank,
+                    url=url or "",
+                    mobile_url=mobile_url or "",
+                    crawl_time=last_time,
+                    ranks=ranks,
+                    first_time=first_time,
+                    last_time=last_time,
+                    count=count,
+                ))
+
+            return NewsData(
+                date=crawl_date,
+                crawl_time=self._latest_crawl_time or default_crawl_time,
+                items=items,
+                id_to_name=id_to_name,
+                failed_ids=list(self._failed_ids),
+            )
+
+
+class DaySnapshotCache:
+    """按数据库路径缓存 DaySnapshot（LRU，只保留最近使用的几天）"""
+
+    def __init__(self, max_days: int = 3):
+        """
+        初始化快照缓存
+
+        Args:
+            max_days: 最多缓存的日期数
+        """
+        self.max_days = max(1, max_days)
+        self._lock = threading.Lock()
+        self._snapshots: "OrderedDict[str, DaySnapshot]" = OrderedDict()
+
+    def get(self, db_path: str) -> DaySnapshot:
+        """获取（或创建）指定数据库的快照"""
+        db_path = str(db_path)
+        with self._lock:
+            snapshot = self._snapshots.get(db_path)
+            if snapshot is None:
+                snapshot = DaySnapshot(db_path)
+                self._snapshots[db_path] = snapshot
+                while len(self._snapshots) > self.max_days:
+                    self._snapshots.popitem(last=False)
+            else:
+                self._snapshots.move_to_end(db_path)
+            return snapshot
+
+    def invalidate(self, db_path: str) -> None:
+        """标记指定数据库的快照需要同步"""
+        with self._lock:
+            snapshot = self._snapshots.get(str(db_path))
+        if snapshot:
+            snapshot.invalidate()
+
+    def clear(self) -> None:
+        """清空所有快照"""
+        with self._lock:
+            self._snapshots.clear()
@@ -0,0 +1,233 @@
+# coding=utf-8
+"""
+SQLite 连接配置模块
+
+提供：
+- DEFAULT_SQLITE_PROFILE: 默认存储配置（WAL 日志 + 调优的 PRAGMA）
+- apply_pragmas: 为连接应用存储配置
+- ReadOnlyConnectionPool: 只读连接池
+
+爬虫（cron）进程写入 output/{type}/{date}.db 的同时，API 服务与 MCP Server
+会读取同一批文件。WAL 模式下读不阻塞写、写不阻塞读，读取方再通过只读连接
+（mode=ro + query_only）访问，不会持有写锁，也不会因写入方占用而报
+"database is locked"。
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# 默认存储配置（键名与 config 加载后的 STORAGE.SQLITE 一致）
+DEFAULT_SQLITE_PROFILE: Dict = {
+    "JOURNAL_MODE": "wal",       # 日志模式：wal / delete（SQLite 默认）
+    "SYNCHRONOUS": "normal",     # 同步级别：WAL 下 normal 已能保证不损坏
+    "CACHE_SIZE_MB": 32,         # 每个连接的页缓存大小
+    "MMAP_SIZE_MB": 128,         # 内存映射读取大小（0 = 关闭）
+    "TEMP_STORE": "memory",      # 临时表/排序位置：memory / file / default
+    "BUSY_TIMEOUT_MS": 5000,     # 遇到锁时的等待时间
+    "READ_POOL_SIZE": 4,         # 每个数据库文件保留的只读连接数（0 = 不使用连接池）
+}
+
+_JOURNAL_MODES = {"wal", "delete", "truncate", "persist", "memory", "off"}
+_SYNCHRONOUS_MODES = {"off", "normal", "full", "extra"}
+_TEMP_STORE_MODES = {"default", "file", "memory"}
+
+
+def resolve_profile(profile: Optional[Dict] = None) -> Dict:
+    """
+    合并用户配置与默认配置
+
+    Args:
+        profile: 用户配置（可只包含部分键）
+
+    Returns:
+        完整的存储配置
+    """
+    resolved = dict(DEFAULT_SQLITE_PROFILE)
+    for key, value in (profile or {}).items():
+        if value is not None:
+            resolved[key.upper()] = value
+    return resolved
+
+
+def apply_pragmas(conn: sqlite3.Connection, profile: Dict, read_only: bool = False) -> None:
+    """
+    为连接应用存储配置
+
+    日志模式会写入数据库文件头，只由写连接设置；只读连接额外开启 query_only。
+
+    Args:
+        conn: 数据库连接
+        profile: 存储配置（resolve_profile 的返回值）
+        read_only: 是否为只读连接
+    """
+    busy_timeout = int(profile.get("BUSY_TIMEOUT_MS", 5000))
+    conn.execute(f"PRAGMA busy_timeout = {max(0, busy_timeout)}")
+
+    if not read_only:
+        journal_mode = str(profile.get("JOURNAL_MODE", "")).lower()
+        if journal_mode in _JOURNAL_MODES:
+            conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+
+        synchronous = str(profile.get("SYNCHRONOUS", "")).lower()
+        if synchronous in _SYNCHRONOUS_MODES:
+            conn.execute(f"PRAGMA synchronous = {synchronous}")
+
+    # cache_size 取负数表示以 KiB 为单位
+    cache_size_mb = int(profile.get("CACHE_SIZE_MB", 0))
+    if cache_size_mb > 0:
+        conn.execute(f"PRAGMA cache_size = -{cache_size_mb * 1024}")
+
+    mmap_size_mb = int(profile.get("MMAP_SIZE_MB", 0))
+    conn.execute(f"PRAGMA mmap_size = {max(0, mmap_size_mb) * 1024 * 1024}")
+
+    temp_store = str(profile.get("TEMP_STORE", "")).lower()
+    if temp_store in _TEMP_STORE_MODES:
+        conn.execute(f"PRAGMA temp_store = {temp_store}")
+
+    if read_only:
+        conn.execute("PRAGMA query_only = 1")
+
+
+def _file_identity(db_path: str) -> Optional[Tuple[int, int]]:
+    """获取文件标识（设备号 + inode），文件被替换后标识会变化"""
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+class ReadOnlyConnectionPool:
+    """
+    SQLite 只读连接池
+
+    按数据库文件路径缓存只读连接，供 API / MCP 等读取方复用：
+    - 连接以 URI mode=ro 打开，并开启 query_only
+    - 文件被替换（如从远程拉取覆盖）后，旧连接自动丢弃
+    - 线程安全：同一连接同一时间只会借给一个线程
+    """
+
+    def __init__(self, profile: Optional[Dict] = None):
+        """
+        初始化连接池
+
+        Args:
+            profile: 存储配置，默认使用 DEFAULT_SQLITE_PROFILE
+        """
+        self.profile = resolve_profile(profile)
+        self.pool_size = max(0, int(self.profile.get("READ_POOL_SIZE", 0)))
+        self._lock = threading.Lock()
+        self._idle: Dict[str, List[Tuple[sqlite3.Connection, Tuple[int, int]]]] = {}
+
+    def _open(self, db_path: str) -> sqlite3.Connection:
+        """打开新的只读连接"""
+        conn = sqlite3.connect(
+            f"file:{db_path}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            timeout=int(self.profile.get("BUSY_TIMEOUT_MS", 5000)) / 1000,
+        )
+        conn.row_factory = sqlite3.Row
+        apply_pragmas(conn, self.profile, read_only=True)
+        return conn
+
+    def _acquire(self, db_path: str, identity: Tuple[int, int]) -> sqlite3.Connection:
+        """借出连接：优先复用同一文件的空闲连接"""
+        stale = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get(db_path, [])
+            while idle:
+                candidate, candidate_identity = idle.pop()
+                if candidate_identity == identity:
+                    conn = candidate
+                    break
+                stale.append(candidate)
+
+        for old in stale:
+            old.close()
+
+        return conn or self._open(db_path)
+
+    def _release(self, db_path: str, identity: Tuple[int, int], conn: sqlite3.Connection) -> None:
+        """归还连接：超出池容量或文件已变化时直接关闭"""
+        if conn.in_transaction:
+            conn.rollback()
+
+        with self._lock:
+            idle = self._idle.setdefault(db_path, [])
+            if len(idle) < self.pool_size and _file_identity(db_path) == identity:
+                idle.append((conn, identity))
+                return
+        conn.close()
+
+    @contextmanager
+    def connection(self, db_path: str) -> Iterator[sqlite3.Connection]:
+        """
+        借用只读连接（上下文管理器）
+
+        Args:
+            db_path: 数据库文件路径（必须已存在）
+
+        Yields:
+            只读数据库连接
+
+        Raises:
+            FileNotFoundError: 数据库文件不存在
+        """
+        db_path = str(db_path)
+        identity = _file_identity(db_path)
+        if identity is None:
+            raise FileNotFoundError(f"Database file not found: {db_path}")
+
+        conn = self._acquire(db_path, identity)
+        try:
+            yield conn
+        except Exception:
+            conn.close()
+            raise
+        else:
+            self._release(db_path, identity, conn)
+
+    def discard(self, db_path: str) -> None:
+        """关闭并移除指定数据库文件的所有空闲连接（删除文件前调用）"""
+        with self._lock:
+            idle = self._idle.pop(str(db_path), [])
+        for conn, _ in idle:
+            conn.close()
+
+    def close_all(self) -> None:
+        """关闭所有空闲连接"""
+        with self._lock:
+            pools = list(self._idle.values())
+            self._idle.clear()
+        for idle in pools:
+            for conn, _ in idle:
+                conn.close()
+
+
+# 只读连接池单例（供不经过 StorageManager 的读取方使用，如 MCP Server）
+_read_pool: Optional[ReadOnlyConnectionPool] = None
+_read_pool_lock = threading.Lock()
+
+
+def get_read_pool(profile: Optional[Dict] = None) -> ReadOnlyConnectionPool:
+    """
+    获取只读连接池单例
+
+    Args:
+        profile: 存储配置，仅在首次创建时生效
+
+    Returns:
+        ReadOnlyConnectionPool 实例
+    """
+    global _read_pool
+
+    with _read_pool_lock:
+        if _read_pool is None:
+            _read_pool = ReadOnlyConnectionPool(profile)
+        return _read_pool
@@ -0,0 +1,297 @@
+# coding=utf-8
+"""
+远程存储后台上传队列
+
+远程模式下每次保存都要把数据库上传到对象存储，同步上传会让抓取流程等待网络；
+上传失败时本次同步也会丢失。UploadQueue 把待上传对象先写入本地队列目录，
+由后台线程依次上传：
+
+- 持久化：每个待上传对象对应队列目录中的 {序号}.data（内容）与 {序号}.json（元数据），
+  元数据最后写入，进程中断后下次启动继续上传未完成的对象
+- 有序：同一分组（同一个数据库的基线与增量段）按入队顺序上传，前一个失败时后面的等待
+- 合并：完整对象入队时，同一分组中还未开始上传的旧对象直接被替换
+  （其待删除对象并入新对象，上传成功后一起删除）
+- 重试：失败后按指数退避重试，不会丢弃
+
+队列只有在数据目录于运行之间保留时才能跨运行续传；运行结束时仍未完成的对象
+由 StorageManager.cleanup 以 UploadIncompleteError 报告（程序以非零状态退出）。
+"""
+
+import json
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+
+class UploadIncompleteError(RuntimeError):
+    """运行结束时上传队列中仍有未完成的对象"""
+
+
+class UploadEntry:
+    """队列中的一个待上传对象"""
+
+    def __init__(self, seq: int, meta: Dict, data_path: Path):
+        self.seq = seq
+        self.key: str = meta["key"]
+        self.group: str = meta.get("group") or meta["key"]
+        self.content_type: str = meta.get("content_type", "application/octet-stream")
+        self.delete_keys: List[str] = list(meta.get("delete_keys", []))
+        self.data_path = data_path
+        self.attempts = 0
+        self.next_attempt = 0.0
+
+    def to_meta(self) -> Dict:
+        return {
+            "key": self.key,
+            "group": self.group,
+            "content_type": self.content_type,
+            "delete_keys": self.delete_keys,
+        }
+
+
+class UploadQueue:
+    """
+    持久化的后台上传队列（线程安全）
+
+    upload_fn(entry) 负责上传 entry.data_path 的内容并删除 entry.delete_keys，
+    失败时抛出异常。
+    """
+
+    # 重试退避（秒）
+    BACKOFF_BASE = 1.0
+    BACKOFF_MAX = 60.0
+
+    def __init__(self, queue_dir: Union[str, Path], upload_fn: Callable[[UploadEntry], None], label: str = "远程存储"):
+        """
+        初始化上传队列（载入上次运行未完成的对象）
+
+        Args:
+            queue_dir: 队列目录
+            upload_fn: 上传函数
+            label: 日志前缀
+        """
+        self.queue_dir = Path(queue_dir)
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self.upload_fn = upload_fn
+        self.label = label
+
+        self._entries: Dict[int, UploadEntry] = {}
+        self._in_flight: Optional[int] = None
+        self._next_seq = 1
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+        self._load()
+        if self._entries:
+            print(f"[{self.label}] 上传队列中有 {len(self._entries)} 个上次未完成的对象，继续上传")
+            self._ensure_worker()
+
+    def _load(self) -> None:
+        """载入队列目录中已提交的对象，删除未提交的残留文件"""
+        for path in sorted(self.queue_dir.iterdir()):
+            stem, suffix = path.stem, path.suffix
+            if not stem.isdigit():
+                if path.name.endswith(".tmp"):
+                    path.unlink(missing_ok=True)
+                continue
+            seq = int(stem)
+            self._next_seq = max(self._next_seq, seq + 1)
+            if suffix != ".json":
+                continue
+            data_path = path.with_suffix(".data")
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                if not data_path.exists():
+                    raise FileNotFoundError(data_path)
+                self._entries[seq] = UploadEntry(seq, meta, data_path)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"[{self.label}] 上传队列条目损坏，已丢弃 {path.name}: {e}")
+                path.unlink(missing_ok=True)
+
+        # 没有元数据的内容文件（写入中途中断）
+        for data_path in self.queue_dir.glob("*.data"):
+            if data_path.stem.isdigit() and int(data_path.stem) not in self._entries:
+                data_path.unlink(missing_ok=True)
+
+    def _paths(self, seq: int):
+        return self.queue_dir / f"{seq:012d}.data", self.queue_dir / f"{seq:012d}.json"
+
+    def _remove_files(self, entry: UploadEntry) -> None:
+        """删除条目文件（先删元数据，中途中断也不会留下半个条目）"""
+        _, meta_path = self._paths(entry.seq)
+        meta_path.unlink(missing_ok=True)
+        entry.data_path.unlink(missing_ok=True)
+
+    def enqueue(
+        self,
+        key: str,
+        source: Union[str, Path, bytes],
+        group: Optional[str] = None,
+        content_type: str = "application/octet-stream",
+        delete_keys: Optional[List[str]] = None,
+    ) -> None:
+        """
+        加入待上传对象
+
+        Args:
+            key: 远程对象键
+            source: 内容（文件路径会被复制，之后修改原文件不影响队列）
+            group: 分组（默认为 key；同一分组按顺序上传）
+            content_type: 内容类型
+            delete_keys: 上传成功后需要删除的远程对象键
+        """
+        group = group or key
+        with self._cond:
+            seq = self._next_seq
+            self._next_seq += 1
+        data_path, meta_path = self._paths(seq)
+
+        # 内容与元数据都先写临时文件再替换，元数据存在即表示条目完整
+        tmp_data = data_path.with_name(data_path.name + ".tmp")
+        if isinstance(source, bytes):
+            with open(tmp_data, "wb") as f:
+                f.write(source)
+        else:
+            shutil.copyfile(source, tmp_data)
+        tmp_data.replace(data_path)
+
+        entry = UploadEntry(seq, {
+            "key": key,
+            "group": group,
+            "content_type": content_type,
+            "delete_keys": list(delete_keys or []),
+        }, data_path)
+
+        with self._cond:
+            # 完整对象覆盖同一分组中还未开始上传的对象
+            if key == group:
+                superseded = [
+                    old for old in self._entries.values()
+                    if old.group == group and old.seq != self._in_flight
+                ]
+                for old in superseded:
+                    for stale_key in old.delete_keys + ([old.key] if old.key != key else []):
+                        if stale_key != key and stale_key not in entry.delete_keys:
+                            entry.delete_keys.append(stale_key)
+                    del self._entries[old.seq]
+                    self._remove_files(old)
+
+            self._write_meta(meta_path, entry)
+            self._entries[seq] = entry
+            self._ensure_worker()
+            self._cond.notify_all()
+
+    def _write_meta(self, meta_path: Path, entry: UploadEntry) -> None:
+        tmp_meta = meta_path.with_name(meta_path.name + ".tmp")
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(entry.to_meta(), f, ensure_ascii=False)
+        tmp_meta.replace(meta_path)
+
+    def _ensure_worker(self) -> None:
+        """启动后台线程（调用方持有锁）"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="trendradar-uploader", daemon=True)
+            self._thread.start()
+
+    def _next_ready(self) -> Optional[UploadEntry]:
+        """各分组中最早的对象里，已到重试时间的序号最小者（调用方持有锁）"""
+        now = time.monotonic()
+        heads: Dict[str, UploadEntry] = {}
+        for seq in sorted(self._entries):
+            entry = self._entries[seq]
+            heads.setdefault(entry.group, entry)
+        ready = [entry for entry in heads.values() if entry.next_attempt <= now]
+        return min(ready, key=lambda entry: entry.seq) if ready else None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                entry = None
+                while not self._stopping:
+                    entry = self._next_ready()
+                    if entry is not None or not self._entries:
+                        break
+                    wait = min(e.next_attempt for e in self._entries.values()) - time.monotonic()
+                    self._cond.wait(timeout=max(wait, 0.05))
+                if entry is None:
+                    self._thread = None
+                    self._cond.notify_all()
+                    return
+                self._in_flight = entry.seq
+
+            try:
+                self.upload_fn(entry)
+                error = None
+            except Exception as e:
+                error = e
+
+            with self._cond:
+                self._in_flight = None
+                if error is None:
+                    self._entries.pop(entry.seq, None)
+                    self._remove_files(entry)
+                else:
+                    entry.attempts += 1
+                    delay = min(self.BACKOFF_MAX, self.BACKOFF_BASE * (2 ** (entry.attempts - 1)))
+                    entry.next_attempt = time.monotonic() + delay
+                    print(
+                        f"[{self.label}] 上传失败（第 {entry.attempts} 次），{delay:.0f} 秒后重试: "
+                        f"{entry.key}: {error}"
+                    )
+                self._cond.notify_all()
+
+    def pending_count(self, group: Optional[str] = None) -> int:
+        """待上传对象数量（指定分组时只统计该分组）"""
+        with self._cond:
+            return sum(1 for entry in self._entries.values() if group is None or entry.group == group)
+
+    def wait(self, group: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """
+        等待队列（或指定分组）上传完成
+
+        Args:
+            group: 分组（None 表示整个队列）
+            timeout: 最长等待秒数（None 表示一直等待）
+
+        Returns:
+            是否全部上传完成
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                pending = [e for e in self._entries.values() if group is None or e.group == group]
+                if not pending:
+                    return True
+                if self._thread is None:
+                    self._ensure_worker()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(timeout=remaining if remaining is not None else 1.0)
+
+    def close(self, timeout: Optional[float] = None) -> int:
+        """
+        等待队列上传完成后停止后台线程，未完成的对象保留在队列目录中
+
+        Args:
+            timeout: 最长等待秒数
+
+        Returns:
+            未完成的对象数量
+        """
+        self.wait(timeout=timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            remaining = len(self._entries)
+        if remaining:
+            print(
+                f"[{self.label}] 上传队列中还有 {remaining} 个对象未完成，已保留在 {self.queue_dir}"
+                f"（数据目录保留时下次运行继续上传）"
+            )
+        return remaining